@@ -24,6 +24,9 @@ Keyword arguments:
 - id (string; optional):
     Unique ID to identify this component in Dash callbacks.
 
+- activeTabId (string; optional):
+    Id of the selected tab in the active tabset. Set by the component.
+
 - apiKey (string; optional):
     API key for premium features. If provided and valid, unlocks
     unlimited tabs. Otherwise, limits to 3 tabs in the free version.
@@ -40,6 +43,27 @@ Keyword arguments:
 - debugMode (boolean; default False):
     Debug mode flag.
 
+- deferModelUpdates (boolean; optional):
+    Report layout changes to Dash (`model`, `visibleTabIds` and
+    `activeTabId`) when the browser is idle, at most 500ms later,
+    instead of serializing the layout after every action. A burst of
+    actions, such as the splitter moves of a `realtimeResize` drag, is
+    then serialized and sent once. The quick switcher and clientside
+    operations still see every change immediately.
+
+- dirtyOutputs (dict with strings as keys and values of type string; optional):
+    Outputs that skipped an update while their tab was hidden, mapped
+    to the id of that tab. Maintained by the
+    `dash_dock.only_if_visible` callback decorator; not used by the
+    component itself.
+
+- dragPlaceholders (boolean; optional):
+    While a splitter or tab is being dragged, replace the content of
+    tabs marked heavy (with `\"config\": {\"heavy\": true}` in the model)
+    by a placeholder. Their content stays mounted at its previous size
+    and is resized once on drop, so expensive content such as WebGL or
+    Plotly figures doesn't re-layout on every frame of the drag.
+
 - font (boolean | number | string | dict | list; optional):
     The tab font (overrides value in css). Example:
     font={{size:\"12px\", style:\"italic\"}}.
@@ -53,6 +77,23 @@ Keyword arguments:
     mapping is supplied.  Note: where possible, it is likely better to
     use classes to style the headers, rather than using this prop.
 
+- headerSpecs (dict with strings as keys and values of type dict with keys:
+
+    - icon (string; optional)
+
+    - text (string; optional)
+
+    - badge (number | string; optional)
+
+    - className (string; optional); optional):
+    Map of lightweight header descriptions for each tab, rendered by
+    the component itself instead of as Dash components. Each entry can
+    have an `icon` (CSS class of an icon element, e.g. \"bi bi-graph-
+    up\"), `text` (defaults to the tab name), a `badge` (e.g. an
+    unread count; hidden when 0 or null) and a `className`. Updating a
+    badge only changes a few bytes of props. An entry in `headers` for
+    the same tab takes precedence over its text.
+
 - loading_state (dict; optional):
     Loading state.
 
@@ -566,14 +607,55 @@ Keyword arguments:
         `popouts` is a dict with keys:
 
 
-- popoutURL (string; default '/assets/popout.html'):
-    URL of popout window relative to origin, defaults to popout.html.
+- popoutURL (string; optional):
+    URL of the page popout windows are opened with, relative to the
+    origin. Defaults to a blank page served by `dash_dock` at
+    `<requests_pathname_prefix>_dash-dock/popout.html`. Popped out tabs
+    are rendered into the window from this page's React tree, so the
+    page needs no scripts of its own.
+
+- prefetchDelay (number; optional):
+    Milliseconds the pointer has to rest on the button of a hidden tab
+    (in a tabset or a border) before `prefetchTabId` is set to that
+    tab. Leave unset to disable.
+
+- prefetchTabId (string; optional):
+    Id of the hidden tab the user is likely to open next, based on
+    hover intent (see `prefetchDelay`). Use it as a callback input to
+    warm caches or render the tab's content before it is clicked. Set
+    by the component.
+
+- quickSwitcher (boolean; optional):
+    Enable the quick switcher: Ctrl+K (Cmd+K on macOS) opens a search
+    box over the names and ids of all tabs, and choosing a tab selects
+    it without a server round trip. The shortcut applies to the dock
+    holding the focus, or to the first dock on the page with a quick
+    switcher. It can also be opened with
+    `dash_clientside.dash_dock.openQuickSwitcher(dockId)`.
 
 - realtimeResize (boolean; optional):
     Boolean value, defaults to False, resize tabs as splitters are
     dragged. Warning: this can cause resizing to become choppy when
     tabs are slow to draw.
 
+- reportTabResize (boolean; optional):
+    Report settled tab resizes through the `resizedTabs` prop. Resizes
+    are always announced with a `dashdock:tabresize` DOM event
+    dispatched on the tab's content element (bubbling up to `window`),
+    whose `detail` holds the `dockId`, `tabId` and the tab's new `x`,
+    `y`, `width` and `height`.
+
+- resizedTabs (dict with strings as keys and values of type dict with keys:
+
+    - width (number; required)
+
+    - height (number; required); optional):
+    The tabs whose size changed in the last splitter drag, maximize or
+    other layout change, mapped to their new `width` and `height`.
+    Only tabs whose rect actually changed are included, and only once
+    the drag has finished. Set by the component when `reportTabResize`
+    is true.
+
 - style (dict; optional):
     CSS styles to apply to the root container element.
 
@@ -7784,6 +7866,25 @@ Keyword arguments:
 - supportsPopout (boolean; optional):
     If left undefined will do simple check based on userAgent.
 
+- syncChannel (string; optional):
+    Name of a channel to keep this dock in sync with the docks using
+    the same name in other browser tabs and windows of the same
+    origin. Every layout action (adding, moving, closing, selecting,
+    resizing tabs...) is broadcast with `BroadcastChannel` and
+    replayed on the other docks' layouts, without going through the
+    server. Docks should start from the same model; actions that no
+    longer apply to a layout that has diverged are skipped.
+
+- tabContainment (boolean; default False):
+    Apply CSS containment to tab content: `content-visibility: hidden`
+    for hidden tabs and `content-visibility: auto` for the others, so
+    content that isn't on screen is skipped by style recalculation,
+    layout and paint. Defaults to false. Contained tab content is the
+    containing block of its `position: fixed` descendants and clips
+    them, so dropdowns and popovers that aren't rendered in a portal
+    are positioned relative to the tab and cut off at its edges. Leave
+    it off if tab content needs to overflow its tab.
+
 - useStateForModel (boolean; default False):
     Flag that we should use internal state to manage the layout. If
     the layout is not being used by dash anywhere (for example, saving
@@ -7791,16 +7892,32 @@ Keyword arguments:
     internal state (as this limits the number of round trips between
     JSON and the Model object).  WARNING: If you set this, do not
     expect the dash property `model` to reflect the current state of
-    the layout!."""
+    the layout!.
+
+- virtualTabStrip (number; optional):
+    Maximum number of tab buttons to show per tabset or border.
+    Tabsets and borders with more tabs only show this many buttons,
+    around the selected tab, and get a button opening a searchable
+    menu of all their tabs (which FlexLayout's overflow button opens
+    too). FlexLayout still renders a button for every tab: those
+    outside the window are empty stubs, without a header, hidden by a
+    `:has()` CSS rule. Leave unset to show every tab button.
+
+- visibleTabIds (list of strings; optional):
+    Ids of the tabs currently on screen: the selected tab of each
+    tabset (or only of the maximized tabset) and of each open border.
+    Set by the component, and only updated when visibility actually
+    changes. Use `dash_dock.visible_tab_ids(model)` to provide the
+    initial value from the server."""
     _children_props = ['headers{}']
     _base_nodes = ['children']
     _namespace = 'dash_dock'
     _type = 'DashDock'
     @_explicitize_args
-    def __init__(self, children=None, id=Component.UNDEFINED, font=Component.UNDEFINED, supportsPopout=Component.UNDEFINED, popoutURL=Component.UNDEFINED, realtimeResize=Component.UNDEFINED, model=Component.REQUIRED, headers=Component.UNDEFINED, useStateForModel=Component.UNDEFINED, debugMode=Component.UNDEFINED, apiKey=Component.UNDEFINED, apiUrl=Component.UNDEFINED, freeTabLimit=Component.UNDEFINED, colorScheme=Component.UNDEFINED, style=Component.UNDEFINED, loading_state=Component.UNDEFINED, **kwargs):
-        self._prop_names = ['children', 'id', 'apiKey', 'apiUrl', 'colorScheme', 'debugMode', 'font', 'freeTabLimit', 'headers', 'loading_state', 'model', 'popoutURL', 'realtimeResize', 'style', 'supportsPopout', 'useStateForModel']
+    def __init__(self, children=None, id=Component.UNDEFINED, font=Component.UNDEFINED, supportsPopout=Component.UNDEFINED, popoutURL=Component.UNDEFINED, realtimeResize=Component.UNDEFINED, model=Component.REQUIRED, headers=Component.UNDEFINED, headerSpecs=Component.UNDEFINED, useStateForModel=Component.UNDEFINED, debugMode=Component.UNDEFINED, apiKey=Component.UNDEFINED, apiUrl=Component.UNDEFINED, freeTabLimit=Component.UNDEFINED, colorScheme=Component.UNDEFINED, style=Component.UNDEFINED, visibleTabIds=Component.UNDEFINED, activeTabId=Component.UNDEFINED, dirtyOutputs=Component.UNDEFINED, reportTabResize=Component.UNDEFINED, resizedTabs=Component.UNDEFINED, dragPlaceholders=Component.UNDEFINED, tabContainment=Component.UNDEFINED, prefetchDelay=Component.UNDEFINED, prefetchTabId=Component.UNDEFINED, virtualTabStrip=Component.UNDEFINED, quickSwitcher=Component.UNDEFINED, deferModelUpdates=Component.UNDEFINED, syncChannel=Component.UNDEFINED, loading_state=Component.UNDEFINED, **kwargs):
+        self._prop_names = ['children', 'id', 'activeTabId', 'apiKey', 'apiUrl', 'colorScheme', 'debugMode', 'deferModelUpdates', 'dirtyOutputs', 'dragPlaceholders', 'font', 'freeTabLimit', 'headers', 'headerSpecs', 'loading_state', 'model', 'popoutURL', 'prefetchDelay', 'prefetchTabId', 'quickSwitcher', 'realtimeResize', 'reportTabResize', 'resizedTabs', 'style', 'supportsPopout', 'syncChannel', 'tabContainment', 'useStateForModel', 'virtualTabStrip', 'visibleTabIds']
         self._valid_wildcard_attributes =            []
-        self.available_properties = ['children', 'id', 'apiKey', 'apiUrl', 'colorScheme', 'debugMode', 'font', 'freeTabLimit', 'headers', 'loading_state', 'model', 'popoutURL', 'realtimeResize', 'style', 'supportsPopout', 'useStateForModel']
+        self.available_properties = ['children', 'id', 'activeTabId', 'apiKey', 'apiUrl', 'colorScheme', 'debugMode', 'deferModelUpdates', 'dirtyOutputs', 'dragPlaceholders', 'font', 'freeTabLimit', 'headers', 'headerSpecs', 'loading_state', 'model', 'popoutURL', 'prefetchDelay', 'prefetchTabId', 'quickSwitcher', 'realtimeResize', 'reportTabResize', 'resizedTabs', 'style', 'supportsPopout', 'syncChannel', 'tabContainment', 'useStateForModel', 'virtualTabStrip', 'visibleTabIds']
         self.available_wildcard_properties =            []
         _explicit_args = kwargs.pop('_explicit_args')
         _locals = locals()
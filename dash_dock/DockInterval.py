@@ -0,0 +1,47 @@
+# AUTO GENERATED FILE - DO NOT EDIT
+
+from dash.development.base_component import Component, _explicitize_args
+
+
+class DockInterval(Component):
+    """A DockInterval component.
+A dock-aware version of `dcc.Interval`. Inside a DashDock tab it is paused while
+the tab is hidden (in a background tabset, a collapsed border or behind a
+maximized tabset), and if an interval elapsed in the meantime it fires once as
+soon as the tab is revealed. Outside a dock it behaves like `dcc.Interval`.
+
+Keyword arguments:
+
+- id (string; optional):
+    Unique ID to identify this component in Dash callbacks.
+
+- disabled (boolean; default False):
+    If true, the counter will no longer update.
+
+- interval (number; default 1000):
+    This component will increment the counter `n_intervals` every
+    `interval` milliseconds.
+
+- max_intervals (number; default -1):
+    Number of times the interval will be fired. If -1, then the
+    interval has no limit (the default) and if 0 then the interval
+    stops running.
+
+- n_intervals (number; default 0):
+    Number of times the interval has passed."""
+    _children_props = []
+    _base_nodes = ['children']
+    _namespace = 'dash_dock'
+    _type = 'DockInterval'
+    @_explicitize_args
+    def __init__(self, id=Component.UNDEFINED, interval=Component.UNDEFINED, disabled=Component.UNDEFINED, n_intervals=Component.UNDEFINED, max_intervals=Component.UNDEFINED, **kwargs):
+        self._prop_names = ['id', 'disabled', 'interval', 'max_intervals', 'n_intervals']
+        self._valid_wildcard_attributes =            []
+        self.available_properties = ['id', 'disabled', 'interval', 'max_intervals', 'n_intervals']
+        self.available_wildcard_properties =            []
+        _explicit_args = kwargs.pop('_explicit_args')
+        _locals = locals()
+        _locals.update(kwargs)  # For wildcard attrs and excess named props
+        args = {k: _locals[k] for k in _explicit_args}
+
+        super(DockInterval, self).__init__(**args)
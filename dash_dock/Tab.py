@@ -8,22 +8,38 @@ class Tab(Component):
 This is a simple component that holds content to be rendered within a Tab.
 Takes an ID that corresponds to a particular tab in the layout.
 
+Inside a DashDock it reports its tab being hidden (`hiddenAt`) or closed
+(`closedAt`, which also sets `hiddenAt`).
+
 Keyword arguments:
 
 - children (a list of or a singular dash component, string or number; optional):
     Children to render within Tab.
 
-- id (string; required):
-    Unique ID to identify this component in Dash callbacks."""
+- id (string | dict with strings as keys and values of type string | number | boolean; required):
+    Unique ID to identify this component in Dash callbacks. Matched
+    against the id of a tab in the model. A dict (pattern-matching) id
+    matches the tab whose id is its stringified form, see
+    `dash_dock.pattern_matching_tabs`.
+
+- closedAt (number; optional):
+    Time (milliseconds since the epoch) the tab was closed. Set by the
+    component.
+
+- hiddenAt (number; optional):
+    Time (milliseconds since the epoch) the tab was last hidden or
+    closed. Set by the component. Use it as the `cancel` input of
+    background callbacks computing the tab's content, see
+    `dash_dock.tab_cancel_inputs`."""
     _children_props = []
     _base_nodes = ['children']
     _namespace = 'dash_dock'
     _type = 'Tab'
     @_explicitize_args
-    def __init__(self, children=None, id=Component.REQUIRED, **kwargs):
-        self._prop_names = ['children', 'id']
+    def __init__(self, children=None, id=Component.REQUIRED, hiddenAt=Component.UNDEFINED, closedAt=Component.UNDEFINED, **kwargs):
+        self._prop_names = ['children', 'id', 'closedAt', 'hiddenAt']
         self._valid_wildcard_attributes =            []
-        self.available_properties = ['children', 'id']
+        self.available_properties = ['children', 'id', 'closedAt', 'hiddenAt']
         self.available_wildcard_properties =            []
         _explicit_args = kwargs.pop('_explicit_args')
         _locals = locals()
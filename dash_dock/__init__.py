@@ -9,6 +9,7 @@ import dash as _dash
 # noinspection PyUnresolvedReferences
 from ._imports_ import *
 from ._imports_ import __all__
+from ._assets import load_asset_manifest, register_immutable_cache
 
 if not hasattr(_dash, '__plotly_dash') and not hasattr(_dash, 'development'):
     print('Dash was not successfully imported. '
@@ -28,18 +29,33 @@ _current_path = _os.path.dirname(_os.path.abspath(__file__))
 
 _this_module = _sys.modules[__name__]
 
-async_resources = []
+# Content-hashed assets emitted by the production build, keyed by their
+# un-hashed names (see DashAssetManifestPlugin in webpack.config.js)
+_asset_manifest = load_asset_manifest(_basepath, package_name)
+
+
+def _asset(name):
+    return _asset_manifest.get(name, name)
+
+
+# Only register the lazy chunks the installed bundle was built with, Dash
+# fails to serve the page with eager_loading=True otherwise
+async_resources = [
+    _resource for _resource in ["dashdock"]
+    if _os.path.exists(_os.path.join(_basepath, _asset("async-{}.js".format(_resource))))
+]
 
 _js_dist = []
 
 _js_dist.extend(
     [
         {
-            "relative_package_path": "async-{}.js".format(async_resource),
+            "relative_package_path": _asset("async-{}.js".format(async_resource)),
             "external_url": (
                 "https://unpkg.com/{0}@{2}"
-                "/{1}/async-{3}.js"
-            ).format(package_name, __name__, __version__, async_resource),
+                "/{1}/{3}"
+            ).format(package_name, __name__, __version__,
+                     _asset("async-{}.js".format(async_resource))),
             "namespace": package_name,
             "async": True,
         }
@@ -51,11 +67,12 @@ _js_dist.extend(
 _js_dist.extend(
     [
         {
-            "relative_package_path": "async-{}.js.map".format(async_resource),
+            "relative_package_path": _asset("async-{}.js".format(async_resource)) + ".map",
             "external_url": (
                 "https://unpkg.com/{0}@{2}"
-                "/{1}/async-{3}.js.map"
-            ).format(package_name, __name__, __version__, async_resource),
+                "/{1}/{3}.map"
+            ).format(package_name, __name__, __version__,
+                     _asset("async-{}.js".format(async_resource))),
             "namespace": package_name,
             "dynamic": True,
         }
@@ -66,12 +83,12 @@ _js_dist.extend(
 _js_dist.extend(
     [
         {
-            'relative_package_path': 'dash_dock.min.js',
+            'relative_package_path': _asset('dash_dock.min.js'),
     
             'namespace': package_name
         },
         {
-            'relative_package_path': 'dash_dock.min.js.map',
+            'relative_package_path': _asset('dash_dock.min.js') + '.map',
     
             'namespace': package_name,
             'dynamic': True
@@ -79,9 +96,78 @@ _js_dist.extend(
     ]
 )
 
-_css_dist = []
-
+_css_dist = [
+    {
+        'relative_package_path': _asset_manifest[_name],
+        'namespace': package_name
+    }
+    for _name in sorted(_asset_manifest)
+    if _name.endswith('.css')
+]
+
+register_immutable_cache(
+    package_name,
+    [_file for _name, _file in _asset_manifest.items() if _name != _file]
+)
 
 for _component in __all__:
     setattr(locals()[_component], '_js_dist', _js_dist)
     setattr(locals()[_component], '_css_dist', _css_dist)
+
+from .popout import POPOUT_ROUTE, register_popout_route as _register_popout_route  # noqa: E402
+
+_register_popout_route()
+
+
+from .serialization import (  # noqa: E402
+    to_canonical_json,
+    to_canonical_bytes,
+    model_hash,
+    models_equal,
+)
+from .model import ModelIndex, iter_nodes  # noqa: E402
+from .patches import (  # noqa: E402
+    add_tab,
+    remove_tab,
+    select_tab,
+    set_weights,
+    add_tab_content,
+    remove_tab_content,
+)
+from .visibility import visible_tab_ids, active_tab_id, only_if_visible  # noqa: E402
+from .limits import count_tabs, limit_model, enforce_tab_limit  # noqa: E402
+from .children import (  # noqa: E402
+    stringify_tab_id,
+    child_tab_id,
+    prune_orphan_children,
+    pattern_matching_tabs,
+)
+from .cancel import tab_cancel_inputs, background_tab_callback  # noqa: E402
+
+__all__ = __all__ + [
+    "POPOUT_ROUTE",
+    "to_canonical_json",
+    "to_canonical_bytes",
+    "model_hash",
+    "models_equal",
+    "ModelIndex",
+    "iter_nodes",
+    "add_tab",
+    "remove_tab",
+    "select_tab",
+    "set_weights",
+    "add_tab_content",
+    "remove_tab_content",
+    "visible_tab_ids",
+    "active_tab_id",
+    "only_if_visible",
+    "count_tabs",
+    "limit_model",
+    "enforce_tab_limit",
+    "stringify_tab_id",
+    "child_tab_id",
+    "prune_orphan_children",
+    "pattern_matching_tabs",
+    "tab_cancel_inputs",
+    "background_tab_callback",
+]
@@ -0,0 +1,73 @@
+"""
+Content-hashed bundle support.
+
+Production builds emit fingerprinted filenames (e.g.
+``dash_dock.1a2b3c4d.min.js``) together with ``dash_dock-manifest.json``,
+which maps each un-hashed name to the file that was actually written. Since
+a hashed file can never change, responses for it are marked ``immutable`` so
+browsers and CDNs don't revalidate them within the one year max-age that Dash
+already sets for fingerprinted component suite URLs.
+"""
+import json
+import os
+import re
+
+import dash
+
+_HASHED_NAME = r"\.[0-9a-f]{8}\."
+
+
+def load_asset_manifest(basepath, package_name):
+    """
+    Load the asset manifest written by the webpack build.
+
+    :param basepath: Directory of the package.
+    :param package_name: Name of the package.
+    :return: Mapping of un-hashed asset names to emitted filenames. Empty if
+        the bundle was built without the manifest.
+    """
+    path = os.path.join(basepath, "{}-manifest.json".format(package_name))
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def register_immutable_cache(package_name, hashed_files):
+    """
+    Mark responses for content-hashed bundles as ``immutable``.
+
+    Uses a Dash ``setup`` hook, so it applies to every Flask based Dash app
+    created after import. Does nothing on Dash versions without hooks.
+
+    :param package_name: Namespace the files are served under.
+    :param hashed_files: Filenames (relative to the package) whose content
+        hash is part of the name.
+    """
+    hooks = getattr(dash, "hooks", None)
+    if hooks is None or not hashed_files:
+        return
+
+    # Dash inserts its own ``.v<version>m<mtime>`` fingerprint after the
+    # first dot, so match on the hash that follows it
+    pattern = re.compile(
+        r"/_dash-component-suites/{}/[^/]*{}".format(re.escape(package_name), _HASHED_NAME)
+    )
+
+    @hooks.setup()
+    def _add_immutable_cache(app):
+        try:
+            import flask
+        except ImportError:  # pragma: no cover - non-Flask backends
+            return
+
+        server = getattr(app, "server", None)
+        if not isinstance(server, flask.Flask):
+            return
+
+        @server.after_request
+        def _immutable(response):
+            cache_control = response.headers.get("Cache-Control", "")
+            if "max-age" in cache_control and pattern.search(flask.request.path):
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+            return response
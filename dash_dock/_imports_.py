@@ -1,7 +1,9 @@
 from .DashDock import DashDock
 from .Tab import Tab
+from .DockInterval import DockInterval
 
 __all__ = [
     "DashDock",
-    "Tab"
+    "Tab",
+    "DockInterval"
 ]
\ No newline at end of file
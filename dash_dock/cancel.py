@@ -0,0 +1,125 @@
+"""
+Cancel background callbacks when the tab showing their result goes away.
+
+Inside a ``DashDock``, each ``Tab`` sets its ``hiddenAt`` prop when its tab
+is hidden or closed, and ``closedAt`` when it is closed. Using them as the
+``cancel`` input of a background callback stops the job (and frees its
+worker) as soon as nobody can see its result:
+
+    @app.callback(
+        Output("report-graph", "figure"),
+        Input("run", "n_clicks"),
+        background=True,
+        cancel=tab_cancel_inputs(dock, Output("report-graph", "figure")),
+    )
+    def build_report(n_clicks):
+        ...
+
+``background_tab_callback`` does the same for every output of a callback:
+
+    @background_tab_callback(dock, Output("report-graph", "figure"), Input("run", "n_clicks"))
+    def build_report(n_clicks):
+        ...
+"""
+import dash
+from dash import ALL, ALLSMALLER, MATCH, Input, Output
+
+from .children import _flatten
+
+__all__ = ["tab_cancel_inputs", "background_tab_callback"]
+
+_WILDCARDS = (ALL, MATCH, ALLSMALLER)
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def _component_ids(component):
+    component_id = getattr(component, "id", None)
+    if component_id is not None:
+        yield component_id
+    for child in component._traverse():  # pylint: disable=protected-access
+        child_id = getattr(child, "id", None)
+        if child_id is not None:
+            yield child_id
+
+
+def _id_matches(pattern, component_id):
+    # Exact ids, or dict ids matching a pattern with wildcards
+    if isinstance(pattern, dict) != isinstance(component_id, dict):
+        return False
+    if not isinstance(pattern, dict):
+        return pattern == component_id
+    if set(pattern) != set(component_id):
+        return False
+    return all(
+        value in _WILDCARDS or value == component_id[key]
+        for key, value in pattern.items()
+    )
+
+
+def tab_cancel_inputs(dock, outputs, on="hiddenAt"):
+    """
+    Build the ``cancel`` inputs of a background callback from the tabs its
+    outputs are rendered in.
+
+    :param dock: The ``DashDock`` component, with its ``Tab`` children.
+    :param outputs: An ``Output`` or a list of them. Outputs with a
+        pattern-matching id are matched against the ids in every tab.
+    :param on: ``"hiddenAt"`` to cancel when a tab is hidden or closed, or
+        ``"closedAt"`` to only cancel when it is closed.
+    :return: List of ``Input(tab_id, on)``, one per tab holding an output.
+        Empty if no output is inside a tab.
+    :raises ValueError: For an output with a ``MATCH`` id. Each match runs its
+        own job, which would be cancelled by hiding the tab of any other match,
+        and Dash doesn't accept pattern-matching ``cancel`` inputs.
+    """
+    if on not in ("hiddenAt", "closedAt"):
+        raise ValueError("on must be 'hiddenAt' or 'closedAt', got {!r}".format(on))
+
+    patterns = [
+        output.component_id
+        for output in _flatten(_as_list(outputs))
+        if isinstance(output, Output)
+    ]
+    for pattern in patterns:
+        if isinstance(pattern, dict) and any(value in (MATCH, ALLSMALLER) for value in pattern.values()):
+            raise ValueError(
+                "Can't cancel a background callback per tab for the MATCH output {!r}, "
+                "pass its cancel inputs explicitly".format(pattern)
+            )
+    inputs = []
+    for tab in _as_list(getattr(dock, "children", None)):
+        tab_id = getattr(tab, "id", None)
+        if tab_id is None or not hasattr(tab, "_traverse"):
+            continue
+        ids = list(_component_ids(tab))
+        if any(_id_matches(pattern, component_id) for pattern in patterns for component_id in ids):
+            inputs.append(Input(tab_id, on))
+    return inputs
+
+
+def background_tab_callback(dock, *args, app=None, on="hiddenAt", **kwargs):
+    """
+    Register a background callback that is cancelled when the tab of any of
+    its outputs is hidden or closed.
+
+    Takes the same arguments as ``dash.callback`` (``background=True`` is
+    implied); ``cancel`` inputs given explicitly are kept.
+
+    :param dock: The ``DashDock`` component, with its ``Tab`` children.
+    :param app: The app to register the callback on. Defaults to
+        ``dash.callback``.
+    :param on: ``"hiddenAt"`` or ``"closedAt"``, see ``tab_cancel_inputs``.
+    """
+    outputs = [arg for arg in _flatten(args) if isinstance(arg, Output)]
+    outputs.extend(_flatten(_as_list(kwargs.get("output"))))
+    kwargs["cancel"] = _as_list(kwargs.get("cancel")) + tab_cancel_inputs(dock, outputs, on)
+    kwargs["background"] = True
+    register = app.callback if app is not None else dash.callback
+    return register(*args, **kwargs)
@@ -0,0 +1,144 @@
+"""
+Helpers for the ``children`` of a DashDock.
+
+Children are allocated to tabs by id. A child whose id doesn't match any tab
+in the model is never rendered, but it is still serialized, sent to the
+browser and hydrated, and its callbacks keep firing. ``prune_orphan_children``
+drops such children before the layout is returned:
+
+    children, dropped = prune_orphan_children(model, children)
+
+Children with a dict (pattern-matching) id are allocated to the tab whose id
+is the stringified dict, which lets a whole family of tabs share one
+``MATCH`` callback; ``pattern_matching_tabs`` builds such a family.
+"""
+import json
+
+from .model import ModelIndex
+from .Tab import Tab
+
+__all__ = [
+    "stringify_tab_id",
+    "child_tab_id",
+    "prune_orphan_children",
+    "pattern_matching_tabs",
+]
+
+
+def stringify_tab_id(component_id):
+    """
+    Get the tab id a component id is matched with.
+
+    :param component_id: A string or dict (pattern-matching) id.
+    :return: The id itself for strings. Dicts are stringified like the
+        renderer does, e.g. ``{"index":1,"type":"panel"}``.
+    """
+    if isinstance(component_id, dict):
+        # Keys sorted and no whitespace, with non-ASCII characters kept as is
+        # to match JSON.stringify in the browser
+        return json.dumps(
+            component_id, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    return component_id
+
+
+def _flatten(items):
+    # Nested lists of outputs, inputs etc. as a flat sequence
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            for sub in _flatten(item):
+                yield sub
+        else:
+            yield item
+
+
+def _child_id(child):
+    # Children passed in as a ``State`` arrive as ``{"type", "namespace",
+    # "props"}`` dicts rather than components
+    if isinstance(child, dict):
+        return (child.get("props") or {}).get("id")
+    return getattr(child, "id", None)
+
+
+def child_tab_id(child):
+    """
+    Get the tab id a child is allocated to.
+
+    :param child: A child of the dock, usually a ``Tab``, either as a
+        component or as the dict a ``State`` of ``children`` provides.
+    :return: The child's id, stringified with ``stringify_tab_id``. ``None``
+        if the child has no id.
+    """
+    return stringify_tab_id(_child_id(child))
+
+
+def prune_orphan_children(model, children):
+    """
+    Drop the children that don't belong to any tab of ``model``.
+
+    :param model: A FlexLayout model (``dict``) or a ``ModelIndex``.
+    :param children: The dock's children.
+    :return: Tuple of the children to keep and the ids of the children that
+        were dropped (``None`` for children without an id), in their
+        original order.
+    """
+    index = model if isinstance(model, ModelIndex) else ModelIndex(model)
+    tab_ids = set(index.tab_ids)
+
+    if children is None:
+        return children, []
+    if not isinstance(children, (list, tuple)):
+        children = [children]
+
+    kept, dropped = [], []
+    for child in children:
+        child_id = child_tab_id(child)
+        if child_id in tab_ids:
+            kept.append(child)
+        else:
+            dropped.append(child_id)
+    return kept, dropped
+
+
+def pattern_matching_tabs(id_type, indices, name=None, content=None, **attributes):
+    """
+    Build a family of tabs with pattern-matching ids.
+
+    Each tab gets a ``Tab`` child with the id ``{"type": id_type, "index":
+    index}``, so a single callback using ``MATCH`` can serve every tab of the
+    family:
+
+        tabs, children = pattern_matching_tabs(
+            "ticker", ["AAPL", "MSFT"],
+            content=lambda ticker: dcc.Graph(id={"type": "chart", "index": ticker}),
+        )
+
+    :param id_type: Value of the ``type`` key of the ids.
+    :param indices: Values of the ``index`` key, one per tab.
+    :param name: Tab name. Either a format string with ``{}`` for the index,
+        or a function of the index. Defaults to the index.
+    :param content: Function of the index returning the children of its
+        ``Tab``. Defaults to empty tabs.
+    :param attributes: Other attributes of each tab node, e.g.
+        ``enableClose=False``.
+    :return: Tuple of the tab nodes, to be placed in a tabset or border of
+        the model, and the ``Tab`` children for the dock.
+    """
+    tabs, children = [], []
+    for index in indices:
+        component_id = {"type": id_type, "index": index}
+        if name is None:
+            tab_name = str(index)
+        elif callable(name):
+            tab_name = name(index)
+        else:
+            tab_name = name.format(index)
+
+        tab = {"type": "tab", "id": stringify_tab_id(component_id), "name": tab_name}
+        tab.update(attributes)
+        tabs.append(tab)
+        children.append(Tab(
+            id=component_id,
+            children=content(index) if content is not None else None,
+        ))
+    return tabs, children
@@ -0,0 +1,16 @@
+(()=>{var m=[function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.DockInterval=exports.Tab=exports.DashDock=void 0,require(1),require(2),require(3),exports.DashDock=__importDefault(require(5)).default,exports.Tab=__importDefault(require(96)).default,exports.DockInterval=__importDefault(require(97)).default},function(require,module,exports){},function(require,module,exports){},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0});let dockRegistry_1=require(4),withDock=(dockId,operation)=>{let dock=(0,dockRegistry_1.getDock)(dockId);if(!dock)return console.warn(`DashDock: no dock with id "${dockId}" is mounted`),!1;try{return operation(dock),!0}catch(e){return console.error(`DashDock: layout operation on "${dockId}" failed:`,e),!1}},defaultTabsetId=model=>{let active=model.getActiveTabset();if(active)return active.getId();let first;return model.visitNodes(node=>{!first&&node.getType()===`tabset`&&(first=node.getId())}),first},addTabTo=(dock,tab,toNodeId,location=`center`,index=-1,select=!0)=>{let target=toNodeId||defaultTabsetId(dock.model);dock.doAction(dock.actions.addNode({type:`tab`,...tab},target,dock.DockLocation.getByName(location),index,select))},selectTab=(dockId,tabId)=>withDock(dockId,dock=>{dock.doAction(dock.actions.selectTab(tabId))}),focusTab=(dockId,tabId)=>withDock(dockId,dock=>{var _a;dock.doAction(dock.actions.selectTab(tabId));let parent=(_a=dock.model.getNodeById(tabId))?.getParent();parent&&parent.getType()===`tabset`&&dock.doAction(dock.actions.setActiveTabset(parent.getId()))}),addTab=(dockId,tab,toNodeId,location,index,select)=>withDock(dockId,dock=>addTabTo(dock,tab,toNodeId,location,index,select)),openTab=(dockId,tab,toNodeId)=>withDock(dockId,dock=>{tab.id&&dock.model.getNodeById(tab.id)?dock.doAction(dock.actions.selectTab(tab.id)):addTabTo(dock,tab,toNodeId)}),deleteTab=(dockId,tabId)=>withDock(dockId,dock=>{dock.doAction(dock.actions.deleteTab(tabId))}),renameTab=(dockId,tabId,name)=>withDock(dockId,dock=>{dock.doAction(dock.actions.renameTab(tabId,name))}),maximizeToggle=(dockId,tabsetId)=>withDock(dockId,dock=>{dock.doAction(dock.actions.maximizeToggle(tabsetId))}),updateNodeAttributes=(dockId,nodeId,attributes)=>withDock(dockId,dock=>{dock.doAction(dock.actions.updateNodeAttributes(nodeId,attributes))}),resetLayout=dockId=>withDock(dockId,dock=>dock.reset()),getModel=dockId=>{let dock=(0,dockRegistry_1.getDock)(dockId);return dock?dock.model.toJson():null},getStats=dockId=>{let dock=(0,dockRegistry_1.getDock)(dockId);return dock?dock.getStats():null},openQuickSwitcher=dockId=>withDock(dockId,dock=>dock.openQuickSwitcher()),w=window;w.dash_clientside=w.dash_clientside||{},w.dash_clientside.dash_dock={...w.dash_clientside.dash_dock||{},selectTab,focusTab,addTab,openTab,deleteTab,renameTab,maximizeToggle,updateNodeAttributes,resetLayout,getModel,getStats,openQuickSwitcher}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.registerDock=registerDock,exports.unregisterDock=unregisterDock,exports.getDock=getDock;let docks=/* @__PURE__ */ new Map;function registerDock(id,handle){docks.set(id,handle)}function unregisterDock(id,handle){docks.get(id)===handle&&docks.delete(id)}function getDock(id){return docks.get(id)}},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})(),__importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let react_1=__importStar(require(6)),LazyLoader_1=__importDefault(require(7)),RealDashDock=react_1.default.lazy(LazyLoader_1.default.dashDock),DashDock=({useStateForModel=!1,freeTabLimit=3,debugMode=!1,tabContainment=!1,...others})=>react_1.default.createElement(react_1.Suspense,{fallback:react_1.default.createElement(`div`,{className:`dash-dock-loading`,style:others.style},`Loading dock layout...`)},react_1.default.createElement(RealDashDock,{useStateForModel,freeTabLimit,debugMode,tabContainment,...others}));exports.default=DashDock},function(require,module,exports){module.exports=window.React},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default={dashDock:()=>Promise.resolve().then(()=>__importStar(require(8)))}},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})(),__importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let react_1=__importStar(require(6)),CaplinFlexLayout=__importStar(require(9)),flexlayout_react_1=require(9),dash_extensions_js_1=require(51),dash3_1=require(82),apiClient_1=require(83),tabAnalyzer_1=require(84),dockRegistry_1=require(4),visibility_1=require(85),TabVisibilityContext_1=__importDefault(require(86)),TabEventsContext_1=__importDefault(require(87)),tabResize_1=require(88),headerSpec_1=require(89),tabStrip_1=require(90),tabIndex_1=require(91),idle_1=require(92),layoutSync_1=require(93),popout_1=require(94),TabMenu_1=__importDefault(require(95)),sameId=(childId,id)=>childId!=null&&(0,dash3_1.stringifyId)(childId)===id,idMatches=(child,id)=>{if(child.props){if((0,dash3_1.isDash3)()&&child.props.componentPath){let layout=(0,dash3_1.getChildLayout)(child);if(layout&&layout.props&&sameId(layout.props.id,id))return!0}else if(child.props._dashprivate_layout&&sameId(child.props._dashprivate_layout.props.id,id))return!0;else if(sameId(child.props.id,id))return!0}return child.key===id},getMatchingChildren=(children,node)=>{let id=node.getId();return react_1.default.Children.toArray(children).filter(child=>idMatches(child,id))},MODEL_REPORT_TIMEOUT=500,headerKey=header=>{if(react_1.default.isValidElement(header)){let layout=(0,dash3_1.isDash3)()?(0,dash3_1.getChildLayout)(header):header.props._dashprivate_layout;if(layout&&layout.type)return layout}return header},renderHeader=(header,spec,name)=>{var _a;let leading=null,content;return spec&&({leading,content}=(0,headerSpec_1.renderHeaderSpec)(spec,name)),header&&(content=react_1.default.isValidElement(header)&&(_a=header.props)?.namespace?(0,dash_extensions_js_1.renderDashComponent)(header):header),{leading,content}},DraggingContext=react_1.default.createContext(!1),TabContent=({node,resizeBatcher,children})=>{let[visible,setVisible]=(0,react_1.useState)(()=>(0,visibility_1.isTabVisible)(node)),elementRef=(0,react_1.useRef)(null);(0,react_1.useEffect)(()=>{let tabId=node.getId();return setVisible((0,visibility_1.isTabVisible)(node)),resizeBatcher.track(tabId,node.getRect()),node.setEventListener(`visibility`,({visible})=>setVisible(visible)),node.setEventListener(`resize`,({rect})=>resizeBatcher.queue(tabId,rect||node.getRect(),elementRef.current)),()=>{node.removeEventListener(`visibility`),node.removeEventListener(`resize`),resizeBatcher.remove(tabId)}},[node,resizeBatcher]);let dragging=(0,react_1.useContext)(DraggingContext),heavy=!!(node.getConfig()&&node.getConfig().heavy),[frozenSize,setFrozenSize]=(0,react_1.useState)(null);return(0,react_1.useLayoutEffect)(()=>{if(dragging&&heavy&&visible&&elementRef.current){let{width,height}=elementRef.current.getBoundingClientRect();setFrozenSize({width,height})}else setFrozenSize(null)},[dragging,heavy,visible]),react_1.default.createElement(react_1.default.Fragment,null,react_1.default.createElement(`div`,{className:`dash-dock-tab-content`+(visible?``:` dash-dock-tab-content--hidden`)+(frozenSize?` dash-dock-tab-content--frozen`:``),style:frozenSize||void 0,ref:elementRef},react_1.default.createElement(TabVisibilityContext_1.default.Provider,{value:visible},children)),frozenSize&&react_1.default.createElement(`div`,{className:`dash-dock-tab-placeholder`},node.getName()))},DashDock=({id,model,children,headers,headerSpecs,setProps,useStateForModel,popoutURL,apiKey,apiUrl,freeTabLimit,colorScheme,style,loading_state,debugMode,visibleTabIds,activeTabId,dirtyOutputs,reportTabResize,resizedTabs,dragPlaceholders,tabContainment,prefetchDelay,prefetchTabId,virtualTabStrip,quickSwitcher,deferModelUpdates,syncChannel,...restProps})=>{let[validation,setValidation]=(0,react_1.useState)({isValidated:!1,isValid:!1,message:``}),[currentTheme,setCurrentTheme]=(0,react_1.useState)(colorScheme||(typeof document<`u`&&document.documentElement.getAttribute(`data-mantine-color-scheme`)===`dark`?`dark`:`light`)),echoedModelsRef=(0,react_1.useRef)(/* @__PURE__ */ new WeakSet),serverModelRef=(0,react_1.useRef)(model);echoedModelsRef.current.has(model)||(serverModelRef.current=model);let serverModel=serverModelRef.current;(0,react_1.useEffect)(()=>{if(typeof document>`u`)return;let detectTheme=()=>{let theme=document.documentElement.getAttribute(`data-mantine-color-scheme`);theme&&theme!==currentTheme&&setCurrentTheme(theme)};detectTheme();let observer=new MutationObserver(mutations=>{mutations.forEach(mutation=>{mutation.type===`attributes`&&mutation.attributeName===`data-mantine-color-scheme`&&detectTheme()})});return observer.observe(document.documentElement,{attributes:!0}),()=>{observer.disconnect()}},[currentTheme]);let initialModelRef=(0,react_1.useRef)(model),sourceModel=setProps&&!useStateForModel?serverModel:initialModelRef.current,sourceTabCount=(0,react_1.useMemo)(()=>(0,tabAnalyzer_1.countTabs)(sourceModel).total,[sourceModel]),[liveTabs,setLiveTabs]=(0,react_1.useState)(null),currentLiveTabs=liveTabs&&liveTabs.source===sourceModel?liveTabs:null,tabCount=currentLiveTabs?currentLiveTabs.count:sourceTabCount,exceedsLimit=tabCount>freeTabLimit||!!currentLiveTabs&&currentLiveTabs.exceeded,limit=!validation.isValid&&exceedsLimit?freeTabLimit:-1,[resetCount,setResetCount]=(0,react_1.useState)(0),builtRef=(0,react_1.useRef)(null),{liveModel,modelLimited}=(0,react_1.useMemo)(()=>{let built=builtRef.current,json=built&&built.source===sourceModel&&built.resetCount===resetCount?built.model.toJson():sourceModel,limited=!1,rebuilt=null;if(limit>=0)try{rebuilt=flexlayout_react_1.Model.fromJson((0,tabAnalyzer_1.limitModelToFreeTier)(json,limit)),limited=!0}catch(e){console.error(`Error limiting model:`,e)}return rebuilt||=flexlayout_react_1.Model.fromJson(json),builtRef.current={source:sourceModel,resetCount,model:rebuilt},{liveModel:rebuilt,modelLimited:limited}},[sourceModel,limit,resetCount]),dispatchAction=action=>liveModel.doAction(syncChannel?(0,layoutSync_1.withSyncedIds)(action):action),resetRef=(0,react_1.useRef)();resetRef.current=()=>{cancelModelReport(),setProps&&!useStateForModel&&(echoedModelsRef.current.add(sourceModel),setProps({model:sourceModel})),setLiveTabs(null),setResetCount(count=>count+1)},(0,react_1.useEffect)(()=>{if(!id)return;let handle={model:liveModel,doAction:dispatchAction,actions:CaplinFlexLayout.Actions,DockLocation:CaplinFlexLayout.DockLocation,reset:()=>resetRef.current&&resetRef.current(),getStats:()=>({headerRenders:headerRendersRef.current}),openQuickSwitcher:()=>openQuickSwitcherRef.current&&openQuickSwitcherRef.current()};return(0,dockRegistry_1.registerDock)(id,handle),()=>(0,dockRegistry_1.unregisterDock)(id,handle)},[id,liveModel,syncChannel]);let visibilityRef=(0,react_1.useRef)(visibleTabIds?{visibleTabIds,activeTabId:activeTabId??null}:void 0),visibilityUpdate=currentModel=>{let visibility=(0,visibility_1.getTabVisibility)(currentModel);return(0,visibility_1.sameVisibility)(visibilityRef.current,visibility)?{}:(visibilityRef.current=visibility,visibility)};(0,react_1.useEffect)(()=>{if(!setProps)return;let update=visibilityUpdate(liveModel);update.visibleTabIds&&setProps(update)},[liveModel]);let reportTabResizeRef=(0,react_1.useRef)(reportTabResize);reportTabResizeRef.current=reportTabResize;let setPropsRef=(0,react_1.useRef)(setProps);setPropsRef.current=setProps;let[resizeBatcher]=(0,react_1.useState)(()=>new tabResize_1.TabResizeBatcher(id,resized=>{if(reportTabResizeRef.current&&setPropsRef.current){let rects={};resized.forEach(({tabId,rect})=>{rects[tabId]={width:rect.width,height:rect.height}}),setPropsRef.current({resizedTabs:rects})}}));(0,react_1.useEffect)(()=>{let release=()=>resizeBatcher.release();return window.addEventListener(`pointerup`,release),window.addEventListener(`pointercancel`,release),()=>{window.removeEventListener(`pointerup`,release),window.removeEventListener(`pointercancel`,release),resizeBatcher.dispose()}},[resizeBatcher]);let[splitterDragging,setSplitterDragging]=(0,react_1.useState)(!1),[tabDragging,setTabDragging]=(0,react_1.useState)(!1);(0,react_1.useEffect)(()=>{if(!dragPlaceholders)return;let endSplitterDrag=()=>setSplitterDragging(!1),endTabDrag=()=>setTabDragging(!1);return window.addEventListener(`pointerup`,endSplitterDrag),window.addEventListener(`pointercancel`,endSplitterDrag),window.addEventListener(`dragend`,endTabDrag),window.addEventListener(`drop`,endTabDrag),()=>{window.removeEventListener(`pointerup`,endSplitterDrag),window.removeEventListener(`pointercancel`,endSplitterDrag),window.removeEventListener(`dragend`,endTabDrag),window.removeEventListener(`drop`,endTabDrag)}},[dragPlaceholders]);let onPointerDown=event=>{var _a,_b;resizeBatcher.hold(),dragPlaceholders&&(_b=(_a=event.target).closest)?.call(_a,`.flexlayout__splitter`)&&setSplitterDragging(!0)},onDragStart=()=>{dragPlaceholders&&setTabDragging(!0)};(0,react_1.useEffect)(()=>{let isMounted=!0,validateKey=async()=>{try{if(apiKey){debugMode&&console.log(`DashDock: Validating API key...`);let result=await(0,apiClient_1.checkApiKeyValidity)(apiKey,`DashDock`,sourceTabCount,apiUrl);isMounted&&(setValidation({isValidated:!0,isValid:result.valid,message:result.message}),debugMode&&console.log(`DashDock: API key validation result: ${result.valid?`Valid`:`Invalid`} - ${result.message}`))}else isMounted&&(setValidation({isValidated:!0,isValid:!1,message:`No API key provided`}),exceedsLimit&&debugMode&&console.log(`DashDock: You are using the free version which is limited to 3 tabs. Get an API key for unlimited tabs at https://pip-install-python.com/pip/dash_dock`))}catch(error){console.error(`API validation error:`,error),isMounted&&setValidation({isValidated:!0,isValid:!1,message:`Error validating API key`})}};return validateKey(),()=>{isMounted=!1}},[apiKey,apiUrl,sourceTabCount,exceedsLimit,debugMode]);let reportModel=updatedModel=>{if(!setProps)return;let update=visibilityUpdate(updatedModel);if(useStateForModel)update.visibleTabIds&&setProps(update);else{let json=updatedModel.toJson();echoedModelsRef.current.add(json),setProps({model:json,...update})}},pendingReportRef=(0,react_1.useRef)(null),cancelModelReport=()=>{pendingReportRef.current!==null&&((0,idle_1.cancelIdle)(pendingReportRef.current),pendingReportRef.current=null)},reportModelRef=(0,react_1.useRef)(reportModel);reportModelRef.current=reportModel;let layoutSyncRef=(0,react_1.useRef)(null);(0,react_1.useEffect)(()=>{if(!syncChannel||!layoutSync_1.LayoutSync.isSupported())return;let sync=new layoutSync_1.LayoutSync(syncChannel,action=>liveModel.doAction(action),(action,error)=>{debugMode&&console.warn(`DashDock: could not replay synced action ${action.type}:`,error)}),restoreNodeIds=(0,layoutSync_1.syncNodeIds)(liveModel);return layoutSyncRef.current=sync,()=>{sync.close(),restoreNodeIds(),layoutSyncRef.current=null}},[syncChannel,liveModel]),(0,react_1.useEffect)(()=>cancelModelReport,[liveModel]);let closeListenersRef=(0,react_1.useRef)(/* @__PURE__ */ new Map),tabEvents=(0,react_1.useMemo)(()=>({onClose:(tabId,listener)=>{let listeners=closeListenersRef.current;return listeners.has(tabId)||listeners.set(tabId,/* @__PURE__ */ new Set),listeners.get(tabId).add(listener),()=>{let forTab=listeners.get(tabId);forTab&&(forTab.delete(listener),forTab.size||listeners.delete(tabId))}}}),[]),notifyClosedTabs=updatedModel=>{closeListenersRef.current.forEach((listeners,tabId)=>{updatedModel.getNodeById(tabId)||(closeListenersRef.current.delete(tabId),listeners.forEach(listener=>listener()))})},lastActionRef=(0,react_1.useRef)(null),onModelChange=(updatedModel,action)=>{if(action===lastActionRef.current)return;lastActionRef.current=action;let liveTabCount=(0,tabAnalyzer_1.countModelTabs)(updatedModel);(liveTabCount!==tabCount||!currentLiveTabs)&&setLiveTabs({source:sourceModel,count:liveTabCount,exceeded:exceedsLimit||liveTabCount>freeTabLimit});let tabIndex=tabIndexRef.current;tabIndex&&tabIndex.model===updatedModel&&!(0,tabIndex_1.updateTabIndex)(tabIndex.index,action,updatedModel)&&(tabIndexRef.current=null),closeListenersRef.current.size&&notifyClosedTabs(updatedModel),layoutSyncRef.current&&layoutSyncRef.current.post(action),deferModelUpdates?pendingReportRef.current===null&&(pendingReportRef.current=(0,idle_1.requestIdle)(()=>{pendingReportRef.current=null,reportModelRef.current(updatedModel)},500)):reportModel(updatedModel)},prefetchTimerRef=(0,react_1.useRef)(null),prefetchedRef=(0,react_1.useRef)(prefetchTabId),cancelPrefetch=()=>{prefetchTimerRef.current!==null&&(window.clearTimeout(prefetchTimerRef.current),prefetchTimerRef.current=null)},schedulePrefetch=node=>{cancelPrefetch(),prefetchTimerRef.current=window.setTimeout(()=>{prefetchTimerRef.current=null;let tabId=node.getId();!(0,visibility_1.isTabVisible)(node)&&prefetchedRef.current!==tabId&&setProps&&(prefetchedRef.current=tabId,setProps({prefetchTabId:tabId}))},prefetchDelay)};(0,react_1.useEffect)(()=>cancelPrefetch,[]);let[tabMenu,setTabMenu]=(0,react_1.useState)(null);(0,react_1.useEffect)(()=>setTabMenu(null),[liveModel]);let isVirtualStrip=node=>!!virtualTabStrip&&virtualTabStrip>0&&node.getChildren().length>virtualTabStrip,stripWindowsRef=(0,react_1.useRef)(/* @__PURE__ */ new WeakMap),updateStripWindow=node=>{let children=node.getChildren(),[start,end]=(0,tabStrip_1.tabWindow)(children.length,node.getSelected(),virtualTabStrip),shown=new Set(children.slice(start,end));return stripWindowsRef.current.set(node,shown),shown},openStripMenu=(node,anchor)=>{let tabs=node.getChildren().map((child,index)=>({id:child.getId(),name:child.getName(),index})),tabSearch=new tabStrip_1.TabListSearch(tabs),selected=node.getSelectedNode(),rect=anchor.getBoundingClientRect();setTabMenu({className:`dash-dock-strip-menu`,search:query=>tabSearch.search(query),placeholder:`Search ${tabs.length} tabs`,selectedId:selected?selected.getId():void 0,style:{top:rect.bottom,right:Math.max(0,window.innerWidth-rect.right)}})},tabIndexRef=(0,react_1.useRef)(null),getTabIndex=()=>((!tabIndexRef.current||tabIndexRef.current.model!==liveModel)&&(tabIndexRef.current={model:liveModel,index:tabIndex_1.TabIndex.fromModel(liveModel)}),tabIndexRef.current.index),containerRef=(0,react_1.useRef)(null),openQuickSwitcherRef=(0,react_1.useRef)();openQuickSwitcherRef.current=()=>{let index=getTabIndex(),rect=containerRef.current?containerRef.current.getBoundingClientRect():{top:0,left:0,width:window.innerWidth},active=liveModel.getActiveTabset(),selected=active?active.getSelectedNode():void 0;setTabMenu({className:`dash-dock-quick-switcher`,search:query=>index.search(query),placeholder:`Go to tab (${index.size} tabs)`,selectedId:selected?selected.getId():void 0,style:{top:rect.top+40,left:rect.left+rect.width/2}})},(0,react_1.useEffect)(()=>{if(!quickSwitcher)return;let onKeyDown=e=>{if(!(e.ctrlKey||e.metaKey)||e.shiftKey||e.altKey||e.key.toLowerCase()!==`k`)return;let target=e.target instanceof Element?e.target:null,dock=target&&target.closest(`.dash-dock-container`)||document.querySelector(`.dash-dock-container[data-quick-switcher]`);dock&&dock===containerRef.current&&openQuickSwitcherRef.current&&(e.preventDefault(),openQuickSwitcherRef.current())};return window.addEventListener(`keydown`,onKeyDown),()=>window.removeEventListener(`keydown`,onKeyDown)},[quickSwitcher]);let selectFromTabMenu=tabId=>{setTabMenu(null);let node=liveModel.getNodeById(tabId);!node||(0,visibility_1.isTabVisible)(node)&&node.getParent()instanceof flexlayout_react_1.BorderNode||dispatchAction(CaplinFlexLayout.Actions.selectTab(tabId))},onRenderTabSet=(node,renderValues)=>{isVirtualStrip(node)&&(updateStripWindow(node),renderValues.buttons.push(react_1.default.createElement(`button`,{key:`dash-dock-strip-menu`,className:`dash-dock-strip-menu-button`,title:`All tabs`,onPointerDown:e=>e.stopPropagation(),onClick:e=>openStripMenu(node,e.currentTarget)},node.getChildren().length)))},onShowOverflowMenu=(node,mouseEvent)=>openStripMenu(node,mouseEvent.target),headerCacheRef=(0,react_1.useRef)(/* @__PURE__ */ new Map),headerRendersRef=(0,react_1.useRef)(0),onRenderTab=(node,renderValues)=>{let parent=node.getParent();if(parent&&isVirtualStrip(parent)&&!(stripWindowsRef.current.get(parent)||updateStripWindow(parent)).has(node)){renderValues.leading=null,renderValues.content=react_1.default.createElement(`span`,{className:`dash-dock-tab-virtual`}),renderValues.buttons.length=0;return}let tabId=node.getId(),header=headers?headers[tabId]:void 0,spec=headerSpecs?headerSpecs[tabId]:void 0;if(!header&&!spec)headerCacheRef.current.delete(tabId);else{let key=headerKey(header),name=node.getName(),cached=headerCacheRef.current.get(tabId);(!cached||cached.key!==key||cached.spec!==spec||cached.name!==name)&&(headerRendersRef.current++,cached={key,spec,name,...renderHeader(header,spec,name)},headerCacheRef.current.set(tabId,cached)),cached.leading&&(renderValues.leading=cached.leading),cached.content!==void 0&&(renderValues.content=cached.content)}prefetchDelay&&setProps&&(renderValues.content=react_1.default.createElement(`span`,{className:`dash-dock-tab-label`,onPointerEnter:()=>schedulePrefetch(node),onPointerLeave:cancelPrefetch},renderValues.content))},factory=node=>{let matchedChildren=getMatchingChildren(children,node);return react_1.default.createElement(TabContent,{node,resizeBatcher},matchedChildren)},isLoading=loading_state?.is_loading||!1;return(0,react_1.useEffect)(()=>{modelLimited&&!isLoading&&debugMode&&console.warn(`DashDock: Your layout has been limited to 3 tabs because you are using the free version. Get an API key for unlimited tabs at https://pip-install-python.com/pip/dash_dock`)},[modelLimited,isLoading,debugMode]),react_1.default.createElement(`div`,{id,ref:containerRef,className:`dash-dock-container dash-dock-${currentTheme}`+(tabContainment?` dash-dock-contained`:``),style,"data-quick-switcher":quickSwitcher?``:void 0,onPointerDownCapture:onPointerDown,onDragStart},validation.isValid&&debugMode&&react_1.default.createElement(`div`,{className:`dashdock-premium-indicator`},`DashDock Premium`),react_1.default.createElement(TabEventsContext_1.default.Provider,{value:tabEvents},react_1.default.createElement(DraggingContext.Provider,{value:!!dragPlaceholders&&(splitterDragging||tabDragging)},react_1.default.createElement(flexlayout_react_1.Layout,{model:liveModel,factory,onModelChange,onAction:syncChannel?layoutSync_1.withSyncedIds:void 0,onRenderTab,onRenderTabSet:virtualTabStrip?onRenderTabSet:void 0,onShowOverflowMenu:virtualTabStrip?onShowOverflowMenu:void 0,popoutURL:popoutURL||(0,popout_1.defaultPopoutURL)(),...restProps}))),tabMenu&&react_1.default.createElement(TabMenu_1.default,{...tabMenu,onSelect:selectFromTabMenu,onClose:()=>setTabMenu(null)}),!validation.isValid&&exceedsLimit&&modelLimited&&react_1.default.createElement(`div`,{className:`dashdock-free-indicator`},`DashDock Free (Limited to `,freeTabLimit,` tabs)`))};exports.default=DashDock},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__exportStar=this&&this.__exportStar||function(m,exports){for(var p in m)p!==`default`&&!Object.prototype.hasOwnProperty.call(exports,p)&&__createBinding(exports,m,p)};Object.defineProperty(exports,`__esModule`,{value:!0}),__exportStar(require(10),exports),__exportStar(require(19),exports),__exportStar(require(18),exports),__exportStar(require(20),exports),__exportStar(require(25),exports),__exportStar(require(37),exports),__exportStar(require(24),exports),__exportStar(require(27),exports),__exportStar(require(26),exports),__exportStar(require(30),exports),__exportStar(require(28),exports),__exportStar(require(13),exports),__exportStar(require(23),exports),__exportStar(require(16),exports),__exportStar(require(14),exports),__exportStar(require(15),exports),__exportStar(require(17),exports)},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.FlexLayoutVersion=exports.LayoutInternal=exports.Layout=void 0;let React=__importStar(require(6)),react_dom_1=require(11),client_1=require(12),DockLocation_1=require(13),I18nLabel_1=require(16),Orientation_1=require(14),Rect_1=require(15),Types_1=require(17),Actions_1=require(18),BorderNode_1=require(20),Model_1=require(24),TabNode_1=require(30),TabSetNode_1=require(28),BorderTab_1=require(33),BorderTabSet_1=require(35),DragContainer_1=require(41),ErrorBoundary_1=require(42),PopoutWindow_1=require(43),Icons_1=require(44),Overlay_1=require(45),Row_1=require(46),Tab_1=require(49),Utils_1=require(29),TabButtonStamp_1=require(39),SizeTracker_1=require(50);class Layout extends React.Component{constructor(props){super(props),this.selfRef=React.createRef(),this.revision=0}redraw(){this.selfRef.current.redraw(`parent `+this.revision)}addTabToTabSet(tabsetId,json){return this.selfRef.current.addTabToTabSet(tabsetId,json)}addTabWithDragAndDrop(event,json,onDrop){this.selfRef.current.addTabWithDragAndDrop(event,json,onDrop)}moveTabWithDragAndDrop(event,node){this.selfRef.current.moveTabWithDragAndDrop(event,node)}addTabToActiveTabSet(json){return this.selfRef.current.addTabToActiveTabSet(json)}setDragComponent(event,component,x,y){this.selfRef.current.setDragComponent(event,component,x,y)}getRootDiv(){return this.selfRef.current.getRootDiv()}render(){return React.createElement(LayoutInternal,Object.assign({ref:this.selfRef},this.props,{renderRevision:this.revision++}))}}exports.Layout=Layout;class LayoutInternal extends React.Component{constructor(props){super(props),this.moveableElementMap=/* @__PURE__ */ new Map,this.dragEnterCount=0,this.dragging=!1,this.updateLayoutMetrics=()=>{if(this.findBorderBarSizeRef.current){let borderBarSize=this.findBorderBarSizeRef.current.getBoundingClientRect().height;borderBarSize!==this.state.calculatedBorderBarSize&&this.setState({calculatedBorderBarSize:borderBarSize})}},this.onModelChange=action=>{this.redrawInternal(`model change`),this.props.onModelChange&&this.props.onModelChange(this.props.model,action)},this.updateRect=()=>{let rect=this.getDomRect();!rect.equals(this.state.rect)&&rect.width!==0&&rect.height!==0&&(this.setState({rect}),this.windowId!==Model_1.Model.MAIN_WINDOW_ID&&this.redrawInternal(`rect updated`))},this.getClassName=defaultClassName=>this.props.classNameMapper===void 0?defaultClassName:this.props.classNameMapper(defaultClassName),this.onCloseWindow=windowLayout=>{this.doAction(Actions_1.Actions.closeWindow(windowLayout.windowId))},this.onSetWindow=(windowLayout,window)=>{},this.showControlInPortal=(control,element)=>{let portal=(0,react_dom_1.createPortal)(control,element);this.setState({portal})},this.hideControlInPortal=()=>{this.setState({portal:void 0})},this.getIcons=()=>this.icons,this.setDragNode=(event,node)=>{if(LayoutInternal.dragState=new DragState(this.mainLayout,DragSource.Internal,node,void 0,void 0),event.dataTransfer.setData(`text/plain`,`--flexlayout--`),event.dataTransfer.effectAllowed=`copyMove`,event.dataTransfer.dropEffect=`move`,this.dragEnterCount=0,node instanceof TabSetNode_1.TabSetNode){let rendered=!1,content=this.i18nName(I18nLabel_1.I18nLabel.Move_Tabset);if(node.getChildren().length>0&&(content=this.i18nName(I18nLabel_1.I18nLabel.Move_Tabs).replace(`?`,String(node.getChildren().length))),this.props.onRenderDragRect){let dragComponent=this.props.onRenderDragRect(content,node,void 0);dragComponent&&(this.setDragComponent(event,dragComponent,10,10),rendered=!0)}rendered||this.setDragComponent(event,content,10,10)}else{let rect=event.target.getBoundingClientRect(),offsetX=event.clientX-rect.left,offsetY=event.clientY-rect.top,parentNode=node?.getParent(),isInVerticalBorder=parentNode instanceof BorderNode_1.BorderNode&&parentNode.getOrientation()===Orientation_1.Orientation.HORZ,x=isInVerticalBorder?10:offsetX,y=isInVerticalBorder?10:offsetY,rendered=!1;if(this.props.onRenderDragRect){let content=React.createElement(TabButtonStamp_1.TabButtonStamp,{key:node.getId(),layout:this,node}),dragComponent=this.props.onRenderDragRect(content,node,void 0);dragComponent&&(this.setDragComponent(event,dragComponent,x,y),rendered=!0)}rendered||((0,Utils_1.isSafari)()?this.setDragComponent(event,React.createElement(TabButtonStamp_1.TabButtonStamp,{node,layout:this}),x,y):event.dataTransfer.setDragImage(node.getTabStamp(),x,y))}},this.onDragEnterRaw=event=>{this.dragEnterCount++,this.dragEnterCount===1&&this.onDragEnter(event)},this.onDragLeaveRaw=event=>{this.dragEnterCount--,this.dragEnterCount===0&&this.onDragLeave(event)},this.onDragEnter=event=>{var _a;if(!LayoutInternal.dragState&&this.props.onExternalDrag){let externalDrag=this.props.onExternalDrag(event);if(externalDrag){let tempNode=TabNode_1.TabNode.fromJson(externalDrag.json,this.props.model,!1);LayoutInternal.dragState=new DragState(this.mainLayout,DragSource.External,tempNode,externalDrag.json,externalDrag.onDrop)}}if(LayoutInternal.dragState){if(this.windowId!==Model_1.Model.MAIN_WINDOW_ID&&LayoutInternal.dragState.mainLayout===this.mainLayout&&LayoutInternal.dragState.mainLayout.setDraggingOverWindow(!0),LayoutInternal.dragState.mainLayout!==this.mainLayout)return;event.preventDefault(),this.dropInfo=void 0;let rootdiv=this.selfRef.current;this.outlineDiv=this.currentDocument.createElement(`div`),this.outlineDiv.className=this.getClassName(Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT),this.outlineDiv.style.visibility=`hidden`;let speed=this.props.model.getAttribute(`tabDragSpeed`);this.outlineDiv.style.transition=`top ${speed}s, left ${speed}s, width ${speed}s, height ${speed}s`,rootdiv.appendChild(this.outlineDiv),this.dragging=!0,this.showOverlay(!0),!this.isDraggingOverWindow&&this.props.model.getMaximizedTabset(this.windowId)===void 0&&this.setState({showEdges:this.props.model.isEnableEdgeDock()});let clientRect=(_a=this.selfRef.current)?.getBoundingClientRect();new Rect_1.Rect(event.clientX-clientRect.left,event.clientY-clientRect.top,1,1).positionElement(this.outlineDiv)}},this.onDragOver=event=>{var _a,_b,_c;if(this.dragging&&!this.isDraggingOverWindow){event.preventDefault();let clientRect=(_a=this.selfRef.current)?.getBoundingClientRect(),pos={x:event.clientX-((_b=clientRect?.left)??0),y:event.clientY-((_c=clientRect?.top)??0)};this.checkForBorderToShow(pos.x,pos.y);let dropInfo=this.props.model.findDropTargetNode(this.windowId,LayoutInternal.dragState.dragNode,pos.x,pos.y);dropInfo&&(this.dropInfo=dropInfo,this.outlineDiv&&(this.outlineDiv.className=this.getClassName(dropInfo.className),dropInfo.rect.positionElement(this.outlineDiv),this.outlineDiv.style.visibility=`visible`))}},this.onDragLeave=event=>{this.dragging&&(this.windowId!==Model_1.Model.MAIN_WINDOW_ID&&LayoutInternal.dragState.mainLayout.setDraggingOverWindow(!1),this.clearDragLocal())},this.onDrop=event=>{if(this.dragging){event.preventDefault();let dragState=LayoutInternal.dragState;if(this.dropInfo)if(dragState.dragJson!==void 0){let newNode=this.doAction(Actions_1.Actions.addNode(dragState.dragJson,this.dropInfo.node.getId(),this.dropInfo.location,this.dropInfo.index));dragState.fnNewNodeDropped!==void 0&&dragState.fnNewNodeDropped(newNode,event)}else dragState.dragNode!==void 0&&this.doAction(Actions_1.Actions.moveNode(dragState.dragNode.getId(),this.dropInfo.node.getId(),this.dropInfo.location,this.dropInfo.index));this.mainLayout.clearDragMain()}this.dragEnterCount=0},this.orderedIds=[],this.selfRef=React.createRef(),this.moveablesRef=React.createRef(),this.mainRef=React.createRef(),this.findBorderBarSizeRef=React.createRef(),this.supportsPopout=props.supportsPopout===void 0?defaultSupportsPopout:props.supportsPopout,this.popoutURL=props.popoutURL?props.popoutURL:`popout.html`,this.icons=Object.assign(Object.assign({},defaultIcons),props.icons),this.windowId=props.windowId?props.windowId:Model_1.Model.MAIN_WINDOW_ID,this.mainLayout=this.props.mainLayout?this.props.mainLayout:this,this.isDraggingOverWindow=!1,this.layoutWindow=this.props.model.getwindowsMap().get(this.windowId),this.layoutWindow.layout=this,this.popoutWindowName=this.props.popoutWindowName||`Popout Window`,this.state={rect:Rect_1.Rect.empty(),editingTab:void 0,showEdges:!1,showOverlay:!1,calculatedBorderBarSize:29,layoutRevision:0,forceRevision:0,showHiddenBorder:DockLocation_1.DockLocation.CENTER},this.isMainWindow=this.windowId===Model_1.Model.MAIN_WINDOW_ID}componentDidMount(){if(this.updateRect(),this.currentDocument=this.selfRef.current.ownerDocument,this.currentWindow=this.currentDocument.defaultView,this.layoutWindow.window=this.currentWindow,this.layoutWindow.toScreenRectFunction=r=>this.getScreenRect(r),this.resizeObserver=new ResizeObserver(entries=>{requestAnimationFrame(()=>{this.updateRect()})}),this.selfRef.current&&this.resizeObserver.observe(this.selfRef.current),this.isMainWindow)this.props.model.addChangeListener(this.onModelChange),this.updateLayoutMetrics();else{this.currentWindow.addEventListener(`resize`,()=>{this.updateRect()});let sourceElement=this.props.mainLayout.getRootDiv(),targetElement=this.selfRef.current;(0,Utils_1.copyInlineStyles)(sourceElement,targetElement),this.styleObserver=new MutationObserver(()=>{(0,Utils_1.copyInlineStyles)(sourceElement,targetElement)&&this.redraw(`mutation observer`)}),this.styleObserver.observe(sourceElement,{attributeFilter:[`style`]})}document.addEventListener(`visibilitychange`,()=>{for(let[_,layoutWindow]of this.props.model.getwindowsMap())layoutWindow.layout&&this.redraw(`visibility change`)})}componentDidUpdate(){this.currentDocument=this.selfRef.current.ownerDocument,this.currentWindow=this.currentDocument.defaultView,this.isMainWindow&&(this.props.model!==this.previousModel&&(this.previousModel!==void 0&&this.previousModel.removeChangeListener(this.onModelChange),this.props.model.getwindowsMap().get(this.windowId).layout=this,this.props.model.addChangeListener(this.onModelChange),this.layoutWindow=this.props.model.getwindowsMap().get(this.windowId),this.layoutWindow.layout=this,this.layoutWindow.toScreenRectFunction=r=>this.getScreenRect(r),this.previousModel=this.props.model,this.tidyMoveablesMap()),this.updateLayoutMetrics())}componentWillUnmount(){var _a,_b;this.selfRef.current&&(_a=this.resizeObserver)?.unobserve(this.selfRef.current),(_b=this.styleObserver)?.disconnect()}render(){if(!this.selfRef.current)return React.createElement(`div`,{ref:this.selfRef,className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT)},React.createElement(`div`,{ref:this.moveablesRef,key:`__moveables__`,className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_MOVEABLES)}),this.renderMetricsElements());let model=this.props.model;model.getRoot(this.windowId).calcMinMaxSize(),model.getRoot(this.windowId).setPaths(``),model.getBorderSet().setPaths();let inner=this.renderLayout(),outer=this.renderBorders(inner),tabs=this.renderTabs(),reorderedTabs=this.reorderComponents(tabs,this.orderedIds),floatingWindows=null,tabMoveables=null,tabStamps=null,metricElements=null;return this.isMainWindow&&(floatingWindows=this.renderWindows(),metricElements=this.renderMetricsElements(),tabMoveables=this.renderTabMoveables(),tabStamps=React.createElement(`div`,{key:`__tabStamps__`,className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_TAB_STAMPS)},this.renderTabStamps())),React.createElement(`div`,{ref:this.selfRef,className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT),onDragEnter:this.onDragEnterRaw,onDragLeave:this.onDragLeaveRaw,onDragOver:this.onDragOver,onDrop:this.onDrop},React.createElement(`div`,{ref:this.moveablesRef,key:`__moveables__`,className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_MOVEABLES)}),metricElements,React.createElement(Overlay_1.Overlay,{key:`__overlay__`,layout:this,show:this.state.showOverlay}),outer,reorderedTabs,tabMoveables,tabStamps,this.state.portal,floatingWindows)}renderBorders(inner){let classMain=this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_MAIN),borders=this.props.model.getBorderSet().getBorderMap();if(this.isMainWindow&&borders.size>0){inner=React.createElement(`div`,{className:classMain,ref:this.mainRef},inner);let borderSetComponents=/* @__PURE__ */ new Map,borderSetContentComponents=/* @__PURE__ */ new Map;for(let[_,location]of DockLocation_1.DockLocation.values){let border=borders.get(location);border&&border.isShowing()&&(!border.isAutoHide()||border.isAutoHide()&&(border.getChildren().length>0||this.state.showHiddenBorder===location))&&(borderSetComponents.set(location,React.createElement(BorderTabSet_1.BorderTabSet,{layout:this,border,size:this.state.calculatedBorderBarSize})),borderSetContentComponents.set(location,React.createElement(BorderTab_1.BorderTab,{layout:this,border,show:border.getSelected()!==-1})))}let classBorderOuter=this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_BORDER_CONTAINER),classBorderInner=this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_BORDER_CONTAINER_INNER);if(this.props.model.getBorderSet().getLayoutHorizontal()){let innerWithBorderTabs=React.createElement(`div`,{className:classBorderInner,style:{flexDirection:`column`}},borderSetContentComponents.get(DockLocation_1.DockLocation.TOP),React.createElement(`div`,{className:classBorderInner,style:{flexDirection:`row`}},borderSetContentComponents.get(DockLocation_1.DockLocation.LEFT),inner,borderSetContentComponents.get(DockLocation_1.DockLocation.RIGHT)),borderSetContentComponents.get(DockLocation_1.DockLocation.BOTTOM));return React.createElement(`div`,{className:classBorderOuter,style:{flexDirection:`column`}},borderSetComponents.get(DockLocation_1.DockLocation.TOP),React.createElement(`div`,{className:classBorderInner,style:{flexDirection:`row`}},borderSetComponents.get(DockLocation_1.DockLocation.LEFT),innerWithBorderTabs,borderSetComponents.get(DockLocation_1.DockLocation.RIGHT)),borderSetComponents.get(DockLocation_1.DockLocation.BOTTOM))}else{let innerWithBorderTabs=React.createElement(`div`,{className:classBorderInner,style:{flexDirection:`row`}},borderSetContentComponents.get(DockLocation_1.DockLocation.LEFT),React.createElement(`div`,{className:classBorderInner,style:{flexDirection:`column`}},borderSetContentComponents.get(DockLocation_1.DockLocation.TOP),inner,borderSetContentComponents.get(DockLocation_1.DockLocation.BOTTOM)),borderSetContentComponents.get(DockLocation_1.DockLocation.RIGHT));return React.createElement(`div`,{className:classBorderOuter,style:{flexDirection:`row`}},borderSetComponents.get(DockLocation_1.DockLocation.LEFT),React.createElement(`div`,{className:classBorderInner,style:{flexDirection:`column`}},borderSetComponents.get(DockLocation_1.DockLocation.TOP),innerWithBorderTabs,borderSetComponents.get(DockLocation_1.DockLocation.BOTTOM)),borderSetComponents.get(DockLocation_1.DockLocation.RIGHT))}}else return React.createElement(`div`,{className:classMain,ref:this.mainRef,style:{position:`absolute`,top:0,left:0,bottom:0,right:0,display:`flex`}},inner)}renderLayout(){return React.createElement(React.Fragment,null,React.createElement(Row_1.Row,{key:`__row__`,layout:this,node:this.props.model.getRoot(this.windowId)}),this.renderEdgeIndicators())}renderEdgeIndicators(){let edges=[],arrowIcon=this.icons.edgeArrow;if(this.state.showEdges){let r=this.props.model.getRoot(this.windowId).getRect(),length=edgeRectLength,width=edgeRectWidth,offset=edgeRectLength/2,className=this.getClassName(Types_1.CLASSES.FLEXLAYOUT__EDGE_RECT),radius=50;edges.push(React.createElement(`div`,{key:`North`,style:{top:0,left:r.width/2-offset,width:length,height:width,borderBottomLeftRadius:50,borderBottomRightRadius:50},className:className+` `+this.getClassName(Types_1.CLASSES.FLEXLAYOUT__EDGE_RECT_TOP)},React.createElement(`div`,{style:{transform:`rotate(180deg)`}},arrowIcon))),edges.push(React.createElement(`div`,{key:`West`,style:{top:r.height/2-offset,left:0,width,height:length,borderTopRightRadius:50,borderBottomRightRadius:50},className:className+` `+this.getClassName(Types_1.CLASSES.FLEXLAYOUT__EDGE_RECT_LEFT)},React.createElement(`div`,{style:{transform:`rotate(90deg)`}},arrowIcon))),edges.push(React.createElement(`div`,{key:`South`,style:{top:r.height-width,left:r.width/2-offset,width:length,height:width,borderTopLeftRadius:50,borderTopRightRadius:50},className:className+` `+this.getClassName(Types_1.CLASSES.FLEXLAYOUT__EDGE_RECT_BOTTOM)},React.createElement(`div`,null,arrowIcon))),edges.push(React.createElement(`div`,{key:`East`,style:{top:r.height/2-offset,left:r.width-width,width,height:length,borderTopLeftRadius:50,borderBottomLeftRadius:50},className:className+` `+this.getClassName(Types_1.CLASSES.FLEXLAYOUT__EDGE_RECT_RIGHT)},React.createElement(`div`,{style:{transform:`rotate(-90deg)`}},arrowIcon)))}return edges}renderWindows(){let floatingWindows=[];if(this.supportsPopout){let windows=this.props.model.getwindowsMap(),i=1;for(let[windowId,layoutWindow]of windows)windowId!==Model_1.Model.MAIN_WINDOW_ID&&(floatingWindows.push(React.createElement(PopoutWindow_1.PopoutWindow,{key:windowId,layout:this,title:this.popoutWindowName+` `+i,layoutWindow,url:this.popoutURL+`?id=`+windowId,onSetWindow:this.onSetWindow,onCloseWindow:this.onCloseWindow},React.createElement(LayoutInternal,Object.assign({},this.props,{windowId,mainLayout:this})))),i++)}return floatingWindows}renderTabMoveables(){let tabMoveables=[];return this.props.model.visitNodes(node=>{if(node instanceof TabNode_1.TabNode){let child=node,element=this.getMoveableElement(child.getId());child.setMoveableElement(element);let selected=child.isSelected(),rect=child.getParent().getContentRect(),renderTab=child.isRendered()||(selected||!child.isEnableRenderOnDemand())&&rect.width>0&&rect.height>0;if(renderTab){let key=child.getId()+(child.isEnableWindowReMount()?child.getWindowId():``);tabMoveables.push((0,react_dom_1.createPortal)(React.createElement(SizeTracker_1.SizeTracker,{rect,selected:child.isSelected(),forceRevision:this.state.forceRevision,tabsRevision:this.props.renderRevision,key},React.createElement(ErrorBoundary_1.ErrorBoundary,{message:this.i18nName(I18nLabel_1.I18nLabel.Error_rendering_component)},this.props.factory(child))),element,key)),child.setRendered(renderTab)}}}),tabMoveables}renderTabStamps(){let tabStamps=[];return this.props.model.visitNodes(node=>{if(node instanceof TabNode_1.TabNode){let child=node;tabStamps.push(React.createElement(DragContainer_1.DragContainer,{key:child.getId(),layout:this,node:child}))}}),tabStamps}renderTabs(){let tabs=/* @__PURE__ */ new Map;return this.props.model.visitWindowNodes(this.windowId,node=>{if(node instanceof TabNode_1.TabNode){let child=node,selected=child.isSelected(),path=child.getPath();(child.isRendered()||selected||!child.isEnableRenderOnDemand())&&tabs.set(child.getId(),React.createElement(Tab_1.Tab,{key:child.getId(),layout:this,path,node:child,selected}))}}),tabs}renderMetricsElements(){return React.createElement(`div`,{key:`findBorderBarSize`,ref:this.findBorderBarSizeRef,className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__BORDER_SIZER)},`FindBorderBarSize`)}checkForBorderToShow(x,y){let r=this.getBoundingClientRect(this.mainRef.current),c=r.getCenter(),margin=edgeRectWidth,offset=edgeRectLength/2,overEdge=!1;this.props.model.isEnableEdgeDock()&&this.state.showHiddenBorder===DockLocation_1.DockLocation.CENTER&&(y>c.y-offset&&y<c.y+offset||x>c.x-offset&&x<c.x+offset)&&(overEdge=!0);let location=DockLocation_1.DockLocation.CENTER;overEdge||(x<=r.x+margin?location=DockLocation_1.DockLocation.LEFT:x>=r.getRight()-margin?location=DockLocation_1.DockLocation.RIGHT:y<=r.y+margin?location=DockLocation_1.DockLocation.TOP:y>=r.getBottom()-margin&&(location=DockLocation_1.DockLocation.BOTTOM)),location!==this.state.showHiddenBorder&&this.setState({showHiddenBorder:location})}tidyMoveablesMap(){let tabs=/* @__PURE__ */ new Map;this.props.model.visitNodes((node,_)=>{node instanceof TabNode_1.TabNode&&tabs.set(node.getId(),node)});for(let[nodeId,element]of this.moveableElementMap)tabs.has(nodeId)||(element.remove(),this.moveableElementMap.delete(nodeId))}reorderComponents(components,ids){let nextIds=[],nextIdsSet=/* @__PURE__ */ new Set,reordered=[];for(let id of ids)components.get(id)&&(nextIds.push(id),nextIdsSet.add(id));ids.splice(0,ids.length,...nextIds);for(let[id,_]of components)nextIdsSet.has(id)||ids.push(id);return reordered=ids.map(id=>components.get(id)),reordered}redraw(type){this.mainLayout.setState((state,props)=>({forceRevision:state.forceRevision+1}))}redrawInternal(type){this.mainLayout.setState((state,props)=>({layoutRevision:state.layoutRevision+1}))}doAction(action){if(this.props.onAction!==void 0){let outcome=this.props.onAction(action);return outcome===void 0?void 0:this.props.model.doAction(outcome)}else return this.props.model.doAction(action)}getBoundingClientRect(div){let layoutRect=this.getDomRect();return layoutRect?Rect_1.Rect.getBoundingClientRect(div).relativeTo(layoutRect):Rect_1.Rect.empty()}getMoveableContainer(){return this.moveablesRef.current}getMoveableElement(id){let moveableElement=this.moveableElementMap.get(id);return moveableElement===void 0&&(moveableElement=document.createElement(`div`),this.moveablesRef.current.appendChild(moveableElement),moveableElement.className=Types_1.CLASSES.FLEXLAYOUT__TAB_MOVEABLE,this.moveableElementMap.set(id,moveableElement)),moveableElement}getMainLayout(){return this.mainLayout}getCurrentDocument(){return this.currentDocument}getDomRect(){return this.selfRef.current?Rect_1.Rect.fromDomRect(this.selfRef.current.getBoundingClientRect()):Rect_1.Rect.empty()}getWindowId(){return this.windowId}getRootDiv(){return this.selfRef.current}getMainElement(){return this.mainRef.current}getFactory(){return this.props.factory}isSupportsPopout(){return this.supportsPopout}isRealtimeResize(){var _a;return(_a=this.props.realtimeResize)??!1}getPopoutURL(){return this.popoutURL}setEditingTab(tabNode){this.setState({editingTab:tabNode})}getEditingTab(){return this.state.editingTab}getModel(){return this.props.model}getScreenRect(inRect){let rect=inRect.clone(),layoutRect=this.getDomRect(),navHeight=60,navWidth=2;return rect.x=this.currentWindow.screenX+this.currentWindow.scrollX+2/2+layoutRect.x+rect.x,rect.y=this.currentWindow.screenY+this.currentWindow.scrollY+(60-2/2)+layoutRect.y+rect.y,rect.height+=60,rect.width+=2,rect}addTabToTabSet(tabsetId,json){if(this.props.model.getNodeById(tabsetId)!==void 0)return this.doAction(Actions_1.Actions.addNode(json,tabsetId,DockLocation_1.DockLocation.CENTER,-1))}addTabToActiveTabSet(json){let tabsetNode=this.props.model.getActiveTabset(this.windowId);if(tabsetNode!==void 0)return this.doAction(Actions_1.Actions.addNode(json,tabsetNode.getId(),DockLocation_1.DockLocation.CENTER,-1))}maximize(tabsetNode){this.doAction(Actions_1.Actions.maximizeToggle(tabsetNode.getId(),this.getWindowId()))}customizeTab(tabNode,renderValues){this.props.onRenderTab&&this.props.onRenderTab(tabNode,renderValues)}customizeTabSet(tabSetNode,renderValues){this.props.onRenderTabSet&&this.props.onRenderTabSet(tabSetNode,renderValues)}i18nName(id,param){let message;return this.props.i18nMapper&&(message=this.props.i18nMapper(id,param)),message===void 0&&(message=id+(param===void 0?``:param)),message}getShowOverflowMenu(){return this.props.onShowOverflowMenu}getTabSetPlaceHolderCallback(){return this.props.onTabSetPlaceHolder}showContextMenu(node,event){this.props.onContextMenu&&this.props.onContextMenu(node,event)}auxMouseClick(node,event){this.props.onAuxMouseClick&&this.props.onAuxMouseClick(node,event)}showOverlay(show){this.setState({showOverlay:show}),(0,Utils_1.enablePointerOnIFrames)(!show,this.currentDocument)}addTabWithDragAndDrop(event,json,onDrop){let tempNode=TabNode_1.TabNode.fromJson(json,this.props.model,!1);LayoutInternal.dragState=new DragState(this.mainLayout,DragSource.Add,tempNode,json,onDrop)}moveTabWithDragAndDrop(event,node){this.setDragNode(event,node)}setDragComponent(event,component,x,y){let dragElement=React.createElement(`div`,{style:{position:`unset`},className:this.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT)+` `+this.getClassName(Types_1.CLASSES.FLEXLAYOUT__DRAG_RECT)},component),tempDiv=this.currentDocument.createElement(`div`);tempDiv.setAttribute(`data-layout-path`,`/drag-rectangle`),tempDiv.style.position=`absolute`,tempDiv.style.left=`-10000px`,tempDiv.style.top=`-10000px`,this.currentDocument.body.appendChild(tempDiv),(0,client_1.createRoot)(tempDiv).render(dragElement),event.dataTransfer.setDragImage(tempDiv,x,y),setTimeout(()=>{this.currentDocument.body.removeChild(tempDiv)},0)}setDraggingOverWindow(overWindow){this.isDraggingOverWindow!==overWindow&&(this.outlineDiv&&(this.outlineDiv.style.visibility=overWindow?`hidden`:`visible`),overWindow?this.setState({showEdges:!1}):this.props.model.getMaximizedTabset(this.windowId)===void 0&&this.setState({showEdges:this.props.model.isEnableEdgeDock()}),this.isDraggingOverWindow=overWindow)}clearDragMain(){LayoutInternal.dragState=void 0,this.windowId===Model_1.Model.MAIN_WINDOW_ID&&(this.isDraggingOverWindow=!1);for(let[,layoutWindow]of this.props.model.getwindowsMap())layoutWindow.layout.clearDragLocal()}clearDragLocal(){this.setState({showEdges:!1}),this.showOverlay(!1),this.dragEnterCount=0,this.dragging=!1,this.outlineDiv&&=(this.selfRef.current.removeChild(this.outlineDiv),void 0)}}exports.LayoutInternal=LayoutInternal,LayoutInternal.dragState=void 0,exports.FlexLayoutVersion=`0.8.1`;let defaultIcons={close:React.createElement(Icons_1.CloseIcon,null),closeTabset:React.createElement(Icons_1.CloseIcon,null),popout:React.createElement(Icons_1.PopoutIcon,null),maximize:React.createElement(Icons_1.MaximizeIcon,null),restore:React.createElement(Icons_1.RestoreIcon,null),more:React.createElement(Icons_1.OverflowIcon,null),edgeArrow:React.createElement(Icons_1.EdgeIcon,null),activeTabset:React.createElement(Icons_1.AsterickIcon,null)};var DragSource;(function(DragSource){DragSource.Internal=`internal`,DragSource.External=`external`,DragSource.Add=`add`})(DragSource||={});let defaultSupportsPopout=(0,Utils_1.isDesktop)(),edgeRectLength=100,edgeRectWidth=10;class DragState{constructor(mainLayout,dragSource,dragNode,dragJson,fnNewNodeDropped){this.mainLayout=mainLayout,this.dragSource=dragSource,this.dragNode=dragNode,this.dragJson=dragJson,this.fnNewNodeDropped=fnNewNodeDropped}}},function(require,module,exports){module.exports=window.ReactDOM},function(require,module,exports){var m=require(11);if(1)exports.createRoot=m.createRoot,exports.hydrateRoot=m.hydrateRoot;else var i},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.DockLocation=void 0;let Orientation_1=require(14),Rect_1=require(15);class DockLocation{static getByName(name){return DockLocation.values.get(name)}static getLocation(rect,x,y){if(x=(x-rect.x)/rect.width,y=(y-rect.y)/rect.height,x>=.25&&x<.75&&y>=.25&&y<.75)return DockLocation.CENTER;let bl=y>=x,br=y>=1-x;return bl?br?DockLocation.BOTTOM:DockLocation.LEFT:br?DockLocation.RIGHT:DockLocation.TOP}constructor(_name,_orientation,_indexPlus){this.name=_name,this.orientation=_orientation,this.indexPlus=_indexPlus,DockLocation.values.set(this.name,this)}getName(){return this.name}getOrientation(){return this.orientation}getDockRect(r){return this===DockLocation.TOP?new Rect_1.Rect(r.x,r.y,r.width,r.height/2):this===DockLocation.BOTTOM?new Rect_1.Rect(r.x,r.getBottom()-r.height/2,r.width,r.height/2):this===DockLocation.LEFT?new Rect_1.Rect(r.x,r.y,r.width/2,r.height):this===DockLocation.RIGHT?new Rect_1.Rect(r.getRight()-r.width/2,r.y,r.width/2,r.height):r.clone()}split(rect,size){return this===DockLocation.TOP?{start:new Rect_1.Rect(rect.x,rect.y,rect.width,size),end:new Rect_1.Rect(rect.x,rect.y+size,rect.width,rect.height-size)}:this===DockLocation.LEFT?{start:new Rect_1.Rect(rect.x,rect.y,size,rect.height),end:new Rect_1.Rect(rect.x+size,rect.y,rect.width-size,rect.height)}:this===DockLocation.RIGHT?{start:new Rect_1.Rect(rect.getRight()-size,rect.y,size,rect.height),end:new Rect_1.Rect(rect.x,rect.y,rect.width-size,rect.height)}:{start:new Rect_1.Rect(rect.x,rect.getBottom()-size,rect.width,size),end:new Rect_1.Rect(rect.x,rect.y,rect.width,rect.height-size)}}reflect(){return this===DockLocation.TOP?DockLocation.BOTTOM:this===DockLocation.LEFT?DockLocation.RIGHT:this===DockLocation.RIGHT?DockLocation.LEFT:DockLocation.TOP}toString(){return`(DockLocation: name=`+this.name+`, orientation=`+this.orientation+`)`}}exports.DockLocation=DockLocation,DockLocation.values=/* @__PURE__ */ new Map,DockLocation.TOP=new DockLocation(`top`,Orientation_1.Orientation.VERT,0),DockLocation.BOTTOM=new DockLocation(`bottom`,Orientation_1.Orientation.VERT,1),DockLocation.LEFT=new DockLocation(`left`,Orientation_1.Orientation.HORZ,0),DockLocation.RIGHT=new DockLocation(`right`,Orientation_1.Orientation.HORZ,1),DockLocation.CENTER=new DockLocation(`center`,Orientation_1.Orientation.VERT,0)},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Orientation=void 0;class Orientation{static flip(from){return from===Orientation.HORZ?Orientation.VERT:Orientation.HORZ}constructor(name){this._name=name}getName(){return this._name}toString(){return this._name}}exports.Orientation=Orientation,Orientation.HORZ=new Orientation(`horz`),Orientation.VERT=new Orientation(`vert`)},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Rect=void 0;let Orientation_1=require(14);class Rect{static empty(){return new Rect(0,0,0,0)}static fromJson(json){return new Rect(json.x,json.y,json.width,json.height)}constructor(x,y,width,height){this.x=x,this.y=y,this.width=width,this.height=height}toJson(){return{x:this.x,y:this.y,width:this.width,height:this.height}}snap(round){this.x=Math.round(this.x/round)*round,this.y=Math.round(this.y/round)*round,this.width=Math.round(this.width/round)*round,this.height=Math.round(this.height/round)*round}static getBoundingClientRect(element){let{x,y,width,height}=element.getBoundingClientRect();return new Rect(x,y,width,height)}static getContentRect(element){let rect=element.getBoundingClientRect(),style=window.getComputedStyle(element),paddingLeft=parseFloat(style.paddingLeft),paddingRight=parseFloat(style.paddingRight),paddingTop=parseFloat(style.paddingTop),paddingBottom=parseFloat(style.paddingBottom),borderLeftWidth=parseFloat(style.borderLeftWidth),borderRightWidth=parseFloat(style.borderRightWidth),borderTopWidth=parseFloat(style.borderTopWidth),borderBottomWidth=parseFloat(style.borderBottomWidth),contentWidth=rect.width-borderLeftWidth-paddingLeft-paddingRight-borderRightWidth,contentHeight=rect.height-borderTopWidth-paddingTop-paddingBottom-borderBottomWidth;return new Rect(rect.left+borderLeftWidth+paddingLeft,rect.top+borderTopWidth+paddingTop,contentWidth,contentHeight)}static fromDomRect(domRect){return new Rect(domRect.x,domRect.y,domRect.width,domRect.height)}relativeTo(r){return new Rect(this.x-r.x,this.y-r.y,this.width,this.height)}clone(){return new Rect(this.x,this.y,this.width,this.height)}equals(rect){return this.x===rect?.x&&this.y===rect?.y&&this.width===rect?.width&&this.height===rect?.height}equalSize(rect){return this.width===rect?.width&&this.height===rect?.height}getBottom(){return this.y+this.height}getRight(){return this.x+this.width}getCenter(){return{x:this.x+this.width/2,y:this.y+this.height/2}}positionElement(element,position){this.styleWithPosition(element.style,position)}styleWithPosition(style,position=`absolute`){return style.left=this.x+`px`,style.top=this.y+`px`,style.width=Math.max(0,this.width)+`px`,style.height=Math.max(0,this.height)+`px`,style.position=position,style}contains(x,y){return this.x<=x&&x<=this.getRight()&&this.y<=y&&y<=this.getBottom()}removeInsets(insets){return new Rect(this.x+insets.left,this.y+insets.top,Math.max(0,this.width-insets.left-insets.right),Math.max(0,this.height-insets.top-insets.bottom))}centerInRect(outerRect){this.x=(outerRect.width-this.width)/2,this.y=(outerRect.height-this.height)/2}_getSize(orientation){let prefSize=this.width;return orientation===Orientation_1.Orientation.VERT&&(prefSize=this.height),prefSize}toString(){return`(Rect: x=`+this.x+`, y=`+this.y+`, width=`+this.width+`, height=`+this.height+`)`}}exports.Rect=Rect},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.I18nLabel=void 0,(function(I18nLabel){I18nLabel.Close_Tab=`Close`,I18nLabel.Close_Tabset=`Close tab set`,I18nLabel.Active_Tabset=`Active tab set`,I18nLabel.Move_Tabset=`Move tab set`,I18nLabel.Move_Tabs=`Move tabs(?)`,I18nLabel.Maximize=`Maximize tab set`,I18nLabel.Restore=`Restore tab set`,I18nLabel.Popout_Tab=`Popout selected tab`,I18nLabel.Overflow_Menu_Tooltip=`Hidden tabs`,I18nLabel.Error_rendering_component=`Error rendering component`})(exports.I18nLabel||={})},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.CLASSES=void 0,(function(CLASSES){CLASSES.FLEXLAYOUT__BORDER=`flexlayout__border`,CLASSES.FLEXLAYOUT__BORDER_=`flexlayout__border_`,CLASSES.FLEXLAYOUT__BORDER_TAB_CONTENTS=`flexlayout__border_tab_contents`,CLASSES.FLEXLAYOUT__BORDER_BUTTON=`flexlayout__border_button`,CLASSES.FLEXLAYOUT__BORDER_BUTTON_=`flexlayout__border_button_`,CLASSES.FLEXLAYOUT__BORDER_BUTTON_CONTENT=`flexlayout__border_button_content`,CLASSES.FLEXLAYOUT__BORDER_BUTTON_LEADING=`flexlayout__border_button_leading`,CLASSES.FLEXLAYOUT__BORDER_BUTTON_TRAILING=`flexlayout__border_button_trailing`,CLASSES.FLEXLAYOUT__BORDER_BUTTON__SELECTED=`flexlayout__border_button--selected`,CLASSES.FLEXLAYOUT__BORDER_BUTTON__UNSELECTED=`flexlayout__border_button--unselected`,CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON_OVERFLOW=`flexlayout__border_toolbar_button_overflow`,CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON_OVERFLOW_=`flexlayout__border_toolbar_button_overflow_`,CLASSES.FLEXLAYOUT__BORDER_INNER=`flexlayout__border_inner`,CLASSES.FLEXLAYOUT__BORDER_INNER_=`flexlayout__border_inner_`,CLASSES.FLEXLAYOUT__BORDER_INNER_TAB_CONTAINER=`flexlayout__border_inner_tab_container`,CLASSES.FLEXLAYOUT__BORDER_INNER_TAB_CONTAINER_=`flexlayout__border_inner_tab_container_`,CLASSES.FLEXLAYOUT__BORDER_TAB_DIVIDER=`flexlayout__border_tab_divider`,CLASSES.FLEXLAYOUT__BORDER_SIZER=`flexlayout__border_sizer`,CLASSES.FLEXLAYOUT__BORDER_TOOLBAR=`flexlayout__border_toolbar`,CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_=`flexlayout__border_toolbar_`,CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON=`flexlayout__border_toolbar_button`,CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON_FLOAT=`flexlayout__border_toolbar_button-float`,CLASSES.FLEXLAYOUT__DRAG_RECT=`flexlayout__drag_rect`,CLASSES.FLEXLAYOUT__EDGE_RECT=`flexlayout__edge_rect`,CLASSES.FLEXLAYOUT__EDGE_RECT_TOP=`flexlayout__edge_rect_top`,CLASSES.FLEXLAYOUT__EDGE_RECT_LEFT=`flexlayout__edge_rect_left`,CLASSES.FLEXLAYOUT__EDGE_RECT_BOTTOM=`flexlayout__edge_rect_bottom`,CLASSES.FLEXLAYOUT__EDGE_RECT_RIGHT=`flexlayout__edge_rect_right`,CLASSES.FLEXLAYOUT__ERROR_BOUNDARY_CONTAINER=`flexlayout__error_boundary_container`,CLASSES.FLEXLAYOUT__ERROR_BOUNDARY_CONTENT=`flexlayout__error_boundary_content`,CLASSES.FLEXLAYOUT__FLOATING_WINDOW_CONTENT=`flexlayout__floating_window_content`,CLASSES.FLEXLAYOUT__FLOATING_WINDOW_TAB=`flexlayout__floating_window_tab`,CLASSES.FLEXLAYOUT__LAYOUT=`flexlayout__layout`,CLASSES.FLEXLAYOUT__LAYOUT_MOVEABLES=`flexlayout__layout_moveables`,CLASSES.FLEXLAYOUT__LAYOUT_OVERLAY=`flexlayout__layout_overlay`,CLASSES.FLEXLAYOUT__LAYOUT_TAB_STAMPS=`flexlayout__layout_tab_stamps`,CLASSES.FLEXLAYOUT__LAYOUT_MAIN=`flexlayout__layout_main`,CLASSES.FLEXLAYOUT__LAYOUT_BORDER_CONTAINER=`flexlayout__layout_border_container`,CLASSES.FLEXLAYOUT__LAYOUT_BORDER_CONTAINER_INNER=`flexlayout__layout_border_container_inner`,CLASSES.FLEXLAYOUT__OUTLINE_RECT=`flexlayout__outline_rect`,CLASSES.FLEXLAYOUT__OUTLINE_RECT_EDGE=`flexlayout__outline_rect_edge`,CLASSES.FLEXLAYOUT__SPLITTER=`flexlayout__splitter`,CLASSES.FLEXLAYOUT__SPLITTER_EXTRA=`flexlayout__splitter_extra`,CLASSES.FLEXLAYOUT__SPLITTER_=`flexlayout__splitter_`,CLASSES.FLEXLAYOUT__SPLITTER_BORDER=`flexlayout__splitter_border`,CLASSES.FLEXLAYOUT__SPLITTER_DRAG=`flexlayout__splitter_drag`,CLASSES.FLEXLAYOUT__SPLITTER_HANDLE=`flexlayout__splitter_handle`,CLASSES.FLEXLAYOUT__SPLITTER_HANDLE_HORZ=`flexlayout__splitter_handle_horz`,CLASSES.FLEXLAYOUT__SPLITTER_HANDLE_VERT=`flexlayout__splitter_handle_vert`,CLASSES.FLEXLAYOUT__ROW=`flexlayout__row`,CLASSES.FLEXLAYOUT__TAB=`flexlayout__tab`,CLASSES.FLEXLAYOUT__TAB_POSITION=`flexlayout__tab_position`,CLASSES.FLEXLAYOUT__TAB_MOVEABLE=`flexlayout__tab_moveable`,CLASSES.FLEXLAYOUT__TAB_OVERLAY=`flexlayout__tab_overlay`,CLASSES.FLEXLAYOUT__TABSET=`flexlayout__tabset`,CLASSES.FLEXLAYOUT__TABSET_CONTAINER=`flexlayout__tabset_container`,CLASSES.FLEXLAYOUT__TABSET_HEADER=`flexlayout__tabset_header`,CLASSES.FLEXLAYOUT__TABSET_HEADER_SIZER=`flexlayout__tabset_header_sizer`,CLASSES.FLEXLAYOUT__TABSET_HEADER_CONTENT=`flexlayout__tabset_header_content`,CLASSES.FLEXLAYOUT__TABSET_MAXIMIZED=`flexlayout__tabset-maximized`,CLASSES.FLEXLAYOUT__TABSET_SELECTED=`flexlayout__tabset-selected`,CLASSES.FLEXLAYOUT__TABSET_SIZER=`flexlayout__tabset_sizer`,CLASSES.FLEXLAYOUT__TABSET_TAB_DIVIDER=`flexlayout__tabset_tab_divider`,CLASSES.FLEXLAYOUT__TABSET_CONTENT=`flexlayout__tabset_content`,CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER=`flexlayout__tabset_tabbar_inner`,CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER_=`flexlayout__tabset_tabbar_inner_`,CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER_TAB_CONTAINER=`flexlayout__tabset_tabbar_inner_tab_container`,CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER_TAB_CONTAINER_=`flexlayout__tabset_tabbar_inner_tab_container_`,CLASSES.FLEXLAYOUT__TABSET_TABBAR_OUTER=`flexlayout__tabset_tabbar_outer`,CLASSES.FLEXLAYOUT__TABSET_TABBAR_OUTER_=`flexlayout__tabset_tabbar_outer_`,CLASSES.FLEXLAYOUT__TAB_BORDER=`flexlayout__tab_border`,CLASSES.FLEXLAYOUT__TAB_BORDER_=`flexlayout__tab_border_`,CLASSES.FLEXLAYOUT__TAB_BUTTON=`flexlayout__tab_button`,CLASSES.FLEXLAYOUT__TAB_BUTTON_STRETCH=`flexlayout__tab_button_stretch`,CLASSES.FLEXLAYOUT__TAB_BUTTON_CONTENT=`flexlayout__tab_button_content`,CLASSES.FLEXLAYOUT__TAB_BUTTON_LEADING=`flexlayout__tab_button_leading`,CLASSES.FLEXLAYOUT__TAB_BUTTON_OVERFLOW=`flexlayout__tab_button_overflow`,CLASSES.FLEXLAYOUT__TAB_BUTTON_OVERFLOW_COUNT=`flexlayout__tab_button_overflow_count`,CLASSES.FLEXLAYOUT__TAB_BUTTON_TEXTBOX=`flexlayout__tab_button_textbox`,CLASSES.FLEXLAYOUT__TAB_BUTTON_TRAILING=`flexlayout__tab_button_trailing`,CLASSES.FLEXLAYOUT__TAB_BUTTON_STAMP=`flexlayout__tab_button_stamp`,CLASSES.FLEXLAYOUT__TAB_FLOATING=`flexlayout__tab_floating`,CLASSES.FLEXLAYOUT__TAB_FLOATING_INNER=`flexlayout__tab_floating_inner`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR=`flexlayout__tab_toolbar`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON=`flexlayout__tab_toolbar_button`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR_ICON=`flexlayout__tab_toolbar_icon`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON_=`flexlayout__tab_toolbar_button-`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON_FLOAT=`flexlayout__tab_toolbar_button-float`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR_STICKY_BUTTONS_CONTAINER=`flexlayout__tab_toolbar_sticky_buttons_container`,CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON_CLOSE=`flexlayout__tab_toolbar_button-close`,CLASSES.FLEXLAYOUT__POPUP_MENU_CONTAINER=`flexlayout__popup_menu_container`,CLASSES.FLEXLAYOUT__POPUP_MENU_ITEM=`flexlayout__popup_menu_item`,CLASSES.FLEXLAYOUT__POPUP_MENU=`flexlayout__popup_menu`})(exports.CLASSES||={})},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Actions=void 0;let Action_1=require(19);class Actions{static addNode(json,toNodeId,location,index,select){return new Action_1.Action(Actions.ADD_NODE,{json,toNode:toNodeId,location:location.getName(),index,select})}static moveNode(fromNodeId,toNodeId,location,index,select){return new Action_1.Action(Actions.MOVE_NODE,{fromNode:fromNodeId,toNode:toNodeId,location:location.getName(),index,select})}static deleteTab(tabNodeId){return new Action_1.Action(Actions.DELETE_TAB,{node:tabNodeId})}static deleteTabset(tabsetNodeId){return new Action_1.Action(Actions.DELETE_TABSET,{node:tabsetNodeId})}static renameTab(tabNodeId,text){return new Action_1.Action(Actions.RENAME_TAB,{node:tabNodeId,text})}static selectTab(tabNodeId){return new Action_1.Action(Actions.SELECT_TAB,{tabNode:tabNodeId})}static setActiveTabset(tabsetNodeId,windowId){return new Action_1.Action(Actions.SET_ACTIVE_TABSET,{tabsetNode:tabsetNodeId,windowId})}static adjustWeights(nodeId,weights){return new Action_1.Action(Actions.ADJUST_WEIGHTS,{nodeId,weights})}static adjustBorderSplit(nodeId,pos){return new Action_1.Action(Actions.ADJUST_BORDER_SPLIT,{node:nodeId,pos})}static maximizeToggle(tabsetNodeId,windowId){return new Action_1.Action(Actions.MAXIMIZE_TOGGLE,{node:tabsetNodeId,windowId})}static updateModelAttributes(attributes){return new Action_1.Action(Actions.UPDATE_MODEL_ATTRIBUTES,{json:attributes})}static updateNodeAttributes(nodeId,attributes){return new Action_1.Action(Actions.UPDATE_NODE_ATTRIBUTES,{node:nodeId,json:attributes})}static popoutTab(nodeId){return new Action_1.Action(Actions.POPOUT_TAB,{node:nodeId})}static popoutTabset(nodeId){return new Action_1.Action(Actions.POPOUT_TABSET,{node:nodeId})}static closeWindow(windowId){return new Action_1.Action(Actions.CLOSE_WINDOW,{windowId})}static createWindow(layout,rect){return new Action_1.Action(Actions.CREATE_WINDOW,{layout,rect})}}exports.Actions=Actions,Actions.ADD_NODE=`FlexLayout_AddNode`,Actions.MOVE_NODE=`FlexLayout_MoveNode`,Actions.DELETE_TAB=`FlexLayout_DeleteTab`,Actions.DELETE_TABSET=`FlexLayout_DeleteTabset`,Actions.RENAME_TAB=`FlexLayout_RenameTab`,Actions.SELECT_TAB=`FlexLayout_SelectTab`,Actions.SET_ACTIVE_TABSET=`FlexLayout_SetActiveTabset`,Actions.ADJUST_WEIGHTS=`FlexLayout_AdjustWeights`,Actions.ADJUST_BORDER_SPLIT=`FlexLayout_AdjustBorderSplit`,Actions.MAXIMIZE_TOGGLE=`FlexLayout_MaximizeToggle`,Actions.UPDATE_MODEL_ATTRIBUTES=`FlexLayout_UpdateModelAttributes`,Actions.UPDATE_NODE_ATTRIBUTES=`FlexLayout_UpdateNodeAttributes`,Actions.POPOUT_TAB=`FlexLayout_PopoutTab`,Actions.POPOUT_TABSET=`FlexLayout_PopoutTabset`,Actions.CLOSE_WINDOW=`FlexLayout_CloseWindow`,Actions.CREATE_WINDOW=`FlexLayout_CreateWindow`},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Action=void 0;class Action{constructor(type,data){this.type=type,this.data=data}}exports.Action=Action},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.BorderNode=void 0;let Attribute_1=require(21),AttributeDefinitions_1=require(22),DockLocation_1=require(13),DropInfo_1=require(23),Orientation_1=require(14),Rect_1=require(15),Types_1=require(17),Model_1=require(24),Node_1=require(27),TabNode_1=require(30),Utils_1=require(31);class BorderNode extends Node_1.Node{static fromJson(json,model){let border=new BorderNode(DockLocation_1.DockLocation.getByName(json.location),json,model);return json.children&&(border.children=json.children.map(jsonChild=>{let child=TabNode_1.TabNode.fromJson(jsonChild,model);return child.setParent(border),child})),border}constructor(location,json,model){super(model),this.outerRect=Rect_1.Rect.empty(),this.contentRect=Rect_1.Rect.empty(),this.tabHeaderRect=Rect_1.Rect.empty(),this.location=location,this.attributes.id=`border_${location.getName()}`,BorderNode.attributeDefinitions.fromJson(json,this.attributes),model.addNode(this)}getLocation(){return this.location}getClassName(){return this.getAttr(`className`)}isHorizontal(){return this.location.orientation===Orientation_1.Orientation.HORZ}getSize(){let defaultSize=this.getAttr(`size`),selected=this.getSelected();if(selected===-1)return defaultSize;{let tabNode=this.children[selected],tabBorderSize=this.isHorizontal()?tabNode.getAttr(`borderWidth`):tabNode.getAttr(`borderHeight`);return tabBorderSize===-1?defaultSize:tabBorderSize}}getMinSize(){let selectedNode=this.getSelectedNode(),min=this.getAttr(`minSize`);if(selectedNode){let nodeMin=this.isHorizontal()?selectedNode.getMinWidth():selectedNode.getMinHeight();min=Math.max(min,nodeMin)}return min}getMaxSize(){let selectedNode=this.getSelectedNode(),max=this.getAttr(`maxSize`);if(selectedNode){let nodeMax=this.isHorizontal()?selectedNode.getMaxWidth():selectedNode.getMaxHeight();max=Math.min(max,nodeMax)}return max}getSelected(){return this.attributes.selected}isAutoHide(){return this.getAttr(`enableAutoHide`)}getSelectedNode(){if(this.getSelected()!==-1)return this.children[this.getSelected()]}getOrientation(){return this.location.getOrientation()}getConfig(){return this.attributes.config}isMaximized(){return!1}isShowing(){return this.attributes.show}toJson(){let json={};return BorderNode.attributeDefinitions.toJson(json,this.attributes),json.location=this.location.getName(),json.children=this.children.map(child=>child.toJson()),json}isAutoSelectTab(whenOpen){return whenOpen??=this.getSelected()!==-1,whenOpen?this.getAttr(`autoSelectTabWhenOpen`):this.getAttr(`autoSelectTabWhenClosed`)}setSelected(index){this.attributes.selected=index}getTabHeaderRect(){return this.tabHeaderRect}setTabHeaderRect(r){this.tabHeaderRect=r}getOuterRect(){return this.outerRect}setOuterRect(r){this.outerRect=r}getRect(){return this.tabHeaderRect}getContentRect(){return this.contentRect}setContentRect(r){this.contentRect=r}isEnableDrop(){return this.getAttr(`enableDrop`)}setSize(pos){let selected=this.getSelected();if(selected===-1)this.attributes.size=pos;else{let tabNode=this.children[selected];(this.isHorizontal()?tabNode.getAttr(`borderWidth`):tabNode.getAttr(`borderHeight`))===-1?this.attributes.size=pos:this.isHorizontal()?tabNode.setBorderWidth(pos):tabNode.setBorderHeight(pos)}}updateAttrs(json){BorderNode.attributeDefinitions.update(json,this.attributes)}remove(node){let removedIndex=this.removeChild(node);this.getSelected()!==-1&&(0,Utils_1.adjustSelectedIndex)(this,removedIndex)}canDrop(dragNode,x,y){if(!(dragNode instanceof TabNode_1.TabNode))return;let dropInfo,dockLocation=DockLocation_1.DockLocation.CENTER;if(this.tabHeaderRect.contains(x,y)){if(this.location.orientation===Orientation_1.Orientation.VERT)if(this.children.length>0){let child=this.children[0],childRect=child.getTabRect(),childY=childRect.y,childHeight=childRect.height,pos=this.tabHeaderRect.x,childCenter=0;for(let i=0;i<this.children.length;i++){if(child=this.children[i],childRect=child.getTabRect(),childCenter=childRect.x+childRect.width/2,x>=pos&&x<childCenter){let outlineRect=new Rect_1.Rect(childRect.x-2,childY,3,childHeight);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,i,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT);break}pos=childCenter}if(dropInfo==null){let outlineRect=new Rect_1.Rect(childRect.getRight()-2,childY,3,childHeight);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,this.children.length,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}}else{let outlineRect=new Rect_1.Rect(this.tabHeaderRect.x+1,this.tabHeaderRect.y+2,3,18);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,0,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}else if(this.children.length>0){let child=this.children[0],childRect=child.getTabRect(),childX=childRect.x,childWidth=childRect.width,pos=this.tabHeaderRect.y,childCenter=0;for(let i=0;i<this.children.length;i++){if(child=this.children[i],childRect=child.getTabRect(),childCenter=childRect.y+childRect.height/2,y>=pos&&y<childCenter){let outlineRect=new Rect_1.Rect(childX,childRect.y-2,childWidth,3);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,i,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT);break}pos=childCenter}if(dropInfo==null){let outlineRect=new Rect_1.Rect(childX,childRect.getBottom()-2,childWidth,3);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,this.children.length,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}}else{let outlineRect=new Rect_1.Rect(this.tabHeaderRect.x+2,this.tabHeaderRect.y+1,18,3);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,0,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}if(!dragNode.canDockInto(dragNode,dropInfo))return}else if(this.getSelected()!==-1&&this.outerRect.contains(x,y)){let outlineRect=this.outerRect;if(dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT),!dragNode.canDockInto(dragNode,dropInfo))return}return dropInfo}drop(dragNode,location,index,select){let fromIndex=0,dragParent=dragNode.getParent();dragParent!==void 0&&(fromIndex=dragParent.removeChild(dragNode),dragParent!==this&&dragParent instanceof BorderNode&&dragParent.getSelected()===fromIndex?dragParent.setSelected(-1):(0,Utils_1.adjustSelectedIndex)(dragParent,fromIndex)),dragNode instanceof TabNode_1.TabNode&&dragParent===this&&fromIndex<index&&index>0&&index--;let insertPos=index;insertPos===-1&&(insertPos=this.children.length),dragNode instanceof TabNode_1.TabNode&&this.addChild(dragNode,insertPos),(select||select!==!1&&this.isAutoSelectTab())&&this.setSelected(insertPos),this.model.tidy()}getSplitterBounds(index,useMinSize=!1){let pBounds=[0,0],minSize=useMinSize?this.getMinSize():0,maxSize=useMinSize?this.getMaxSize():99999,rootRow=this.model.getRoot(Model_1.Model.MAIN_WINDOW_ID),innerRect=rootRow.getRect(),splitterSize=this.model.getSplitterSize();if(this.location===DockLocation_1.DockLocation.TOP){pBounds[0]=this.tabHeaderRect.getBottom()+minSize;let maxPos=this.tabHeaderRect.getBottom()+maxSize;pBounds[1]=Math.max(pBounds[0],innerRect.getBottom()-rootRow.getMinHeight()-splitterSize),pBounds[1]=Math.min(pBounds[1],maxPos)}else if(this.location===DockLocation_1.DockLocation.LEFT){pBounds[0]=this.tabHeaderRect.getRight()+minSize;let maxPos=this.tabHeaderRect.getRight()+maxSize;pBounds[1]=Math.max(pBounds[0],innerRect.getRight()-rootRow.getMinWidth()-splitterSize),pBounds[1]=Math.min(pBounds[1],maxPos)}else if(this.location===DockLocation_1.DockLocation.BOTTOM){pBounds[1]=this.tabHeaderRect.y-minSize-splitterSize;let maxPos=this.tabHeaderRect.y-maxSize-splitterSize;pBounds[0]=Math.min(pBounds[1],innerRect.y+rootRow.getMinHeight()),pBounds[0]=Math.max(pBounds[0],maxPos)}else if(this.location===DockLocation_1.DockLocation.RIGHT){pBounds[1]=this.tabHeaderRect.x-minSize-splitterSize;let maxPos=this.tabHeaderRect.x-maxSize-splitterSize;pBounds[0]=Math.min(pBounds[1],innerRect.x+rootRow.getMinWidth()),pBounds[0]=Math.max(pBounds[0],maxPos)}return pBounds}calculateSplit(splitter,splitterPos){let pBounds=this.getSplitterBounds(splitterPos);return this.location===DockLocation_1.DockLocation.BOTTOM||this.location===DockLocation_1.DockLocation.RIGHT?Math.max(0,pBounds[1]-splitterPos):Math.max(0,splitterPos-pBounds[0])}getAttributeDefinitions(){return BorderNode.attributeDefinitions}static getAttributeDefinitions(){return BorderNode.attributeDefinitions}static createAttributeDefinitions(){let attributeDefinitions=new AttributeDefinitions_1.AttributeDefinitions;return attributeDefinitions.add(`type`,BorderNode.TYPE,!0).setType(Attribute_1.Attribute.STRING).setFixed(),attributeDefinitions.add(`selected`,-1).setType(Attribute_1.Attribute.NUMBER).setDescription(`index of selected/visible tab in border; -1 means no tab selected`),attributeDefinitions.add(`show`,!0).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`show/hide this border`),attributeDefinitions.add(`config`,void 0).setType(`any`).setDescription(`a place to hold json config used in your own code`),attributeDefinitions.addInherited(`enableDrop`,`borderEnableDrop`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether tabs can be dropped into this border`),attributeDefinitions.addInherited(`className`,`borderClassName`).setType(Attribute_1.Attribute.STRING).setDescription(`class applied to tab button`),attributeDefinitions.addInherited(`autoSelectTabWhenOpen`,`borderAutoSelectTabWhenOpen`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether to select new/moved tabs in border when the border is already open`),attributeDefinitions.addInherited(`autoSelectTabWhenClosed`,`borderAutoSelectTabWhenClosed`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether to select new/moved tabs in border when the border is currently closed`),attributeDefinitions.addInherited(`size`,`borderSize`).setType(Attribute_1.Attribute.NUMBER).setDescription(`size of the tab area when selected`),attributeDefinitions.addInherited(`minSize`,`borderMinSize`).setType(Attribute_1.Attribute.NUMBER).setDescription(`the minimum size of the tab area`),attributeDefinitions.addInherited(`maxSize`,`borderMaxSize`).setType(Attribute_1.Attribute.NUMBER).setDescription(`the maximum size of the tab area`),attributeDefinitions.addInherited(`enableAutoHide`,`borderEnableAutoHide`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`hide border if it has zero tabs`),attributeDefinitions}}exports.BorderNode=BorderNode,BorderNode.TYPE=`border`,BorderNode.attributeDefinitions=BorderNode.createAttributeDefinitions()},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Attribute=void 0;class Attribute{constructor(name,modelName,defaultValue,alwaysWriteJson){this.name=name,this.alias=void 0,this.modelName=modelName,this.defaultValue=defaultValue,this.alwaysWriteJson=alwaysWriteJson,this.required=!1,this.fixed=!1,this.type=`any`}setType(value){return this.type=value,this}setAlias(value){return this.alias=value,this}setDescription(value){this.description=value}setRequired(){return this.required=!0,this}setFixed(){return this.fixed=!0,this}setpairedAttr(value){this.pairedAttr=value}setPairedType(value){this.pairedType=value}}exports.Attribute=Attribute,Attribute.NUMBER=`number`,Attribute.STRING=`string`,Attribute.BOOLEAN=`boolean`},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.AttributeDefinitions=void 0;let Attribute_1=require(21);class AttributeDefinitions{constructor(){this.attributes=[],this.nameToAttribute=/* @__PURE__ */ new Map}addWithAll(name,modelName,defaultValue,alwaysWriteJson){let attr=new Attribute_1.Attribute(name,modelName,defaultValue,alwaysWriteJson);return this.attributes.push(attr),this.nameToAttribute.set(name,attr),attr}addInherited(name,modelName){return this.addWithAll(name,modelName,void 0,!1)}add(name,defaultValue,alwaysWriteJson){return this.addWithAll(name,void 0,defaultValue,alwaysWriteJson)}getAttributes(){return this.attributes}getModelName(name){let conversion=this.nameToAttribute.get(name);if(conversion!==void 0)return conversion.modelName}toJson(jsonObj,obj){for(let attr of this.attributes){let fromValue=obj[attr.name];(attr.alwaysWriteJson||fromValue!==attr.defaultValue)&&(jsonObj[attr.name]=fromValue)}}fromJson(jsonObj,obj){for(let attr of this.attributes){let fromValue=jsonObj[attr.name];fromValue===void 0&&attr.alias&&(fromValue=jsonObj[attr.alias]),fromValue===void 0?obj[attr.name]=attr.defaultValue:obj[attr.name]=fromValue}}update(jsonObj,obj){for(let attr of this.attributes)if(jsonObj.hasOwnProperty(attr.name)){let fromValue=jsonObj[attr.name];fromValue===void 0?delete obj[attr.name]:obj[attr.name]=fromValue}}setDefaults(obj){for(let attr of this.attributes)obj[attr.name]=attr.defaultValue}pairAttributes(type,childAttributes){for(let attr of childAttributes.attributes)if(attr.modelName&&this.nameToAttribute.has(attr.modelName)){let pairedAttr=this.nameToAttribute.get(attr.modelName);pairedAttr.setpairedAttr(attr),attr.setpairedAttr(pairedAttr),pairedAttr.setPairedType(type)}}toTypescriptInterface(name,parentAttributes){var _a,_b;let lines=[],sorted=this.attributes.sort((a,b)=>a.name.localeCompare(b.name));lines.push(`export interface I`+name+`Attributes {`);for(let i=0;i<sorted.length;i++){let c=sorted[i],type=c.type,defaultValue,attr=c,inherited;attr.defaultValue===void 0?attr.modelName!==void 0&&parentAttributes!==void 0&&parentAttributes.nameToAttribute.get(attr.modelName)!==void 0&&(inherited=attr.modelName,attr=parentAttributes.nameToAttribute.get(inherited),defaultValue=attr.defaultValue,type=attr.type):defaultValue=attr.defaultValue;let defValue=JSON.stringify(defaultValue),required=attr.required?``:`?`,sb=`	/**
+	  `;c.description?sb+=c.description:c.pairedType&&(_a=c.pairedAttr)?.description&&(sb+=`Value for ${c.pairedType} attribute ${c.pairedAttr.name} if not overridden`,sb+=`
+
+	  `,sb+=(_b=c.pairedAttr)?.description),sb+=`
+
+	  `,c.fixed?sb+=`Fixed value: ${defValue}`:inherited?sb+=`Default: inherited from Global attribute ${c.modelName} (default ${defValue})`:sb+=`Default: ${defValue}`,sb+=`
+	 */`,lines.push(sb),lines.push(`	`+c.name+required+`: `+type+`;
+`)}return lines.push(`}`),lines.join(`
+`)}}exports.AttributeDefinitions=AttributeDefinitions},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.DropInfo=void 0;class DropInfo{constructor(node,rect,location,index,className){this.node=node,this.rect=rect,this.location=location,this.index=index,this.className=className}}exports.DropInfo=DropInfo},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Model=exports.DefaultMax=exports.DefaultMin=void 0;let Attribute_1=require(21),AttributeDefinitions_1=require(22),DockLocation_1=require(13),Rect_1=require(15),Actions_1=require(18),BorderNode_1=require(20),BorderSet_1=require(25),RowNode_1=require(26),TabNode_1=require(30),TabSetNode_1=require(28),Utils_1=require(31),LayoutWindow_1=require(32);exports.DefaultMin=0,exports.DefaultMax=99999;class Model{constructor(){this.attributes={},this.idMap=/* @__PURE__ */ new Map,this.borders=new BorderSet_1.BorderSet(this),this.windows=/* @__PURE__ */ new Map,this.rootWindow=new LayoutWindow_1.LayoutWindow(Model.MAIN_WINDOW_ID,Rect_1.Rect.empty()),this.windows.set(Model.MAIN_WINDOW_ID,this.rootWindow),this.changeListeners=[]}doAction(action){var _a;let returnVal;switch(action.type){case Actions_1.Actions.ADD_NODE:{let newNode=new TabNode_1.TabNode(this,action.data.json,!0),toNode=this.idMap.get(action.data.toNode);(toNode instanceof TabSetNode_1.TabSetNode||toNode instanceof BorderNode_1.BorderNode||toNode instanceof RowNode_1.RowNode)&&(toNode.drop(newNode,DockLocation_1.DockLocation.getByName(action.data.location),action.data.index,action.data.select),returnVal=newNode);break}case Actions_1.Actions.MOVE_NODE:{let fromNode=this.idMap.get(action.data.fromNode);if(fromNode instanceof TabNode_1.TabNode||fromNode instanceof TabSetNode_1.TabSetNode||fromNode instanceof RowNode_1.RowNode){if(fromNode===this.getMaximizedTabset(fromNode.getWindowId())){let fromWindow=this.windows.get(fromNode.getWindowId());fromWindow.maximizedTabSet=void 0}let toNode=this.idMap.get(action.data.toNode);(toNode instanceof TabSetNode_1.TabSetNode||toNode instanceof BorderNode_1.BorderNode||toNode instanceof RowNode_1.RowNode)&&toNode.drop(fromNode,DockLocation_1.DockLocation.getByName(action.data.location),action.data.index,action.data.select)}this.removeEmptyWindows();break}case Actions_1.Actions.DELETE_TAB:{let node=this.idMap.get(action.data.node);node instanceof TabNode_1.TabNode&&node.delete(),this.removeEmptyWindows();break}case Actions_1.Actions.DELETE_TABSET:{let node=this.idMap.get(action.data.node);if(node instanceof TabSetNode_1.TabSetNode){let children=[...node.getChildren()];for(let i=0;i<children.length;i++){let child=children[i];child.isEnableClose()&&child.delete()}node.getChildren().length===0&&node.delete(),this.tidy()}this.removeEmptyWindows();break}case Actions_1.Actions.POPOUT_TABSET:{let node=this.idMap.get(action.data.node);if(node instanceof TabSetNode_1.TabSetNode){let isMaximized=node.isMaximized(),oldLayoutWindow=this.windows.get(node.getWindowId()),windowId=(0,Utils_1.randomUUID)(),layoutWindow=new LayoutWindow_1.LayoutWindow(windowId,oldLayoutWindow.toScreenRectFunction(node.getRect())),row=RowNode_1.RowNode.fromJson({type:`row`,children:[]},this,layoutWindow);layoutWindow.root=row,this.windows.set(windowId,layoutWindow),row.drop(node,DockLocation_1.DockLocation.CENTER,0),isMaximized&&(this.rootWindow.maximizedTabSet=void 0)}this.removeEmptyWindows();break}case Actions_1.Actions.POPOUT_TAB:{let node=this.idMap.get(action.data.node);if(node instanceof TabNode_1.TabNode){let windowId=(0,Utils_1.randomUUID)(),r=Rect_1.Rect.empty();r=node.getParent()instanceof TabSetNode_1.TabSetNode?node.getParent().getRect():node.getParent().getContentRect();let oldLayoutWindow=this.windows.get(node.getWindowId()),layoutWindow=new LayoutWindow_1.LayoutWindow(windowId,oldLayoutWindow.toScreenRectFunction(r)),tabsetId=(0,Utils_1.randomUUID)(),json={type:`row`,children:[{type:`tabset`,id:tabsetId}]};layoutWindow.root=RowNode_1.RowNode.fromJson(json,this,layoutWindow),this.windows.set(windowId,layoutWindow),this.idMap.get(tabsetId).drop(node,DockLocation_1.DockLocation.CENTER,0,!0)}this.removeEmptyWindows();break}case Actions_1.Actions.CLOSE_WINDOW:{let window=this.windows.get(action.data.windowId);window&&((_a=this.rootWindow.root)?.drop(window?.root,DockLocation_1.DockLocation.CENTER,-1),this.rootWindow.visitNodes((node,level)=>{node instanceof RowNode_1.RowNode&&node.setWindowId(Model.MAIN_WINDOW_ID)}),this.windows.delete(action.data.windowId));break}case Actions_1.Actions.CREATE_WINDOW:{let windowId=(0,Utils_1.randomUUID)(),layoutWindow=new LayoutWindow_1.LayoutWindow(windowId,Rect_1.Rect.fromJson(action.data.rect));layoutWindow.root=RowNode_1.RowNode.fromJson(action.data.layout,this,layoutWindow),this.windows.set(windowId,layoutWindow),returnVal=windowId;break}case Actions_1.Actions.RENAME_TAB:{let node=this.idMap.get(action.data.node);node instanceof TabNode_1.TabNode&&node.setName(action.data.text);break}case Actions_1.Actions.SELECT_TAB:{let tabNode=this.idMap.get(action.data.tabNode),windowId=action.data.windowId?action.data.windowId:Model.MAIN_WINDOW_ID,window=this.windows.get(windowId);if(tabNode instanceof TabNode_1.TabNode){let parent=tabNode.getParent(),pos=parent.getChildren().indexOf(tabNode);parent instanceof BorderNode_1.BorderNode?parent.getSelected()===pos?parent.setSelected(-1):parent.setSelected(pos):parent instanceof TabSetNode_1.TabSetNode&&(parent.getSelected()!==pos&&parent.setSelected(pos),window.activeTabSet=parent)}break}case Actions_1.Actions.SET_ACTIVE_TABSET:{let windowId=action.data.windowId?action.data.windowId:Model.MAIN_WINDOW_ID,window=this.windows.get(windowId);if(action.data.tabsetNode===void 0)window.activeTabSet=void 0;else{let tabsetNode=this.idMap.get(action.data.tabsetNode);tabsetNode instanceof TabSetNode_1.TabSetNode&&(window.activeTabSet=tabsetNode)}break}case Actions_1.Actions.ADJUST_WEIGHTS:{let c=this.idMap.get(action.data.nodeId).getChildren();for(let i=0;i<c.length;i++)c[i].setWeight(action.data.weights[i]);break}case Actions_1.Actions.ADJUST_BORDER_SPLIT:{let node=this.idMap.get(action.data.node);node instanceof BorderNode_1.BorderNode&&node.setSize(action.data.pos);break}case Actions_1.Actions.MAXIMIZE_TOGGLE:{let windowId=action.data.windowId?action.data.windowId:Model.MAIN_WINDOW_ID,window=this.windows.get(windowId),node=this.idMap.get(action.data.node);node instanceof TabSetNode_1.TabSetNode&&(node===window.maximizedTabSet?window.maximizedTabSet=void 0:(window.maximizedTabSet=node,window.activeTabSet=node));break}case Actions_1.Actions.UPDATE_MODEL_ATTRIBUTES:this.updateAttrs(action.data.json);break;case Actions_1.Actions.UPDATE_NODE_ATTRIBUTES:this.idMap.get(action.data.node).updateAttrs(action.data.json);break;default:break}this.updateIdMap();for(let listener of this.changeListeners)listener(action);return returnVal}getActiveTabset(windowId=Model.MAIN_WINDOW_ID){let window=this.windows.get(windowId);if(window&&window.activeTabSet&&this.getNodeById(window.activeTabSet.getId()))return window.activeTabSet}getMaximizedTabset(windowId=Model.MAIN_WINDOW_ID){return this.windows.get(windowId).maximizedTabSet}getRoot(windowId=Model.MAIN_WINDOW_ID){return this.windows.get(windowId).root}isRootOrientationVertical(){return this.attributes.rootOrientationVertical}isEnableRotateBorderIcons(){return this.attributes.enableRotateBorderIcons}getBorderSet(){return this.borders}getwindowsMap(){return this.windows}visitNodes(fn){this.borders.forEachNode(fn);for(let[_,w]of this.windows)w.root.forEachNode(fn,0)}visitWindowNodes(windowId,fn){this.windows.has(windowId)&&(windowId===Model.MAIN_WINDOW_ID&&this.borders.forEachNode(fn),this.windows.get(windowId).visitNodes(fn))}getNodeById(id){return this.idMap.get(id)}getFirstTabSet(node=this.windows.get(Model.MAIN_WINDOW_ID).root){let child=node.getChildren()[0];return child instanceof TabSetNode_1.TabSetNode?child:this.getFirstTabSet(child)}static fromJson(json){let model=new Model;if(Model.attributeDefinitions.fromJson(json.global,model.attributes),json.borders&&(model.borders=BorderSet_1.BorderSet.fromJson(json.borders,model)),json.popouts)for(let windowId in json.popouts){let windowJson=json.popouts[windowId],layoutWindow=LayoutWindow_1.LayoutWindow.fromJson(windowJson,model,windowId);model.windows.set(windowId,layoutWindow)}return model.rootWindow.root=RowNode_1.RowNode.fromJson(json.layout,model,model.getwindowsMap().get(Model.MAIN_WINDOW_ID)),model.tidy(),model}toJson(){let global={};Model.attributeDefinitions.toJson(global,this.attributes),this.visitNodes(node=>{node.fireEvent(`save`,{})});let windows={};for(let[id,window]of this.windows)id!==Model.MAIN_WINDOW_ID&&(windows[id]=window.toJson());return{global,borders:this.borders.toJson(),layout:this.rootWindow.root.toJson(),popouts:windows}}getSplitterSize(){return this.attributes.splitterSize}getSplitterExtra(){return this.attributes.splitterExtra}isEnableEdgeDock(){return this.attributes.enableEdgeDock}isSplitterEnableHandle(){return this.attributes.splitterEnableHandle}setOnAllowDrop(onAllowDrop){this.onAllowDrop=onAllowDrop}setOnCreateTabSet(onCreateTabSet){this.onCreateTabSet=onCreateTabSet}addChangeListener(listener){this.changeListeners.push(listener)}removeChangeListener(listener){let pos=this.changeListeners.findIndex(l=>l===listener);pos!==-1&&this.changeListeners.splice(pos,1)}toString(){return JSON.stringify(this.toJson())}removeEmptyWindows(){let emptyWindows=/* @__PURE__ */ new Set;for(let[windowId]of this.windows)if(windowId!==Model.MAIN_WINDOW_ID){let count=0;this.visitWindowNodes(windowId,node=>{node instanceof TabNode_1.TabNode&&count++}),count===0&&emptyWindows.add(windowId)}for(let windowId of emptyWindows)this.windows.delete(windowId)}setActiveTabset(tabsetNode,windowId){let window=this.windows.get(windowId);window&&(tabsetNode?window.activeTabSet=tabsetNode:window.activeTabSet=void 0)}setMaximizedTabset(tabsetNode,windowId){let window=this.windows.get(windowId);window&&(tabsetNode?window.maximizedTabSet=tabsetNode:window.maximizedTabSet=void 0)}updateIdMap(){this.idMap.clear(),this.visitNodes(node=>{this.idMap.set(node.getId(),node)})}addNode(node){let id=node.getId();if(this.idMap.has(id))throw Error(`Error: each node must have a unique id, duplicate id:${node.getId()}`);this.idMap.set(id,node)}findDropTargetNode(windowId,dragNode,x,y){let node=this.windows.get(windowId).root.findDropTargetNode(windowId,dragNode,x,y);return node===void 0&&windowId===Model.MAIN_WINDOW_ID&&(node=this.borders.findDropTargetNode(dragNode,x,y)),node}tidy(){for(let[_,window]of this.windows)window.root.tidy()}updateAttrs(json){Model.attributeDefinitions.update(json,this.attributes)}nextUniqueId(){return`#`+(0,Utils_1.randomUUID)()}getAttribute(name){return this.attributes[name]}getOnAllowDrop(){return this.onAllowDrop}getOnCreateTabSet(){return this.onCreateTabSet}static toTypescriptInterfaces(){Model.attributeDefinitions.pairAttributes(`RowNode`,RowNode_1.RowNode.getAttributeDefinitions()),Model.attributeDefinitions.pairAttributes(`TabSetNode`,TabSetNode_1.TabSetNode.getAttributeDefinitions()),Model.attributeDefinitions.pairAttributes(`TabNode`,TabNode_1.TabNode.getAttributeDefinitions()),Model.attributeDefinitions.pairAttributes(`BorderNode`,BorderNode_1.BorderNode.getAttributeDefinitions());let sb=[];sb.push(Model.attributeDefinitions.toTypescriptInterface(`Global`,void 0)),sb.push(RowNode_1.RowNode.getAttributeDefinitions().toTypescriptInterface(`Row`,Model.attributeDefinitions)),sb.push(TabSetNode_1.TabSetNode.getAttributeDefinitions().toTypescriptInterface(`TabSet`,Model.attributeDefinitions)),sb.push(TabNode_1.TabNode.getAttributeDefinitions().toTypescriptInterface(`Tab`,Model.attributeDefinitions)),sb.push(BorderNode_1.BorderNode.getAttributeDefinitions().toTypescriptInterface(`Border`,Model.attributeDefinitions)),console.log(sb.join(`
+`))}static createAttributeDefinitions(){let attributeDefinitions=new AttributeDefinitions_1.AttributeDefinitions;return attributeDefinitions.add(`enableEdgeDock`,!0).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`enable docking to the edges of the layout, this will show the edge indicators`),attributeDefinitions.add(`rootOrientationVertical`,!1).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`the top level 'row' will layout horizontally by default, set this option true to make it layout vertically`),attributeDefinitions.add(`enableRotateBorderIcons`,!0).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`boolean indicating if tab icons should rotate with the text in the left and right borders`),attributeDefinitions.add(`splitterSize`,8).setType(Attribute_1.Attribute.NUMBER).setDescription(`width in pixels of all splitters between tabsets/borders`),attributeDefinitions.add(`splitterExtra`,0).setType(Attribute_1.Attribute.NUMBER).setDescription(`additional width in pixels of the splitter hit test area`),attributeDefinitions.add(`splitterEnableHandle`,!1).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`enable a small centralized handle on all splitters`),attributeDefinitions.add(`tabEnableClose`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabCloseType`,1).setType(`ICloseType`),attributeDefinitions.add(`tabEnablePopout`,!1).setType(Attribute_1.Attribute.BOOLEAN).setAlias(`tabEnableFloat`),attributeDefinitions.add(`tabEnablePopoutIcon`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabEnablePopoutOverlay`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabEnableDrag`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabEnableRename`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabContentClassName`,void 0).setType(Attribute_1.Attribute.STRING),attributeDefinitions.add(`tabClassName`,void 0).setType(Attribute_1.Attribute.STRING),attributeDefinitions.add(`tabIcon`,void 0).setType(Attribute_1.Attribute.STRING),attributeDefinitions.add(`tabEnableRenderOnDemand`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabDragSpeed`,.3).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabBorderWidth`,-1).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabBorderHeight`,-1).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabSetEnableDeleteWhenEmpty`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableDrop`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableDrag`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableDivide`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableMaximize`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableClose`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableSingleTabStretch`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetAutoSelectTab`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableActiveIcon`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetClassNameTabStrip`,void 0).setType(Attribute_1.Attribute.STRING),attributeDefinitions.add(`tabSetEnableTabStrip`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetEnableTabWrap`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`tabSetTabLocation`,`top`).setType(`ITabLocation`),attributeDefinitions.add(`tabMinWidth`,exports.DefaultMin).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabMinHeight`,exports.DefaultMin).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabSetMinWidth`,exports.DefaultMin).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabSetMinHeight`,exports.DefaultMin).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabMaxWidth`,exports.DefaultMax).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabMaxHeight`,exports.DefaultMax).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabSetMaxWidth`,exports.DefaultMax).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`tabSetMaxHeight`,exports.DefaultMax).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`borderSize`,200).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`borderMinSize`,exports.DefaultMin).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`borderMaxSize`,exports.DefaultMax).setType(Attribute_1.Attribute.NUMBER),attributeDefinitions.add(`borderEnableDrop`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`borderAutoSelectTabWhenOpen`,!0).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`borderAutoSelectTabWhenClosed`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions.add(`borderClassName`,void 0).setType(Attribute_1.Attribute.STRING),attributeDefinitions.add(`borderEnableAutoHide`,!1).setType(Attribute_1.Attribute.BOOLEAN),attributeDefinitions}}exports.Model=Model,Model.MAIN_WINDOW_ID=`__main_window_id__`,Model.attributeDefinitions=Model.createAttributeDefinitions()},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.BorderSet=void 0;let BorderNode_1=require(20);class BorderSet{static fromJson(json,model){let borderSet=new BorderSet(model);borderSet.borders=json.map(borderJson=>BorderNode_1.BorderNode.fromJson(borderJson,model));for(let border of borderSet.borders)borderSet.borderMap.set(border.getLocation(),border);return borderSet}constructor(_model){this.borders=[],this.borderMap=/* @__PURE__ */ new Map,this.layoutHorizontal=!0}toJson(){return this.borders.map(borderNode=>borderNode.toJson())}getLayoutHorizontal(){return this.layoutHorizontal}getBorders(){return this.borders}getBorderMap(){return this.borderMap}forEachNode(fn){for(let borderNode of this.borders){fn(borderNode,0);for(let node of borderNode.getChildren())node.forEachNode(fn,1)}}setPaths(){for(let borderNode of this.borders){let path=`/border/`+borderNode.getLocation().getName();borderNode.setPath(path);let i=0;for(let node of borderNode.getChildren())node.setPath(path+`/t`+i),i++}}findDropTargetNode(dragNode,x,y){for(let border of this.borders)if(border.isShowing()){let dropInfo=border.canDrop(dragNode,x,y);if(dropInfo!==void 0)return dropInfo}}}exports.BorderSet=BorderSet},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.RowNode=void 0;let Attribute_1=require(21),AttributeDefinitions_1=require(22),DockLocation_1=require(13),DropInfo_1=require(23),Orientation_1=require(14),Types_1=require(17),BorderNode_1=require(20),Model_1=require(24),Node_1=require(27),TabSetNode_1=require(28),Utils_1=require(29);class RowNode extends Node_1.Node{static fromJson(json,model,layoutWindow){let newLayoutNode=new RowNode(model,layoutWindow.windowId,json);if(json.children!=null)for(let jsonChild of json.children)if(jsonChild.type===TabSetNode_1.TabSetNode.TYPE){let child=TabSetNode_1.TabSetNode.fromJson(jsonChild,model,layoutWindow);newLayoutNode.addChild(child)}else{let child=RowNode.fromJson(jsonChild,model,layoutWindow);newLayoutNode.addChild(child)}return newLayoutNode}constructor(model,windowId,json){super(model),this.windowId=windowId,this.minHeight=Model_1.DefaultMin,this.minWidth=Model_1.DefaultMin,this.maxHeight=Model_1.DefaultMax,this.maxWidth=Model_1.DefaultMax,RowNode.attributeDefinitions.fromJson(json,this.attributes),this.normalizeWeights(),model.addNode(this)}getWeight(){return this.attributes.weight}toJson(){let json={};RowNode.attributeDefinitions.toJson(json,this.attributes),json.children=[];for(let child of this.children)json.children.push(child.toJson());return json}getWindowId(){return this.windowId}setWindowId(windowId){this.windowId=windowId}setWeight(weight){this.attributes.weight=weight}getSplitterBounds(index){let h=this.getOrientation()===Orientation_1.Orientation.HORZ,c=this.getChildren(),ss=this.model.getSplitterSize(),fr=c[0].getRect(),lr=c[c.length-1].getRect(),p=h?[fr.x,lr.getRight()]:[fr.y,lr.getBottom()],q=h?[fr.x,lr.getRight()]:[fr.y,lr.getBottom()];for(let i=0;i<index;i++){let n=c[i];p[0]+=h?n.getMinWidth():n.getMinHeight(),q[0]+=h?n.getMaxWidth():n.getMaxHeight(),i>0&&(p[0]+=ss,q[0]+=ss)}for(let i=c.length-1;i>=index;i--){let n=c[i];p[1]-=(h?n.getMinWidth():n.getMinHeight())+ss,q[1]-=(h?n.getMaxWidth():n.getMaxHeight())+ss}return p=[Math.max(q[1],p[0]),Math.min(q[0],p[1])],p}getSplitterInitials(index){let h=this.getOrientation()===Orientation_1.Orientation.HORZ,c=this.getChildren(),ss=this.model.getSplitterSize(),initialSizes=[],sum=0;for(let i=0;i<c.length;i++){let r=c[i].getRect(),s=h?r.width:r.height;initialSizes.push(s),sum+=s}let startRect=c[index].getRect(),startPosition=(h?startRect.x:startRect.y)-ss;return{initialSizes,sum,startPosition}}calculateSplit(index,splitterPos,initialSizes,sum,startPosition){let h=this.getOrientation()===Orientation_1.Orientation.HORZ,c=this.getChildren(),sn=c[index],smax=h?sn.getMaxWidth():sn.getMaxHeight(),sizes=[...initialSizes];if(splitterPos<startPosition){let shift=startPosition-splitterPos,altShift=0;sizes[index]+shift>smax?(altShift=sizes[index]+shift-smax,sizes[index]=smax):sizes[index]+=shift;for(let i=index-1;i>=0;i--){let n=c[i],m=h?n.getMinWidth():n.getMinHeight();if(sizes[i]-shift>m){sizes[i]-=shift;break}else shift-=sizes[i]-m,sizes[i]=m}for(let i=index+1;i<c.length;i++){let n=c[i],m=h?n.getMaxWidth():n.getMaxHeight();if(sizes[i]+altShift<m){sizes[i]+=altShift;break}else altShift-=m-sizes[i],sizes[i]=m}}else{let shift=splitterPos-startPosition,altShift=0;sizes[index-1]+shift>smax?(altShift=sizes[index-1]+shift-smax,sizes[index-1]=smax):sizes[index-1]+=shift;for(let i=index;i<c.length;i++){let n=c[i],m=h?n.getMinWidth():n.getMinHeight();if(sizes[i]-shift>m){sizes[i]-=shift;break}else shift-=sizes[i]-m,sizes[i]=m}for(let i=index-1;i>=0;i--){let n=c[i],m=h?n.getMaxWidth():n.getMaxHeight();if(sizes[i]+altShift<m){sizes[i]+=altShift;break}else altShift-=m-sizes[i],sizes[i]=m}}return sizes.map(s=>Math.max(.1,s)*100/sum)}getMinSize(orientation){return orientation===Orientation_1.Orientation.HORZ?this.getMinWidth():this.getMinHeight()}getMinWidth(){return this.minWidth}getMinHeight(){return this.minHeight}getMaxSize(orientation){return orientation===Orientation_1.Orientation.HORZ?this.getMaxWidth():this.getMaxHeight()}getMaxWidth(){return this.maxWidth}getMaxHeight(){return this.maxHeight}calcMinMaxSize(){this.minHeight=Model_1.DefaultMin,this.minWidth=Model_1.DefaultMin,this.maxHeight=Model_1.DefaultMax,this.maxWidth=Model_1.DefaultMax;let first=!0;for(let child of this.children){let c=child;c.calcMinMaxSize(),this.getOrientation()===Orientation_1.Orientation.VERT?(this.minHeight+=c.getMinHeight(),this.maxHeight+=c.getMaxHeight(),first||(this.minHeight+=this.model.getSplitterSize(),this.maxHeight+=this.model.getSplitterSize()),this.minWidth=Math.max(this.minWidth,c.getMinWidth()),this.maxWidth=Math.min(this.maxWidth,c.getMaxWidth())):(this.minWidth+=c.getMinWidth(),this.maxWidth+=c.getMaxWidth(),first||(this.minWidth+=this.model.getSplitterSize(),this.maxWidth+=this.model.getSplitterSize()),this.minHeight=Math.max(this.minHeight,c.getMinHeight()),this.maxHeight=Math.min(this.maxHeight,c.getMaxHeight())),first=!1}}tidy(){let i=0;for(;i<this.children.length;){let child=this.children[i];if(child instanceof RowNode){child.tidy();let childChildren=child.getChildren();if(childChildren.length===0)this.removeChild(child);else if(childChildren.length===1){let subchild=childChildren[0];if(this.removeChild(child),subchild instanceof RowNode){let subChildrenTotal=0,subChildChildren=subchild.getChildren();for(let ssc of subChildChildren)subChildrenTotal+=ssc.getWeight();for(let j=0;j<subChildChildren.length;j++){let subsubChild=subChildChildren[j];subsubChild.setWeight(child.getWeight()*subsubChild.getWeight()/subChildrenTotal),this.addChild(subsubChild,i+j)}}else subchild.setWeight(child.getWeight()),this.addChild(subchild,i)}else i++}else child instanceof TabSetNode_1.TabSetNode&&child.getChildren().length===0&&child.isEnableDeleteWhenEmpty()?(this.removeChild(child),child===this.model.getMaximizedTabset(this.windowId)&&this.model.setMaximizedTabset(void 0,this.windowId)):i++}if(this===this.model.getRoot(this.windowId)&&this.children.length===0){let callback=this.model.getOnCreateTabSet(),attrs=callback?callback():{};attrs=Object.assign(Object.assign({},attrs),{selected:-1});let child=new TabSetNode_1.TabSetNode(this.model,attrs);this.model.setActiveTabset(child,this.windowId),this.addChild(child)}}canDrop(dragNode,x,y){let yy=y-this.rect.y,xx=x-this.rect.x,w=this.rect.width,h=this.rect.height,margin=10,half=50,dropInfo;if(!(this.getWindowId()!==Model_1.Model.MAIN_WINDOW_ID&&!(0,Utils_1.canDockToWindow)(dragNode))){if(this.model.isEnableEdgeDock()&&this.parent===void 0){if(x<this.rect.x+10&&yy>h/2-50&&yy<h/2+50){let dockLocation=DockLocation_1.DockLocation.LEFT,outlineRect=dockLocation.getDockRect(this.rect);outlineRect.width/=2,dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT_EDGE)}else if(x>this.rect.getRight()-10&&yy>h/2-50&&yy<h/2+50){let dockLocation=DockLocation_1.DockLocation.RIGHT,outlineRect=dockLocation.getDockRect(this.rect);outlineRect.width/=2,outlineRect.x+=outlineRect.width,dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT_EDGE)}else if(y<this.rect.y+10&&xx>w/2-50&&xx<w/2+50){let dockLocation=DockLocation_1.DockLocation.TOP,outlineRect=dockLocation.getDockRect(this.rect);outlineRect.height/=2,dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT_EDGE)}else if(y>this.rect.getBottom()-10&&xx>w/2-50&&xx<w/2+50){let dockLocation=DockLocation_1.DockLocation.BOTTOM,outlineRect=dockLocation.getDockRect(this.rect);outlineRect.height/=2,outlineRect.y+=outlineRect.height,dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT_EDGE)}if(dropInfo!==void 0&&!dragNode.canDockInto(dragNode,dropInfo))return}return dropInfo}}drop(dragNode,location,index){let dockLocation=location,parent=dragNode.getParent();parent&&parent.removeChild(dragNode),parent!==void 0&&parent instanceof TabSetNode_1.TabSetNode&&parent.setSelected(0),parent!==void 0&&parent instanceof BorderNode_1.BorderNode&&parent.setSelected(-1);let node;if(dragNode instanceof TabSetNode_1.TabSetNode||dragNode instanceof RowNode)node=dragNode,node instanceof RowNode&&node.getOrientation()===this.getOrientation()&&(location.getOrientation()===this.getOrientation()||location===DockLocation_1.DockLocation.CENTER)&&(node=new RowNode(this.model,this.windowId,{}),node.addChild(dragNode));else{let callback=this.model.getOnCreateTabSet();node=new TabSetNode_1.TabSetNode(this.model,callback?callback(dragNode):{}),node.addChild(dragNode)}let size=this.children.reduce((sum,child)=>sum+child.getWeight(),0);size===0&&(size=100),node.setWeight(size/3);let horz=!this.model.isRootOrientationVertical();if(dockLocation===DockLocation_1.DockLocation.CENTER)index===-1?this.addChild(node,this.children.length):this.addChild(node,index);else if(horz&&dockLocation===DockLocation_1.DockLocation.LEFT||!horz&&dockLocation===DockLocation_1.DockLocation.TOP)this.addChild(node,0);else if(horz&&dockLocation===DockLocation_1.DockLocation.RIGHT||!horz&&dockLocation===DockLocation_1.DockLocation.BOTTOM)this.addChild(node);else if(horz&&dockLocation===DockLocation_1.DockLocation.TOP||!horz&&dockLocation===DockLocation_1.DockLocation.LEFT){let vrow=new RowNode(this.model,this.windowId,{}),hrow=new RowNode(this.model,this.windowId,{});hrow.setWeight(75),node.setWeight(25);for(let child of this.children)hrow.addChild(child);this.removeAll(),vrow.addChild(node),vrow.addChild(hrow),this.addChild(vrow)}else if(horz&&dockLocation===DockLocation_1.DockLocation.BOTTOM||!horz&&dockLocation===DockLocation_1.DockLocation.RIGHT){let vrow=new RowNode(this.model,this.windowId,{}),hrow=new RowNode(this.model,this.windowId,{});hrow.setWeight(75),node.setWeight(25);for(let child of this.children)hrow.addChild(child);this.removeAll(),vrow.addChild(hrow),vrow.addChild(node),this.addChild(vrow)}node instanceof TabSetNode_1.TabSetNode&&this.model.setActiveTabset(node,this.windowId),this.model.tidy()}isEnableDrop(){return!0}getAttributeDefinitions(){return RowNode.attributeDefinitions}updateAttrs(json){RowNode.attributeDefinitions.update(json,this.attributes)}static getAttributeDefinitions(){return RowNode.attributeDefinitions}normalizeWeights(){let sum=0;for(let n of this.children)sum+=n.getWeight();sum===0&&(sum=1);for(let n of this.children){let node=n;node.setWeight(Math.max(.001,100*node.getWeight()/sum))}}static createAttributeDefinitions(){let attributeDefinitions=new AttributeDefinitions_1.AttributeDefinitions;return attributeDefinitions.add(`type`,RowNode.TYPE,!0).setType(Attribute_1.Attribute.STRING).setFixed(),attributeDefinitions.add(`id`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`the unique id of the row, if left undefined a uuid will be assigned`),attributeDefinitions.add(`weight`,100).setType(Attribute_1.Attribute.NUMBER).setDescription(`relative weight for sizing of this row in parent row`),attributeDefinitions}}exports.RowNode=RowNode,RowNode.TYPE=`row`,RowNode.attributeDefinitions=RowNode.createAttributeDefinitions()},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Node=void 0;let DockLocation_1=require(13),Orientation_1=require(14),Rect_1=require(15);class Node{constructor(_model){this.model=_model,this.attributes={},this.children=[],this.rect=Rect_1.Rect.empty(),this.listeners=/* @__PURE__ */ new Map,this.path=``}getId(){let id=this.attributes.id;return id===void 0?(id=this.model.nextUniqueId(),this.setId(id),id):id}getModel(){return this.model}getType(){return this.attributes.type}getParent(){return this.parent}getChildren(){return this.children}getRect(){return this.rect}getPath(){return this.path}getOrientation(){return this.parent===void 0?this.model.isRootOrientationVertical()?Orientation_1.Orientation.VERT:Orientation_1.Orientation.HORZ:Orientation_1.Orientation.flip(this.parent.getOrientation())}setEventListener(event,callback){this.listeners.set(event,callback)}removeEventListener(event){this.listeners.delete(event)}setId(id){this.attributes.id=id}fireEvent(event,params){this.listeners.has(event)&&this.listeners.get(event)(params)}getAttr(name){let val=this.attributes[name];if(val===void 0){let modelName=this.getAttributeDefinitions().getModelName(name);modelName!==void 0&&(val=this.model.getAttribute(modelName))}return val}forEachNode(fn,level){fn(this,level),level++;for(let node of this.children)node.forEachNode(fn,level)}setPaths(path){let i=0;for(let node of this.children){let newPath=path;node.getType()===`row`?node.getOrientation()===Orientation_1.Orientation.VERT?newPath+=`/c`+i:newPath+=`/r`+i:node.getType()===`tabset`?newPath+=`/ts`+i:node.getType()===`tab`&&(newPath+=`/t`+i),node.path=newPath,node.setPaths(newPath),i++}}setParent(parent){this.parent=parent}setRect(rect){this.rect=rect}setPath(path){this.path=path}setWeight(weight){this.attributes.weight=weight}setSelected(index){this.attributes.selected=index}findDropTargetNode(windowId,dragNode,x,y){let rtn;if(this.rect.contains(x,y)){if(this.model.getMaximizedTabset(windowId)!==void 0)rtn=this.model.getMaximizedTabset(windowId).canDrop(dragNode,x,y);else if(rtn=this.canDrop(dragNode,x,y),rtn===void 0&&this.children.length!==0){for(let child of this.children)if(rtn=child.findDropTargetNode(windowId,dragNode,x,y),rtn!==void 0)break}}return rtn}canDrop(dragNode,x,y){}canDockInto(dragNode,dropInfo){if(dropInfo!=null){if(dropInfo.location===DockLocation_1.DockLocation.CENTER&&dropInfo.node.isEnableDrop()===!1||dropInfo.location===DockLocation_1.DockLocation.CENTER&&dragNode.getType()===`tabset`&&dragNode.getName()!==void 0||dropInfo.location!==DockLocation_1.DockLocation.CENTER&&dropInfo.node.isEnableDivide()===!1)return!1;if(this.model.getOnAllowDrop())return this.model.getOnAllowDrop()(dragNode,dropInfo)}return!0}removeChild(childNode){let pos=this.children.indexOf(childNode);return pos!==-1&&this.children.splice(pos,1),pos}addChild(childNode,pos){return pos==null?(this.children.push(childNode),pos=this.children.length-1):this.children.splice(pos,0,childNode),childNode.parent=this,pos}removeAll(){this.children=[]}styleWithPosition(style){return style??={},this.rect.styleWithPosition(style)}isEnableDivide(){return!0}toAttributeString(){return JSON.stringify(this.attributes,void 0,`	`)}}exports.Node=Node},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabSetNode=void 0;let Attribute_1=require(21),AttributeDefinitions_1=require(22),DockLocation_1=require(13),DropInfo_1=require(23),Orientation_1=require(14),Rect_1=require(15),Types_1=require(17),Utils_1=require(29),BorderNode_1=require(20),Model_1=require(24),Node_1=require(27),RowNode_1=require(26),TabNode_1=require(30),Utils_2=require(31);class TabSetNode extends Node_1.Node{static fromJson(json,model,layoutWindow){let newLayoutNode=new TabSetNode(model,json);if(json.children!=null)for(let jsonChild of json.children){let child=TabNode_1.TabNode.fromJson(jsonChild,model);newLayoutNode.addChild(child)}return newLayoutNode.children.length===0&&newLayoutNode.setSelected(-1),json.maximized&&json.maximized===!0&&(layoutWindow.maximizedTabSet=newLayoutNode),json.active&&json.active===!0&&(layoutWindow.activeTabSet=newLayoutNode),newLayoutNode}constructor(model,json){super(model),this.tabStripRect=Rect_1.Rect.empty(),this.contentRect=Rect_1.Rect.empty(),this.calculatedMinHeight=0,this.calculatedMinWidth=0,this.calculatedMaxHeight=0,this.calculatedMaxWidth=0,TabSetNode.attributeDefinitions.fromJson(json,this.attributes),model.addNode(this)}getName(){return this.getAttr(`name`)}isEnableActiveIcon(){return this.getAttr(`enableActiveIcon`)}getSelected(){let selected=this.attributes.selected;return selected===void 0?-1:selected}getSelectedNode(){let selected=this.getSelected();if(selected!==-1)return this.children[selected]}getWeight(){return this.getAttr(`weight`)}getAttrMinWidth(){return this.getAttr(`minWidth`)}getAttrMinHeight(){return this.getAttr(`minHeight`)}getMinWidth(){return this.calculatedMinWidth}getMinHeight(){return this.calculatedMinHeight}getMinSize(orientation){return orientation===Orientation_1.Orientation.HORZ?this.getMinWidth():this.getMinHeight()}getAttrMaxWidth(){return this.getAttr(`maxWidth`)}getAttrMaxHeight(){return this.getAttr(`maxHeight`)}getMaxWidth(){return this.calculatedMaxWidth}getMaxHeight(){return this.calculatedMaxHeight}getMaxSize(orientation){return orientation===Orientation_1.Orientation.HORZ?this.getMaxWidth():this.getMaxHeight()}getConfig(){return this.attributes.config}isMaximized(){return this.model.getMaximizedTabset(this.getWindowId())===this}isActive(){return this.model.getActiveTabset(this.getWindowId())===this}isEnableDeleteWhenEmpty(){return this.getAttr(`enableDeleteWhenEmpty`)}isEnableDrop(){return this.getAttr(`enableDrop`)}isEnableTabWrap(){return this.getAttr(`enableTabWrap`)}isEnableDrag(){return this.getAttr(`enableDrag`)}isEnableDivide(){return this.getAttr(`enableDivide`)}isEnableMaximize(){return this.getAttr(`enableMaximize`)}isEnableClose(){return this.getAttr(`enableClose`)}isEnableSingleTabStretch(){return this.getAttr(`enableSingleTabStretch`)}isEnableTabStrip(){return this.getAttr(`enableTabStrip`)}isAutoSelectTab(){return this.getAttr(`autoSelectTab`)}getClassNameTabStrip(){return this.getAttr(`classNameTabStrip`)}getTabLocation(){return this.getAttr(`tabLocation`)}toJson(){let json={};return TabSetNode.attributeDefinitions.toJson(json,this.attributes),json.children=this.children.map(child=>child.toJson()),this.isActive()&&(json.active=!0),this.isMaximized()&&(json.maximized=!0),json}calcMinMaxSize(){this.calculatedMinHeight=this.getAttrMinHeight(),this.calculatedMinWidth=this.getAttrMinWidth(),this.calculatedMaxHeight=this.getAttrMaxHeight(),this.calculatedMaxWidth=this.getAttrMaxWidth();for(let child of this.children){let c=child;this.calculatedMinWidth=Math.max(this.calculatedMinWidth,c.getMinWidth()),this.calculatedMinHeight=Math.max(this.calculatedMinHeight,c.getMinHeight()),this.calculatedMaxWidth=Math.min(this.calculatedMaxWidth,c.getMaxWidth()),this.calculatedMaxHeight=Math.min(this.calculatedMaxHeight,c.getMaxHeight())}this.calculatedMinHeight+=this.tabStripRect.height,this.calculatedMaxHeight+=this.tabStripRect.height}canMaximize(){return this.isEnableMaximize()?this.getModel().getMaximizedTabset(this.getWindowId())===this?!0:!(this.getParent()===this.getModel().getRoot(this.getWindowId())&&this.getModel().getRoot(this.getWindowId()).getChildren().length===1):!1}setContentRect(rect){this.contentRect=rect}getContentRect(){return this.contentRect}setTabStripRect(rect){this.tabStripRect=rect}setWeight(weight){this.attributes.weight=weight}setSelected(index){this.attributes.selected=index}getWindowId(){return this.parent.getWindowId()}canDrop(dragNode,x,y){let dropInfo;if(dragNode===this){let dockLocation=DockLocation_1.DockLocation.CENTER,outlineRect=this.tabStripRect;dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}else if(this.getWindowId()!==Model_1.Model.MAIN_WINDOW_ID&&!(0,Utils_1.canDockToWindow)(dragNode))return;else if(this.contentRect.contains(x,y)){let dockLocation=DockLocation_1.DockLocation.CENTER;this.model.getMaximizedTabset(this.parent.getWindowId())===void 0&&(dockLocation=DockLocation_1.DockLocation.getLocation(this.contentRect,x,y));let outlineRect=dockLocation.getDockRect(this.rect);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,-1,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}else if(this.tabStripRect!=null&&this.tabStripRect.contains(x,y)){let r,yy,h;if(this.children.length===0)r=this.tabStripRect.clone(),yy=r.y+3,h=r.height-4,r.width=2;else{let child=this.children[0];r=child.getTabRect(),yy=r.y,h=r.height;let p=this.tabStripRect.x,childCenter=0;for(let i=0;i<this.children.length;i++){if(child=this.children[i],r=child.getTabRect(),r.y!==yy&&(yy=r.y,p=this.tabStripRect.x),childCenter=r.x+r.width/2,x>=p&&x<childCenter&&y>r.y&&y<r.getBottom()){let dockLocation=DockLocation_1.DockLocation.CENTER,outlineRect=new Rect_1.Rect(r.x-2,r.y,3,r.height);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,i,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT);break}p=childCenter}}if(dropInfo==null){let dockLocation=DockLocation_1.DockLocation.CENTER,outlineRect=new Rect_1.Rect(r.getRight()-2,yy,3,h);dropInfo=new DropInfo_1.DropInfo(this,outlineRect,dockLocation,this.children.length,Types_1.CLASSES.FLEXLAYOUT__OUTLINE_RECT)}}if(dragNode.canDockInto(dragNode,dropInfo))return dropInfo}delete(){this.parent.removeChild(this)}remove(node){let removedIndex=this.removeChild(node);this.model.tidy(),(0,Utils_2.adjustSelectedIndex)(this,removedIndex)}drop(dragNode,location,index,select){let dockLocation=location;if(this===dragNode)return;let dragParent=dragNode.getParent(),fromIndex=0;if(dragParent!==void 0&&(fromIndex=dragParent.removeChild(dragNode),dragParent instanceof BorderNode_1.BorderNode&&dragParent.getSelected()===fromIndex?dragParent.setSelected(-1):(0,Utils_2.adjustSelectedIndex)(dragParent,fromIndex)),dragNode instanceof TabNode_1.TabNode&&dragParent===this&&fromIndex<index&&index>0&&index--,dockLocation===DockLocation_1.DockLocation.CENTER){let insertPos=index;if(insertPos===-1&&(insertPos=this.children.length),dragNode instanceof TabNode_1.TabNode)this.addChild(dragNode,insertPos),(select||select!==!1&&this.isAutoSelectTab())&&this.setSelected(insertPos);else if(dragNode instanceof RowNode_1.RowNode)dragNode.forEachNode((child,level)=>{child instanceof TabNode_1.TabNode&&(this.addChild(child,insertPos),insertPos++)},0);else{for(let i=0;i<dragNode.getChildren().length;i++){let child=dragNode.getChildren()[i];this.addChild(child,insertPos),insertPos++}this.getSelected()===-1&&this.children.length>0&&this.setSelected(0)}this.model.setActiveTabset(this,this.parent.getWindowId())}else{let moveNode=dragNode;if(dragNode instanceof TabNode_1.TabNode){let callback=this.model.getOnCreateTabSet();moveNode=new TabSetNode(this.model,callback?callback(dragNode):{}),moveNode.addChild(dragNode),dragParent=moveNode}else if(dragNode instanceof RowNode_1.RowNode){let parent=this.getParent();if(dragNode.getOrientation()===parent.getOrientation()&&(location.getOrientation()===parent.getOrientation()||location===DockLocation_1.DockLocation.CENTER)){let node=new RowNode_1.RowNode(this.model,this.getWindowId(),{});node.addChild(dragNode),moveNode=node}}else moveNode=dragNode;let parentRow=this.parent,pos=parentRow.getChildren().indexOf(this);if(parentRow.getOrientation()===dockLocation.orientation)moveNode.setWeight(this.getWeight()/2),this.setWeight(this.getWeight()/2),parentRow.addChild(moveNode,pos+dockLocation.indexPlus);else{let newRow=new RowNode_1.RowNode(this.model,this.getWindowId(),{});newRow.setWeight(this.getWeight()),newRow.addChild(this),this.setWeight(50),moveNode.setWeight(50),newRow.addChild(moveNode,dockLocation.indexPlus),parentRow.removeChild(this),parentRow.addChild(newRow,pos)}moveNode instanceof TabSetNode&&this.model.setActiveTabset(moveNode,this.getWindowId())}this.model.tidy()}updateAttrs(json){TabSetNode.attributeDefinitions.update(json,this.attributes)}getAttributeDefinitions(){return TabSetNode.attributeDefinitions}static getAttributeDefinitions(){return TabSetNode.attributeDefinitions}static createAttributeDefinitions(){let attributeDefinitions=new AttributeDefinitions_1.AttributeDefinitions;return attributeDefinitions.add(`type`,TabSetNode.TYPE,!0).setType(Attribute_1.Attribute.STRING).setFixed(),attributeDefinitions.add(`id`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`the unique id of the tab set, if left undefined a uuid will be assigned`),attributeDefinitions.add(`weight`,100).setType(Attribute_1.Attribute.NUMBER).setDescription(`relative weight for sizing of this tabset in parent row`),attributeDefinitions.add(`selected`,0).setType(Attribute_1.Attribute.NUMBER).setDescription(`index of selected/visible tab in tabset`),attributeDefinitions.add(`name`,void 0).setType(Attribute_1.Attribute.STRING),attributeDefinitions.add(`config`,void 0).setType(`any`).setDescription(`a place to hold json config used in your own code`),attributeDefinitions.addInherited(`enableDeleteWhenEmpty`,`tabSetEnableDeleteWhenEmpty`).setDescription(`whether to delete this tabset when is has no tabs`),attributeDefinitions.addInherited(`enableDrop`,`tabSetEnableDrop`).setDescription(`allow user to drag tabs into this tabset`),attributeDefinitions.addInherited(`enableDrag`,`tabSetEnableDrag`).setDescription(`allow user to drag tabs out this tabset`),attributeDefinitions.addInherited(`enableDivide`,`tabSetEnableDivide`).setDescription(`allow user to drag tabs to region of this tabset, splitting into new tabset`),attributeDefinitions.addInherited(`enableMaximize`,`tabSetEnableMaximize`).setDescription(`allow user to maximize tabset to fill view via maximize button`),attributeDefinitions.addInherited(`enableClose`,`tabSetEnableClose`).setDescription(`allow user to close tabset via a close button`),attributeDefinitions.addInherited(`enableSingleTabStretch`,`tabSetEnableSingleTabStretch`).setDescription(`if the tabset has only a single tab then stretch the single tab to fill area and display in a header style`),attributeDefinitions.addInherited(`classNameTabStrip`,`tabSetClassNameTabStrip`).setDescription(`a class name to apply to the tab strip`),attributeDefinitions.addInherited(`enableTabStrip`,`tabSetEnableTabStrip`).setDescription(`enable tab strip and allow multiple tabs in this tabset`),attributeDefinitions.addInherited(`minWidth`,`tabSetMinWidth`).setDescription(`minimum width (in px) for this tabset`),attributeDefinitions.addInherited(`minHeight`,`tabSetMinHeight`).setDescription(`minimum height (in px) for this tabset`),attributeDefinitions.addInherited(`maxWidth`,`tabSetMaxWidth`).setDescription(`maximum width (in px) for this tabset`),attributeDefinitions.addInherited(`maxHeight`,`tabSetMaxHeight`).setDescription(`maximum height (in px) for this tabset`),attributeDefinitions.addInherited(`enableTabWrap`,`tabSetEnableTabWrap`).setDescription(`wrap tabs onto multiple lines`),attributeDefinitions.addInherited(`tabLocation`,`tabSetTabLocation`).setDescription(`the location of the tabs either top or bottom`),attributeDefinitions.addInherited(`autoSelectTab`,`tabSetAutoSelectTab`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether to select new/moved tabs in tabset`),attributeDefinitions.addInherited(`enableActiveIcon`,`tabSetEnableActiveIcon`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether the active icon (*) should be displayed when the tabset is active`),attributeDefinitions}}exports.TabSetNode=TabSetNode,TabSetNode.TYPE=`tabset`,TabSetNode.attributeDefinitions=TabSetNode.createAttributeDefinitions()},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.isDesktop=isDesktop,exports.getRenderStateEx=getRenderStateEx,exports.isAuxMouseEvent=isAuxMouseEvent,exports.enablePointerOnIFrames=enablePointerOnIFrames,exports.getElementsByTagName=getElementsByTagName,exports.startDrag=startDrag,exports.canDockToWindow=canDockToWindow,exports.copyInlineStyles=copyInlineStyles,exports.isSafari=isSafari;let React=__importStar(require(6)),TabNode_1=require(30),TabSetNode_1=require(28);function isDesktop(){return typeof window<`u`&&window.matchMedia&&window.matchMedia(`(hover: hover) and (pointer: fine)`).matches}function getRenderStateEx(layout,node,iconAngle){let leadingContent,titleContent=node.getName(),name=node.getName();iconAngle===void 0&&(iconAngle=0),leadingContent===void 0&&node.getIcon()!==void 0&&(leadingContent=iconAngle===0?React.createElement(`img`,{style:{width:`1em`,height:`1em`},src:node.getIcon(),alt:`leadingContent`}):React.createElement(`img`,{style:{width:`1em`,height:`1em`,transform:`rotate(`+iconAngle+`deg)`},src:node.getIcon(),alt:`leadingContent`}));let renderState={leading:leadingContent,content:titleContent,name,buttons:[]};return layout.customizeTab(node,renderState),node.setRenderedName(renderState.name),renderState}function isAuxMouseEvent(event){let auxEvent=!1;return event.nativeEvent instanceof MouseEvent&&(event.nativeEvent.button!==0||event.ctrlKey||event.altKey||event.metaKey||event.shiftKey)&&(auxEvent=!0),auxEvent}function enablePointerOnIFrames(enable,currentDocument){let iframes=[...getElementsByTagName(`iframe`,currentDocument),...getElementsByTagName(`webview`,currentDocument)];for(let iframe of iframes)iframe.style.pointerEvents=enable?`auto`:`none`}function getElementsByTagName(tag,currentDocument){return[...currentDocument.getElementsByTagName(tag)]}function startDrag(doc,event,drag,dragEnd,dragCancel){event.preventDefault();let pointerMove=ev=>{ev.preventDefault(),drag(ev.clientX,ev.clientY)},pointerCancel=ev=>{ev.preventDefault(),dragCancel()},pointerUp=()=>{doc.removeEventListener(`pointermove`,pointerMove),doc.removeEventListener(`pointerup`,pointerUp),doc.removeEventListener(`pointercancel`,pointerCancel),dragEnd()};doc.addEventListener(`pointermove`,pointerMove),doc.addEventListener(`pointerup`,pointerUp),doc.addEventListener(`pointercancel`,pointerCancel)}function canDockToWindow(node){if(node instanceof TabNode_1.TabNode)return node.isEnablePopout();if(node instanceof TabSetNode_1.TabSetNode){for(let child of node.getChildren())if(child.isEnablePopout()===!1)return!1;return!0}return!1}function copyInlineStyles(source,target){let sourceStyle=source.getAttribute(`style`);return sourceStyle===target.getAttribute(`style`)?!1:(sourceStyle?target.setAttribute(`style`,sourceStyle):target.removeAttribute(`style`),!0)}function isSafari(){let userAgent=navigator.userAgent;return userAgent.includes(`Safari`)&&!userAgent.includes(`Chrome`)&&!userAgent.includes(`Chromium`)}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabNode=void 0;let Attribute_1=require(21),AttributeDefinitions_1=require(22),Rect_1=require(15),Model_1=require(24),Node_1=require(27),TabSetNode_1=require(28);class TabNode extends Node_1.Node{static fromJson(json,model,addToModel=!0){return new TabNode(model,json,addToModel)}constructor(model,json,addToModel=!0){super(model),this.tabRect=Rect_1.Rect.empty(),this.extra={},this.moveableElement=null,this.tabStamp=null,this.rendered=!1,this.visible=!1,TabNode.attributeDefinitions.fromJson(json,this.attributes),addToModel===!0&&model.addNode(this)}getName(){return this.getAttr(`name`)}getHelpText(){return this.getAttr(`helpText`)}getComponent(){return this.getAttr(`component`)}getWindowId(){return this.parent instanceof TabSetNode_1.TabSetNode?this.parent.getWindowId():Model_1.Model.MAIN_WINDOW_ID}getWindow(){let layoutWindow=this.model.getwindowsMap().get(this.getWindowId());if(layoutWindow)return layoutWindow.window}getConfig(){return this.attributes.config}getExtraData(){return this.extra}isPoppedOut(){return this.getWindowId()!==Model_1.Model.MAIN_WINDOW_ID}isSelected(){return this.getParent().getSelectedNode()===this}getIcon(){return this.getAttr(`icon`)}isEnableClose(){return this.getAttr(`enableClose`)}getCloseType(){return this.getAttr(`closeType`)}isEnablePopout(){return this.getAttr(`enablePopout`)}isEnablePopoutIcon(){return this.getAttr(`enablePopoutIcon`)}isEnablePopoutOverlay(){return this.getAttr(`enablePopoutOverlay`)}isEnableDrag(){return this.getAttr(`enableDrag`)}isEnableRename(){return this.getAttr(`enableRename`)}isEnableWindowReMount(){return this.getAttr(`enableWindowReMount`)}getClassName(){return this.getAttr(`className`)}getContentClassName(){return this.getAttr(`contentClassName`)}getTabSetClassName(){return this.getAttr(`tabsetClassName`)}isEnableRenderOnDemand(){return this.getAttr(`enableRenderOnDemand`)}getMinWidth(){return this.getAttr(`minWidth`)}getMinHeight(){return this.getAttr(`minHeight`)}getMaxWidth(){return this.getAttr(`maxWidth`)}getMaxHeight(){return this.getAttr(`maxHeight`)}toJson(){let json={};return TabNode.attributeDefinitions.toJson(json,this.attributes),json}saveScrollPosition(){this.moveableElement&&(this.scrollLeft=this.moveableElement.scrollLeft,this.scrollTop=this.moveableElement.scrollTop)}restoreScrollPosition(){this.scrollTop&&requestAnimationFrame(()=>{this.moveableElement&&this.scrollTop&&(this.moveableElement.scrollTop=this.scrollTop,this.moveableElement.scrollLeft=this.scrollLeft)})}setRect(rect){rect.equals(this.rect)||(this.fireEvent(`resize`,{rect}),this.rect=rect)}setVisible(visible){visible!==this.visible&&(this.fireEvent(`visibility`,{visible}),this.visible=visible)}getScrollTop(){return this.scrollTop}setScrollTop(scrollTop){this.scrollTop=scrollTop}getScrollLeft(){return this.scrollLeft}setScrollLeft(scrollLeft){this.scrollLeft=scrollLeft}isRendered(){return this.rendered}setRendered(rendered){this.rendered=rendered}getTabRect(){return this.tabRect}setTabRect(rect){this.tabRect=rect}getTabStamp(){return this.tabStamp}setTabStamp(stamp){this.tabStamp=stamp}getMoveableElement(){return this.moveableElement}setMoveableElement(element){this.moveableElement=element}setRenderedName(name){this.renderedName=name}getNameForOverflowMenu(){let altName=this.getAttr(`altName`);return altName===void 0?this.renderedName:altName}setName(name){this.attributes.name=name}delete(){this.parent.remove(this),this.fireEvent(`close`,{})}updateAttrs(json){TabNode.attributeDefinitions.update(json,this.attributes)}getAttributeDefinitions(){return TabNode.attributeDefinitions}setBorderWidth(width){this.attributes.borderWidth=width}setBorderHeight(height){this.attributes.borderHeight=height}static getAttributeDefinitions(){return TabNode.attributeDefinitions}static createAttributeDefinitions(){let attributeDefinitions=new AttributeDefinitions_1.AttributeDefinitions;return attributeDefinitions.add(`type`,TabNode.TYPE,!0).setType(Attribute_1.Attribute.STRING).setFixed(),attributeDefinitions.add(`id`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`the unique id of the tab, if left undefined a uuid will be assigned`),attributeDefinitions.add(`name`,`[Unnamed Tab]`).setType(Attribute_1.Attribute.STRING).setDescription(`name of tab to be displayed in the tab button`),attributeDefinitions.add(`altName`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`if there is no name specifed then this value will be used in the overflow menu`),attributeDefinitions.add(`helpText`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`An optional help text for the tab to be displayed upon tab hover.`),attributeDefinitions.add(`component`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`string identifying which component to run (for factory)`),attributeDefinitions.add(`config`,void 0).setType(`any`).setDescription(`a place to hold json config for the hosted component`),attributeDefinitions.add(`tabsetClassName`,void 0).setType(Attribute_1.Attribute.STRING).setDescription(`class applied to parent tabset when this is the only tab and it is stretched to fill the tabset`),attributeDefinitions.add(`enableWindowReMount`,!1).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`if enabled the tab will re-mount when popped out/in`),attributeDefinitions.addInherited(`enableClose`,`tabEnableClose`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`allow user to close tab via close button`),attributeDefinitions.addInherited(`closeType`,`tabCloseType`).setType(`ICloseType`).setDescription(`see values in ICloseType`),attributeDefinitions.addInherited(`enableDrag`,`tabEnableDrag`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`allow user to drag tab to new location`),attributeDefinitions.addInherited(`enableRename`,`tabEnableRename`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`allow user to rename tabs by double clicking`),attributeDefinitions.addInherited(`className`,`tabClassName`).setType(Attribute_1.Attribute.STRING).setDescription(`class applied to tab button`),attributeDefinitions.addInherited(`contentClassName`,`tabContentClassName`).setType(Attribute_1.Attribute.STRING).setDescription(`class applied to tab content`),attributeDefinitions.addInherited(`icon`,`tabIcon`).setType(Attribute_1.Attribute.STRING).setDescription(`the tab icon`),attributeDefinitions.addInherited(`enableRenderOnDemand`,`tabEnableRenderOnDemand`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether to avoid rendering component until tab is visible`),attributeDefinitions.addInherited(`enablePopout`,`tabEnablePopout`).setType(Attribute_1.Attribute.BOOLEAN).setAlias(`enableFloat`).setDescription(`enable popout (in popout capable browser)`),attributeDefinitions.addInherited(`enablePopoutIcon`,`tabEnablePopoutIcon`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`whether to show the popout icon in the tabset header if this tab enables popouts`),attributeDefinitions.addInherited(`enablePopoutOverlay`,`tabEnablePopoutOverlay`).setType(Attribute_1.Attribute.BOOLEAN).setDescription(`if this tab will not work correctly in a popout window when the main window is backgrounded (inactive)
+            then enabling this option will gray out this tab`),attributeDefinitions.addInherited(`borderWidth`,`tabBorderWidth`).setType(Attribute_1.Attribute.NUMBER).setDescription(`width when added to border, -1 will use border size`),attributeDefinitions.addInherited(`borderHeight`,`tabBorderHeight`).setType(Attribute_1.Attribute.NUMBER).setDescription(`height when added to border, -1 will use border size`),attributeDefinitions.addInherited(`minWidth`,`tabMinWidth`).setType(Attribute_1.Attribute.NUMBER).setDescription(`the min width of this tab`),attributeDefinitions.addInherited(`minHeight`,`tabMinHeight`).setType(Attribute_1.Attribute.NUMBER).setDescription(`the min height of this tab`),attributeDefinitions.addInherited(`maxWidth`,`tabMaxWidth`).setType(Attribute_1.Attribute.NUMBER).setDescription(`the max width of this tab`),attributeDefinitions.addInherited(`maxHeight`,`tabMaxHeight`).setType(Attribute_1.Attribute.NUMBER).setDescription(`the max height of this tab`),attributeDefinitions}}exports.TabNode=TabNode,TabNode.TYPE=`tab`,TabNode.attributeDefinitions=TabNode.createAttributeDefinitions()},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.adjustSelectedIndexAfterDock=adjustSelectedIndexAfterDock,exports.adjustSelectedIndex=adjustSelectedIndex,exports.randomUUID=randomUUID;let TabSetNode_1=require(28),BorderNode_1=require(20);function adjustSelectedIndexAfterDock(node){let parent=node.getParent();if(parent!==null&&(parent instanceof TabSetNode_1.TabSetNode||parent instanceof BorderNode_1.BorderNode)){let children=parent.getChildren();for(let i=0;i<children.length;i++)if(children[i]===node){parent.setSelected(i);return}}}function adjustSelectedIndex(parent,removedIndex){if(parent!==void 0&&(parent instanceof TabSetNode_1.TabSetNode||parent instanceof BorderNode_1.BorderNode)){let selectedIndex=parent.getSelected();selectedIndex!==-1&&(removedIndex===selectedIndex&&parent.getChildren().length>0?removedIndex>=parent.getChildren().length&&parent.setSelected(parent.getChildren().length-1):removedIndex<selectedIndex?parent.setSelected(selectedIndex-1):removedIndex>selectedIndex||parent.setSelected(-1))}}function randomUUID(){return`10000000-1000-4000-8000-100000000000`.replace(/[018]/g,c=>(c^crypto.getRandomValues(new Uint8Array(1))[0]&15>>c/4).toString(16))}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.LayoutWindow=void 0;let Rect_1=require(15),RowNode_1=require(26);class LayoutWindow{constructor(windowId,rect){this._windowId=windowId,this._rect=rect,this._toScreenRectFunction=r=>r}visitNodes(fn){this.root.forEachNode(fn,0)}get windowId(){return this._windowId}get rect(){return this._rect}get layout(){return this._layout}get window(){return this._window}get root(){return this._root}get maximizedTabSet(){return this._maximizedTabSet}get activeTabSet(){return this._activeTabSet}set rect(value){this._rect=value}set layout(value){this._layout=value}set window(value){this._window=value}set root(value){this._root=value}set maximizedTabSet(value){this._maximizedTabSet=value}set activeTabSet(value){this._activeTabSet=value}get toScreenRectFunction(){return this._toScreenRectFunction}set toScreenRectFunction(value){this._toScreenRectFunction=value}toJson(){return this._window&&this._window.screenTop>-1e4&&(this.rect=new Rect_1.Rect(this._window.screenLeft,this._window.screenTop,this._window.outerWidth,this._window.outerHeight)),{layout:this.root.toJson(),rect:this.rect.toJson()}}static fromJson(windowJson,model,windowId){let count=model.getwindowsMap().size,rect=windowJson.rect?Rect_1.Rect.fromJson(windowJson.rect):new Rect_1.Rect(50+50*count,50+50*count,600,400);rect.snap(10);let layoutWindow=new LayoutWindow(windowId,rect);return layoutWindow.root=RowNode_1.RowNode.fromJson(windowJson.layout,model,layoutWindow),layoutWindow}}exports.LayoutWindow=LayoutWindow},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.BorderTab=BorderTab;let React=__importStar(require(6)),Orientation_1=require(14),Rect_1=require(15),Splitter_1=require(34),DockLocation_1=require(13),Types_1=require(17);function BorderTab(props){let{layout,border,show}=props,selfRef=React.useRef(null);React.useLayoutEffect(()=>{let outerRect=layout.getBoundingClientRect(selfRef.current),contentRect=Rect_1.Rect.getContentRect(selfRef.current).relativeTo(layout.getDomRect());outerRect.width>0&&(border.setOuterRect(outerRect),border.getContentRect().equals(contentRect)||(border.setContentRect(contentRect),layout.redrawInternal(`border content rect`)))});let horizontal=!0,style={};border.getOrientation()===Orientation_1.Orientation.HORZ?(style.width=border.getSize(),style.minWidth=border.getMinSize(),style.maxWidth=border.getMaxSize()):(style.height=border.getSize(),style.minHeight=border.getMinSize(),style.maxHeight=border.getMaxSize(),horizontal=!1),style.display=show?`flex`:`none`;let className=layout.getClassName(Types_1.CLASSES.FLEXLAYOUT__BORDER_TAB_CONTENTS);return border.getLocation()===DockLocation_1.DockLocation.LEFT||border.getLocation()===DockLocation_1.DockLocation.TOP?React.createElement(React.Fragment,null,React.createElement(`div`,{ref:selfRef,style,className}),show&&React.createElement(Splitter_1.Splitter,{layout,node:border,index:0,horizontal})):React.createElement(React.Fragment,null,show&&React.createElement(Splitter_1.Splitter,{layout,node:border,index:0,horizontal}),React.createElement(`div`,{ref:selfRef,style,className}))}},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Splitter=void 0;let React=__importStar(require(6)),Actions_1=require(18),BorderNode_1=require(20),RowNode_1=require(26),Orientation_1=require(14),Types_1=require(17),Utils_1=require(29),Rect_1=require(15),Splitter=props=>{let{layout,node,index,horizontal}=props,[dragging,setDragging]=React.useState(!1),selfRef=React.useRef(null),extendedRef=React.useRef(null),pBounds=React.useRef([]),outlineDiv=React.useRef(void 0),handleDiv=React.useRef(void 0),dragStartX=React.useRef(0),dragStartY=React.useRef(0),initalSizes=React.useRef({initialSizes:[],sum:0,startPosition:0}),size=node.getModel().getSplitterSize(),extra=node.getModel().getSplitterExtra();(0,Utils_1.isDesktop)()||(extra=Math.max(30,extra+size)-size),React.useEffect(()=>{var _a,_b;return(_a=selfRef.current)?.addEventListener(`touchstart`,onTouchStart,{passive:!1}),(_b=extendedRef.current)?.addEventListener(`touchstart`,onTouchStart,{passive:!1}),()=>{var _a,_b;(_a=selfRef.current)?.removeEventListener(`touchstart`,onTouchStart),(_b=extendedRef.current)?.removeEventListener(`touchstart`,onTouchStart)}},[]);let onTouchStart=event=>{event.preventDefault(),event.stopImmediatePropagation()},onPointerDown=event=>{var _a;event.stopPropagation(),node instanceof RowNode_1.RowNode&&(initalSizes.current=node.getSplitterInitials(index)),(0,Utils_1.enablePointerOnIFrames)(!1,layout.getCurrentDocument()),(0,Utils_1.startDrag)(event.currentTarget.ownerDocument,event,onDragMove,onDragEnd,onDragCancel),pBounds.current=node.getSplitterBounds(index,!0);let rootdiv=layout.getRootDiv();outlineDiv.current=layout.getCurrentDocument().createElement(`div`),outlineDiv.current.style.flexDirection=horizontal?`row`:`column`,outlineDiv.current.className=layout.getClassName(Types_1.CLASSES.FLEXLAYOUT__SPLITTER_DRAG),outlineDiv.current.style.cursor=node.getOrientation()===Orientation_1.Orientation.VERT?`ns-resize`:`ew-resize`,node.getModel().isSplitterEnableHandle()&&(handleDiv.current=layout.getCurrentDocument().createElement(`div`),handleDiv.current.className=cm(Types_1.CLASSES.FLEXLAYOUT__SPLITTER_HANDLE)+` `+cm(horizontal?Types_1.CLASSES.FLEXLAYOUT__SPLITTER_HANDLE_HORZ:Types_1.CLASSES.FLEXLAYOUT__SPLITTER_HANDLE_VERT),outlineDiv.current.appendChild(handleDiv.current));let r=(_a=selfRef.current)?.getBoundingClientRect(),rect=new Rect_1.Rect(r.x-layout.getDomRect().x,r.y-layout.getDomRect().y,r.width,r.height);dragStartX.current=event.clientX-r.x,dragStartY.current=event.clientY-r.y,rect.positionElement(outlineDiv.current),rootdiv&&rootdiv.appendChild(outlineDiv.current),setDragging(!0)},onDragCancel=()=>{let rootdiv=layout.getRootDiv();rootdiv&&outlineDiv.current&&rootdiv.removeChild(outlineDiv.current),outlineDiv.current=void 0,setDragging(!1)},onDragMove=(x,y)=>{if(outlineDiv.current){let clientRect=layout.getDomRect();if(!clientRect)return;node.getOrientation()===Orientation_1.Orientation.VERT?outlineDiv.current.style.top=getBoundPosition(y-clientRect.y-dragStartY.current)+`px`:outlineDiv.current.style.left=getBoundPosition(x-clientRect.x-dragStartX.current)+`px`,layout.isRealtimeResize()&&updateLayout(!0)}},onDragEnd=()=>{if(outlineDiv.current){updateLayout(!1);let rootdiv=layout.getRootDiv();rootdiv&&outlineDiv.current&&rootdiv.removeChild(outlineDiv.current),outlineDiv.current=void 0}(0,Utils_1.enablePointerOnIFrames)(!0,layout.getCurrentDocument()),setDragging(!1)},updateLayout=realtime=>{let redraw=()=>{if(outlineDiv.current){let value=0;if(value=node.getOrientation()===Orientation_1.Orientation.VERT?outlineDiv.current.offsetTop:outlineDiv.current.offsetLeft,node instanceof BorderNode_1.BorderNode){let pos=node.calculateSplit(node,value);layout.doAction(Actions_1.Actions.adjustBorderSplit(node.getId(),pos))}else{let init=initalSizes.current,weights=node.calculateSplit(index,value,init.initialSizes,init.sum,init.startPosition);layout.doAction(Actions_1.Actions.adjustWeights(node.getId(),weights))}}};redraw()},getBoundPosition=p=>{let bounds=pBounds.current,rtn=p;return p<bounds[0]&&(rtn=bounds[0]),p>bounds[1]&&(rtn=bounds[1]),rtn},cm=layout.getClassName,style={cursor:horizontal?`ew-resize`:`ns-resize`,flexDirection:horizontal?`column`:`row`},className=cm(Types_1.CLASSES.FLEXLAYOUT__SPLITTER)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__SPLITTER_+node.getOrientation().getName());node instanceof BorderNode_1.BorderNode?className+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__SPLITTER_BORDER):node.getModel().getMaximizedTabset(layout.getWindowId())!==void 0&&(style.display=`none`),horizontal?(style.width=size+`px`,style.minWidth=size+`px`):(style.height=size+`px`,style.minHeight=size+`px`);let handle;if(!dragging&&node.getModel().isSplitterEnableHandle()&&(handle=React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__SPLITTER_HANDLE)+` `+cm(horizontal?Types_1.CLASSES.FLEXLAYOUT__SPLITTER_HANDLE_HORZ:Types_1.CLASSES.FLEXLAYOUT__SPLITTER_HANDLE_VERT)})),extra===0)return React.createElement(`div`,{className,style,ref:selfRef,"data-layout-path":node.getPath()+`/s`+(index-1),onPointerDown},handle);{let style2={};node.getOrientation()===Orientation_1.Orientation.HORZ?(style2.height=`100%`,style2.width=size+extra+`px`,style2.cursor=`ew-resize`):(style2.height=size+extra+`px`,style2.width=`100%`,style2.cursor=`ns-resize`);let className2=cm(Types_1.CLASSES.FLEXLAYOUT__SPLITTER_EXTRA);return React.createElement(`div`,{className,style,ref:selfRef,"data-layout-path":node.getPath()+`/s`+(index-1),onPointerDown},React.createElement(`div`,{style:style2,ref:extendedRef,className:className2,onPointerDown}))}};exports.Splitter=Splitter},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.BorderTabSet=void 0;let React=__importStar(require(6)),DockLocation_1=require(13),BorderButton_1=require(36),PopupMenu_1=require(38),Actions_1=require(18),I18nLabel_1=require(16),TabOverflowHook_1=require(40),Orientation_1=require(14),Types_1=require(17),Utils_1=require(29),Rect_1=require(15),BorderTabSet=props=>{let{border,layout,size}=props,toolbarRef=React.useRef(null),overflowbuttonRef=React.useRef(null),stickyButtonsRef=React.useRef(null),icons=layout.getIcons();React.useLayoutEffect(()=>{border.setTabHeaderRect(Rect_1.Rect.getBoundingClientRect(selfRef.current).relativeTo(layout.getDomRect()))});let{selfRef,position,userControlledLeft,hiddenTabs,onMouseWheel,tabsTruncated}=(0,TabOverflowHook_1.useTabOverflow)(border,Orientation_1.Orientation.flip(border.getOrientation()),toolbarRef,stickyButtonsRef),onAuxMouseClick=event=>{(0,Utils_1.isAuxMouseEvent)(event)&&layout.auxMouseClick(border,event)},onContextMenu=event=>{layout.showContextMenu(border,event)},onInterceptPointerDown=event=>{event.stopPropagation()},onOverflowClick=event=>{let callback=layout.getShowOverflowMenu();if(callback!==void 0)callback(border,event,hiddenTabs,onOverflowItemSelect);else{let element=overflowbuttonRef.current;(0,PopupMenu_1.showPopup)(element,hiddenTabs,onOverflowItemSelect,layout)}event.stopPropagation()},onOverflowItemSelect=item=>{layout.doAction(Actions_1.Actions.selectTab(item.node.getId())),userControlledLeft.current=!1},onPopoutTab=event=>{let selectedTabNode=border.getChildren()[border.getSelected()];selectedTabNode!==void 0&&layout.doAction(Actions_1.Actions.popoutTab(selectedTabNode.getId())),event.stopPropagation()},cm=layout.getClassName,tabButtons=[],layoutTab=i=>{let isSelected=border.getSelected()===i,child=border.getChildren()[i];tabButtons.push(React.createElement(BorderButton_1.BorderButton,{layout,border:border.getLocation().getName(),node:child,path:border.getPath()+`/tb`+i,key:child.getId(),selected:isSelected,icons})),i<border.getChildren().length-1&&tabButtons.push(React.createElement(`div`,{key:`divider`+i,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TAB_DIVIDER)}))};for(let i=0;i<border.getChildren().length;i++)layoutTab(i);let borderClasses=cm(Types_1.CLASSES.FLEXLAYOUT__BORDER)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_+border.getLocation().getName());border.getClassName()!==void 0&&(borderClasses+=` `+border.getClassName());let buttons=[],stickyButtons=[],renderState={buttons,stickyButtons,overflowPosition:void 0};if(layout.customizeTabSet(border,renderState),buttons=renderState.buttons,renderState.overflowPosition===void 0&&(renderState.overflowPosition=stickyButtons.length),stickyButtons.length>0&&(tabsTruncated?buttons=[...stickyButtons,...buttons]:tabButtons.push(React.createElement(`div`,{ref:stickyButtonsRef,key:`sticky_buttons_container`,onPointerDown:onInterceptPointerDown,onDragStart:e=>{e.preventDefault()},className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_STICKY_BUTTONS_CONTAINER)},stickyButtons))),hiddenTabs.length>0){let overflowTitle=layout.i18nName(I18nLabel_1.I18nLabel.Overflow_Menu_Tooltip),overflowContent;overflowContent=typeof icons.more==`function`?icons.more(border,hiddenTabs):React.createElement(React.Fragment,null,icons.more,React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_OVERFLOW_COUNT)},hiddenTabs.length)),buttons.splice(Math.min(renderState.overflowPosition,buttons.length),0,React.createElement(`button`,{key:`overflowbutton`,ref:overflowbuttonRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON_OVERFLOW)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON_OVERFLOW_+border.getLocation().getName()),title:overflowTitle,onClick:onOverflowClick,onPointerDown:onInterceptPointerDown},overflowContent))}let selectedIndex=border.getSelected();if(selectedIndex!==-1){let selectedTabNode=border.getChildren()[selectedIndex];if(selectedTabNode!==void 0&&layout.isSupportsPopout()&&selectedTabNode.isEnablePopout()){let popoutTitle=layout.i18nName(I18nLabel_1.I18nLabel.Popout_Tab);buttons.push(React.createElement(`button`,{key:`popout`,title:popoutTitle,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_BUTTON_FLOAT),onClick:onPopoutTab,onPointerDown:onInterceptPointerDown},typeof icons.popout==`function`?icons.popout(selectedTabNode):icons.popout))}}let toolbar=React.createElement(`div`,{key:`toolbar`,ref:toolbarRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_TOOLBAR_+border.getLocation().getName())},buttons),innerStyle={},outerStyle={},borderHeight=size-1;return border.getLocation()===DockLocation_1.DockLocation.LEFT?(innerStyle={right:`100%`,top:position},outerStyle={width:borderHeight}):border.getLocation()===DockLocation_1.DockLocation.RIGHT?(innerStyle={left:`100%`,top:position},outerStyle={width:borderHeight}):(innerStyle={left:position},outerStyle={height:borderHeight}),React.createElement(`div`,{ref:selfRef,style:{display:`flex`,flexDirection:border.getOrientation()===Orientation_1.Orientation.VERT?`row`:`column`},className:borderClasses,"data-layout-path":border.getPath(),onClick:onAuxMouseClick,onAuxClick:onAuxMouseClick,onContextMenu,onWheel:onMouseWheel},React.createElement(`div`,{style:outerStyle,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_INNER)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_INNER_+border.getLocation().getName())},React.createElement(`div`,{style:innerStyle,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_INNER_TAB_CONTAINER)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_INNER_TAB_CONTAINER_+border.getLocation().getName())},tabButtons)),toolbar)};exports.BorderTabSet=BorderTabSet},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.BorderButton=void 0;let React=__importStar(require(6)),I18nLabel_1=require(16),Actions_1=require(18),ICloseType_1=require(37),Types_1=require(17),Utils_1=require(29),BorderButton=props=>{let{layout,node,selected,border,icons,path}=props,selfRef=React.useRef(null),contentRef=React.useRef(null),onDragStart=event=>{node.isEnableDrag()?(event.stopPropagation(),layout.setDragNode(event.nativeEvent,node)):event.preventDefault()},onDragEnd=event=>{event.stopPropagation(),layout.clearDragMain()},onAuxMouseClick=event=>{(0,Utils_1.isAuxMouseEvent)(event)&&layout.auxMouseClick(node,event)},onContextMenu=event=>{layout.showContextMenu(node,event)},onClick=()=>{layout.doAction(Actions_1.Actions.selectTab(node.getId()))},onEndEdit=event=>{event.target!==contentRef.current&&(layout.getCurrentDocument().body.removeEventListener(`pointerdown`,onEndEdit),layout.setEditingTab(void 0))},isClosable=()=>{let closeType=node.getCloseType();return!!(selected||closeType===ICloseType_1.ICloseType.Always||closeType===ICloseType_1.ICloseType.Visible&&window.matchMedia&&window.matchMedia(`(hover: hover) and (pointer: fine)`).matches)},onClose=event=>{isClosable()?layout.doAction(Actions_1.Actions.deleteTab(node.getId())):onClick()},onClosePointerDown=event=>{event.stopPropagation()};React.useLayoutEffect(()=>{node.setTabRect(layout.getBoundingClientRect(selfRef.current)),layout.getEditingTab()===node&&contentRef.current.select()});let onTextBoxPointerDown=event=>{event.stopPropagation()},onTextBoxKeyPress=event=>{event.code===`Escape`?layout.setEditingTab(void 0):event.code===`Enter`&&(layout.setEditingTab(void 0),layout.doAction(Actions_1.Actions.renameTab(node.getId(),event.target.value)))},cm=layout.getClassName,classNames=cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON_+border);selected?classNames+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON__SELECTED):classNames+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON__UNSELECTED),node.getClassName()!==void 0&&(classNames+=` `+node.getClassName());let iconAngle=0;node.getModel().isEnableRotateBorderIcons()===!1&&(border===`left`?iconAngle=90:border===`right`&&(iconAngle=-90));let renderState=(0,Utils_1.getRenderStateEx)(layout,node,iconAngle),content=renderState.content?React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON_CONTENT)},renderState.content):null,leading=renderState.leading?React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON_LEADING)},renderState.leading):null;if(layout.getEditingTab()===node&&(content=React.createElement(`input`,{ref:contentRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_TEXTBOX),"data-layout-path":path+`/textbox`,type:`text`,autoFocus:!0,defaultValue:node.getName(),onKeyDown:onTextBoxKeyPress,onPointerDown:onTextBoxPointerDown})),node.isEnableClose()){let closeTitle=layout.i18nName(I18nLabel_1.I18nLabel.Close_Tab);renderState.buttons.push(React.createElement(`div`,{key:`close`,"data-layout-path":path+`/button/close`,title:closeTitle,className:cm(Types_1.CLASSES.FLEXLAYOUT__BORDER_BUTTON_TRAILING),onPointerDown:onClosePointerDown,onClick:onClose},typeof icons.close==`function`?icons.close(node):icons.close))}return React.createElement(`div`,{ref:selfRef,"data-layout-path":path,className:classNames,onClick,onAuxClick:onAuxMouseClick,onContextMenu,title:node.getHelpText(),draggable:!0,onDragStart,onDragEnd},leading,content,renderState.buttons)};exports.BorderButton=BorderButton},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.ICloseType=void 0,(function(ICloseType){ICloseType[ICloseType.Visible=1]=`Visible`,ICloseType[ICloseType.Always=2]=`Always`,ICloseType[ICloseType.Selected=3]=`Selected`})(exports.ICloseType||={})},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.showPopup=showPopup;let React=__importStar(require(6)),Types_1=require(17),TabButtonStamp_1=require(39);function showPopup(triggerElement,items,onSelect,layout){var _a;let layoutDiv=layout.getRootDiv(),classNameMapper=layout.getClassName,currentDocument=triggerElement.ownerDocument,triggerRect=triggerElement.getBoundingClientRect(),layoutRect=(_a=layoutDiv?.getBoundingClientRect())??new DOMRect(0,0,100,100),elm=currentDocument.createElement(`div`);elm.className=classNameMapper(Types_1.CLASSES.FLEXLAYOUT__POPUP_MENU_CONTAINER),triggerRect.left<layoutRect.left+layoutRect.width/2?elm.style.left=triggerRect.left-layoutRect.left+`px`:elm.style.right=layoutRect.right-triggerRect.right+`px`,triggerRect.top<layoutRect.top+layoutRect.height/2?elm.style.top=triggerRect.top-layoutRect.top+`px`:elm.style.bottom=layoutRect.bottom-triggerRect.bottom+`px`,layout.showOverlay(!0),layoutDiv&&layoutDiv.appendChild(elm);let onHide=()=>{layout.hideControlInPortal(),layout.showOverlay(!1),layoutDiv&&layoutDiv.removeChild(elm),elm.removeEventListener(`pointerdown`,onElementPointerDown),currentDocument.removeEventListener(`pointerdown`,onDocPointerDown)},onElementPointerDown=event=>{event.stopPropagation()},onDocPointerDown=_event=>{onHide()};elm.addEventListener(`pointerdown`,onElementPointerDown),currentDocument.addEventListener(`pointerdown`,onDocPointerDown),layout.showControlInPortal(React.createElement(PopupMenu,{currentDocument,onSelect,onHide,items,classNameMapper,layout}),elm)}let PopupMenu=props=>{let{items,onHide,onSelect,classNameMapper,layout}=props,onItemClick=(item,event)=>{onSelect(item),onHide(),event.stopPropagation()},onDragStart=(event,node)=>{event.stopPropagation(),layout.setDragNode(event.nativeEvent,node),setTimeout(()=>{onHide()},0)},onDragEnd=event=>{layout.clearDragMain()},itemElements=items.map((item,i)=>React.createElement(`div`,{key:item.index,className:classNameMapper(Types_1.CLASSES.FLEXLAYOUT__POPUP_MENU_ITEM),"data-layout-path":`/popup-menu/tb`+i,onClick:event=>onItemClick(item,event),draggable:!0,onDragStart:e=>onDragStart(e,item.node),onDragEnd,title:item.node.getHelpText()},React.createElement(TabButtonStamp_1.TabButtonStamp,{node:item.node,layout})));return React.createElement(`div`,{className:classNameMapper(Types_1.CLASSES.FLEXLAYOUT__POPUP_MENU),"data-layout-path":`/popup-menu`},itemElements)}},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabButtonStamp=void 0;let React=__importStar(require(6)),Types_1=require(17),Utils_1=require(29),TabButtonStamp=props=>{let{layout,node}=props,cm=layout.getClassName,classNames=cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_STAMP),renderState=(0,Utils_1.getRenderStateEx)(layout,node),content=renderState.content?React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_CONTENT)},renderState.content):node.getNameForOverflowMenu(),leading=renderState.leading?React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_LEADING)},renderState.leading):null;return React.createElement(`div`,{className:classNames,title:node.getHelpText()},leading,content)};exports.TabButtonStamp=TabButtonStamp},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.useTabOverflow=void 0;let React=__importStar(require(6)),Rect_1=require(15),TabSetNode_1=require(28),Orientation_1=require(14),useTabOverflow=(node,orientation,toolbarRef,stickyButtonsRef)=>{let firstRender=React.useRef(!0),tabsTruncated=React.useRef(!1),lastRect=React.useRef(Rect_1.Rect.empty()),selfRef=React.useRef(null),[position,setPosition]=React.useState(0),userControlledLeft=React.useRef(!1),[hiddenTabs,setHiddenTabs]=React.useState([]),lastHiddenCount=React.useRef(0);React.useLayoutEffect(()=>{userControlledLeft.current=!1},[node.getSelectedNode(),node.getRect().width,node.getRect().height]),React.useLayoutEffect(()=>{let nodeRect=node instanceof TabSetNode_1.TabSetNode?node.getRect():node.getTabHeaderRect();nodeRect.width>0&&nodeRect.height>0&&updateVisibleTabs()});let instance=toolbarRef.current;React.useEffect(()=>{if(instance)return instance.addEventListener(`wheel`,onWheel,{passive:!1}),()=>{instance.removeEventListener(`wheel`,onWheel)}},[instance]);let onWheel=event=>{event.preventDefault()},getNear=rect=>orientation===Orientation_1.Orientation.HORZ?rect.x:rect.y,getFar=rect=>orientation===Orientation_1.Orientation.HORZ?rect.getRight():rect.getBottom(),getSize=rect=>orientation===Orientation_1.Orientation.HORZ?rect.width:rect.height,updateVisibleTabs=()=>{let tabMargin=2;firstRender.current===!0&&(tabsTruncated.current=!1);let nodeRect=node instanceof TabSetNode_1.TabSetNode?node.getRect():node.getTabHeaderRect(),lastChild=node.getChildren()[node.getChildren().length-1],stickyButtonsSize=stickyButtonsRef.current===null?0:getSize(stickyButtonsRef.current.getBoundingClientRect());if(firstRender.current===!0||lastHiddenCount.current===0&&hiddenTabs.length!==0||nodeRect.width!==lastRect.current.width||nodeRect.height!==lastRect.current.height){lastHiddenCount.current=hiddenTabs.length,lastRect.current=nodeRect;let enabled=node instanceof TabSetNode_1.TabSetNode?node.isEnableTabStrip()===!0:!0,endPos=getFar(nodeRect)-stickyButtonsSize;if(toolbarRef.current!==null&&(endPos-=getSize(toolbarRef.current.getBoundingClientRect())),enabled&&node.getChildren().length>0){if(hiddenTabs.length===0&&position===0&&getFar(lastChild.getTabRect())+2<endPos)return;let shiftPos=0,selectedTab=node.getSelectedNode();if(selectedTab&&!userControlledLeft.current){let selectedRect=selectedTab.getTabRect(),selectedStart=getNear(selectedRect)-2,selectedEnd=getFar(selectedRect)+2;getSize(selectedRect)+4>=endPos-getNear(nodeRect)?shiftPos=getNear(nodeRect)-selectedStart:(selectedEnd>endPos||selectedStart<getNear(nodeRect))&&(selectedStart<getNear(nodeRect)&&(shiftPos=getNear(nodeRect)-selectedStart),selectedEnd+shiftPos>endPos&&(shiftPos=endPos-selectedEnd))}let extraSpace=Math.max(0,endPos-(getFar(lastChild.getTabRect())+2+shiftPos)),newPosition=Math.min(0,position+shiftPos+extraSpace),diff=newPosition-position,hidden=[];for(let i=0;i<node.getChildren().length;i++){let child=node.getChildren()[i];(getNear(child.getTabRect())+diff<getNear(nodeRect)||getFar(child.getTabRect())+diff>endPos)&&hidden.push({node:child,index:i})}tabsTruncated.current=hidden.length>0,firstRender.current=!1,setHiddenTabs(hidden),setPosition(newPosition)}}else firstRender.current=!0},onMouseWheel=event=>{if(node.getChildren().length===0)return;let delta=0;delta=Math.abs(event.deltaX)>Math.abs(event.deltaY)?-event.deltaX:-event.deltaY,event.deltaMode===1&&(delta*=40),setPosition(position+delta),userControlledLeft.current=!0,event.stopPropagation()};return{selfRef,position,userControlledLeft,hiddenTabs,onMouseWheel,tabsTruncated:tabsTruncated.current}};exports.useTabOverflow=useTabOverflow},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.DragContainer=void 0;let React=__importStar(require(6)),Types_1=require(17),TabButtonStamp_1=require(39),DragContainer=props=>{let{layout,node}=props,selfRef=React.useRef(null);React.useEffect(()=>{node.setTabStamp(selfRef.current)},[node,selfRef.current]);let cm=layout.getClassName,classNames=cm(Types_1.CLASSES.FLEXLAYOUT__DRAG_RECT);return React.createElement(`div`,{ref:selfRef,className:classNames},React.createElement(TabButtonStamp_1.TabButtonStamp,{key:node.getId(),layout,node}))};exports.DragContainer=DragContainer},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.ErrorBoundary=void 0;let React=__importStar(require(6)),Types_1=require(17);class ErrorBoundary extends React.Component{constructor(props){super(props),this.state={hasError:!1}}static getDerivedStateFromError(error){return{hasError:!0}}componentDidCatch(error,errorInfo){console.debug(error),console.debug(errorInfo)}render(){return this.state.hasError?React.createElement(`div`,{className:Types_1.CLASSES.FLEXLAYOUT__ERROR_BOUNDARY_CONTAINER},React.createElement(`div`,{className:Types_1.CLASSES.FLEXLAYOUT__ERROR_BOUNDARY_CONTENT},this.props.message)):this.props.children}}exports.ErrorBoundary=ErrorBoundary},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.PopoutWindow=void 0;let React=__importStar(require(6)),react_dom_1=require(11),Types_1=require(17),PopoutWindow=props=>{let{title,layout,layoutWindow,url,onCloseWindow,onSetWindow,children}=props,popoutWindow=React.useRef(null),[content,setContent]=React.useState(void 0),styleMap=/* @__PURE__ */ new Map;return React.useLayoutEffect(()=>{if(!popoutWindow.current){let windowId=layoutWindow.windowId,rect=layoutWindow.rect;popoutWindow.current=window.open(url,windowId,`left=${rect.x},top=${rect.y},width=${rect.width},height=${rect.height}`),popoutWindow.current?(layoutWindow.window=popoutWindow.current,onSetWindow(layoutWindow,popoutWindow.current),window.addEventListener(`beforeunload`,()=>{if(popoutWindow.current){let closedWindow=popoutWindow.current;popoutWindow.current=null,closedWindow.close()}}),popoutWindow.current.addEventListener(`load`,()=>{if(popoutWindow.current){popoutWindow.current.focus(),popoutWindow.current.resizeTo(rect.width,rect.height),popoutWindow.current.moveTo(rect.x,rect.y);let popoutDocument=popoutWindow.current.document;popoutDocument.title=title;let popoutContent=popoutDocument.createElement(`div`);popoutContent.className=Types_1.CLASSES.FLEXLAYOUT__FLOATING_WINDOW_CONTENT,popoutDocument.body.appendChild(popoutContent),copyStyles(popoutDocument,styleMap).then(()=>{setContent(popoutContent)});let observer=new MutationObserver(mutationsList=>handleStyleMutations(mutationsList,popoutDocument,styleMap));observer.observe(document.head,{childList:!0}),popoutWindow.current.addEventListener(`beforeunload`,()=>{popoutWindow.current&&(onCloseWindow(layoutWindow),popoutWindow.current=null,observer.disconnect())})}})):(console.warn(`Unable to open window ${url}`),onCloseWindow(layoutWindow))}return()=>{var _a;layout.getModel().getwindowsMap().has(layoutWindow.windowId)||((_a=popoutWindow.current)?.close(),popoutWindow.current=null)}},[]),content===void 0?null:(0,react_dom_1.createPortal)(children,content)};exports.PopoutWindow=PopoutWindow;function handleStyleMutations(mutationsList,popoutDocument,styleMap){for(let mutation of mutationsList)if(mutation.type===`childList`){for(let addition of mutation.addedNodes)(addition instanceof HTMLLinkElement||addition instanceof HTMLStyleElement)&&copyStyle(popoutDocument,addition,styleMap);for(let removal of mutation.removedNodes)if(removal instanceof HTMLLinkElement||removal instanceof HTMLStyleElement){let popoutStyle=styleMap.get(removal);popoutStyle&&popoutDocument.head.removeChild(popoutStyle)}}}function copyStyles(popoutDoc,styleMap){let promises=[],styleElements=document.querySelectorAll(`style, link[rel="stylesheet"]`);for(let element of styleElements)copyStyle(popoutDoc,element,styleMap,promises);return Promise.all(promises)}function copyStyle(popoutDoc,element,styleMap,promises){if(element instanceof HTMLLinkElement){let linkElement=element.cloneNode(!0);popoutDoc.head.appendChild(linkElement),styleMap.set(element,linkElement),promises&&promises.push(new Promise(resolve=>{linkElement.onload=()=>resolve(!0)}))}else if(element instanceof HTMLStyleElement)try{let styleElement=element.cloneNode(!0);popoutDoc.head.appendChild(styleElement),styleMap.set(element,styleElement)}catch{}}},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.AsterickIcon=exports.RestoreIcon=exports.PopoutIcon=exports.EdgeIcon=exports.OverflowIcon=exports.MaximizeIcon=exports.CloseIcon=void 0;let React=__importStar(require(6)),style={width:`1em`,height:`1em`,display:`flex`,alignItems:`center`},CloseIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style,viewBox:`0 0 24 24`},React.createElement(`path`,{fill:`none`,d:`M0 0h24v24H0z`}),React.createElement(`path`,{stroke:`var(--color-icon)`,fill:`var(--color-icon)`,d:`M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z`}));exports.CloseIcon=CloseIcon;let MaximizeIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style,viewBox:`0 0 24 24`,fill:`var(--color-icon)`},React.createElement(`path`,{d:`M0 0h24v24H0z`,fill:`none`}),React.createElement(`path`,{stroke:`var(--color-icon)`,d:`M7 14H5v5h5v-2H7v-3zm-2-4h2V7h3V5H5v5zm12 7h-3v2h5v-5h-2v3zM14 5v2h3v3h2V5h-5z`}));exports.MaximizeIcon=MaximizeIcon;let OverflowIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style,viewBox:`0 0 24 24`,fill:`var(--color-icon)`},React.createElement(`path`,{d:`M0 0h24v24H0z`,fill:`none`}),React.createElement(`path`,{stroke:`var(--color-icon)`,d:`M7 10l5 5 5-5z`}));exports.OverflowIcon=OverflowIcon;let EdgeIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style:{display:`block`,width:10,height:10},preserveAspectRatio:`none`,viewBox:`0 0 100 100`},React.createElement(`path`,{fill:`var(--color-edge-icon)`,stroke:`var(--color-edge-icon)`,d:`M10 30 L90 30 l-40 40 Z`}));exports.EdgeIcon=EdgeIcon;let PopoutIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style,viewBox:`0 0 20 20`,fill:`var(--color-icon)`},React.createElement(`path`,{d:`M11 3a1 1 0 100 2h2.586l-6.293 6.293a1 1 0 101.414 1.414L15 6.414V9a1 1 0 102 0V4a1 1 0 00-1-1h-5z`}),React.createElement(`path`,{d:`M5 5a2 2 0 00-2 2v8a2 2 0 002 2h8a2 2 0 002-2v-3a1 1 0 10-2 0v3H5V7h3a1 1 0 000-2H5z`}));exports.PopoutIcon=PopoutIcon;let RestoreIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style,viewBox:`0 0 24 24`,fill:`var(--color-icon)`},React.createElement(`path`,{d:`M0 0h24v24H0z`,fill:`none`}),React.createElement(`path`,{stroke:`var(--color-icon)`,d:`M5 16h3v3h2v-5H5v2zm3-8H5v2h5V5H8v3zm6 11h2v-3h3v-2h-5v5zm2-11V5h-2v5h5V8h-3z`}));exports.RestoreIcon=RestoreIcon;let AsterickIcon=()=>React.createElement(`svg`,{xmlns:`http://www.w3.org/2000/svg`,style,height:`24px`,viewBox:`0 -960 960 960`,width:`24px`},React.createElement(`path`,{fill:`var(--color-icon)`,stroke:`var(--color-icon)`,d:`M440-120v-264L254-197l-57-57 187-186H120v-80h264L197-706l57-57 186 187v-264h80v264l186-187 57 57-187 186h264v80H576l187 186-57 57-186-187v264h-80Z`}));exports.AsterickIcon=AsterickIcon},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Overlay=void 0;let React=__importStar(require(6)),Types_1=require(17),Overlay=props=>{let{layout,show}=props;return React.createElement(`div`,{className:layout.getClassName(Types_1.CLASSES.FLEXLAYOUT__LAYOUT_OVERLAY),style:{display:show?`flex`:`none`}})};exports.Overlay=Overlay},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Row=void 0;let React=__importStar(require(6)),RowNode_1=require(26),TabSetNode_1=require(28),Types_1=require(17),TabSet_1=require(47),Splitter_1=require(34),Orientation_1=require(14),Row=props=>{let{layout,node}=props,selfRef=React.useRef(null),horizontal=node.getOrientation()===Orientation_1.Orientation.HORZ;React.useLayoutEffect(()=>{node.setRect(layout.getBoundingClientRect(selfRef.current))});let items=[],i=0;for(let child of node.getChildren())i>0&&items.push(React.createElement(Splitter_1.Splitter,{key:`splitter`+i,layout,node,index:i,horizontal})),child instanceof RowNode_1.RowNode?items.push(React.createElement(exports.Row,{key:child.getId(),layout,node:child})):child instanceof TabSetNode_1.TabSetNode&&items.push(React.createElement(TabSet_1.TabSet,{key:child.getId(),layout,node:child})),i++;let style={flexGrow:Math.max(1,node.getWeight()*1e3),minWidth:node.getMinWidth(),minHeight:node.getMinHeight(),maxWidth:node.getMaxWidth(),maxHeight:node.getMaxHeight()};return horizontal?style.flexDirection=`row`:style.flexDirection=`column`,React.createElement(`div`,{ref:selfRef,className:layout.getClassName(Types_1.CLASSES.FLEXLAYOUT__ROW),style},items)};exports.Row=Row},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabSet=void 0;let React=__importStar(require(6)),I18nLabel_1=require(16),Actions_1=require(18),PopupMenu_1=require(38),TabButton_1=require(48),TabOverflowHook_1=require(40),Orientation_1=require(14),Types_1=require(17),Utils_1=require(29),react_dom_1=require(11),Rect_1=require(15),TabSet=props=>{let{node,layout}=props,tabStripRef=React.useRef(null),tabStripInnerRef=React.useRef(null),contentRef=React.useRef(null),buttonBarRef=React.useRef(null),overflowbuttonRef=React.useRef(null),stickyButtonsRef=React.useRef(null),icons=layout.getIcons();React.useEffect(()=>{node.setRect(layout.getBoundingClientRect(selfRef.current)),tabStripRef.current&&node.setTabStripRect(layout.getBoundingClientRect(tabStripRef.current));let newContentRect=Rect_1.Rect.getContentRect(contentRef.current).relativeTo(layout.getDomRect());node.getContentRect().equals(newContentRect)||(node.setContentRect(newContentRect),layout.redrawInternal(`tabset content rect `+newContentRect))});let{selfRef,position,userControlledLeft,hiddenTabs,onMouseWheel,tabsTruncated}=(0,TabOverflowHook_1.useTabOverflow)(node,Orientation_1.Orientation.HORZ,buttonBarRef,stickyButtonsRef),onOverflowClick=event=>{let callback=layout.getShowOverflowMenu();if(callback!==void 0)callback(node,event,hiddenTabs,onOverflowItemSelect);else{let element=overflowbuttonRef.current;(0,PopupMenu_1.showPopup)(element,hiddenTabs,onOverflowItemSelect,layout)}event.stopPropagation()},onOverflowItemSelect=item=>{layout.doAction(Actions_1.Actions.selectTab(item.node.getId())),userControlledLeft.current=!1},onDragStart=event=>{layout.getEditingTab()?event.preventDefault():node.isEnableDrag()?(event.stopPropagation(),layout.setDragNode(event.nativeEvent,node)):event.preventDefault()},onPointerDown=event=>{if(!(0,Utils_1.isAuxMouseEvent)(event)){let name=node.getName();name=name===void 0?``:`: `+name,layout.doAction(Actions_1.Actions.setActiveTabset(node.getId(),layout.getWindowId()))}},onAuxMouseClick=event=>{(0,Utils_1.isAuxMouseEvent)(event)&&layout.auxMouseClick(node,event)},onContextMenu=event=>{layout.showContextMenu(node,event)},onInterceptPointerDown=event=>{event.stopPropagation()},onMaximizeToggle=event=>{node.canMaximize()&&layout.maximize(node),event.stopPropagation()},onClose=event=>{layout.doAction(Actions_1.Actions.deleteTabset(node.getId())),event.stopPropagation()},onCloseTab=event=>{layout.doAction(Actions_1.Actions.deleteTab(node.getChildren()[0].getId())),event.stopPropagation()},onPopoutTab=event=>{selectedTabNode!==void 0&&layout.doAction(Actions_1.Actions.popoutTab(selectedTabNode.getId())),event.stopPropagation()},onDoubleClick=event=>{node.canMaximize()&&layout.maximize(node)},cm=layout.getClassName;tabStripInnerRef.current!==null&&tabStripInnerRef.current.scrollLeft!==0&&(tabStripInnerRef.current.scrollLeft=0);let selectedTabNode=node.getSelectedNode(),path=node.getPath(),tabs=[];if(node.isEnableTabStrip())for(let i=0;i<node.getChildren().length;i++){let child=node.getChildren()[i],isSelected=node.getSelected()===i;tabs.push(React.createElement(TabButton_1.TabButton,{layout,node:child,path:path+`/tb`+i,key:child.getId(),selected:isSelected})),i<node.getChildren().length-1&&tabs.push(React.createElement(`div`,{key:`divider`+i,className:cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_TAB_DIVIDER)}))}let stickyButtons=[],buttons=[],renderState={stickyButtons,buttons,overflowPosition:void 0};layout.customizeTabSet(node,renderState),stickyButtons=renderState.stickyButtons,buttons=renderState.buttons;let isTabStretch=node.isEnableSingleTabStretch()&&node.getChildren().length===1,showClose=isTabStretch&&node.getChildren()[0].isEnableClose()||node.isEnableClose();if(renderState.overflowPosition===void 0&&(renderState.overflowPosition=stickyButtons.length),stickyButtons.length>0&&(!node.isEnableTabWrap()&&(tabsTruncated||isTabStretch)?buttons=[...stickyButtons,...buttons]:tabs.push(React.createElement(`div`,{ref:stickyButtonsRef,key:`sticky_buttons_container`,onPointerDown:onInterceptPointerDown,onDragStart:e=>{e.preventDefault()},className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_STICKY_BUTTONS_CONTAINER)},stickyButtons))),!node.isEnableTabWrap()&&hiddenTabs.length>0){let overflowTitle=layout.i18nName(I18nLabel_1.I18nLabel.Overflow_Menu_Tooltip),overflowContent;overflowContent=typeof icons.more==`function`?icons.more(node,hiddenTabs):React.createElement(React.Fragment,null,icons.more,React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_OVERFLOW_COUNT)},hiddenTabs.length)),buttons.splice(Math.min(renderState.overflowPosition,buttons.length),0,React.createElement(`button`,{key:`overflowbutton`,"data-layout-path":path+`/button/overflow`,ref:overflowbuttonRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_OVERFLOW),title:overflowTitle,onClick:onOverflowClick,onPointerDown:onInterceptPointerDown},overflowContent))}if(selectedTabNode!==void 0&&layout.isSupportsPopout()&&selectedTabNode.isEnablePopout()&&selectedTabNode.isEnablePopoutIcon()){let popoutTitle=layout.i18nName(I18nLabel_1.I18nLabel.Popout_Tab);buttons.push(React.createElement(`button`,{key:`popout`,"data-layout-path":path+`/button/popout`,title:popoutTitle,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON_FLOAT),onClick:onPopoutTab,onPointerDown:onInterceptPointerDown},typeof icons.popout==`function`?icons.popout(selectedTabNode):icons.popout))}if(node.canMaximize()){let minTitle=layout.i18nName(I18nLabel_1.I18nLabel.Restore),maxTitle=layout.i18nName(I18nLabel_1.I18nLabel.Maximize);buttons.push(React.createElement(`button`,{key:`max`,"data-layout-path":path+`/button/max`,title:node.isMaximized()?minTitle:maxTitle,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON_+(node.isMaximized()?`max`:`min`)),onClick:onMaximizeToggle,onPointerDown:onInterceptPointerDown},node.isMaximized()?typeof icons.restore==`function`?icons.restore(node):icons.restore:typeof icons.maximize==`function`?icons.maximize(node):icons.maximize))}if(!node.isMaximized()&&showClose){let title=isTabStretch?layout.i18nName(I18nLabel_1.I18nLabel.Close_Tab):layout.i18nName(I18nLabel_1.I18nLabel.Close_Tabset);buttons.push(React.createElement(`button`,{key:`close`,"data-layout-path":path+`/button/close`,title,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_BUTTON_CLOSE),onClick:isTabStretch?onCloseTab:onClose,onPointerDown:onInterceptPointerDown},typeof icons.closeTabset==`function`?icons.closeTabset(node):icons.closeTabset))}if(node.isActive()&&node.isEnableActiveIcon()){let title=layout.i18nName(I18nLabel_1.I18nLabel.Active_Tabset);buttons.push(React.createElement(`div`,{key:`active`,"data-layout-path":path+`/button/active`,title,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR_ICON)},typeof icons.activeTabset==`function`?icons.activeTabset(node):icons.activeTabset))}let buttonbar=React.createElement(`div`,{key:`buttonbar`,ref:buttonBarRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_TOOLBAR),onPointerDown:onInterceptPointerDown,onDragStart:e=>{e.preventDefault()}},buttons),tabStrip,tabStripClasses=cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_TABBAR_OUTER);if(node.getClassNameTabStrip()!==void 0&&(tabStripClasses+=` `+node.getClassNameTabStrip()),tabStripClasses+=` `+Types_1.CLASSES.FLEXLAYOUT__TABSET_TABBAR_OUTER_+node.getTabLocation(),node.isActive()&&(tabStripClasses+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_SELECTED)),node.isMaximized()&&(tabStripClasses+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_MAXIMIZED)),isTabStretch){let tabNode=node.getChildren()[0];tabNode.getTabSetClassName()!==void 0&&(tabStripClasses+=` `+tabNode.getTabSetClassName())}node.isEnableTabWrap()?node.isEnableTabStrip()&&(tabStrip=React.createElement(`div`,{className:tabStripClasses,style:{flexWrap:`wrap`,gap:`1px`,marginTop:`2px`},ref:tabStripRef,"data-layout-path":path+`/tabstrip`,onPointerDown,onDoubleClick,onContextMenu,onClick:onAuxMouseClick,onAuxClick:onAuxMouseClick,draggable:!0,onDragStart},tabs,React.createElement(`div`,{style:{flexGrow:1}}),buttonbar)):node.isEnableTabStrip()&&(tabStrip=React.createElement(`div`,{className:tabStripClasses,ref:tabStripRef,"data-layout-path":path+`/tabstrip`,onPointerDown,onDoubleClick,onContextMenu,onClick:onAuxMouseClick,onAuxClick:onAuxMouseClick,draggable:!0,onWheel:onMouseWheel,onDragStart},React.createElement(`div`,{ref:tabStripInnerRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER_+node.getTabLocation())},React.createElement(`div`,{style:{left:position,width:isTabStretch?`100%`:`10000px`},className:cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER_TAB_CONTAINER)+` `+cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_TABBAR_INNER_TAB_CONTAINER_+node.getTabLocation())},tabs)),buttonbar));var emptyTabset;if(node.getChildren().length===0){let placeHolderCallback=layout.getTabSetPlaceHolderCallback();placeHolderCallback&&(emptyTabset=placeHolderCallback(node))}let content=React.createElement(`div`,{ref:contentRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_CONTENT)},emptyTabset);content=node.getTabLocation()===`top`?React.createElement(React.Fragment,null,tabStrip,content):React.createElement(React.Fragment,null,content,tabStrip);let style={flexGrow:Math.max(1,node.getWeight()*1e3),minWidth:node.getMinWidth(),minHeight:node.getMinHeight(),maxWidth:node.getMaxWidth(),maxHeight:node.getMaxHeight()};node.getModel().getMaximizedTabset(layout.getWindowId())!==void 0&&!node.isMaximized()&&(style.display=`none`);let tabset=React.createElement(`div`,{ref:selfRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TABSET_CONTAINER),style},React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TABSET),"data-layout-path":path},content));return node.isMaximized()&&layout.getMainElement()?(0,react_dom_1.createPortal)(React.createElement(`div`,{style:{position:`absolute`,display:`flex`,top:0,left:0,bottom:0,right:0}},tabset),layout.getMainElement()):tabset};exports.TabSet=TabSet},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabButton=void 0;let React=__importStar(require(6)),I18nLabel_1=require(16),Actions_1=require(18),ICloseType_1=require(37),Types_1=require(17),Utils_1=require(29),TabButton=props=>{let{layout,node,selected,path}=props,selfRef=React.useRef(null),contentRef=React.useRef(null),icons=layout.getIcons();React.useLayoutEffect(()=>{node.setTabRect(layout.getBoundingClientRect(selfRef.current)),layout.getEditingTab()===node&&contentRef.current.select()});let onDragStart=event=>{node.isEnableDrag()?(event.stopPropagation(),layout.setDragNode(event.nativeEvent,node)):event.preventDefault()},onDragEnd=event=>{layout.clearDragMain()},onAuxMouseClick=event=>{(0,Utils_1.isAuxMouseEvent)(event)&&layout.auxMouseClick(node,event)},onContextMenu=event=>{layout.showContextMenu(node,event)},onClick=()=>{layout.doAction(Actions_1.Actions.selectTab(node.getId()))},onDoubleClick=event=>{node.isEnableRename()&&(onRename(),event.stopPropagation())},onRename=()=>{layout.setEditingTab(node),layout.getCurrentDocument().body.addEventListener(`pointerdown`,onEndEdit)},onEndEdit=event=>{event.target!==contentRef.current&&(layout.getCurrentDocument().body.removeEventListener(`pointerdown`,onEndEdit),layout.setEditingTab(void 0))},isClosable=()=>{let closeType=node.getCloseType();return!!(selected||closeType===ICloseType_1.ICloseType.Always||closeType===ICloseType_1.ICloseType.Visible&&window.matchMedia&&window.matchMedia(`(hover: hover) and (pointer: fine)`).matches)},onClose=event=>{isClosable()?layout.doAction(Actions_1.Actions.deleteTab(node.getId())):onClick()},onClosePointerDown=event=>{event.stopPropagation()},onTextBoxPointerDown=event=>{event.stopPropagation()},onTextBoxKeyPress=event=>{event.code===`Escape`?layout.setEditingTab(void 0):event.code===`Enter`&&(layout.setEditingTab(void 0),layout.doAction(Actions_1.Actions.renameTab(node.getId(),event.target.value)))},cm=layout.getClassName,parentNode=node.getParent(),isStretch=parentNode.isEnableSingleTabStretch()&&parentNode.getChildren().length===1,baseClassName=isStretch?Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_STRETCH:Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON,classNames=cm(baseClassName);classNames+=` `+cm(baseClassName+`_`+parentNode.getTabLocation()),isStretch||(selected?classNames+=` `+cm(baseClassName+`--selected`):classNames+=` `+cm(baseClassName+`--unselected`)),node.getClassName()!==void 0&&(classNames+=` `+node.getClassName());let renderState=(0,Utils_1.getRenderStateEx)(layout,node),content=renderState.content?React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_CONTENT)},renderState.content):null,leading=renderState.leading?React.createElement(`div`,{className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_LEADING)},renderState.leading):null;if(layout.getEditingTab()===node&&(content=React.createElement(`input`,{ref:contentRef,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_TEXTBOX),"data-layout-path":path+`/textbox`,type:`text`,autoFocus:!0,defaultValue:node.getName(),onKeyDown:onTextBoxKeyPress,onPointerDown:onTextBoxPointerDown})),node.isEnableClose()&&!isStretch){let closeTitle=layout.i18nName(I18nLabel_1.I18nLabel.Close_Tab);renderState.buttons.push(React.createElement(`div`,{key:`close`,"data-layout-path":path+`/button/close`,title:closeTitle,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BUTTON_TRAILING),onPointerDown:onClosePointerDown,onClick:onClose},typeof icons.close==`function`?icons.close(node):icons.close))}return React.createElement(`div`,{ref:selfRef,"data-layout-path":path,className:classNames,onClick,onAuxClick:onAuxMouseClick,onContextMenu,title:node.getHelpText(),draggable:!0,onDragStart,onDragEnd,onDoubleClick},leading,content,renderState.buttons)};exports.TabButton=TabButton},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.Tab=void 0;let React=__importStar(require(6)),TabSetNode_1=require(28),Types_1=require(17),BorderNode_1=require(20),Actions_1=require(18),Tab=props=>{let{layout,selected,node,path}=props,selfRef=React.useRef(null),firstSelect=React.useRef(!0),parentNode=node.getParent(),rect=parentNode.getContentRect();React.useLayoutEffect(()=>{let element=node.getMoveableElement();selfRef.current.appendChild(element),node.setMoveableElement(element);let handleScroll=()=>{node.saveScrollPosition()};return element.addEventListener(`scroll`,handleScroll),selfRef.current.addEventListener(`pointerdown`,onPointerDown),()=>{element.removeEventListener(`scroll`,handleScroll),selfRef.current&&selfRef.current.removeEventListener(`pointerdown`,onPointerDown),node.setVisible(!1)}},[]),React.useEffect(()=>{node.isSelected()&&(firstSelect.current&&=(node.restoreScrollPosition(),!1))});let onPointerDown=()=>{let parent=node.getParent();parent instanceof TabSetNode_1.TabSetNode&&(parent.isActive()||layout.doAction(Actions_1.Actions.setActiveTabset(parent.getId(),layout.getWindowId())))};node.setRect(rect);let cm=layout.getClassName,style={};rect.styleWithPosition(style);let overlay=null;if(selected){if(node.setVisible(!0),document.hidden&&node.isEnablePopoutOverlay()){let overlayStyle={};rect.styleWithPosition(overlayStyle),overlay=React.createElement(`div`,{style:overlayStyle,className:cm(Types_1.CLASSES.FLEXLAYOUT__TAB_OVERLAY)})}}else style.display=`none`,node.setVisible(!1);parentNode instanceof TabSetNode_1.TabSetNode&&node.getModel().getMaximizedTabset(layout.getWindowId())!==void 0&&(parentNode.isMaximized()?style.zIndex=10:style.display=`none`),parentNode instanceof BorderNode_1.BorderNode&&(parentNode.isShowing()||(style.display=`none`));let className=cm(Types_1.CLASSES.FLEXLAYOUT__TAB);return parentNode instanceof BorderNode_1.BorderNode&&(className+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BORDER),className+=` `+cm(Types_1.CLASSES.FLEXLAYOUT__TAB_BORDER_+parentNode.getLocation().getName())),node.getContentClassName()!==void 0&&(className+=` `+node.getContentClassName()),React.createElement(React.Fragment,null,overlay,React.createElement(`div`,{ref:selfRef,style,className,"data-layout-path":path}))};exports.Tab=Tab},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0}),exports.SizeTracker=void 0;let React=__importStar(require(6));exports.SizeTracker=React.memo(({children})=>React.createElement(React.Fragment,null,children),(prevProps,nextProps)=>prevProps.rect.equalSize(nextProps.rect)&&prevProps.selected===nextProps.selected&&prevProps.forceRevision===nextProps.forceRevision&&prevProps.tabsRevision===nextProps.tabsRevision)},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.resolveProp=resolveProp,exports.resolveProps=resolveProps,exports.getDescendantProp=getDescendantProp,exports.renderDashComponent=renderDashComponent,exports.renderDashComponents=renderDashComponents;let ramda_1=require(52),ReactPropTypesSecret_1=__importDefault(require(80)),prop_types_1=__importDefault(require(81)),react_1=__importDefault(require(6));function checkPropTypes(typeSpecs,values,location,componentName,getStack=null){let errors=[];for(let typeSpecName in typeSpecs)if(typeSpecs.hasOwnProperty(typeSpecName)){let error;try{typeof typeSpecs[typeSpecName]==`function`?error=typeSpecs[typeSpecName](values,typeSpecName,componentName,location,null,ReactPropTypesSecret_1.default):(error=Error((componentName||`React class`)+`: `+location+" type `"+typeSpecName+"` is invalid; it must be a function, usually from the `prop-types` package, but received `"+typeof typeSpecs[typeSpecName]+"`."),error.name=`Invariant Violation`)}catch(ex){error=ex}if(error&&!(error instanceof Error)&&errors.push((componentName||`React class`)+`: type specification of `+location+" `"+typeSpecName+"` is invalid; the type checker function must return `null` or an `Error` but returned a "+typeof error+`. You may have forgotten to pass an argument to the type checker creator (arrayOf, instanceOf, objectOf, oneOf, oneOfType, and shape all require an argument).`),error instanceof Error){var stack=getStack&&getStack()||``;errors.push(`Failed `+location+` type: `+error.message+stack)}}return errors.join(`
+
+`)}function propTypeErrorHandler(message,props,type){let messageParts=message.split("`"),errorMessage;if((0,ramda_1.includes)(`is marked as required`,message))errorMessage=`${messageParts[1]} in ${type}`,props.id&&(errorMessage+=` with ID "${props.id}"`),errorMessage+=` is required but it was not provided.`;else if((0,ramda_1.includes)(`Bad object`,message))errorMessage=message.split(`supplied to `)[0]+`supplied to ${type}.
+Bad`+message.split(`.
+Bad`)[1];else if((0,ramda_1.includes)(`Invalid `,message)&&(0,ramda_1.includes)(` supplied to `,message)){let invalidPropPath=messageParts[1];if(errorMessage=`Invalid argument \`${invalidPropPath}\` passed into ${type}`,props.id&&(errorMessage+=` with ID "${props.id}"`),errorMessage+=`.`,(0,ramda_1.includes)(`, expected `,message)){let expectedPropType=message.split(`, expected `)[1];errorMessage+=`\nExpected ${expectedPropType}`}if((0,ramda_1.includes)(" of type `",message)){let invalidPropTypeProvided=message.split(" of type `")[1].split("`")[0];errorMessage+=`\nWas supplied type \`${invalidPropTypeProvided}\`.`}if((0,ramda_1.has)(invalidPropPath,props)){let jsonSuppliedValue=JSON.stringify(props[invalidPropPath],null,2);jsonSuppliedValue&&((0,ramda_1.includes)(`
+`,jsonSuppliedValue)?errorMessage+=`\nValue provided: \n${jsonSuppliedValue}`:errorMessage+=`\nValue provided: ${jsonSuppliedValue}`)}}else throw Error(message);throw Error(errorMessage)}function CheckedComponent(p){let{element,extraProps,props,children,type}=p,errorMessage=checkPropTypes(element.propTypes,props,`component prop`,element);return errorMessage&&propTypeErrorHandler(errorMessage,props,type),createElement(element,props,extraProps,children)}CheckedComponent.propTypes={children:prop_types_1.default.any,element:prop_types_1.default.any,layout:prop_types_1.default.any,props:prop_types_1.default.any,extraProps:prop_types_1.default.any,id:prop_types_1.default.string};function createElement(element,props,extraProps,children){let allProps=(0,ramda_1.mergeRight)(props,extraProps);return Array.isArray(children)?react_1.default.createElement(element,allProps,...children):react_1.default.createElement(element,allProps,children)}function stringifyId(id){if(typeof id!=`object`)return id;let stringifyVal=v=>v&&v.wild||JSON.stringify(v);return`{`+Object.keys(id).sort().map(k=>JSON.stringify(k)+`:`+stringifyVal(id[k])).join(`,`)+`}`}let SIMPLE_COMPONENT_TYPES=[`String`,`Number`,`Null`,`Boolean`],isSimpleComponent=component=>(0,ramda_1.includes)((0,ramda_1.type)(component),SIMPLE_COMPONENT_TYPES),NOT_LOADING={is_loading:!1},Registry={resolve:component=>{let{type,namespace}=component,ns=window[namespace];if(ns){if(ns[type])return ns[type];throw Error(`Component ${type} not found in ${namespace}`)}throw Error(`${namespace} was not found.`)}};function isPlainObject(o){return o===null||Array.isArray(o)||typeof o==`function`||o.constructor===Date?!1:typeof o==`object`}function isFunction(functionToCheck){return functionToCheck&&{}.toString.call(functionToCheck)===`[object Function]`}function resolveProp(prop,context){return isPlainObject(prop)?prop.variable?resolveVariable(prop,context):prop.arrow?(...args)=>prop.arrow:prop:prop}function resolveVariable(prop,context){let variable=getDescendantProp(window,prop.variable);if(variable===void 0)throw Error(`No match for [`+prop.variable+`] in the global window object.`);return isFunction(variable)&&context?(...args)=>variable(...args,context):variable}function getDescendantProp(obj,desc){let arr=desc.split(`.`);for(;arr.length&&(obj=obj[arr.shift()]););return obj}function resolveProps(props,functionalProps,context){let nProps=Object.assign({},props);for(let prop of functionalProps)nProps[prop]&&(nProps[prop]=resolveProp(nProps[prop],context));return nProps}function renderDashComponent(component,index=null){if((0,ramda_1.isNil)(component)||(0,ramda_1.isEmpty)(component))return null;if(isSimpleComponent(component))return component;if(Array.isArray(component))return component.map((item,i)=>renderDashComponent(item,i));let element=Registry.resolve(component),props=(0,ramda_1.dissoc)(`children`,component.props),children=renderDashComponent(component.props.children);(0,ramda_1.type)(props.id)===`Object`&&(props.id=stringifyId(props.id));let allProps={props,element,extraProps:{loading_state:NOT_LOADING,setProps:()=>null},type:component.type,key:index};return react_1.default.createElement(CheckedComponent,allProps,children)}function renderDashComponents(props,propsToRender){for(let i=0;i<propsToRender.length;i++){let key=propsToRender[i];props.hasOwnProperty(key)&&(props[key]=renderDashComponent(props[key]))}return props}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.type=exports.mergeRight=exports.isNil=exports.isEmpty=exports.includes=exports.has=exports.dissoc=void 0;var dissoc_js_1=require(53);Object.defineProperty(exports,`dissoc`,{enumerable:!0,get:function(){return __importDefault(dissoc_js_1).default}});var has_js_1=require(57);Object.defineProperty(exports,`has`,{enumerable:!0,get:function(){return __importDefault(has_js_1).default}});var includes_js_1=require(60);Object.defineProperty(exports,`includes`,{enumerable:!0,get:function(){return __importDefault(includes_js_1).default}});var isEmpty_js_1=require(72);Object.defineProperty(exports,`isEmpty`,{enumerable:!0,get:function(){return __importDefault(isEmpty_js_1).default}});var isNil_js_1=require(77);Object.defineProperty(exports,`isNil`,{enumerable:!0,get:function(){return __importDefault(isNil_js_1).default}});var mergeRight_js_1=require(78);Object.defineProperty(exports,`mergeRight`,{enumerable:!0,get:function(){return __importDefault(mergeRight_js_1).default}});var type_js_1=require(71);Object.defineProperty(exports,`type`,{enumerable:!0,get:function(){return __importDefault(type_js_1).default}})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=(0,__importDefault(require(54)).default)(function dissoc(prop,obj){var result={};for(var p in obj)result[p]=obj[p];return delete result[prop],result})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_curry2;let _curry1_js_1=__importDefault(require(55)),_isPlaceholder_js_1=__importDefault(require(56));function _curry2(fn){return function f2(a,b){switch(arguments.length){case 0:return f2;case 1:return(0,_isPlaceholder_js_1.default)(a)?f2:(0,_curry1_js_1.default)(function(_b){return fn(a,_b)});default:return(0,_isPlaceholder_js_1.default)(a)&&(0,_isPlaceholder_js_1.default)(b)?f2:(0,_isPlaceholder_js_1.default)(a)?(0,_curry1_js_1.default)(function(_a){return fn(_a,b)}):(0,_isPlaceholder_js_1.default)(b)?(0,_curry1_js_1.default)(function(_b){return fn(a,_b)}):fn(a,b)}}}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_curry1;let _isPlaceholder_js_1=__importDefault(require(56));function _curry1(fn){return function f1(a){return arguments.length===0||(0,_isPlaceholder_js_1.default)(a)?f1:fn.apply(this,arguments)}}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_isPlaceholder;function _isPlaceholder(a){return typeof a==`object`&&!!a&&a[`@@functional/placeholder`]===!0}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _curry2_js_1=__importDefault(require(54)),hasPath_js_1=__importDefault(require(58));exports.default=(0,_curry2_js_1.default)(function has(prop,obj){return(0,hasPath_js_1.default)([prop],obj)})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _curry2_js_1=__importDefault(require(54)),_has_js_1=__importDefault(require(59));exports.default=(0,_curry2_js_1.default)(function hasPath(_path,obj){if(_path.length===0)return!1;for(var val=obj,idx=0;idx<_path.length;)if((0,_has_js_1.default)(_path[idx],val))val=val[_path[idx]],idx+=1;else return!1;return!0})},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_has;function _has(prop,obj){return Object.prototype.hasOwnProperty.call(obj,prop)}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _includes_js_1=__importDefault(require(61));exports.default=(0,__importDefault(require(54)).default)(_includes_js_1.default)},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_includes;let _indexOf_js_1=__importDefault(require(62));function _includes(a,list){return(0,_indexOf_js_1.default)(list,a,0)>=0}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_indexOf;let equals_js_1=__importDefault(require(63));function _indexOf(list,a,idx){var inf,item;if(typeof list.indexOf==`function`)switch(typeof a){case`number`:if(a===0){for(inf=1/a;idx<list.length;){if(item=list[idx],item===0&&1/item===inf)return idx;idx+=1}return-1}else if(a!==a){for(;idx<list.length;){if(item=list[idx],typeof item==`number`&&item!==item)return idx;idx+=1}return-1}return list.indexOf(a,idx);case`string`:case`boolean`:case`function`:case`undefined`:return list.indexOf(a,idx);case`object`:if(a===null)return list.indexOf(a,idx)}for(;idx<list.length;){if((0,equals_js_1.default)(list[idx],a))return idx;idx+=1}return-1}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _curry2_js_1=__importDefault(require(54)),_equals_js_1=__importDefault(require(64));exports.default=(0,_curry2_js_1.default)(function equals(a,b){return(0,_equals_js_1.default)(a,b,[],[])})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_equals;let _arrayFromIterator_js_1=__importDefault(require(65)),_includesWith_js_1=__importDefault(require(66)),_functionName_js_1=__importDefault(require(67)),_has_js_1=__importDefault(require(59)),_objectIs_js_1=__importDefault(require(68)),keys_js_1=__importDefault(require(69)),type_js_1=__importDefault(require(71));function _uniqContentEquals(aIterator,bIterator,stackA,stackB){var a=(0,_arrayFromIterator_js_1.default)(aIterator),b=(0,_arrayFromIterator_js_1.default)(bIterator);function eq(_a,_b){return _equals(_a,_b,stackA.slice(),stackB.slice())}return!(0,_includesWith_js_1.default)(function(b,aItem){return!(0,_includesWith_js_1.default)(eq,aItem,b)},b,a)}function _equals(a,b,stackA,stackB){if((0,_objectIs_js_1.default)(a,b))return!0;var typeA=(0,type_js_1.default)(a);if(typeA!==(0,type_js_1.default)(b)||a==null||b==null)return!1;if(typeof a[`fantasy-land/equals`]==`function`||typeof b[`fantasy-land/equals`]==`function`)return typeof a[`fantasy-land/equals`]==`function`&&a[`fantasy-land/equals`](b)&&typeof b[`fantasy-land/equals`]==`function`&&b[`fantasy-land/equals`](a);if(typeof a.equals==`function`||typeof b.equals==`function`)return typeof a.equals==`function`&&a.equals(b)&&typeof b.equals==`function`&&b.equals(a);switch(typeA){case`Arguments`:case`Array`:case`Object`:if(typeof a.constructor==`function`&&(0,_functionName_js_1.default)(a.constructor)===`Promise`)return a===b;break;case`Boolean`:case`Number`:case`String`:if(!(typeof a==typeof b&&(0,_objectIs_js_1.default)(a.valueOf(),b.valueOf())))return!1;break;case`Date`:if(!(0,_objectIs_js_1.default)(a.valueOf(),b.valueOf()))return!1;break;case`Error`:return a.name===b.name&&a.message===b.message;case`RegExp`:if(!(a.source===b.source&&a.global===b.global&&a.ignoreCase===b.ignoreCase&&a.multiline===b.multiline&&a.sticky===b.sticky&&a.unicode===b.unicode))return!1;break}for(var idx=stackA.length-1;idx>=0;){if(stackA[idx]===a)return stackB[idx]===b;--idx}switch(typeA){case`Map`:return a.size===b.size?_uniqContentEquals(a.entries(),b.entries(),stackA.concat([a]),stackB.concat([b])):!1;case`Set`:return a.size===b.size?_uniqContentEquals(a.values(),b.values(),stackA.concat([a]),stackB.concat([b])):!1;case`Arguments`:case`Array`:case`Object`:case`Boolean`:case`Number`:case`String`:case`Date`:case`Error`:case`RegExp`:case`Int8Array`:case`Uint8Array`:case`Uint8ClampedArray`:case`Int16Array`:case`Uint16Array`:case`Int32Array`:case`Uint32Array`:case`Float32Array`:case`Float64Array`:case`ArrayBuffer`:break;default:return!1}var keysA=(0,keys_js_1.default)(a);if(keysA.length!==(0,keys_js_1.default)(b).length)return!1;var extendedStackA=stackA.concat([a]),extendedStackB=stackB.concat([b]);for(idx=keysA.length-1;idx>=0;){var key=keysA[idx];if(!((0,_has_js_1.default)(key,b)&&_equals(b[key],a[key],extendedStackA,extendedStackB)))return!1;--idx}return!0}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_arrayFromIterator;function _arrayFromIterator(iter){for(var list=[],next;!(next=iter.next()).done;)list.push(next.value);return list}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_includesWith;function _includesWith(pred,x,list){for(var idx=0,len=list.length;idx<len;){if(pred(x,list[idx]))return!0;idx+=1}return!1}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_functionName;function _functionName(f){var match=String(f).match(/^function (\w*)/);return match==null?``:match[1]}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0});function _objectIs(a,b){return a===b?a!==0||1/a==1/b:a!==a&&b!==b}exports.default=typeof Object.is==`function`?Object.is:_objectIs},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _curry1_js_1=__importDefault(require(55)),_has_js_1=__importDefault(require(59)),_isArguments_js_1=__importDefault(require(70));var hasEnumBug=!{toString:null}.propertyIsEnumerable(`toString`),nonEnumerableProps=[`constructor`,`valueOf`,`isPrototypeOf`,`toString`,`propertyIsEnumerable`,`hasOwnProperty`,`toLocaleString`],hasArgsEnumBug=function(){return arguments.propertyIsEnumerable(`length`)}(),contains=function contains(list,item){for(var idx=0;idx<list.length;){if(list[idx]===item)return!0;idx+=1}return!1};exports.default=typeof Object.keys==`function`&&!hasArgsEnumBug?(0,_curry1_js_1.default)(function keys(obj){return Object(obj)===obj?Object.keys(obj):[]}):(0,_curry1_js_1.default)(function keys(obj){if(Object(obj)!==obj)return[];var prop,nIdx,ks=[],checkArgsLength=hasArgsEnumBug&&(0,_isArguments_js_1.default)(obj);for(prop in obj)(0,_has_js_1.default)(prop,obj)&&(!checkArgsLength||prop!==`length`)&&(ks[ks.length]=prop);if(hasEnumBug)for(nIdx=nonEnumerableProps.length-1;nIdx>=0;)prop=nonEnumerableProps[nIdx],(0,_has_js_1.default)(prop,obj)&&!contains(ks,prop)&&(ks[ks.length]=prop),--nIdx;return ks})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _has_js_1=__importDefault(require(59));var toString=Object.prototype.toString;exports.default=function(){return toString.call(arguments)===`[object Arguments]`?function _isArguments(x){return toString.call(x)===`[object Arguments]`}:function _isArguments(x){return(0,_has_js_1.default)(`callee`,x)}}()},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=(0,__importDefault(require(55)).default)(function type(val){return val===null?`Null`:val===void 0?`Undefined`:Object.prototype.toString.call(val).slice(8,-1)})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _curry1_js_1=__importDefault(require(55)),empty_js_1=__importDefault(require(73)),equals_js_1=__importDefault(require(63));exports.default=(0,_curry1_js_1.default)(function isEmpty(x){return x!=null&&(0,equals_js_1.default)(x,(0,empty_js_1.default)(x))})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _curry1_js_1=__importDefault(require(55)),_isArguments_js_1=__importDefault(require(70)),_isArray_js_1=__importDefault(require(74)),_isObject_js_1=__importDefault(require(75)),_isString_js_1=__importDefault(require(76));exports.default=(0,_curry1_js_1.default)(function empty(x){return x!=null&&typeof x[`fantasy-land/empty`]==`function`?x[`fantasy-land/empty`]():x!=null&&x.constructor!=null&&typeof x.constructor[`fantasy-land/empty`]==`function`?x.constructor[`fantasy-land/empty`]():x!=null&&typeof x.empty==`function`?x.empty():x!=null&&x.constructor!=null&&typeof x.constructor.empty==`function`?x.constructor.empty():(0,_isArray_js_1.default)(x)?[]:(0,_isString_js_1.default)(x)?``:(0,_isObject_js_1.default)(x)?{}:(0,_isArguments_js_1.default)(x)?function(){return arguments}():void 0})},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=Array.isArray||function _isArray(val){return val!=null&&val.length>=0&&Object.prototype.toString.call(val)===`[object Array]`}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_isObject;function _isObject(x){return Object.prototype.toString.call(x)===`[object Object]`}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=_isString;function _isString(x){return Object.prototype.toString.call(x)===`[object String]`}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=(0,__importDefault(require(55)).default)(function isNil(x){return x==null})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _objectAssign_js_1=__importDefault(require(79));exports.default=(0,__importDefault(require(54)).default)(function mergeRight(l,r){return(0,_objectAssign_js_1.default)({},l,r)})},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let _has_js_1=__importDefault(require(59));function _objectAssign(target){if(target==null)throw TypeError(`Cannot convert undefined or null to object`);for(var output=Object(target),idx=1,length=arguments.length;idx<length;){var source=arguments[idx];if(source!=null)for(var nextKey in source)(0,_has_js_1.default)(nextKey,source)&&(output[nextKey]=source[nextKey]);idx+=1}return output}exports.default=typeof Object.assign==`function`?Object.assign:_objectAssign},function(require,module,exports){module.exports=`SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED`},function(require,module,exports){module.exports=window.PropTypes},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.useDispatch=exports.useStore=exports.setProps=exports.getChildProps=exports.stringifyId=exports.getChildLayout=exports.getLoadingState=exports.setPersistence=exports.isDash3=void 0;let react_1=__importDefault(require(6)),isDash3=()=>typeof window<`u`&&`dash_component_api`in window;exports.isDash3=isDash3;let setPersistence=(Component,props=[`value`])=>{let persistence={persisted_props:props,persistence_type:`local`};parseFloat(react_1.default.version)<18.3?Component.defaultProps=persistence:Component.dashPersistence=persistence};exports.setPersistence=setPersistence;let getLoadingState=loading_state=>{var _a,_b;if((0,exports.isDash3)()&&typeof window<`u`&&window.dash_component_api)try{return window.dash_component_api.useDashContext().useLoading()}catch{return(_a=loading_state?.is_loading)??!1}return(_b=loading_state?.is_loading)??!1};exports.getLoadingState=getLoadingState;let getChildLayout=child=>{var _a,_b,_c,_d;if((0,exports.isDash3)()&&typeof window<`u`&&window.dash_component_api){if(child.props&&child.props.componentPath)try{return window.dash_component_api.getLayout(child.props.componentPath)}catch{return{type:null,props:{}}}return{type:null,props:{}}}return{type:(_b=(_a=child.props)?._dashprivate_layout)?.type,props:(_d=(_c=child.props)?._dashprivate_layout)?.props}};exports.getChildLayout=getChildLayout;let stringifyId=id=>{var _a;return typeof id!=`object`||!id?id:typeof window<`u`&&(_a=window.dash_component_api)?.stringifyId?window.dash_component_api.stringifyId(id):`{`+Object.keys(id).sort().map(key=>JSON.stringify(key)+`:`+JSON.stringify(id[key])).join(`,`)+`}`};exports.stringifyId=stringifyId;let getChildProps=child=>(0,exports.getChildLayout)(child).props;exports.getChildProps=getChildProps;let setProps=(componentPath,props)=>{(0,exports.isDash3)()&&typeof window<`u`&&window.dash_clientside&&window.dash_clientside.set_props(componentPath,props)};exports.setProps=setProps;let useStore=()=>{if((0,exports.isDash3)()&&typeof window<`u`&&window.dash_component_api)try{return window.dash_component_api.useDashContext().useStore()}catch{return null}return null};exports.useStore=useStore;let useDispatch=()=>{if((0,exports.isDash3)()&&typeof window<`u`&&window.dash_component_api)try{return window.dash_component_api.useDashContext().useDispatch()}catch{return null}return null};exports.useDispatch=useDispatch},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.validateApiKey=validateApiKey,exports.checkApiKeyValidity=checkApiKeyValidity,exports.clearApiKeyCache=clearApiKeyCache;let DEFAULT_API_URL=`https://geomapindex.com/api/api-keys/validate`;async function validateApiKey(apiKey,componentName,itemsCount,apiUrl){if(!apiKey)return{valid:!1,message:`No API key provided`};try{let url=new URL(apiUrl||`https://geomapindex.com/api/api-keys/validate`),fullUrl=`${url.origin}${url.pathname}?key=${apiKey}`,response=await fetch(fullUrl,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({component_name:componentName,items_count:itemsCount})}),data=await response.json();return response.ok?{valid:data.valid,message:data.message,usage_count:data.usage_count}:(console.error(`API validation failed:`,data),{valid:!1,message:data.message||`API validation failed`})}catch(error){return console.error(`API key validation error:`,error),{valid:!1,message:`API validation error`}}}let validationCache=/* @__PURE__ */ new Map;async function checkApiKeyValidity(apiKey,componentName,itemsCount,apiUrl){if(!apiKey)return{valid:!1,message:`No API key provided`};let cacheKey=`${apiKey}:${componentName}`;if(validationCache.has(cacheKey))return validationCache.get(cacheKey);let result=await validateApiKey(apiKey,componentName,itemsCount,apiUrl);return validationCache.set(cacheKey,result),result}function clearApiKeyCache(apiKey,componentName){componentName?validationCache.delete(`${apiKey}:${componentName}`):Array.from(validationCache.keys()).forEach(key=>{key.startsWith(`${apiKey}:`)&&validationCache.delete(key)})}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.countTabs=countTabs,exports.countModelTabs=countModelTabs,exports.exceedsFreeTierLimit=exceedsFreeTierLimit,exports.limitModelToFreeTier=limitModelToFreeTier;function countTabs(model){let result={total:0,borderTabs:0,layoutTabs:0};if(model.borders){for(let border of model.borders)if(border.children)for(let child of border.children)child.type===`tab`&&(result.borderTabs++,result.total++)}return model.layout&&(result.layoutTabs=countTabsInLayout(model.layout),result.total+=result.layoutTabs),result}function countModelTabs(model){let total=0;return model.visitNodes(node=>{node.getType()===`tab`&&total++}),total}function countTabsInLayout(node){if(!node)return 0;if(node.type===`tab`)return 1;let count=0;if(node.children&&Array.isArray(node.children))for(let child of node.children)count+=countTabsInLayout(child);return count}function exceedsFreeTierLimit(model,freeLimit=3){return countTabs(model).total>freeLimit}function limitModelToFreeTier(model,freeLimit=3){let limitedModel={...model},remainingTabs=freeLimit;return model.borders&&model.borders.length>0&&(limitedModel.borders=model.borders.map(border=>{if(!border.children||border.children.length===0)return border;if(remainingTabs<=0)return{...border,children:[]};let tabsInBorder=border.children.filter(child=>child.type===`tab`);if(tabsInBorder.length>remainingTabs){let children=border.children.filter(child=>child.type!==`tab`);return children.push(...tabsInBorder.slice(0,remainingTabs)),remainingTabs=0,{...border,children}}return remainingTabs-=tabsInBorder.length,border})),remainingTabs>0&&limitedModel.layout?limitedModel.layout=limitLayoutNode(limitedModel.layout,remainingTabs):remainingTabs<=0&&limitedModel.layout&&(limitedModel.layout=createEmptyLayoutNode(limitedModel.layout.type)),limitedModel}function limitLayoutNode(node,maxTabs){if(!node)return null;if(node.type===`tab`)return maxTabs>0?(maxTabs--,node):null;if(node.type===`tabset`&&node.children){let tabs=node.children.filter(child=>child.type===`tab`);if(tabs.length<=maxTabs)return maxTabs-=tabs.length,node;{let limitedNode={...node};return limitedNode.children=tabs.slice(0,maxTabs),maxTabs=0,limitedNode}}if(node.children&&Array.isArray(node.children)){let newChildren=[],remainingTabs=maxTabs;for(let child of node.children){if(remainingTabs<=0)break;let limitedChild=limitLayoutNode(child,remainingTabs);if(limitedChild){let childTabCount=countTabsInLayout(limitedChild);remainingTabs-=childTabCount,newChildren.push(limitedChild)}}return{...node,children:newChildren.length>0?newChildren:[createEmptyLayoutNode(`tabset`)]}}return node}function createEmptyLayoutNode(type){return type===`tabset`?{type:`tabset`,weight:100,children:[]}:type===`row`||type===`column`?{type,weight:100,children:[createEmptyLayoutNode(`tabset`)]}:{type:`row`,weight:100,children:[createEmptyLayoutNode(`tabset`)]}}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.getTabVisibility=getTabVisibility,exports.isTabVisible=isTabVisible,exports.sameVisibility=sameVisibility;let selectedTabId=node=>{let selected=node.getSelectedNode();return selected?selected.getId():void 0};function getTabVisibility(model){let visibleTabIds=[];model.getBorderSet().getBorders().forEach(border=>{let tabId=selectedTabId(border);tabId!==void 0&&visibleTabIds.push(tabId)});let maximized=model.getMaximizedTabset();if(maximized){let tabId=selectedTabId(maximized);tabId!==void 0&&visibleTabIds.push(tabId)}else model.visitNodes(node=>{if(node.getType()===`tabset`){let tabId=selectedTabId(node);tabId!==void 0&&visibleTabIds.push(tabId)}});let active=model.getActiveTabset();return{visibleTabIds,activeTabId:active&&selectedTabId(active)||null}}function isTabVisible(node){let parent=node.getParent();if(!parent||!node.isSelected())return!1;if(parent.getType()===`border`)return!0;let maximized=node.getModel().getMaximizedTabset(node.getWindowId());return!maximized||maximized===parent}function sameVisibility(a,b){return!!a&&a.activeTabId===b.activeTabId&&a.visibleTabIds.length===b.visibleTabIds.length&&a.visibleTabIds.every((tabId,i)=>tabId===b.visibleTabIds[i])}},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=__importDefault(require(6)).default.createContext(!0)},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.default=__importDefault(require(6)).default.createContext(null)},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabResizeBatcher=exports.TAB_RESIZE_EVENT=void 0,exports.TAB_RESIZE_EVENT=`dashdock:tabresize`;let sameRect=(a,b)=>a.x===b.x&&a.y===b.y&&a.width===b.width&&a.height===b.height;class TabResizeBatcher{constructor(dockId,onFlush){this.dockId=dockId,this.onFlush=onFlush,this.lastRects=/* @__PURE__ */ new Map,this.pending=/* @__PURE__ */ new Map,this.frame=null,this.held=!1}queue(tabId,rect,element){let{x,y,width,height}=rect;this.pending.set(tabId,{rect:{x,y,width,height},element}),this.schedule()}track(tabId,rect){if(!this.lastRects.has(tabId)&&rect.width>0&&rect.height>0){let{x,y,width,height}=rect;this.lastRects.set(tabId,{x,y,width,height})}}hold(){this.held=!0}release(){this.held=!1,this.schedule()}remove(tabId){this.lastRects.delete(tabId),this.pending.delete(tabId)}dispose(){this.frame!==null&&(window.cancelAnimationFrame(this.frame),this.frame=null),this.pending.clear()}schedule(){this.held||this.frame!==null||this.pending.size===0||(this.frame=window.requestAnimationFrame(()=>{this.frame=null,this.flush()}))}flush(){if(this.held)return;let resized=[];this.pending.forEach(({rect,element},tabId)=>{let last=this.lastRects.get(tabId);this.lastRects.set(tabId,rect),!(!last||sameRect(last,rect))&&(resized.push({tabId,rect}),element&&element.dispatchEvent(new CustomEvent(exports.TAB_RESIZE_EVENT,{bubbles:!0,detail:{dockId:this.dockId,tabId,...rect}})))}),this.pending.clear(),resized.length>0&&this.onFlush(resized)}}exports.TabResizeBatcher=TabResizeBatcher},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0}),exports.renderHeaderSpec=renderHeaderSpec;let react_1=__importDefault(require(6));function renderHeaderSpec(spec,name){let showBadge=spec.badge!==void 0&&spec.badge!==null&&spec.badge!==0&&spec.badge!==``;return{leading:spec.icon?react_1.default.createElement(`i`,{className:`dash-dock-tab-icon ${spec.icon}`}):null,content:react_1.default.createElement(`span`,{className:spec.className?`dash-dock-tab-header ${spec.className}`:`dash-dock-tab-header`},spec.text===void 0?name:spec.text,showBadge&&react_1.default.createElement(`span`,{className:`dash-dock-tab-badge`},spec.badge))}}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabListSearch=void 0,exports.tabWindow=tabWindow;function tabWindow(count,selected,size){if(count<=size)return[0,count];let start=Math.min(Math.max(selected-Math.floor(size/2),0),count-size);return[start,start+size]}class TabListSearch{constructor(tabs){this.tabs=tabs,this.lastQuery=``,this.keys=tabs.map(tab=>`${tab.name}\n${tab.id}`.toLowerCase()),this.lastMatches=tabs.map((_,i)=>i)}search(query){let q=query.trim().toLowerCase(),candidates=q.startsWith(this.lastQuery)?this.lastMatches:this.tabs.map((_,i)=>i),matches=q?candidates.filter(i=>this.keys[i].includes(q)):candidates;return this.lastQuery=q,this.lastMatches=matches,matches.map(i=>this.tabs[i])}}exports.TabListSearch=TabListSearch},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.TabIndex=void 0,exports.updateTabIndex=updateTabIndex;let flexlayout_react_1=require(9),WORD_SEPARATOR=/[\s\-_.:/\\|()[\]]+/,indexKeys=text=>{let keys=/* @__PURE__ */ new Set;for(let word of text.split(WORD_SEPARATOR))word&&(keys.add(`p:${word.slice(0,1)}`),keys.add(`p:${word.slice(0,2)}`));for(let i=0;i+3<=text.length;i++)keys.add(`t:${text.slice(i,i+3)}`);return Array.from(keys)},queryKeys=query=>{if(query.length<3)return[`p:${query}`];let keys=/* @__PURE__ */ new Set;for(let i=0;i+3<=query.length;i++)keys.add(`t:${query.slice(i,i+3)}`);return Array.from(keys)},rank=(entry,query)=>{let name=entry.name.toLowerCase();return name.startsWith(query)?0:name.split(WORD_SEPARATOR).some(word=>word.startsWith(query))?1:2};class TabIndex{constructor(){this.entries=/* @__PURE__ */ new Map,this.postings=/* @__PURE__ */ new Map}static fromModel(model){let index=new TabIndex;return model.visitNodes(node=>{node.getType()===`tab`&&index.add(node.getId(),node.getName())}),index}get size(){return this.entries.size}has(id){return this.entries.has(id)}add(id,name){this.remove(id);let text=`${name}\n${id}`.toLowerCase(),entry={id,name,text,keys:indexKeys(text)};this.entries.set(id,entry);for(let key of entry.keys){let ids=this.postings.get(key);ids||(ids=/* @__PURE__ */ new Set,this.postings.set(key,ids)),ids.add(id)}}remove(id){let entry=this.entries.get(id);if(entry){this.entries.delete(id);for(let key of entry.keys){let ids=this.postings.get(key);ids.delete(id),ids.size||this.postings.delete(key)}}}search(query){let q=query.trim().toLowerCase();if(!q)return Array.from(this.entries.values(),({id,name})=>({id,name}));let sets=queryKeys(q).map(key=>this.postings.get(key));if(sets.some(ids=>!ids))return[];sets.sort((a,b)=>a.size-b.size);let candidates=Array.from(sets[0]);for(let ids of sets.slice(1))candidates=candidates.filter(id=>ids.has(id));return candidates.map(id=>this.entries.get(id)).filter(entry=>q.length<3||entry.text.includes(q)).map(entry=>({entry,rank:rank(entry,q)})).sort((a,b)=>a.rank-b.rank||a.entry.name.length-b.entry.name.length||a.entry.name.localeCompare(b.entry.name)).map(({entry:{id,name}})=>({id,name}))}}exports.TabIndex=TabIndex;function updateTabIndex(index,action,model){let data=action.data||{};switch(action.type){case flexlayout_react_1.Actions.ADD_NODE:{let json=data.json||{};if(json.type&&json.type!==`tab`||!json.id)return!1;let node=model.getNodeById(json.id);return node&&index.add(json.id,node.getName()),!0}case flexlayout_react_1.Actions.DELETE_TAB:return index.remove(data.node),!0;case flexlayout_react_1.Actions.RENAME_TAB:return index.has(data.node)&&index.add(data.node,data.text),!0;case flexlayout_react_1.Actions.UPDATE_NODE_ATTRIBUTES:return index.has(data.node)&&data.json&&data.json.name!==void 0&&index.add(data.node,data.json.name),!0;case flexlayout_react_1.Actions.DELETE_TABSET:return!1;default:return!0}}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.requestIdle=requestIdle,exports.cancelIdle=cancelIdle;let w=typeof window<`u`?window:void 0;function requestIdle(callback,timeout){return w&&w.requestIdleCallback?w.requestIdleCallback(callback,{timeout}):window.setTimeout(callback,1)}function cancelIdle(handle){w&&w.cancelIdleCallback?w.cancelIdleCallback(handle):window.clearTimeout(handle)}},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.LayoutSync=void 0,exports.withSyncedIds=withSyncedIds,exports.syncNodeIds=syncNodeIds;let flexlayout_react_1=require(9),UNSYNCED_ACTIONS=new Set([flexlayout_react_1.Actions.POPOUT_TAB,flexlayout_react_1.Actions.POPOUT_TABSET,flexlayout_react_1.Actions.CLOSE_WINDOW,flexlayout_react_1.Actions.CREATE_WINDOW]),randomId=()=>typeof crypto<`u`&&crypto.randomUUID?crypto.randomUUID():Math.random().toString(36).slice(2)+Date.now().toString(36);function withSyncedIds(action){return action.data&&!UNSYNCED_ACTIONS.has(action.type)&&!action.data.syncId&&(action.data.syncId=randomId()),action}function syncNodeIds(model){let patched=model,{doAction,nextUniqueId}=patched,syncId,count=0;return patched.nextUniqueId=()=>syncId?`#${syncId}-${count++}`:nextUniqueId.call(model),patched.doAction=action=>{syncId=action.data&&action.data.syncId,count=0;try{return doAction.call(model,action)}finally{syncId=void 0}},()=>{delete patched.nextUniqueId,delete patched.doAction}}class LayoutSync{constructor(name,replay,onError){this.source=randomId(),this.replaying=!1,this.channel=new BroadcastChannel(`dash-dock:${name}`),this.channel.onmessage=e=>{let message=e.data||{};if(message.source===this.source||!message.type||UNSYNCED_ACTIONS.has(message.type))return;let action=new flexlayout_react_1.Action(message.type,message.data);this.replaying=!0;try{replay(action)}catch(error){onError&&onError(action,error)}finally{this.replaying=!1}}}static isSupported(){return typeof BroadcastChannel<`u`}post(action){if(!(this.replaying||UNSYNCED_ACTIONS.has(action.type)))try{this.channel.postMessage({source:this.source,type:action.type,data:action.data})}catch(e){console.warn(`DashDock: could not sync action ${action.type}:`,e)}}close(){this.channel.close()}}exports.LayoutSync=LayoutSync},function(require,module,exports){Object.defineProperty(exports,`__esModule`,{value:!0}),exports.POPOUT_ROUTE=void 0,exports.defaultPopoutURL=defaultPopoutURL,exports.POPOUT_ROUTE=`_dash-dock/popout.html`;let popoutURL;function defaultPopoutURL(){if(popoutURL===void 0){let prefix=`/`;try{let config=document.getElementById(`_dash-config`);config&&config.textContent&&(prefix=JSON.parse(config.textContent).requests_pathname_prefix||prefix)}catch{}popoutURL=`${prefix}${exports.POPOUT_ROUTE}`}return popoutURL}},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})();Object.defineProperty(exports,`__esModule`,{value:!0});let react_1=__importStar(require(6)),TabMenu=({search,placeholder,selectedId,className,style,maxItems=100,onSelect,onClose})=>{let menuRef=(0,react_1.useRef)(null),listRef=(0,react_1.useRef)(null),[query,setQuery]=(0,react_1.useState)(``),matches=(0,react_1.useMemo)(()=>search(query),[search,query]),shown=matches.length>maxItems?matches.slice(0,maxItems):matches,[highlighted,setHighlighted]=(0,react_1.useState)(()=>Math.max(0,shown.findIndex(tab=>tab.id===selectedId)));(0,react_1.useEffect)(()=>{let onPointerDown=e=>{menuRef.current&&!menuRef.current.contains(e.target)&&onClose()};return window.addEventListener(`pointerdown`,onPointerDown,!0),()=>window.removeEventListener(`pointerdown`,onPointerDown,!0)},[onClose]),(0,react_1.useEffect)(()=>{var _a;((_a=listRef.current)?.children[highlighted])?.scrollIntoView({block:`nearest`})},[highlighted]);let onKeyDown=e=>{if(e.key===`ArrowDown`)setHighlighted(i=>Math.min(i+1,shown.length-1));else if(e.key===`ArrowUp`)setHighlighted(i=>Math.max(i-1,0));else if(e.key===`Enter`)shown[highlighted]&&onSelect(shown[highlighted].id);else if(e.key===`Escape`)onClose();else return;e.preventDefault()};return react_1.default.createElement(`div`,{ref:menuRef,className:`dash-dock-tab-menu ${className}`,style,onKeyDown},react_1.default.createElement(`input`,{className:`dash-dock-tab-menu-search`,autoFocus:!0,placeholder,value:query,onChange:e=>{setQuery(e.target.value),setHighlighted(0)}}),react_1.default.createElement(`ul`,{ref:listRef,className:`dash-dock-tab-menu-list`,role:`listbox`},shown.map((tab,i)=>react_1.default.createElement(`li`,{key:tab.id,role:`option`,"aria-selected":tab.id===selectedId,className:`dash-dock-tab-menu-item`+(i===highlighted?` dash-dock-tab-menu-item--highlighted`:``)+(tab.id===selectedId?` dash-dock-tab-menu-item--selected`:``),onPointerEnter:()=>setHighlighted(i),onClick:()=>onSelect(tab.id)},tab.index!==void 0&&react_1.default.createElement(`span`,{className:`dash-dock-tab-menu-index`},tab.index+1),tab.name))),matches.length>shown.length&&react_1.default.createElement(`div`,{className:`dash-dock-tab-menu-more`},matches.length-shown.length,` more, refine the search`))};exports.default=TabMenu},function(require,module,exports){var __createBinding=this&&this.__createBinding||(Object.create?(function(o,m,k,k2){k2===void 0&&(k2=k);var desc=Object.getOwnPropertyDescriptor(m,k);(!desc||(`get`in desc?!m.__esModule:desc.writable||desc.configurable))&&(desc={enumerable:!0,get:function(){return m[k]}}),Object.defineProperty(o,k2,desc)}):(function(o,m,k,k2){k2===void 0&&(k2=k),o[k2]=m[k]})),__setModuleDefault=this&&this.__setModuleDefault||(Object.create?(function(o,v){Object.defineProperty(o,`default`,{enumerable:!0,value:v})}):function(o,v){o.default=v}),__importStar=this&&this.__importStar||(function(){var ownKeys=function(o){return ownKeys=Object.getOwnPropertyNames||function(o){var ar=[];for(var k in o)Object.prototype.hasOwnProperty.call(o,k)&&(ar[ar.length]=k);return ar},ownKeys(o)};return function(mod){if(mod&&mod.__esModule)return mod;var result={};if(mod!=null)for(var k=ownKeys(mod),i=0;i<k.length;i++)k[i]!==`default`&&__createBinding(result,mod,k[i]);return __setModuleDefault(result,mod),result}})(),__importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let react_1=__importStar(require(6)),TabVisibilityContext_1=__importDefault(require(86)),TabEventsContext_1=__importDefault(require(87)),dash3_1=require(82),Tab=({id,children,setProps})=>{let visible=(0,react_1.useContext)(TabVisibilityContext_1.default),tabEvents=(0,react_1.useContext)(TabEventsContext_1.default),setPropsRef=(0,react_1.useRef)(setProps);setPropsRef.current=setProps;let visibleRef=(0,react_1.useRef)(visible);(0,react_1.useEffect)(()=>{visibleRef.current&&!visible&&setPropsRef.current&&setPropsRef.current({hiddenAt:Date.now()}),visibleRef.current=visible},[visible]);let tabId=(0,dash3_1.stringifyId)(id);return(0,react_1.useEffect)(()=>{if(tabEvents)return tabEvents.onClose(tabId,()=>{if(setPropsRef.current){let now=Date.now();setPropsRef.current({hiddenAt:now,closedAt:now})}})},[tabEvents,tabId]),react_1.default.createElement(react_1.default.Fragment,null,children)};exports.default=Tab},function(require,module,exports){var __importDefault=this&&this.__importDefault||function(mod){return mod&&mod.__esModule?mod:{default:mod}};Object.defineProperty(exports,`__esModule`,{value:!0});let react_1=require(6),TabVisibilityContext_1=__importDefault(require(86)),DockInterval=({interval=1e3,disabled=!1,n_intervals=0,max_intervals=-1,setProps})=>{let visible=(0,react_1.useContext)(TabVisibilityContext_1.default),lastTickRef=(0,react_1.useRef)(Date.now()),nIntervalsRef=(0,react_1.useRef)(n_intervals);nIntervalsRef.current=n_intervals;let running=!disabled&&(max_intervals===-1||n_intervals<max_intervals);return(0,react_1.useEffect)(()=>{if(!running||!visible||!setProps)return;let tick=()=>{lastTickRef.current=Date.now(),setProps({n_intervals:nIntervalsRef.current+1})};Date.now()-lastTickRef.current>=interval&&tick();let handle=window.setInterval(tick,interval);return()=>window.clearInterval(handle)},[running,visible,interval]),null};exports.default=DockInterval}],c={};function r(i){var e=c[i];return e?e.exports:(e=c[i]={exports:{}},m[i].call(e.exports,r,e,e.exports),e.exports)}window.dash_dock=r(0)})();
\ No newline at end of file
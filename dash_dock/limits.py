@@ -0,0 +1,152 @@
+"""
+Server-side enforcement of the free tier tab limit.
+
+Without an API key the component only shows the first ``freeTabLimit`` tabs,
+but it still receives the whole model and the children of every tab, and
+trims the model in the browser. ``enforce_tab_limit`` applies the same
+trimming before the layout is serialized, so the tabs that won't be shown and
+their children are never sent:
+
+    model, children = enforce_tab_limit(model, children, limit=3)
+    dash_dock.DashDock(id="dock", model=model, children=children)
+
+Tabs are kept in the same order as in the component (borders first, then the
+main layout in document order), and the model it returns is already within
+the limit, so the component uses it as is.
+"""
+from .children import child_tab_id
+from .model import ModelIndex
+
+__all__ = ["count_tabs", "limit_model", "enforce_tab_limit"]
+
+
+def _count_layout_tabs(node):
+    if not node:
+        return 0
+    if node.get("type") == "tab":
+        return 1
+    return sum(_count_layout_tabs(child) for child in node.get("children") or [])
+
+
+def count_tabs(model):
+    """
+    Count the tabs in a model.
+
+    :param model: A FlexLayout model (``dict``).
+    :return: Number of tabs in the borders and the main layout.
+    """
+    border_tabs = sum(
+        1
+        for border in model.get("borders") or []
+        for child in border.get("children") or []
+        if child.get("type") == "tab"
+    )
+    return border_tabs + _count_layout_tabs(model.get("layout"))
+
+
+def _empty_node(node_type):
+    if node_type == "tabset":
+        return {"type": "tabset", "weight": 100, "children": []}
+    if node_type not in ("row", "column"):
+        node_type = "row"
+    return {"type": node_type, "weight": 100, "children": [_empty_node("tabset")]}
+
+
+def _limit_layout_node(node, max_tabs):
+    if not node:
+        return None
+
+    if node.get("type") == "tab":
+        return node if max_tabs > 0 else None
+
+    children = node.get("children")
+    if node.get("type") == "tabset" and children is not None:
+        tabs = [child for child in children if child.get("type") == "tab"]
+        if len(tabs) <= max_tabs:
+            return node
+        return dict(node, children=tabs[:max_tabs])
+
+    if isinstance(children, list):
+        new_children = []
+        remaining = max_tabs
+        for child in children:
+            if remaining <= 0:
+                break
+            limited = _limit_layout_node(child, remaining)
+            if limited:
+                remaining -= _count_layout_tabs(limited)
+                new_children.append(limited)
+        return dict(node, children=new_children or [_empty_node("tabset")])
+
+    return node
+
+
+def limit_model(model, limit=3):
+    """
+    Trim a model to its first ``limit`` tabs.
+
+    Matches the trimming the component applies in the browser. Only the
+    nodes on the path to a change are copied; untouched subtrees are shared
+    with ``model``.
+
+    :param model: A FlexLayout model (``dict``).
+    :param limit: Maximum number of tabs to keep.
+    :return: The trimmed model, or ``model`` itself if it is within the limit.
+    """
+    if count_tabs(model) <= limit:
+        return model
+
+    limited = dict(model)
+    remaining = limit
+
+    if model.get("borders"):
+        borders = []
+        for border in model["borders"]:
+            children = border.get("children")
+            if not children:
+                borders.append(border)
+            elif remaining <= 0:
+                borders.append(dict(border, children=[]))
+            else:
+                tabs = [child for child in children if child.get("type") == "tab"]
+                if len(tabs) > remaining:
+                    kept = [child for child in children if child.get("type") != "tab"]
+                    kept.extend(tabs[:remaining])
+                    remaining = 0
+                    borders.append(dict(border, children=kept))
+                else:
+                    remaining -= len(tabs)
+                    borders.append(border)
+        limited["borders"] = borders
+
+    layout = limited.get("layout")
+    if layout:
+        if remaining > 0:
+            limited["layout"] = _limit_layout_node(layout, remaining)
+        else:
+            limited["layout"] = _empty_node(layout.get("type"))
+
+    return limited
+
+
+def enforce_tab_limit(model, children=None, limit=3):
+    """
+    Trim a model to its first ``limit`` tabs and drop the children of the
+    tabs that were removed.
+
+    :param model: A FlexLayout model (``dict``).
+    :param children: The dock's children (usually ``Tab`` components), or
+        ``None``. Children whose id is not a tab of ``model`` are kept.
+    :param limit: Maximum number of tabs to keep, e.g. the dock's
+        ``freeTabLimit``.
+    :return: Tuple of the trimmed model and the remaining children.
+    """
+    limited = limit_model(model, limit)
+    if children is None or limited is model:
+        return limited, children
+
+    removed = set(ModelIndex(model).tab_ids) - set(ModelIndex(limited).tab_ids)
+    if not isinstance(children, (list, tuple)):
+        children = [children]
+    kept = [child for child in children if child_tab_id(child) not in removed]
+    return limited, kept
@@ -0,0 +1,132 @@
+"""
+Helpers for inspecting FlexLayout JSON models on the server.
+
+A FlexLayout model is a nested dict with an optional ``borders`` list and a
+``layout`` tree of ``row``, ``tabset`` and ``tab`` nodes. ``ModelIndex`` walks
+the model once and records the JSON path of every node that has an ``id``, so
+callers can address nodes directly instead of searching the tree each time.
+"""
+
+__all__ = ["ModelIndex", "iter_nodes"]
+
+
+def _border_id(border):
+    # FlexLayout gives borders a fixed id derived from their location
+    return border.get("id") or "border_{}".format(border.get("location"))
+
+
+def iter_nodes(model):
+    """
+    Iterate over every node in ``model``.
+
+    Borders are visited first, followed by the main layout in depth-first
+    order.
+
+    :param model: A FlexLayout model (``dict``).
+    :return: An iterator of ``(path, node, parent_path)`` tuples, where
+        ``path`` is the tuple of keys leading to ``node`` from the model root.
+    """
+    for i, border in enumerate(model.get("borders") or []):
+        path = ("borders", i)
+        yield path, border, None
+        for j, child in enumerate(border.get("children") or []):
+            yield path + ("children", j), child, path
+
+    layout = model.get("layout")
+    if not layout:
+        return
+
+    stack = [(("layout",), layout, None)]
+    while stack:
+        path, node, parent_path = stack.pop()
+        yield path, node, parent_path
+        children = node.get("children") or []
+        # Push in reverse so children are visited in document order
+        for j in range(len(children) - 1, -1, -1):
+            stack.append((path + ("children", j), children[j], path))
+
+
+class ModelIndex(object):
+    """
+    Index of the nodes in a FlexLayout model, keyed by node id.
+
+    The index reflects the model it was built from; it is not updated when
+    the model (or a ``dash.Patch`` derived from it) changes.
+
+    :param model: A FlexLayout model (``dict``).
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._paths = {}
+        self._parents = {}
+        self._tab_ids = []
+
+        for path, node, parent_path in iter_nodes(model):
+            if path[0] == "borders" and len(path) == 2:
+                node_id = _border_id(node)
+            else:
+                node_id = node.get("id")
+            if node.get("type") == "tab" and node_id is not None:
+                self._tab_ids.append(node_id)
+            if node_id is None:
+                continue
+            self._paths[node_id] = path
+            self._parents[node_id] = parent_path
+
+    def __contains__(self, node_id):
+        return node_id in self._paths
+
+    def __len__(self):
+        return len(self._paths)
+
+    @property
+    def tab_ids(self):
+        """List of tab ids in document order (borders first)."""
+        return list(self._tab_ids)
+
+    def path(self, node_id):
+        """
+        Get the JSON path of a node.
+
+        :param node_id: Id of the node.
+        :return: Tuple of keys leading to the node from the model root.
+        :raises KeyError: If there is no node with this id.
+        """
+        try:
+            return self._paths[node_id]
+        except KeyError:
+            raise KeyError("No node with id {!r} in model".format(node_id))
+
+    def node(self, node_id):
+        """
+        Get a node from the model by id.
+
+        :param node_id: Id of the node.
+        :return: The node ``dict``.
+        :raises KeyError: If there is no node with this id.
+        """
+        return self.resolve(self.path(node_id))
+
+    def parent_path(self, node_id):
+        """
+        Get the JSON path of a node's parent.
+
+        :param node_id: Id of the node.
+        :return: Tuple of keys, or ``None`` for top level nodes.
+        :raises KeyError: If there is no node with this id.
+        """
+        self.path(node_id)
+        return self._parents[node_id]
+
+    def resolve(self, path):
+        """
+        Follow ``path`` from the model root.
+
+        :param path: Tuple of keys, as returned by ``path``.
+        :return: The value at ``path``.
+        """
+        value = self.model
+        for key in path:
+            value = value[key]
+        return value
@@ -0,0 +1,188 @@
+"""
+``dash.Patch`` helpers for mutating a DashDock from a callback.
+
+Returning a whole ``model`` (and often the whole ``children`` list) to add or
+select a single tab sends the entire layout and every panel back to the
+browser. These helpers instead record small ``Patch`` operations against
+``DashDock.model`` and ``DashDock.children``, so only the change goes over the
+wire.
+
+The model helpers take the *current* model (usually passed in as a ``State``)
+or a ``ModelIndex`` built from it, which is used to resolve the JSON path of
+the nodes being changed. Paths are resolved against that model, so combining
+several operations that shift the same list (e.g. two removals from the same
+tabset) in one patch is not supported; rebuild the patch from the updated
+model instead.
+
+Example::
+
+    @app.callback(
+        Output("dock", "model"),
+        Output("dock", "children"),
+        Input("add-button", "n_clicks"),
+        State("dock", "model"),
+        prevent_initial_call=True,
+    )
+    def add_panel(n_clicks, model):
+        model_patch, children_patch = Patch(), Patch()
+        tab_id = "panel-{}".format(n_clicks)
+        add_tab(model_patch, model, "main-tabset", {"id": tab_id, "name": tab_id})
+        add_tab_content(children_patch, tab_id, html.Div(tab_id))
+        return model_patch, children_patch
+"""
+from .children import _child_id
+from .model import ModelIndex
+from .Tab import Tab
+
+__all__ = [
+    "add_tab",
+    "remove_tab",
+    "select_tab",
+    "set_weights",
+    "add_tab_content",
+    "remove_tab_content",
+]
+
+
+def _as_index(model):
+    return model if isinstance(model, ModelIndex) else ModelIndex(model)
+
+
+def _at(patch, path):
+    for key in path:
+        patch = patch[key]
+    return patch
+
+
+def _child_position(index, node_id):
+    path = index.path(node_id)
+    parent_path = index.parent_path(node_id)
+    if parent_path is None:
+        raise ValueError("Node {!r} is not inside a tabset or border".format(node_id))
+    return parent_path, path[-1]
+
+
+def add_tab(patch, model, tabset_id, tab, position=None, select=True):
+    """
+    Add a tab to a tabset or border.
+
+    :param patch: ``dash.Patch`` for the ``model`` prop.
+    :param model: The current model, or a ``ModelIndex`` of it.
+    :param tabset_id: Id of the tabset (or border, e.g. ``"border_left"``)
+        to add the tab to.
+    :param tab: Tab node ``dict``. Must have an ``id`` so that its content
+        can be matched in ``children``.
+    :param position: Index to insert the tab at. Defaults to the end.
+    :param select: Whether to make the new tab the selected tab.
+    :return: The patch.
+    """
+    if "id" not in tab:
+        raise ValueError("Tabs added with add_tab must have an 'id'")
+    index = _as_index(model)
+    path = index.path(tabset_id)
+    tabset = index.resolve(path)
+    count = len(tabset.get("children") or [])
+
+    tab = dict(tab, type="tab")
+    target = _at(patch, path)
+    if position is None or position >= count:
+        position = count
+        target["children"].append(tab)
+    else:
+        position = max(position, 0)
+        target["children"].insert(position, tab)
+
+    # A border without a selection is closed (-1); a tabset shows its first tab
+    selected = tabset.get("selected", -1 if tabset.get("type") == "border" else 0)
+    if select:
+        target["selected"] = position
+    elif position <= selected < count:
+        target["selected"] = selected + 1
+    return patch
+
+
+def remove_tab(patch, model, tab_id):
+    """
+    Remove a tab, keeping the selection of its tabset consistent.
+
+    :param patch: ``dash.Patch`` for the ``model`` prop.
+    :param model: The current model, or a ``ModelIndex`` of it.
+    :param tab_id: Id of the tab to remove.
+    :return: The patch.
+    """
+    index = _as_index(model)
+    parent_path, position = _child_position(index, tab_id)
+    parent = index.resolve(parent_path)
+    target = _at(patch, parent_path)
+
+    del target["children"][position]
+
+    selected = parent.get("selected")
+    if selected is not None and selected >= 0:
+        remaining = len(parent.get("children") or []) - 1
+        if selected > position or selected >= remaining:
+            # Borders use -1 for "closed"; tabsets fall back to the last tab
+            target["selected"] = min(selected - 1, remaining - 1) if remaining else -1
+    return patch
+
+
+def select_tab(patch, model, tab_id):
+    """
+    Make a tab the selected tab of its tabset or border.
+
+    :param patch: ``dash.Patch`` for the ``model`` prop.
+    :param model: The current model, or a ``ModelIndex`` of it.
+    :param tab_id: Id of the tab to select.
+    :return: The patch.
+    """
+    index = _as_index(model)
+    parent_path, position = _child_position(index, tab_id)
+    _at(patch, parent_path)["selected"] = position
+    return patch
+
+
+def set_weights(patch, model, weights):
+    """
+    Set the weights of rows and tabsets.
+
+    :param patch: ``dash.Patch`` for the ``model`` prop.
+    :param model: The current model, or a ``ModelIndex`` of it.
+    :param weights: Mapping of node id to weight.
+    :return: The patch.
+    """
+    index = _as_index(model)
+    for node_id, weight in weights.items():
+        _at(patch, index.path(node_id))["weight"] = weight
+    return patch
+
+
+def add_tab_content(patch, tab_id, children):
+    """
+    Append the content for a tab to ``DashDock.children``.
+
+    :param patch: ``dash.Patch`` for the ``children`` prop.
+    :param tab_id: Id of the tab the content belongs to.
+    :param children: Content to render in the tab.
+    :return: The patch.
+    """
+    patch.append(Tab(id=tab_id, children=children))
+    return patch
+
+
+def remove_tab_content(patch, children, tab_id):
+    """
+    Remove the content for a tab from ``DashDock.children``.
+
+    :param patch: ``dash.Patch`` for the ``children`` prop.
+    :param children: The current ``children`` (usually passed in as a
+        ``State``).
+    :param tab_id: Id of the tab whose content should be removed.
+    :return: The patch.
+    """
+    if not isinstance(children, (list, tuple)):
+        children = [children]
+    positions = [i for i, child in enumerate(children) if _child_id(child) == tab_id]
+    # Delete from the end so earlier positions stay valid
+    for position in reversed(positions):
+        del patch[position]
+    return patch
@@ -0,0 +1,48 @@
+"""
+Page that popped out tabs are opened in.
+
+FlexLayout opens a popout window on ``popoutURL``, copies the stylesheets of
+the main page into it and renders the tab into the window through a React
+portal. The page only has to exist on the same origin; loading the Dash app
+itself there would download every script and fetch the layout again for
+nothing. ``DashDock`` defaults ``popoutURL`` to the blank page registered
+here, under the app's ``routes_pathname_prefix``.
+"""
+import dash
+
+__all__ = ["POPOUT_ROUTE", "POPOUT_HTML", "register_popout_route"]
+
+#: Route of the popout page, relative to the app's pathname prefix
+POPOUT_ROUTE = "_dash-dock/popout.html"
+
+POPOUT_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title></title>
+<style>
+html, body { height: 100%; margin: 0; padding: 0; overflow: hidden; }
+</style>
+</head>
+<body>
+</body>
+</html>
+"""
+
+
+def register_popout_route():
+    """
+    Serve the popout page from every Dash app created afterwards.
+
+    Uses a Dash ``route`` hook, and is called when ``dash_dock`` is imported.
+    Does nothing on Dash versions without hooks; set ``popoutURL`` to a page
+    of your own (e.g. an HTML file in ``assets``) there.
+    """
+    hooks = getattr(dash, "hooks", None)
+    if hooks is None:
+        return
+
+    @hooks.route(name=POPOUT_ROUTE)
+    def _dash_dock_popout():
+        return POPOUT_HTML
@@ -0,0 +1,107 @@
+"""
+Canonical JSON serialization and structural hashing for DashDock models.
+
+FlexLayout models are plain nested dicts/lists, so two layouts are the same
+layout exactly when their canonical (key-sorted, compact) JSON is the same.
+Serializing once and hashing the bytes gives a cheap O(n) fingerprint that
+can be used for caching, persistence and de-duplication, instead of repeated
+``json.dumps`` comparisons.
+
+``orjson`` is used when it is installed; otherwise the standard library
+``json`` module is used. Both backends produce key-sorted, compact output,
+but number formatting can differ slightly between them (e.g. ``1e16`` vs
+``1e+16``), so hashes should not be compared across installations with and
+without ``orjson``.
+"""
+import hashlib
+import json
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _orjson = None
+
+
+__all__ = [
+    "to_canonical_json",
+    "to_canonical_bytes",
+    "model_hash",
+    "models_equal",
+]
+
+
+def _default(obj):
+    """Serialize Dash components and other non-JSON types."""
+    if hasattr(obj, "to_plotly_json"):
+        return obj.to_plotly_json()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(type(obj).__name__)
+    )
+
+
+def to_canonical_bytes(model):
+    """
+    Serialize ``model`` to canonical UTF-8 encoded JSON.
+
+    Keys are sorted and no whitespace is emitted, so equal models always
+    serialize to identical bytes.
+
+    :param model: A FlexLayout model (``dict``) or any JSON-compatible value.
+    :return: The canonical JSON as ``bytes``.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(
+            model,
+            default=_default,
+            option=_orjson.OPT_SORT_KEYS | _orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        model,
+        default=_default,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def to_canonical_json(model):
+    """
+    Serialize ``model`` to a canonical, key-sorted, compact JSON string.
+
+    :param model: A FlexLayout model (``dict``) or any JSON-compatible value.
+    :return: The canonical JSON as ``str``.
+    """
+    return to_canonical_bytes(model).decode("utf-8")
+
+
+def model_hash(model, digest_size=16):
+    """
+    Compute a structural hash of ``model``.
+
+    The hash is taken over the canonical JSON, so it does not depend on key
+    order and is stable between processes (unlike ``hash()``).
+
+    :param model: A FlexLayout model (``dict``) or any JSON-compatible value.
+    :param digest_size: Size of the digest in bytes (1-64). Default 16.
+    :return: The hex digest as ``str``.
+    """
+    return hashlib.blake2b(
+        to_canonical_bytes(model), digest_size=digest_size
+    ).hexdigest()
+
+
+def models_equal(a, b):
+    """
+    Check whether two models describe the same layout.
+
+    :param a: First model.
+    :param b: Second model.
+    :return: ``True`` if both models have the same canonical JSON.
+    """
+    if a is b:
+        return True
+    return to_canonical_bytes(a) == to_canonical_bytes(b)
@@ -0,0 +1,179 @@
+"""
+Skip callback work for outputs that live in hidden tabs.
+
+``DashDock`` publishes the ids of the tabs on screen as ``visibleTabIds``.
+Decorating a callback with ``only_if_visible`` makes it skip the update while
+its tab is hidden and remember that the output is out of date (in the dock's
+``dirtyOutputs`` prop), so it is recomputed once the tab is revealed:
+
+    @app.callback(
+        Output("sales-graph", "figure"),
+        Input("date-range", "value"),
+        Input("dock", "visibleTabIds"),
+        State("dock", "dirtyOutputs"),
+    )
+    @only_if_visible("dock", "sales-tab")
+    def update_sales(date_range, visible_tab_ids, dirty_outputs):
+        ...
+
+``Input(dock, "visibleTabIds")`` is what triggers the recompute on reveal.
+``State(dock, "dirtyOutputs")`` is optional; without it, every change of
+visibility while the tab is shown recomputes the output, rather than only
+the first one after it missed an update.
+"""
+import functools
+
+import dash
+from dash import callback_context, no_update
+from dash.exceptions import PreventUpdate
+
+from .children import _flatten, stringify_tab_id
+from .model import iter_nodes
+
+__all__ = ["visible_tab_ids", "active_tab_id", "only_if_visible"]
+
+
+def _selected_tab_id(node, default):
+    children = node.get("children") or []
+    selected = node.get("selected", default)
+    if 0 <= selected < len(children):
+        return children[selected].get("id")
+    return None
+
+
+def _tabsets(model):
+    for path, node, _ in iter_nodes(model):
+        if path[0] == "layout" and node.get("type") == "tabset":
+            yield node
+
+
+def visible_tab_ids(model):
+    """
+    Work out which tabs of a model are on screen.
+
+    Matches the ``visibleTabIds`` prop the component reports: the selected
+    tab of every open border and every tabset (or only of the maximized
+    tabset, when there is one). Passing it as ``visibleTabIds`` when the
+    dock is created lets ``only_if_visible`` skip hidden tabs on the initial
+    callbacks too.
+
+    :param model: A FlexLayout model (``dict``).
+    :return: List of tab ids, borders first.
+    """
+    tab_ids = [
+        _selected_tab_id(border, -1) for border in model.get("borders") or []
+    ]
+    tabsets = list(_tabsets(model))
+    maximized = [tabset for tabset in tabsets if tabset.get("maximized")]
+    tab_ids.extend(_selected_tab_id(tabset, 0) for tabset in maximized or tabsets)
+    return [tab_id for tab_id in tab_ids if tab_id is not None]
+
+
+def active_tab_id(model):
+    """
+    Get the selected tab of the active tabset.
+
+    :param model: A FlexLayout model (``dict``).
+    :return: Tab id, or ``None`` if no tabset is active.
+    """
+    for tabset in _tabsets(model):
+        if tabset.get("active"):
+            return _selected_tab_id(tabset, 0)
+    return None
+
+
+def _outputs():
+    outputs = callback_context.outputs_list
+    return list(_flatten(outputs if isinstance(outputs, (list, tuple)) else [outputs]))
+
+
+def _dependency(prop_id):
+    # (declared, value) for an Input or State of the running callback
+    for values in (callback_context.inputs, callback_context.states):
+        if prop_id in values:
+            return True, values[prop_id]
+    return False, None
+
+
+def _set_dirty(dock_id, key, tab_id):
+    set_props = getattr(dash, "set_props", None)
+    if set_props is None:
+        return
+    # Always patch, so callbacks running at the same time don't overwrite
+    # each other's marks (a patch of an unset prop starts from {})
+    value = dash.Patch()
+    if tab_id is None:
+        del value[key]
+    else:
+        value[key] = tab_id
+    set_props(dock_id, {"dirtyOutputs": value})
+
+
+def only_if_visible(dock_id, tab_id=None):
+    """
+    Only run a callback while the tab its outputs live in is visible.
+
+    Place it below ``@app.callback``. The callback must take
+    ``Input(dock_id, "visibleTabIds")`` and may take
+    ``State(dock_id, "dirtyOutputs")``; both are passed on to the decorated
+    function like any other argument.
+
+    - While the tab is hidden, a change of any other input returns
+      ``no_update`` and marks the outputs dirty.
+    - A change of visibility alone only runs the callback when the tab is
+      visible and its outputs are dirty (or, without the ``dirtyOutputs``
+      state, whenever the tab is visible).
+    - Before the component has reported visibility, the callback always runs.
+
+    :param dock_id: Id of the ``DashDock``.
+    :param tab_id: Id of the tab the outputs are rendered in, a string or a
+        pattern-matching dict. Defaults to the id of the first output, for
+        callbacks that update a ``Tab``.
+    """
+    dock_key = stringify_tab_id(dock_id)
+    tab_key = None if tab_id is None else stringify_tab_id(tab_id)
+    visible_prop_id = "{}.visibleTabIds".format(dock_key)
+    dirty_prop_id = "{}.dirtyOutputs".format(dock_key)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            declared, visible = _dependency(visible_prop_id)
+            if not declared:
+                raise ValueError(
+                    "only_if_visible needs Input({!r}, 'visibleTabIds') in the "
+                    "callback".format(dock_id)
+                )
+            tracked, dirty_outputs = _dependency(dirty_prop_id)
+
+            outputs = _outputs()
+            key = "|".join(
+                "{}.{}".format(stringify_tab_id(output["id"]), output["property"])
+                for output in outputs
+            )
+            tab = tab_key
+            if tab is None and outputs:
+                tab = stringify_tab_id(outputs[0]["id"])
+
+            triggered = set(callback_context.triggered_prop_ids)
+            visibility_only = triggered == {visible_prop_id}
+            is_dirty = key in (dirty_outputs or {})
+
+            if visible is not None and tab not in visible:
+                if visibility_only:
+                    raise PreventUpdate
+                if tracked and not is_dirty:
+                    _set_dirty(dock_id, key, tab)
+                return no_update
+
+            if visibility_only and tracked and not is_dirty:
+                raise PreventUpdate
+
+            result = func(*args, **kwargs)
+            if is_dirty:
+                _set_dirty(dock_id, key, None)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -7,6 +7,7 @@ const version = "0.0.1"
 
 include("jl/dashdock.jl")
 include("jl/tab.jl")
+include("jl/dockinterval.jl")
 
 function __init__()
     DashBase.register_package(
@@ -22,6 +22,7 @@ WARNING: There is no validation done on whether the children here will be render
 If there is no matching tab for a particular ID, that element will be silently ignored in
 rendering (although callbacks will still be applied).
 - `id` (String; optional): Unique ID to identify this component in Dash callbacks.
+- `activeTabId` (String; optional): Id of the selected tab in the active tabset. Set by the component.
 - `apiKey` (String; optional): API key for premium features.
 If provided and valid, unlocks unlimited tabs.
 Otherwise, limits to 3 tabs in the free version.
@@ -30,6 +31,19 @@ If not provided, uses the default endpoint.
 - `colorScheme` (a value equal to: 'light', 'dark'; optional): Current color scheme, automatically detected from Mantine theme
 If not specified, will try to auto-detect from HTML data-mantine-color-scheme
 - `debugMode` (Bool; optional): Debug mode flag
+- `deferModelUpdates` (Bool; optional): Report layout changes to Dash (`model`, `visibleTabIds` and `activeTabId`) when
+the browser is idle, at most 500ms later, instead of serializing the layout after
+every action. A burst of actions, such as the splitter moves of a `realtimeResize`
+drag, is then serialized and sent once. The quick switcher and clientside
+operations still see every change immediately.
+- `dirtyOutputs` (Dict with Strings as keys and values of type String; optional): Outputs that skipped an update while their tab was hidden, mapped to the id of
+that tab. Maintained by the `dash_dock.only_if_visible` callback decorator; not
+used by the component itself.
+- `dragPlaceholders` (Bool; optional): While a splitter or tab is being dragged, replace the content of tabs marked
+heavy (with `"config": {"heavy": true}` in the model) by a placeholder. Their
+content stays mounted at its previous size and is resized once on drop, so
+expensive content such as WebGL or Plotly figures doesn't re-layout on every
+frame of the drag.
 - `font` (Bool | Real | String | Dict | Array; optional): The tab font (overrides value in css).
 Example: font={{size:"12px", style:"italic"}}
 - `freeTabLimit` (Real; optional): Maximum number of tabs allowed in free version.
@@ -39,6 +53,17 @@ the default headers, where a custom header mapping is supplied.
 
 Note: where possible, it is likely better to use classes to style the headers, rather than
 using this prop.
+- `headerSpecs` (Dict with Strings as keys and values of type lists containing elements 'icon', 'text', 'badge', 'className'.
+Those elements have the following types:
+  - `icon` (String; optional)
+  - `text` (String; optional)
+  - `badge` (Real | String; optional)
+  - `className` (String; optional); optional): Map of lightweight header descriptions for each tab, rendered by the component
+itself instead of as Dash components. Each entry can have an `icon` (CSS class of
+an icon element, e.g. "bi bi-graph-up"), `text` (defaults to the tab name), a
+`badge` (e.g. an unread count; hidden when 0 or null) and a `className`.
+Updating a badge only changes a few bytes of props. An entry in `headers` for the
+same tab takes precedence over its text.
 - `loading_state` (optional): Loading state.. loading_state has the following type: lists containing elements 'is_loading', 'component_name', 'prop_name'.
 Those elements have the following types:
   - `is_loading` (Bool; required)
@@ -415,9 +440,33 @@ Default: 100
   - `popouts` (optional): . popouts has the following type: lists containing elements .
 Those elements have the following types:
 
-- `popoutURL` (String; optional): URL of popout window relative to origin, defaults to popout.html
+- `popoutURL` (String; optional): URL of the page popout windows are opened with, relative to the origin. Defaults
+to a blank page served by `dash_dock` at `<requests_pathname_prefix>_dash-dock/popout.html`.
+Popped out tabs are rendered into the window from this page's React tree, so the page
+needs no scripts of its own.
+- `prefetchDelay` (Real; optional): Milliseconds the pointer has to rest on the button of a hidden tab (in a tabset
+or a border) before `prefetchTabId` is set to that tab. Leave unset to disable.
+- `prefetchTabId` (String; optional): Id of the hidden tab the user is likely to open next, based on hover intent
+(see `prefetchDelay`). Use it as a callback input to warm caches or render the
+tab's content before it is clicked. Set by the component.
+- `quickSwitcher` (Bool; optional): Enable the quick switcher: Ctrl+K (Cmd+K on macOS) opens a search box over the
+names and ids of all tabs, and choosing a tab selects it without a server round
+trip. The shortcut applies to the dock holding the focus, or to the first dock
+on the page with a quick switcher. It can also be opened with
+`dash_clientside.dash_dock.openQuickSwitcher(dockId)`.
 - `realtimeResize` (Bool; optional): Boolean value, defaults to false, resize tabs as splitters are dragged.
 Warning: this can cause resizing to become choppy when tabs are slow to draw
+- `reportTabResize` (Bool; optional): Report settled tab resizes through the `resizedTabs` prop. Resizes are always
+announced with a `dashdock:tabresize` DOM event dispatched on the tab's content
+element (bubbling up to `window`), whose `detail` holds the `dockId`, `tabId`
+and the tab's new `x`, `y`, `width` and `height`.
+- `resizedTabs` (Dict with Strings as keys and values of type lists containing elements 'width', 'height'.
+Those elements have the following types:
+  - `width` (Real; required)
+  - `height` (Real; required); optional): The tabs whose size changed in the last splitter drag, maximize or other layout
+change, mapped to their new `width` and `height`. Only tabs whose rect actually
+changed are included, and only once the drag has finished. Set by the component
+when `reportTabResize` is true.
 - `style` (optional): CSS styles to apply to the root container element. style has the following type: lists containing elements 'accentColor', 'alignContent', 'alignItems', 'alignSelf', 'alignTracks', 'animationComposition', 'animationDelay', 'animationDirection', 'animationDuration', 'animationFillMode', 'animationIterationCount', 'animationName', 'animationPlayState', 'animationRangeEnd', 'animationRangeStart', 'animationTimeline', 'animationTimingFunction', 'appearance', 'aspectRatio', 'backdropFilter', 'backfaceVisibility', 'backgroundAttachment', 'backgroundBlendMode', 'backgroundClip', 'backgroundColor', 'backgroundImage', 'backgroundOrigin', 'backgroundPositionX', 'backgroundPositionY', 'backgroundRepeat', 'backgroundSize', 'blockOverflow', 'blockSize', 'borderBlockColor', 'borderBlockEndColor', 'borderBlockEndStyle', 'borderBlockEndWidth', 'borderBlockStartColor', 'borderBlockStartStyle', 'borderBlockStartWidth', 'borderBlockStyle', 'borderBlockWidth', 'borderBottomColor', 'borderBottomLeftRadius', 'borderBottomRightRadius', 'borderBottomStyle', 'borderBottomWidth', 'borderCollapse', 'borderEndEndRadius', 'borderEndStartRadius', 'borderImageOutset', 'borderImageRepeat', 'borderImageSlice', 'borderImageSource', 'borderImageWidth', 'borderInlineColor', 'borderInlineEndColor', 'borderInlineEndStyle', 'borderInlineEndWidth', 'borderInlineStartColor', 'borderInlineStartStyle', 'borderInlineStartWidth', 'borderInlineStyle', 'borderInlineWidth', 'borderLeftColor', 'borderLeftStyle', 'borderLeftWidth', 'borderRightColor', 'borderRightStyle', 'borderRightWidth', 'borderSpacing', 'borderStartEndRadius', 'borderStartStartRadius', 'borderTopColor', 'borderTopLeftRadius', 'borderTopRightRadius', 'borderTopStyle', 'borderTopWidth', 'bottom', 'boxDecorationBreak', 'boxShadow', 'boxSizing', 'breakAfter', 'breakBefore', 'breakInside', 'captionSide', 'caretColor', 'caretShape', 'clear', 'clipPath', 'color', 'colorAdjust', 'colorScheme', 'columnCount', 'columnFill', 'columnGap', 'columnRuleColor', 'columnRuleStyle', 'columnRuleWidth', 'columnSpan', 'columnWidth', 'contain', 'containIntrinsicBlockSize', 'containIntrinsicHeight', 'containIntrinsicInlineSize', 'containIntrinsicWidth', 'containerName', 'containerType', 'content', 'contentVisibility', 'counterIncrement', 'counterReset', 'counterSet', 'cursor', 'direction', 'display', 'emptyCells', 'filter', 'flexBasis', 'flexDirection', 'flexGrow', 'flexShrink', 'flexWrap', 'float', 'fontFamily', 'fontFeatureSettings', 'fontKerning', 'fontLanguageOverride', 'fontOpticalSizing', 'fontPalette', 'fontSize', 'fontSizeAdjust', 'fontSmooth', 'fontStretch', 'fontStyle', 'fontSynthesis', 'fontSynthesisPosition', 'fontSynthesisSmallCaps', 'fontSynthesisStyle', 'fontSynthesisWeight', 'fontVariant', 'fontVariantAlternates', 'fontVariantCaps', 'fontVariantEastAsian', 'fontVariantEmoji', 'fontVariantLigatures', 'fontVariantNumeric', 'fontVariantPosition', 'fontVariationSettings', 'fontWeight', 'forcedColorAdjust', 'gridAutoColumns', 'gridAutoFlow', 'gridAutoRows', 'gridColumnEnd', 'gridColumnStart', 'gridRowEnd', 'gridRowStart', 'gridTemplateAreas', 'gridTemplateColumns', 'gridTemplateRows', 'hangingPunctuation', 'height', 'hyphenateCharacter', 'hyphenateLimitChars', 'hyphens', 'imageOrientation', 'imageRendering', 'imageResolution', 'initialLetter', 'inlineSize', 'inputSecurity', 'insetBlockEnd', 'insetBlockStart', 'insetInlineEnd', 'insetInlineStart', 'isolation', 'justifyContent', 'justifyItems', 'justifySelf', 'justifyTracks', 'left', 'letterSpacing', 'lineBreak', 'lineHeight', 'lineHeightStep', 'listStyleImage', 'listStylePosition', 'listStyleType', 'marginBlockEnd', 'marginBlockStart', 'marginBottom', 'marginInlineEnd', 'marginInlineStart', 'marginLeft', 'marginRight', 'marginTop', 'marginTrim', 'maskBorderMode', 'maskBorderOutset', 'maskBorderRepeat', 'maskBorderSlice', 'maskBorderSource', 'maskBorderWidth', 'maskClip', 'maskComposite', 'maskImage', 'maskMode', 'maskOrigin', 'maskPosition', 'maskRepeat', 'maskSize', 'maskType', 'masonryAutoFlow', 'mathDepth', 'mathShift', 'mathStyle', 'maxBlockSize', 'maxHeight', 'maxInlineSize', 'maxLines', 'maxWidth', 'minBlockSize', 'minHeight', 'minInlineSize', 'minWidth', 'mixBlendMode', 'motionDistance', 'motionPath', 'motionRotation', 'objectFit', 'objectPosition', 'offsetAnchor', 'offsetDistance', 'offsetPath', 'offsetPosition', 'offsetRotate', 'offsetRotation', 'opacity', 'order', 'orphans', 'outlineColor', 'outlineOffset', 'outlineStyle', 'outlineWidth', 'overflowAnchor', 'overflowBlock', 'overflowClipBox', 'overflowClipMargin', 'overflowInline', 'overflowWrap', 'overflowX', 'overflowY', 'overlay', 'overscrollBehaviorBlock', 'overscrollBehaviorInline', 'overscrollBehaviorX', 'overscrollBehaviorY', 'paddingBlockEnd', 'paddingBlockStart', 'paddingBottom', 'paddingInlineEnd', 'paddingInlineStart', 'paddingLeft', 'paddingRight', 'paddingTop', 'page', 'pageBreakAfter', 'pageBreakBefore', 'pageBreakInside', 'paintOrder', 'perspective', 'perspectiveOrigin', 'pointerEvents', 'position', 'printColorAdjust', 'quotes', 'resize', 'right', 'rotate', 'rowGap', 'rubyAlign', 'rubyMerge', 'rubyPosition', 'scale', 'scrollBehavior', 'scrollMarginBlockEnd', 'scrollMarginBlockStart', 'scrollMarginBottom', 'scrollMarginInlineEnd', 'scrollMarginInlineStart', 'scrollMarginLeft', 'scrollMarginRight', 'scrollMarginTop', 'scrollPaddingBlockEnd', 'scrollPaddingBlockStart', 'scrollPaddingBottom', 'scrollPaddingInlineEnd', 'scrollPaddingInlineStart', 'scrollPaddingLeft', 'scrollPaddingRight', 'scrollPaddingTop', 'scrollSnapAlign', 'scrollSnapMarginBottom', 'scrollSnapMarginLeft', 'scrollSnapMarginRight', 'scrollSnapMarginTop', 'scrollSnapStop', 'scrollSnapType', 'scrollTimelineAxis', 'scrollTimelineName', 'scrollbarColor', 'scrollbarGutter', 'scrollbarWidth', 'shapeImageThreshold', 'shapeMargin', 'shapeOutside', 'tabSize', 'tableLayout', 'textAlign', 'textAlignLast', 'textCombineUpright', 'textDecorationColor', 'textDecorationLine', 'textDecorationSkip', 'textDecorationSkipInk', 'textDecorationStyle', 'textDecorationThickness', 'textEmphasisColor', 'textEmphasisPosition', 'textEmphasisStyle', 'textIndent', 'textJustify', 'textOrientation', 'textOverflow', 'textRendering', 'textShadow', 'textSizeAdjust', 'textTransform', 'textUnderlineOffset', 'textUnderlinePosition', 'textWrap', 'timelineScope', 'top', 'touchAction', 'transform', 'transformBox', 'transformOrigin', 'transformStyle', 'transitionBehavior', 'transitionDelay', 'transitionDuration', 'transitionProperty', 'transitionTimingFunction', 'translate', 'unicodeBidi', 'userSelect', 'verticalAlign', 'viewTimelineAxis', 'viewTimelineInset', 'viewTimelineName', 'viewTransitionName', 'visibility', 'whiteSpace', 'whiteSpaceCollapse', 'whiteSpaceTrim', 'widows', 'width', 'willChange', 'wordBreak', 'wordSpacing', 'wordWrap', 'writingMode', 'zIndex', 'zoom', 'all', 'animation', 'animationRange', 'background', 'backgroundPosition', 'border', 'borderBlock', 'borderBlockEnd', 'borderBlockStart', 'borderBottom', 'borderColor', 'borderImage', 'borderInline', 'borderInlineEnd', 'borderInlineStart', 'borderLeft', 'borderRadius', 'borderRight', 'borderStyle', 'borderTop', 'borderWidth', 'caret', 'columnRule', 'columns', 'containIntrinsicSize', 'container', 'flex', 'flexFlow', 'font', 'gap', 'grid', 'gridArea', 'gridColumn', 'gridRow', 'gridTemplate', 'inset', 'insetBlock', 'insetInline', 'lineClamp', 'listStyle', 'margin', 'marginBlock', 'marginInline', 'mask', 'maskBorder', 'motion', 'offset', 'outline', 'overflow', 'overscrollBehavior', 'padding', 'paddingBlock', 'paddingInline', 'placeContent', 'placeItems', 'placeSelf', 'scrollMargin', 'scrollMarginBlock', 'scrollMarginInline', 'scrollPadding', 'scrollPaddingBlock', 'scrollPaddingInline', 'scrollSnapMargin', 'scrollTimeline', 'textDecoration', 'textEmphasis', 'transition', 'viewTimeline', 'MozAnimationDelay', 'MozAnimationDirection', 'MozAnimationDuration', 'MozAnimationFillMode', 'MozAnimationIterationCount', 'MozAnimationName', 'MozAnimationPlayState', 'MozAnimationTimingFunction', 'MozAppearance', 'MozBinding', 'MozBorderBottomColors', 'MozBorderEndColor', 'MozBorderEndStyle', 'MozBorderEndWidth', 'MozBorderLeftColors', 'MozBorderRightColors', 'MozBorderStartColor', 'MozBorderStartStyle', 'MozBorderTopColors', 'MozBoxSizing', 'MozColumnCount', 'MozColumnFill', 'MozColumnRuleColor', 'MozColumnRuleStyle', 'MozColumnRuleWidth', 'MozColumnWidth', 'MozContextProperties', 'MozFontFeatureSettings', 'MozFontLanguageOverride', 'MozHyphens', 'MozImageRegion', 'MozMarginEnd', 'MozMarginStart', 'MozOrient', 'MozOsxFontSmoothing', 'MozOutlineRadiusBottomleft', 'MozOutlineRadiusBottomright', 'MozOutlineRadiusTopleft', 'MozOutlineRadiusTopright', 'MozPaddingEnd', 'MozPaddingStart', 'MozStackSizing', 'MozTabSize', 'MozTextBlink', 'MozTextSizeAdjust', 'MozUserFocus', 'MozUserModify', 'MozUserSelect', 'MozWindowDragging', 'MozWindowShadow', 'msAccelerator', 'msBlockProgression', 'msContentZoomChaining', 'msContentZoomLimitMax', 'msContentZoomLimitMin', 'msContentZoomSnapPoints', 'msContentZoomSnapType', 'msContentZooming', 'msFilter', 'msFlexDirection', 'msFlexPositive', 'msFlowFrom', 'msFlowInto', 'msGridColumns', 'msGridRows', 'msHighContrastAdjust', 'msHyphenateLimitChars', 'msHyphenateLimitLines', 'msHyphenateLimitZone', 'msHyphens', 'msImeAlign', 'msLineBreak', 'msOrder', 'msOverflowStyle', 'msOverflowX', 'msOverflowY', 'msScrollChaining', 'msScrollLimitXMax', 'msScrollLimitXMin', 'msScrollLimitYMax', 'msScrollLimitYMin', 'msScrollRails', 'msScrollSnapPointsX', 'msScrollSnapPointsY', 'msScrollSnapType', 'msScrollTranslation', 'msScrollbar3dlightColor', 'msScrollbarArrowColor', 'msScrollbarBaseColor', 'msScrollbarDarkshadowColor', 'msScrollbarFaceColor', 'msScrollbarHighlightColor', 'msScrollbarShadowColor', 'msScrollbarTrackColor', 'msTextAutospace', 'msTextCombineHorizontal', 'msTextOverflow', 'msTouchAction', 'msTouchSelect', 'msTransform', 'msTransformOrigin', 'msTransitionDelay', 'msTransitionDuration', 'msTransitionProperty', 'msTransitionTimingFunction', 'msUserSelect', 'msWordBreak', 'msWrapFlow', 'msWrapMargin', 'msWrapThrough', 'msWritingMode', 'WebkitAlignContent', 'WebkitAlignItems', 'WebkitAlignSelf', 'WebkitAnimationDelay', 'WebkitAnimationDirection', 'WebkitAnimationDuration', 'WebkitAnimationFillMode', 'WebkitAnimationIterationCount', 'WebkitAnimationName', 'WebkitAnimationPlayState', 'WebkitAnimationTimingFunction', 'WebkitAppearance', 'WebkitBackdropFilter', 'WebkitBackfaceVisibility', 'WebkitBackgroundClip', 'WebkitBackgroundOrigin', 'WebkitBackgroundSize', 'WebkitBorderBeforeColor', 'WebkitBorderBeforeStyle', 'WebkitBorderBeforeWidth', 'WebkitBorderBottomLeftRadius', 'WebkitBorderBottomRightRadius', 'WebkitBorderImageSlice', 'WebkitBorderTopLeftRadius', 'WebkitBorderTopRightRadius', 'WebkitBoxDecorationBreak', 'WebkitBoxReflect', 'WebkitBoxShadow', 'WebkitBoxSizing', 'WebkitClipPath', 'WebkitColumnCount', 'WebkitColumnFill', 'WebkitColumnRuleColor', 'WebkitColumnRuleStyle', 'WebkitColumnRuleWidth', 'WebkitColumnSpan', 'WebkitColumnWidth', 'WebkitFilter', 'WebkitFlexBasis', 'WebkitFlexDirection', 'WebkitFlexGrow', 'WebkitFlexShrink', 'WebkitFlexWrap', 'WebkitFontFeatureSettings', 'WebkitFontKerning', 'WebkitFontSmoothing', 'WebkitFontVariantLigatures', 'WebkitHyphenateCharacter', 'WebkitHyphens', 'WebkitInitialLetter', 'WebkitJustifyContent', 'WebkitLineBreak', 'WebkitLineClamp', 'WebkitMarginEnd', 'WebkitMarginStart', 'WebkitMaskAttachment', 'WebkitMaskBoxImageOutset', 'WebkitMaskBoxImageRepeat', 'WebkitMaskBoxImageSlice', 'WebkitMaskBoxImageSource', 'WebkitMaskBoxImageWidth', 'WebkitMaskClip', 'WebkitMaskComposite', 'WebkitMaskImage', 'WebkitMaskOrigin', 'WebkitMaskPosition', 'WebkitMaskPositionX', 'WebkitMaskPositionY', 'WebkitMaskRepeat', 'WebkitMaskRepeatX', 'WebkitMaskRepeatY', 'WebkitMaskSize', 'WebkitMaxInlineSize', 'WebkitOrder', 'WebkitOverflowScrolling', 'WebkitPaddingEnd', 'WebkitPaddingStart', 'WebkitPerspective', 'WebkitPerspectiveOrigin', 'WebkitPrintColorAdjust', 'WebkitRubyPosition', 'WebkitScrollSnapType', 'WebkitShapeMargin', 'WebkitTapHighlightColor', 'WebkitTextCombine', 'WebkitTextDecorationColor', 'WebkitTextDecorationLine', 'WebkitTextDecorationSkip', 'WebkitTextDecorationStyle', 'WebkitTextEmphasisColor', 'WebkitTextEmphasisPosition', 'WebkitTextEmphasisStyle', 'WebkitTextFillColor', 'WebkitTextOrientation', 'WebkitTextSizeAdjust', 'WebkitTextStrokeColor', 'WebkitTextStrokeWidth', 'WebkitTextUnderlinePosition', 'WebkitTouchCallout', 'WebkitTransform', 'WebkitTransformOrigin', 'WebkitTransformStyle', 'WebkitTransitionDelay', 'WebkitTransitionDuration', 'WebkitTransitionProperty', 'WebkitTransitionTimingFunction', 'WebkitUserModify', 'WebkitUserSelect', 'WebkitWritingMode', 'MozAnimation', 'MozBorderImage', 'MozColumnRule', 'MozColumns', 'MozOutlineRadius', 'msContentZoomLimit', 'msContentZoomSnap', 'msFlex', 'msScrollLimit', 'msScrollSnapX', 'msScrollSnapY', 'msTransition', 'WebkitAnimation', 'WebkitBorderBefore', 'WebkitBorderImage', 'WebkitBorderRadius', 'WebkitColumnRule', 'WebkitColumns', 'WebkitFlex', 'WebkitFlexFlow', 'WebkitMask', 'WebkitMaskBoxImage', 'WebkitTextEmphasis', 'WebkitTextStroke', 'WebkitTransition', 'azimuth', 'boxAlign', 'boxDirection', 'boxFlex', 'boxFlexGroup', 'boxLines', 'boxOrdinalGroup', 'boxOrient', 'boxPack', 'clip', 'gridColumnGap', 'gridGap', 'gridRowGap', 'imeMode', 'offsetBlock', 'offsetBlockEnd', 'offsetBlockStart', 'offsetInline', 'offsetInlineEnd', 'offsetInlineStart', 'scrollSnapCoordinate', 'scrollSnapDestination', 'scrollSnapPointsX', 'scrollSnapPointsY', 'scrollSnapTypeX', 'scrollSnapTypeY', 'KhtmlBoxAlign', 'KhtmlBoxDirection', 'KhtmlBoxFlex', 'KhtmlBoxFlexGroup', 'KhtmlBoxLines', 'KhtmlBoxOrdinalGroup', 'KhtmlBoxOrient', 'KhtmlBoxPack', 'KhtmlLineBreak', 'KhtmlOpacity', 'KhtmlUserSelect', 'MozBackfaceVisibility', 'MozBackgroundClip', 'MozBackgroundInlinePolicy', 'MozBackgroundOrigin', 'MozBackgroundSize', 'MozBorderRadius', 'MozBorderRadiusBottomleft', 'MozBorderRadiusBottomright', 'MozBorderRadiusTopleft', 'MozBorderRadiusTopright', 'MozBoxAlign', 'MozBoxDirection', 'MozBoxFlex', 'MozBoxOrdinalGroup', 'MozBoxOrient', 'MozBoxPack', 'MozBoxShadow', 'MozFloatEdge', 'MozForceBrokenImageIcon', 'MozOpacity', 'MozOutline', 'MozOutlineColor', 'MozOutlineStyle', 'MozOutlineWidth', 'MozPerspective', 'MozPerspectiveOrigin', 'MozTextAlignLast', 'MozTextDecorationColor', 'MozTextDecorationLine', 'MozTextDecorationStyle', 'MozTransform', 'MozTransformOrigin', 'MozTransformStyle', 'MozTransition', 'MozTransitionDelay', 'MozTransitionDuration', 'MozTransitionProperty', 'MozTransitionTimingFunction', 'MozUserInput', 'msImeMode', 'OAnimation', 'OAnimationDelay', 'OAnimationDirection', 'OAnimationDuration', 'OAnimationFillMode', 'OAnimationIterationCount', 'OAnimationName', 'OAnimationPlayState', 'OAnimationTimingFunction', 'OBackgroundSize', 'OBorderImage', 'OObjectFit', 'OObjectPosition', 'OTabSize', 'OTextOverflow', 'OTransform', 'OTransformOrigin', 'OTransition', 'OTransitionDelay', 'OTransitionDuration', 'OTransitionProperty', 'OTransitionTimingFunction', 'WebkitBoxAlign', 'WebkitBoxDirection', 'WebkitBoxFlex', 'WebkitBoxFlexGroup', 'WebkitBoxLines', 'WebkitBoxOrdinalGroup', 'WebkitBoxOrient', 'WebkitBoxPack', 'alignmentBaseline', 'baselineShift', 'clipRule', 'colorInterpolation', 'colorRendering', 'dominantBaseline', 'fill', 'fillOpacity', 'fillRule', 'floodColor', 'floodOpacity', 'glyphOrientationVertical', 'lightingColor', 'marker', 'markerEnd', 'markerMid', 'markerStart', 'shapeRendering', 'stopColor', 'stopOpacity', 'stroke', 'strokeDasharray', 'strokeDashoffset', 'strokeLinecap', 'strokeLinejoin', 'strokeMiterlimit', 'strokeOpacity', 'strokeWidth', 'textAnchor', 'vectorEffect'.
 Those elements have the following types:
   - `accentColor` (Bool | Real | String | Dict | Array; optional): The **`accent-color`** CSS property sets the accent color for user-interface controls generated by some elements.
@@ -6580,6 +6629,19 @@ Those elements have the following types:
   - `textAnchor` (a value equal to: '-moz-initial', 'inherit', 'initial', 'revert', 'revert-layer', 'unset', 'end', 'start', 'middle'; optional)
   - `vectorEffect` (a value equal to: '-moz-initial', 'inherit', 'initial', 'revert', 'revert-layer', 'unset', 'none', 'non-scaling-stroke'; optional)
 - `supportsPopout` (Bool; optional): If left undefined will do simple check based on userAgent
+- `syncChannel` (String; optional): Name of a channel to keep this dock in sync with the docks using the same name in
+other browser tabs and windows of the same origin. Every layout action (adding,
+moving, closing, selecting, resizing tabs...) is broadcast with `BroadcastChannel`
+and replayed on the other docks' layouts, without going through the server. Docks
+should start from the same model; actions that no longer apply to a layout that
+has diverged are skipped.
+- `tabContainment` (Bool; optional): Apply CSS containment to tab content: `content-visibility: hidden` for hidden
+tabs and `content-visibility: auto` for the others, so content that isn't on
+screen is skipped by style recalculation, layout and paint. Defaults to false.
+Contained tab content is the containing block of its `position: fixed`
+descendants and clips them, so dropdowns and popovers that aren't rendered in a
+portal are positioned relative to the tab and cut off at its edges. Leave it
+off if tab content needs to overflow its tab.
 - `useStateForModel` (Bool; optional): Flag that we should use internal state to manage the layout. If the layout is not being
 used by dash anywhere (for example, saving and re-hydrating the layout), it is more efficient
 to use the internal state (as this limits the number of round trips between JSON
@@ -6587,9 +6649,19 @@ and the Model object).
 
 WARNING: If you set this, do not expect the dash property `model` to reflect the current
 state of the layout!
+- `virtualTabStrip` (Real; optional): Maximum number of tab buttons to show per tabset or border. Tabsets and borders
+with more tabs only show this many buttons, around the selected tab, and get a
+button opening a searchable menu of all their tabs (which FlexLayout's overflow
+button opens too). FlexLayout still renders a button for every tab: those
+outside the window are empty stubs, without a header, hidden by a `:has()` CSS
+rule. Leave unset to show every tab button.
+- `visibleTabIds` (Array of Strings; optional): Ids of the tabs currently on screen: the selected tab of each tabset (or only of
+the maximized tabset) and of each open border. Set by the component, and only
+updated when visibility actually changes. Use `dash_dock.visible_tab_ids(model)`
+to provide the initial value from the server.
 """
 function dashdock(; kwargs...)
-        available_props = Symbol[:children, :id, :apiKey, :apiUrl, :colorScheme, :debugMode, :font, :freeTabLimit, :headers, :loading_state, :model, :popoutURL, :realtimeResize, :style, :supportsPopout, :useStateForModel]
+        available_props = Symbol[:children, :id, :activeTabId, :apiKey, :apiUrl, :colorScheme, :debugMode, :deferModelUpdates, :dirtyOutputs, :dragPlaceholders, :font, :freeTabLimit, :headers, :headerSpecs, :loading_state, :model, :popoutURL, :prefetchDelay, :prefetchTabId, :quickSwitcher, :realtimeResize, :reportTabResize, :resizedTabs, :style, :supportsPopout, :syncChannel, :tabContainment, :useStateForModel, :virtualTabStrip, :visibleTabIds]
         wild_props = Symbol[]
         return Component("dashdock", "DashDock", "dash_dock", available_props, wild_props; kwargs...)
 end
@@ -0,0 +1,28 @@
+# AUTO GENERATED FILE - DO NOT EDIT
+
+export dockinterval
+
+"""
+    dockinterval(;kwargs...)
+
+A DockInterval component.
+A dock-aware version of `dcc.Interval`. Inside a DashDock tab it is paused while
+the tab is hidden (in a background tabset, a collapsed border or behind a
+maximized tabset), and if an interval elapsed in the meantime it fires once as
+soon as the tab is revealed. Outside a dock it behaves like `dcc.Interval`.
+Keyword arguments:
+- `id` (String; optional): Unique ID to identify this component in Dash callbacks.
+- `disabled` (Bool; optional): If true, the counter will no longer update
+- `interval` (Real; optional): This component will increment the counter `n_intervals` every
+`interval` milliseconds
+- `max_intervals` (Real; optional): Number of times the interval will be fired.
+If -1, then the interval has no limit (the default)
+and if 0 then the interval stops running.
+- `n_intervals` (Real; optional): Number of times the interval has passed
+"""
+function dockinterval(; kwargs...)
+        available_props = Symbol[:id, :disabled, :interval, :max_intervals, :n_intervals]
+        wild_props = Symbol[]
+        return Component("dockinterval", "DockInterval", "dash_dock", available_props, wild_props; kwargs...)
+end
+
@@ -11,12 +11,21 @@ export tab
 A Tab component.
 This is a simple component that holds content to be rendered within a Tab.
 Takes an ID that corresponds to a particular tab in the layout.
+
+Inside a DashDock it reports its tab being hidden (`hiddenAt`) or closed
+(`closedAt`, which also sets `hiddenAt`).
 Keyword arguments:
 - `children` (a list of or a singular dash component, string or number; optional): Children to render within Tab
-- `id` (String; required): Unique ID to identify this component in Dash callbacks.
+- `id` (String | Dict with Strings as keys and values of type String | Real | Bool; required): Unique ID to identify this component in Dash callbacks. Matched against the id
+of a tab in the model. A dict (pattern-matching) id matches the tab whose id is
+its stringified form, see `dash_dock.pattern_matching_tabs`.
+- `closedAt` (Real; optional): Time (milliseconds since the epoch) the tab was closed. Set by the component.
+- `hiddenAt` (Real; optional): Time (milliseconds since the epoch) the tab was last hidden or closed. Set by
+the component. Use it as the `cancel` input of background callbacks computing
+the tab's content, see `dash_dock.tab_cancel_inputs`.
 """
 function tab(; kwargs...)
-        available_props = Symbol[:children, :id]
+        available_props = Symbol[:children, :id, :closedAt, :hiddenAt]
         wild_props = Symbol[]
         return Component("tab", "Tab", "dash_dock", available_props, wild_props; kwargs...)
 end
@@ -0,0 +1,8 @@
+/**
+ * Dynamic imports for the heavy parts of the library. Each entry is split
+ * into its own async chunk (served as `async-<name>.js`) and only fetched
+ * when a component that needs it is rendered.
+ */
+export default {
+  dashDock: () => import(/* webpackChunkName: "dashdock" */ "./fragments/DashDock"),
+};
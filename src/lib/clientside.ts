@@ -0,0 +1,162 @@
+/**
+ * Clientside layout operations, exposed as `window.dash_clientside.dash_dock`.
+ *
+ * These dispatch FlexLayout actions straight onto a mounted dock's live model,
+ * so common interactions ("open tab X", "focus tab", "reset layout") don't need
+ * a server round trip. When the dock is controlled by Dash, the resulting layout
+ * is still sent back through `setProps` as usual.
+ *
+ * Every function takes the dock id first and returns true if the operation was
+ * applied, e.g. from a clientside callback:
+ *
+ *   dash_clientside.dash_dock.openTab("dock", {id: "logs", name: "Logs"});
+ */
+import { getDock, DockHandle } from "./utils/dockRegistry";
+
+const withDock = (dockId: string, operation: (dock: DockHandle) => void): boolean => {
+  const dock = getDock(dockId);
+  if (!dock) {
+    console.warn(`DashDock: no dock with id "${dockId}" is mounted`);
+    return false;
+  }
+  try {
+    operation(dock);
+    return true;
+  } catch (e) {
+    console.error(`DashDock: layout operation on "${dockId}" failed:`, e);
+    return false;
+  }
+};
+
+/**
+ * Find the tabset new tabs should go to: the active tabset, or else the first one
+ */
+const defaultTabsetId = (model: any): string | undefined => {
+  const active = model.getActiveTabset();
+  if (active) {
+    return active.getId();
+  }
+  let first: string | undefined;
+  model.visitNodes((node: any) => {
+    if (!first && node.getType() === "tabset") {
+      first = node.getId();
+    }
+  });
+  return first;
+};
+
+const addTabTo = (
+  dock: DockHandle,
+  tab: Record<string, any>,
+  toNodeId?: string,
+  location: string = "center",
+  index: number = -1,
+  select: boolean = true
+) => {
+  const target = toNodeId || defaultTabsetId(dock.model);
+  dock.doAction(
+    dock.actions.addNode(
+      { type: "tab", ...tab },
+      target,
+      dock.DockLocation.getByName(location),
+      index,
+      select
+    )
+  );
+};
+
+const selectTab = (dockId: string, tabId: string): boolean =>
+  withDock(dockId, dock => {
+    dock.doAction(dock.actions.selectTab(tabId));
+  });
+
+const focusTab = (dockId: string, tabId: string): boolean =>
+  withDock(dockId, dock => {
+    dock.doAction(dock.actions.selectTab(tabId));
+    const parent = dock.model.getNodeById(tabId)?.getParent();
+    if (parent && parent.getType() === "tabset") {
+      dock.doAction(dock.actions.setActiveTabset(parent.getId()));
+    }
+  });
+
+const addTab = (
+  dockId: string,
+  tab: Record<string, any>,
+  toNodeId?: string,
+  location?: string,
+  index?: number,
+  select?: boolean
+): boolean => withDock(dockId, dock => addTabTo(dock, tab, toNodeId, location, index, select));
+
+const openTab = (dockId: string, tab: Record<string, any>, toNodeId?: string): boolean =>
+  withDock(dockId, dock => {
+    if (tab.id && dock.model.getNodeById(tab.id)) {
+      dock.doAction(dock.actions.selectTab(tab.id));
+    } else {
+      addTabTo(dock, tab, toNodeId);
+    }
+  });
+
+const deleteTab = (dockId: string, tabId: string): boolean =>
+  withDock(dockId, dock => {
+    dock.doAction(dock.actions.deleteTab(tabId));
+  });
+
+const renameTab = (dockId: string, tabId: string, name: string): boolean =>
+  withDock(dockId, dock => {
+    dock.doAction(dock.actions.renameTab(tabId, name));
+  });
+
+const maximizeToggle = (dockId: string, tabsetId: string): boolean =>
+  withDock(dockId, dock => {
+    dock.doAction(dock.actions.maximizeToggle(tabsetId));
+  });
+
+const updateNodeAttributes = (
+  dockId: string,
+  nodeId: string,
+  attributes: Record<string, any>
+): boolean =>
+  withDock(dockId, dock => {
+    dock.doAction(dock.actions.updateNodeAttributes(nodeId, attributes));
+  });
+
+const resetLayout = (dockId: string): boolean => withDock(dockId, dock => dock.reset());
+
+const getModel = (dockId: string) => {
+  const dock = getDock(dockId);
+  return dock ? dock.model.toJson() : null;
+};
+
+/**
+ * Rendering counters of a dock: `headerRenders` is the number of times a tab
+ * header was (re)built
+ */
+const getStats = (dockId: string) => {
+  const dock = getDock(dockId);
+  return dock ? dock.getStats() : null;
+};
+
+/**
+ * Open the quick switcher of a dock, e.g. from a toolbar button
+ */
+const openQuickSwitcher = (dockId: string) =>
+  withDock(dockId, dock => dock.openQuickSwitcher());
+
+const w = window as any;
+w.dash_clientside = w.dash_clientside || {};
+w.dash_clientside.dash_dock = {
+  ...(w.dash_clientside.dash_dock || {}),
+  selectTab,
+  focusTab,
+  addTab,
+  openTab,
+  deleteTab,
+  renameTab,
+  maximizeToggle,
+  updateNodeAttributes,
+  resetLayout,
+  getModel,
+  getStats,
+  openQuickSwitcher
+};
@@ -1,16 +1,8 @@
-import React, { useState, useEffect, useMemo } from "react";
-import * as CaplinFlexLayout from "flexlayout-react";
-import { IJsonModel, TabNode, Layout, Model, ITabRenderValues } from "flexlayout-react";
-import { renderDashComponent } from "dash-extensions-js";
-
-// Import FlexLayout styles and our custom theme styles
-import "flexlayout-react/style/light.css";
-import "../styles/theme.css";
-import { isDash3, getChildLayout, getLoadingState } from "../utils/dash3";
-import { checkApiKeyValidity } from "../utils/apiClient";
-import { countTabs, exceedsFreeTierLimit, limitModelToFreeTier } from "../utils/tabAnalyzer";
-
-type Props = {
+import React, { Suspense } from "react";
+import type { IJsonModel } from "flexlayout-react";
+import LazyLoader from "../LazyLoader";
+
+export type Props = {
   /**
    * Unique ID to identify this component in Dash callbacks.
    */
@@ -33,7 +25,10 @@ type Props = {
   supportsPopout?: boolean;
 
   /**
-   * URL of popout window relative to origin, defaults to popout.html
+   * URL of the page popout windows are opened with, relative to the origin. Defaults
+   * to a blank page served by `dash_dock` at `<requests_pathname_prefix>_dash-dock/popout.html`.
+   * Popped out tabs are rendered into the window from this page's React tree, so the page
+   * needs no scripts of its own.
    */
   popoutURL?: string;
 
@@ -67,6 +62,23 @@ type Props = {
    */
   headers?: { [key: string]: React.ReactNode };
 
+  /**
+   * Map of lightweight header descriptions for each tab, rendered by the component
+   * itself instead of as Dash components. Each entry can have an `icon` (CSS class of
+   * an icon element, e.g. "bi bi-graph-up"), `text` (defaults to the tab name), a
+   * `badge` (e.g. an unread count; hidden when 0 or null) and a `className`.
+   * Updating a badge only changes a few bytes of props. An entry in `headers` for the
+   * same tab takes precedence over its text.
+   */
+  headerSpecs?: {
+    [key: string]: {
+      icon?: string;
+      text?: string;
+      badge?: number | string;
+      className?: string;
+    };
+  };
+
   /**
    * Flag that we should use internal state to manage the layout. If the layout is not being
    * used by dash anywhere (for example, saving and re-hydrating the layout), it is more efficient
@@ -113,6 +125,113 @@ type Props = {
    */
   style?: React.CSSProperties;
 
+  /**
+   * Ids of the tabs currently on screen: the selected tab of each tabset (or only of
+   * the maximized tabset) and of each open border. Set by the component, and only
+   * updated when visibility actually changes. Use `dash_dock.visible_tab_ids(model)`
+   * to provide the initial value from the server.
+   */
+  visibleTabIds?: string[];
+
+  /**
+   * Id of the selected tab in the active tabset. Set by the component.
+   */
+  activeTabId?: string;
+
+  /**
+   * Outputs that skipped an update while their tab was hidden, mapped to the id of
+   * that tab. Maintained by the `dash_dock.only_if_visible` callback decorator; not
+   * used by the component itself.
+   */
+  dirtyOutputs?: { [key: string]: string };
+
+  /**
+   * Report settled tab resizes through the `resizedTabs` prop. Resizes are always
+   * announced with a `dashdock:tabresize` DOM event dispatched on the tab's content
+   * element (bubbling up to `window`), whose `detail` holds the `dockId`, `tabId`
+   * and the tab's new `x`, `y`, `width` and `height`.
+   */
+  reportTabResize?: boolean;
+
+  /**
+   * The tabs whose size changed in the last splitter drag, maximize or other layout
+   * change, mapped to their new `width` and `height`. Only tabs whose rect actually
+   * changed are included, and only once the drag has finished. Set by the component
+   * when `reportTabResize` is true.
+   */
+  resizedTabs?: { [key: string]: { width: number; height: number } };
+
+  /**
+   * While a splitter or tab is being dragged, replace the content of tabs marked
+   * heavy (with `"config": {"heavy": true}` in the model) by a placeholder. Their
+   * content stays mounted at its previous size and is resized once on drop, so
+   * expensive content such as WebGL or Plotly figures doesn't re-layout on every
+   * frame of the drag.
+   */
+  dragPlaceholders?: boolean;
+
+  /**
+   * Apply CSS containment to tab content: `content-visibility: hidden` for hidden
+   * tabs and `content-visibility: auto` for the others, so content that isn't on
+   * screen is skipped by style recalculation, layout and paint. Defaults to false.
+   * Contained tab content is the containing block of its `position: fixed`
+   * descendants and clips them, so dropdowns and popovers that aren't rendered in a
+   * portal are positioned relative to the tab and cut off at its edges. Leave it
+   * off if tab content needs to overflow its tab.
+   */
+  tabContainment?: boolean;
+
+  /**
+   * Milliseconds the pointer has to rest on the button of a hidden tab (in a tabset
+   * or a border) before `prefetchTabId` is set to that tab. Leave unset to disable.
+   */
+  prefetchDelay?: number;
+
+  /**
+   * Id of the hidden tab the user is likely to open next, based on hover intent
+   * (see `prefetchDelay`). Use it as a callback input to warm caches or render the
+   * tab's content before it is clicked. Set by the component.
+   */
+  prefetchTabId?: string;
+
+  /**
+   * Maximum number of tab buttons to show per tabset or border. Tabsets and borders
+   * with more tabs only show this many buttons, around the selected tab, and get a
+   * button opening a searchable menu of all their tabs (which FlexLayout's overflow
+   * button opens too). FlexLayout still renders a button for every tab: those
+   * outside the window are empty stubs, without a header, hidden by a `:has()` CSS
+   * rule. Leave unset to show every tab button.
+   */
+  virtualTabStrip?: number;
+
+  /**
+   * Enable the quick switcher: Ctrl+K (Cmd+K on macOS) opens a search box over the
+   * names and ids of all tabs, and choosing a tab selects it without a server round
+   * trip. The shortcut applies to the dock holding the focus, or to the first dock
+   * on the page with a quick switcher. It can also be opened with
+   * `dash_clientside.dash_dock.openQuickSwitcher(dockId)`.
+   */
+  quickSwitcher?: boolean;
+
+  /**
+   * Report layout changes to Dash (`model`, `visibleTabIds` and `activeTabId`) when
+   * the browser is idle, at most 500ms later, instead of serializing the layout after
+   * every action. A burst of actions, such as the splitter moves of a `realtimeResize`
+   * drag, is then serialized and sent once. The quick switcher and clientside
+   * operations still see every change immediately.
+   */
+  deferModelUpdates?: boolean;
+
+  /**
+   * Name of a channel to keep this dock in sync with the docks using the same name in
+   * other browser tabs and windows of the same origin. Every layout action (adding,
+   * moving, closing, selecting, resizing tabs...) is broadcast with `BroadcastChannel`
+   * and replayed on the other docks' layouts, without going through the server. Docks
+   * should start from the same model; actions that no longer apply to a layout that
+   * has diverged are skipped.
+   */
+  syncChannel?: string;
+
   /**
    * Loading state.
    */
@@ -123,46 +242,7 @@ type Props = {
   };
 };
 
-// Track API key validation status
-interface ValidationState {
-  isValidated: boolean;
-  isValid: boolean;
-  message: string;
-}
-
-const idMatches = (child: any, id: string) => {
-  // For Dash 3 compatibility, use componentPath instead of _dashprivate_layout
-  if (child.props) {
-    if (isDash3() && child.props.componentPath) {
-      const layout = getChildLayout(child);
-      if (layout && layout.props && layout.props.id === id) {
-        return true;
-      }
-    }
-    // Fallback for older versions
-    else if (child.props._dashprivate_layout && child.props._dashprivate_layout.props.id === id) {
-      return true;
-    }
-    // Direct id match
-    else if (child.props.id === id) {
-      return true;
-    }
-  }
-
-  return child.key === id;
-};
-
-const getMatchingChildren = (
-  children: React.ReactNode,
-  node: CaplinFlexLayout.TabNode
-) => {
-  const id = node.getId();
-  // Convert children to array, handling both arrays and single elements
-  const childArray = React.Children.toArray(children);
-  // Filter to find matching children
-  const matchedChildren = childArray.filter((child) => idMatches(child, id));
-  return matchedChildren;
-};
+const RealDashDock = React.lazy(LazyLoader.dashDock);
 
 /**
  * DashDock is a wrapper around FlexLayout-React that provides
@@ -174,264 +254,32 @@ const getMatchingChildren = (
  * The component automatically adjusts its theme based on Mantine's theme.
  */
 const DashDock = ({
-  id,
-  model,
-  children,
-  headers,
-  setProps,
   useStateForModel = false,
-  popoutURL = "/assets/popout.html",
-  apiKey,
-  apiUrl,
   freeTabLimit = 3,
-  colorScheme,
-  style,
-  loading_state,
   debugMode = false,
-  ...restProps
+  tabContainment = false,
+  ...others
 }: Props) => {
-  // Track if we're in premium or free mode
-  const [validation, setValidation] = useState<ValidationState>({
-    isValidated: false,
-    isValid: false,
-    message: ""
-  });
-
-  // Track if we had to limit the model
-  const [modelLimited, setModelLimited] = useState<boolean>(false);
-
-  // Track current color scheme
-  const [currentTheme, setCurrentTheme] = useState<'light' | 'dark'>(
-    colorScheme || (typeof document !== 'undefined' &&
-      document.documentElement.getAttribute('data-mantine-color-scheme') === 'dark'
-        ? 'dark'
-        : 'light')
-  );
-
-  // Use memoized values to avoid recalculations on every render
-  const tabCount = useMemo(() => countTabs(model), [model]);
-  const exceedsLimit = useMemo(() => exceedsFreeTierLimit(model, freeTabLimit), [model, freeTabLimit]);
-
-  // Hold a reference to the original model
-  const [initialModel] = useState(model);
-
-  // Use the original model for state tracking
-  const [modelState, setModelState] = useState(() => Model.fromJson(model));
-
-  // Cache the final model to use - computed once per render
-  const [currentModel, setCurrentModel] = useState<Model | null>(null);
-
-  // Listen to Mantine theme changes
-  useEffect(() => {
-    if (typeof document === 'undefined') return;
-
-    const detectTheme = () => {
-      const htmlEl = document.documentElement;
-      const theme = htmlEl.getAttribute('data-mantine-color-scheme') as 'light' | 'dark';
-      if (theme && theme !== currentTheme) {
-        setCurrentTheme(theme);
-      }
-    };
-
-    // Initial detection
-    detectTheme();
-
-    // Set up observer to watch for attribute changes on html element
-    const observer = new MutationObserver((mutations) => {
-      mutations.forEach((mutation) => {
-        if (
-          mutation.type === 'attributes' &&
-          mutation.attributeName === 'data-mantine-color-scheme'
-        ) {
-          detectTheme();
-        }
-      });
-    });
-
-    observer.observe(document.documentElement, { attributes: true });
-
-    return () => {
-      observer.disconnect();
-    };
-  }, [currentTheme]);
-
-  // Handle model updates when validation state or props change
-  useEffect(() => {
-    // Get the base model
-    const baseModel = setProps && !useStateForModel
-      ? Model.fromJson(model)
-      : modelState;
-
-    // Handle tab limits based on validation
-    if (!validation.isValid && exceedsLimit) {
-      try {
-        // Apply limitations by converting to JSON, limiting, and converting back
-        const limitedModelJson = limitModelToFreeTier(baseModel.toJson(), freeTabLimit);
-        const limitedModel = Model.fromJson(limitedModelJson);
-        setCurrentModel(limitedModel);
-
-        // Only update modelLimited if needed to avoid re-renders
-        if (!modelLimited) {
-          setModelLimited(true);
-        }
-      } catch (e) {
-        console.error("Error limiting model:", e);
-        setCurrentModel(baseModel);
-      }
-    } else {
-      setCurrentModel(baseModel);
-
-      // Only update modelLimited if needed to avoid re-renders
-      if (modelLimited) {
-        setModelLimited(false);
-      }
-    }
-  }, [model, modelState, validation.isValid, exceedsLimit, freeTabLimit, modelLimited, setProps, useStateForModel]);
-
-  // Validate API key on component load or when key changes
-  useEffect(() => {
-    let isMounted = true;
-
-    const validateKey = async () => {
-      try {
-        if (apiKey) {
-          if (debugMode) {
-            console.log("DashDock: Validating API key...");
-          }
-
-          const result = await checkApiKeyValidity(apiKey, 'DashDock', tabCount.total, apiUrl);
-
-          // Only update state if component is still mounted
-          if (isMounted) {
-            setValidation({
-              isValidated: true,
-              isValid: result.valid,
-              message: result.message
-            });
-
-            if (debugMode) {
-              console.log(`DashDock: API key validation result: ${result.valid ? "Valid" : "Invalid"} - ${result.message}`);
-            }
-          }
-        } else if (isMounted) {
-          setValidation({
-            isValidated: true,
-            isValid: false,
-            message: "No API key provided"
-          });
-
-          if (exceedsLimit && debugMode) {
-            console.log(
-              "DashDock: You are using the free version which is limited to 3 tabs. " +
-              "Get an API key for unlimited tabs at https://pip-install-python.com/pip/dash_dock"
-            );
-          }
-        }
-      } catch (error) {
-        console.error("API validation error:", error);
-        if (isMounted) {
-          setValidation({
-            isValidated: true,
-            isValid: false,
-            message: "Error validating API key"
-          });
-        }
-      }
-    };
-
-    validateKey();
-
-    // Cleanup function
-    return () => {
-      isMounted = false;
-    };
-  }, [apiKey, apiUrl, tabCount.total, exceedsLimit, debugMode]);
-
-  /**
-   * Whenever the model changes, if we are using dash to handle the layout,
-   * we should call setProps to persist the updated layout. Otherwise
-   * we do nothing and let the useState hook handle it.
-   */
-  const onModelChange = (updatedModel: Model) => {
-    if (setProps && !useStateForModel) {
-      setProps({ model: updatedModel.toJson() });
-    } else {
-      setModelState(updatedModel);
-    }
-  };
-
-  /**
-   * Customise rendering of the tab to use the `headers` map
-   * if available.
-   */
-  const onRenderTab = (
-    node: TabNode,
-    renderValues: ITabRenderValues
-  ) => {
-    if (headers && headers[node.getId()]) {
-      const header = headers[node.getId()];
-      // Use dash-extensions-js for Dash components
-      if (React.isValidElement(header) && (header as any).props?.namespace) {
-        renderValues.content = renderDashComponent(header);
-      } else {
-        renderValues.content = header;
-      }
-    }
-  };
-
-  /**
-   * Factory function to create the content for each tab
-   */
-  const factory = (node: CaplinFlexLayout.TabNode) => {
-    const matchedChildren = getMatchingChildren(children, node);
-    return <React.Fragment>{matchedChildren}</React.Fragment>;
-  };
-
-  // Check if component is in loading state - this should be safe now with our defensive code
-  const isLoading = loading_state?.is_loading || false;
-
-  // Show a warning on the console if we're limiting tabs
-  useEffect(() => {
-    if (modelLimited && !isLoading && debugMode) {
-      console.warn(
-        "DashDock: Your layout has been limited to 3 tabs because you are using the free version. " +
-        "Get an API key for unlimited tabs at https://pip-install-python.com/pip/dash_dock"
-      );
-    }
-  }, [modelLimited, isLoading, debugMode]);
-
-  // If the model isn't ready yet, show a simple loading indicator
-  if (!currentModel) {
-    return <div className="dash-dock-loading" style={style}>Loading dock layout...</div>;
-  }
-
-  // Render the component
+  // FlexLayout lives in an async chunk so pages without a dock don't pay
+  // for it (its styles are in the entry's extracted stylesheet); render a
+  // placeholder until the chunk arrives
   return (
-    <div className={`dash-dock-container dash-dock-${currentTheme}`} style={style}>
-      {/* Show a premium indicator if using a valid API key */}
-      {validation.isValid && debugMode && (
-        <div className="dashdock-premium-indicator">
-          DashDock Premium
+    <Suspense
+      fallback={
+        <div className="dash-dock-loading" style={others.style}>
+          Loading dock layout...
         </div>
-      )}
-
-      <Layout
-        model={currentModel}
-        factory={factory}
-        onModelChange={onModelChange}
-        onRenderTab={onRenderTab}
-        popoutURL={popoutURL}
-        {...restProps}
+      }
+    >
+      <RealDashDock
+        useStateForModel={useStateForModel}
+        freeTabLimit={freeTabLimit}
+        debugMode={debugMode}
+        tabContainment={tabContainment}
+        {...others}
       />
-
-      {/* Show a free version indicator if not validated or invalid */}
-      {!validation.isValid && exceedsLimit && modelLimited && (
-        <div className="dashdock-free-indicator">
-          DashDock Free (Limited to {freeTabLimit} tabs)
-        </div>
-      )}
-    </div>
+    </Suspense>
   );
 };
 
-export default DashDock;
\ No newline at end of file
+export default DashDock;
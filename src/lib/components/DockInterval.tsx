@@ -0,0 +1,79 @@
+import React, { useContext, useEffect, useRef } from "react";
+import TabVisibilityContext from "../utils/TabVisibilityContext";
+
+type Props = {
+  /**
+   * Unique ID to identify this component in Dash callbacks.
+   */
+  id?: string;
+
+  /**
+   * Update props to trigger callbacks.
+   */
+  setProps?: (props: Record<string, any>) => void;
+
+  /**
+   * This component will increment the counter `n_intervals` every
+   * `interval` milliseconds
+   */
+  interval?: number;
+
+  /**
+   * If true, the counter will no longer update
+   */
+  disabled?: boolean;
+
+  /**
+   * Number of times the interval has passed
+   */
+  n_intervals?: number;
+
+  /**
+   * Number of times the interval will be fired.
+   * If -1, then the interval has no limit (the default)
+   * and if 0 then the interval stops running.
+   */
+  max_intervals?: number;
+};
+
+/**
+ * A dock-aware version of `dcc.Interval`. Inside a DashDock tab it is paused while
+ * the tab is hidden (in a background tabset, a collapsed border or behind a
+ * maximized tabset), and if an interval elapsed in the meantime it fires once as
+ * soon as the tab is revealed. Outside a dock it behaves like `dcc.Interval`.
+ */
+const DockInterval = ({
+  interval = 1000,
+  disabled = false,
+  n_intervals = 0,
+  max_intervals = -1,
+  setProps
+}: Props) => {
+  const visible = useContext(TabVisibilityContext);
+
+  const lastTickRef = useRef(Date.now());
+  const nIntervalsRef = useRef(n_intervals);
+  nIntervalsRef.current = n_intervals;
+
+  const running = !disabled && (max_intervals === -1 || n_intervals < max_intervals);
+
+  useEffect(() => {
+    if (!running || !visible || !setProps) {
+      return undefined;
+    }
+    const tick = () => {
+      lastTickRef.current = Date.now();
+      setProps({ n_intervals: nIntervalsRef.current + 1 });
+    };
+    // Catch up once on the ticks missed while hidden, rather than replaying them
+    if (Date.now() - lastTickRef.current >= interval) {
+      tick();
+    }
+    const handle = window.setInterval(tick, interval);
+    return () => window.clearInterval(handle);
+  }, [running, visible, interval]);
+
+  return null;
+};
+
+export default DockInterval;
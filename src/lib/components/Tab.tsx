@@ -1,27 +1,78 @@
-import React from "react";
+import React, { useContext, useEffect, useRef } from "react";
+import TabVisibilityContext from "../utils/TabVisibilityContext";
+import TabEventsContext from "../utils/TabEventsContext";
+import { stringifyId } from "../utils/dash3";
 
 type Props = {
   /**
-   * Unique ID to identify this component in Dash callbacks.
+   * Unique ID to identify this component in Dash callbacks. Matched against the id
+   * of a tab in the model. A dict (pattern-matching) id matches the tab whose id is
+   * its stringified form, see `dash_dock.pattern_matching_tabs`.
    */
-  id: string;
+  id: string | { [key: string]: string | number | boolean };
 
   /**
    * Children to render within Tab
    */
   children?: React.ReactNode;
+
+  /**
+   * Update props to trigger callbacks.
+   */
+  setProps?: (props: Record<string, any>) => void;
+
+  /**
+   * Time (milliseconds since the epoch) the tab was last hidden or closed. Set by
+   * the component. Use it as the `cancel` input of background callbacks computing
+   * the tab's content, see `dash_dock.tab_cancel_inputs`.
+   */
+  hiddenAt?: number;
+
+  /**
+   * Time (milliseconds since the epoch) the tab was closed. Set by the component.
+   */
+  closedAt?: number;
 };
 
 /**
  * This is a simple component that holds content to be rendered within a Tab.
  * Takes an ID that corresponds to a particular tab in the layout.
+ *
+ * Inside a DashDock it reports its tab being hidden (`hiddenAt`) or closed
+ * (`closedAt`, which also sets `hiddenAt`).
  */
-const Tab = ({ id, children }: Props) => {
-  // Using default parameters instead of defaultProps for React 18 compatibility
+const Tab = ({ id, children, setProps }: Props) => {
+  const visible = useContext(TabVisibilityContext);
+  const tabEvents = useContext(TabEventsContext);
+
+  const setPropsRef = useRef(setProps);
+  setPropsRef.current = setProps;
+
+  const visibleRef = useRef(visible);
+  useEffect(() => {
+    if (visibleRef.current && !visible && setPropsRef.current) {
+      setPropsRef.current({ hiddenAt: Date.now() });
+    }
+    visibleRef.current = visible;
+  }, [visible]);
+
+  const tabId = stringifyId(id);
+  useEffect(() => {
+    if (!tabEvents) {
+      return undefined;
+    }
+    return tabEvents.onClose(tabId, () => {
+      if (setPropsRef.current) {
+        const now = Date.now();
+        setPropsRef.current({ hiddenAt: now, closedAt: now });
+      }
+    });
+  }, [tabEvents, tabId]);
+
   return <React.Fragment>{children}</React.Fragment>;
 };
 
 // No need for defaultProps as per Dash 3 changes
 // Tab.defaultProps = {};
 
-export default Tab;
\ No newline at end of file
+export default Tab;
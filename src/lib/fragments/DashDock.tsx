@@ -0,0 +1,991 @@
+import React, { useState, useEffect, useLayoutEffect, useMemo, useRef, useContext } from "react";
+import * as CaplinFlexLayout from "flexlayout-react";
+import {
+  IJsonModel,
+  TabNode,
+  TabSetNode,
+  BorderNode,
+  Layout,
+  Model,
+  ITabRenderValues,
+  ITabSetRenderValues
+} from "flexlayout-react";
+import { renderDashComponent } from "dash-extensions-js";
+
+import { isDash3, getChildLayout, getLoadingState, stringifyId } from "../utils/dash3";
+import { checkApiKeyValidity } from "../utils/apiClient";
+import { countTabs, countModelTabs, limitModelToFreeTier } from "../utils/tabAnalyzer";
+import { registerDock, unregisterDock, DockHandle } from "../utils/dockRegistry";
+import { getTabVisibility, isTabVisible, sameVisibility, TabVisibility } from "../utils/visibility";
+import TabVisibilityContext from "../utils/TabVisibilityContext";
+import TabEventsContext, { TabEvents } from "../utils/TabEventsContext";
+import { TabResizeBatcher, TabResize } from "../utils/tabResize";
+import { renderHeaderSpec, HeaderSpec } from "../utils/headerSpec";
+import { tabWindow, TabListSearch } from "../utils/tabStrip";
+import { TabIndex, updateTabIndex } from "../utils/tabIndex";
+import { requestIdle, cancelIdle } from "../utils/idle";
+import { LayoutSync, withSyncedIds, syncNodeIds } from "../utils/layoutSync";
+import { defaultPopoutURL } from "../utils/popout";
+import TabMenu, { MenuTab } from "./TabMenu";
+import type { Props } from "../components/DashDock";
+
+// Track API key validation status
+interface ValidationState {
+  isValidated: boolean;
+  isValid: boolean;
+  message: string;
+}
+
+/**
+ * Compare a child's id with a tab id. Dict (pattern-matching) ids match the tab
+ * whose id is their stringified form, e.g. `{"index":1,"type":"panel"}`
+ */
+const sameId = (childId: any, id: string) =>
+  childId !== undefined && childId !== null && stringifyId(childId) === id;
+
+const idMatches = (child: any, id: string) => {
+  // For Dash 3 compatibility, use componentPath instead of _dashprivate_layout
+  if (child.props) {
+    if (isDash3() && child.props.componentPath) {
+      const layout = getChildLayout(child);
+      if (layout && layout.props && sameId(layout.props.id, id)) {
+        return true;
+      }
+    }
+    // Fallback for older versions
+    else if (child.props._dashprivate_layout && sameId(child.props._dashprivate_layout.props.id, id)) {
+      return true;
+    }
+    // Direct id match
+    else if (sameId(child.props.id, id)) {
+      return true;
+    }
+  }
+
+  return child.key === id;
+};
+
+const getMatchingChildren = (
+  children: React.ReactNode,
+  node: CaplinFlexLayout.TabNode
+) => {
+  const id = node.getId();
+  // Convert children to array, handling both arrays and single elements
+  const childArray = React.Children.toArray(children);
+  // Filter to find matching children
+  const matchedChildren = childArray.filter((child) => idMatches(child, id));
+  return matchedChildren;
+};
+
+/** Longest delay (ms) before a deferred layout change is reported to Dash */
+const MODEL_REPORT_TIMEOUT = 500;
+
+interface CachedHeader {
+  key: any;
+  spec: HeaderSpec | undefined;
+  name: string;
+  leading: React.ReactNode;
+  content: React.ReactNode;
+}
+
+/**
+ * Identity of a header for caching. Dash hands us new elements for `headers`
+ * whenever the dock re-renders, so the layout they are rendered from is
+ * compared instead. Dash updates its layout immutably, so that object is only
+ * replaced when the header changes. On Dash 2 it is the element's
+ * `_dashprivate_layout`; on Dash 3 the element only carries its component
+ * path, which stays the same when the header is patched, so the layout is
+ * read from the store.
+ */
+const headerKey = (header: any) => {
+  if (React.isValidElement(header)) {
+    const layout = isDash3()
+      ? getChildLayout(header)
+      : (header.props as any)._dashprivate_layout;
+    if (layout && layout.type) {
+      return layout;
+    }
+  }
+  return header;
+};
+
+/**
+ * Render the leading icon and content of a tab button from its `headerSpecs`
+ * and `headers` entries. An entry in `headers` replaces the spec's content.
+ */
+const renderHeader = (header: any, spec: HeaderSpec | undefined, name: string) => {
+  let leading: React.ReactNode = null;
+  let content: React.ReactNode = undefined;
+  if (spec) {
+    ({ leading, content } = renderHeaderSpec(spec, name));
+  }
+  if (header) {
+    // Use dash-extensions-js for Dash components
+    content = React.isValidElement(header) && (header as any).props?.namespace
+      ? renderDashComponent(header)
+      : header;
+  }
+  return { leading, content };
+};
+
+/**
+ * Whether a splitter or tab drag is in progress in the dock, when drag
+ * placeholders are enabled
+ */
+const DraggingContext = React.createContext(false);
+
+/**
+ * Content of a tab. Provides the tab's visibility to components such as
+ * `DockInterval` through `TabVisibilityContext`, and reports the tab's resizes
+ * to the dock's `TabResizeBatcher`.
+ *
+ * While a drag is in progress, the content of tabs marked `heavy` in their
+ * config is frozen at its current size and hidden behind a placeholder, so it
+ * doesn't re-layout on every frame; it is resized once when the drag ends.
+ */
+const TabContent = ({
+  node,
+  resizeBatcher,
+  children
+}: {
+  node: TabNode;
+  resizeBatcher: TabResizeBatcher;
+  children: React.ReactNode;
+}) => {
+  const [visible, setVisible] = useState(() => isTabVisible(node));
+  const elementRef = useRef<HTMLDivElement>(null);
+
+  useEffect(() => {
+    const tabId = node.getId();
+    setVisible(isTabVisible(node));
+    resizeBatcher.track(tabId, node.getRect());
+    node.setEventListener("visibility", ({ visible }: { visible: boolean }) => setVisible(visible));
+    node.setEventListener("resize", ({ rect }: { rect: any }) =>
+      resizeBatcher.queue(tabId, rect || node.getRect(), elementRef.current)
+    );
+    return () => {
+      node.removeEventListener("visibility");
+      node.removeEventListener("resize");
+      resizeBatcher.remove(tabId);
+    };
+  }, [node, resizeBatcher]);
+
+  const dragging = useContext(DraggingContext);
+  const heavy = !!(node.getConfig() && node.getConfig().heavy);
+  const [frozenSize, setFrozenSize] = useState<{ width: number; height: number } | null>(null);
+
+  useLayoutEffect(() => {
+    if (dragging && heavy && visible && elementRef.current) {
+      const { width, height } = elementRef.current.getBoundingClientRect();
+      setFrozenSize({ width, height });
+    } else {
+      setFrozenSize(null);
+    }
+  }, [dragging, heavy, visible]);
+
+  return (
+    <React.Fragment>
+      <div
+        className={
+          "dash-dock-tab-content" +
+          (visible ? "" : " dash-dock-tab-content--hidden") +
+          (frozenSize ? " dash-dock-tab-content--frozen" : "")
+        }
+        style={frozenSize || undefined}
+        ref={elementRef}
+      >
+        <TabVisibilityContext.Provider value={visible}>
+          {children}
+        </TabVisibilityContext.Provider>
+      </div>
+      {frozenSize && <div className="dash-dock-tab-placeholder">{node.getName()}</div>}
+    </React.Fragment>
+  );
+};
+
+/**
+ * Implementation of DashDock, loaded asynchronously by
+ * `components/DashDock` so FlexLayout is only fetched when a dock is rendered.
+ */
+const DashDock = ({
+  id,
+  model,
+  children,
+  headers,
+  headerSpecs,
+  setProps,
+  useStateForModel,
+  popoutURL,
+  apiKey,
+  apiUrl,
+  freeTabLimit,
+  colorScheme,
+  style,
+  loading_state,
+  debugMode,
+  visibleTabIds,
+  activeTabId,
+  dirtyOutputs,
+  reportTabResize,
+  resizedTabs,
+  dragPlaceholders,
+  tabContainment,
+  prefetchDelay,
+  prefetchTabId,
+  virtualTabStrip,
+  quickSwitcher,
+  deferModelUpdates,
+  syncChannel,
+  ...restProps
+}: Props) => {
+  // Track if we're in premium or free mode
+  const [validation, setValidation] = useState<ValidationState>({
+    isValidated: false,
+    isValid: false,
+    message: ""
+  });
+
+  // Track current color scheme
+  const [currentTheme, setCurrentTheme] = useState<'light' | 'dark'>(
+    colorScheme || (typeof document !== 'undefined' &&
+      document.documentElement.getAttribute('data-mantine-color-scheme') === 'dark'
+        ? 'dark'
+        : 'light')
+  );
+
+  // Models we sent through setProps. Dash feeds them straight back as the `model`
+  // prop, but the live Model already reflects them, so they must not be re-parsed
+  const echoedModelsRef = useRef(new WeakSet<IJsonModel>());
+
+  // Only server-originated models need re-analysing; echoes are our own output
+  const serverModelRef = useRef<IJsonModel>(model);
+  if (!echoedModelsRef.current.has(model)) {
+    serverModelRef.current = model;
+  }
+  const serverModel = serverModelRef.current;
+
+  // Listen to Mantine theme changes
+  useEffect(() => {
+    if (typeof document === 'undefined') return;
+
+    const detectTheme = () => {
+      const htmlEl = document.documentElement;
+      const theme = htmlEl.getAttribute('data-mantine-color-scheme') as 'light' | 'dark';
+      if (theme && theme !== currentTheme) {
+        setCurrentTheme(theme);
+      }
+    };
+
+    // Initial detection
+    detectTheme();
+
+    // Set up observer to watch for attribute changes on html element
+    const observer = new MutationObserver((mutations) => {
+      mutations.forEach((mutation) => {
+        if (
+          mutation.type === 'attributes' &&
+          mutation.attributeName === 'data-mantine-color-scheme'
+        ) {
+          detectTheme();
+        }
+      });
+    });
+
+    observer.observe(document.documentElement, { attributes: true });
+
+    return () => {
+      observer.disconnect();
+    };
+  }, [currentTheme]);
+
+  // With internal state the layout is only ever taken from the first model
+  const initialModelRef = useRef<IJsonModel>(model);
+  const sourceModel = setProps && !useStateForModel ? serverModel : initialModelRef.current;
+
+  // Tabs can also be added in the browser, so after the first action on a source
+  // model the tabs of the live Model are counted instead (see `onModelChange`).
+  // Once a layout exceeded the limit it stays limited, although the limited
+  // Model itself no longer does
+  const sourceTabCount = useMemo(() => countTabs(sourceModel).total, [sourceModel]);
+  const [liveTabs, setLiveTabs] = useState<{
+    source: IJsonModel;
+    count: number;
+    exceeded: boolean;
+  } | null>(null);
+  const currentLiveTabs = liveTabs && liveTabs.source === sourceModel ? liveTabs : null;
+  const tabCount = currentLiveTabs ? currentLiveTabs.count : sourceTabCount;
+  const exceedsLimit = tabCount > freeTabLimit || (!!currentLiveTabs && currentLiveTabs.exceeded);
+
+  // -1 when no limit applies
+  const limit = !validation.isValid && exceedsLimit ? freeTabLimit : -1;
+
+  // Bumped to rebuild the layout from the source model (see `resetLayout`)
+  const [resetCount, setResetCount] = useState(0);
+
+  // What the live Model was last built from
+  const builtRef = useRef<{ source: IJsonModel; resetCount: number; model: Model } | null>(null);
+
+  /**
+   * The one live FlexLayout Model for this dock. FlexLayout mutates it in place on
+   * every interaction, so it is only rebuilt when a new model arrives from the
+   * server or the tab limit changes. When limiting applies, the limited JSON is
+   * parsed directly rather than building (and discarding) a full Model first.
+   */
+  const { liveModel, modelLimited } = useMemo(() => {
+    // When only the limit changed (e.g. once the API key is validated), rebuild
+    // from the live layout, which is what was last reported, so the changes made
+    // since the source model arrived are kept
+    const built = builtRef.current;
+    const json = built && built.source === sourceModel && built.resetCount === resetCount
+      ? built.model.toJson()
+      : sourceModel;
+    let limited = false;
+    let rebuilt: Model | null = null;
+    if (limit >= 0) {
+      try {
+        rebuilt = Model.fromJson(limitModelToFreeTier(json, limit));
+        limited = true;
+      } catch (e) {
+        console.error("Error limiting model:", e);
+      }
+    }
+    rebuilt = rebuilt || Model.fromJson(json);
+    builtRef.current = { source: sourceModel, resetCount, model: rebuilt };
+    return { liveModel: rebuilt, modelLimited: limited };
+  }, [sourceModel, limit, resetCount]);
+
+  // FlexLayout's Layout has no public doAction, so actions dispatched outside
+  // of it are passed through the same onAction filter and applied to the model
+  // directly; the model's change listener still reports them via onModelChange
+  const dispatchAction = (action: CaplinFlexLayout.Action) =>
+    liveModel.doAction(syncChannel ? withSyncedIds(action) : action);
+
+  const resetRef = useRef<() => void>();
+  resetRef.current = () => {
+    cancelModelReport();
+    if (setProps && !useStateForModel) {
+      // Dash still holds the last layout we reported, so report the source model
+      // again; it is our own output from here on and must not be re-parsed
+      echoedModelsRef.current.add(sourceModel);
+      setProps({ model: sourceModel });
+    }
+    setLiveTabs(null);
+    setResetCount(count => count + 1);
+  };
+
+  // Expose the live model to the clientside layout operations
+  useEffect(() => {
+    if (!id) {
+      return undefined;
+    }
+    const handle: DockHandle = {
+      model: liveModel,
+      doAction: dispatchAction,
+      actions: CaplinFlexLayout.Actions,
+      DockLocation: CaplinFlexLayout.DockLocation,
+      reset: () => resetRef.current && resetRef.current(),
+      getStats: () => ({ headerRenders: headerRendersRef.current }),
+      openQuickSwitcher: () => openQuickSwitcherRef.current && openQuickSwitcherRef.current()
+    };
+    registerDock(id, handle);
+    return () => unregisterDock(id, handle);
+  }, [id, liveModel, syncChannel]);
+
+  // Last visibility reported to Dash, so it is only sent when it changes
+  const visibilityRef = useRef<TabVisibility | undefined>(
+    visibleTabIds ? { visibleTabIds, activeTabId: activeTabId ?? null } : undefined
+  );
+
+  const visibilityUpdate = (currentModel: Model): Partial<TabVisibility> => {
+    const visibility = getTabVisibility(currentModel);
+    if (sameVisibility(visibilityRef.current, visibility)) {
+      return {};
+    }
+    visibilityRef.current = visibility;
+    return visibility;
+  };
+
+  // Report the visibility of a freshly built layout
+  useEffect(() => {
+    if (!setProps) {
+      return;
+    }
+    const update = visibilityUpdate(liveModel);
+    if (update.visibleTabIds) {
+      setProps(update);
+    }
+  }, [liveModel]);
+
+  // Resize notifications for tab content, sent once a drag or maximize settles
+  const reportTabResizeRef = useRef(reportTabResize);
+  reportTabResizeRef.current = reportTabResize;
+  const setPropsRef = useRef(setProps);
+  setPropsRef.current = setProps;
+
+  const [resizeBatcher] = useState(
+    () => new TabResizeBatcher(id, (resized: TabResize[]) => {
+      if (reportTabResizeRef.current && setPropsRef.current) {
+        const rects: Record<string, { width: number; height: number }> = {};
+        resized.forEach(({ tabId, rect }) => {
+          rects[tabId] = { width: rect.width, height: rect.height };
+        });
+        setPropsRef.current({ resizedTabs: rects });
+      }
+    })
+  );
+
+  // Hold notifications while a pointer (splitter or tab drag) is down
+  useEffect(() => {
+    const release = () => resizeBatcher.release();
+    window.addEventListener("pointerup", release);
+    window.addEventListener("pointercancel", release);
+    return () => {
+      window.removeEventListener("pointerup", release);
+      window.removeEventListener("pointercancel", release);
+      resizeBatcher.dispose();
+    };
+  }, [resizeBatcher]);
+
+  // Splitter drags are pointer driven, tab drags use HTML5 drag and drop
+  const [splitterDragging, setSplitterDragging] = useState(false);
+  const [tabDragging, setTabDragging] = useState(false);
+
+  useEffect(() => {
+    if (!dragPlaceholders) {
+      return undefined;
+    }
+    const endSplitterDrag = () => setSplitterDragging(false);
+    const endTabDrag = () => setTabDragging(false);
+    window.addEventListener("pointerup", endSplitterDrag);
+    window.addEventListener("pointercancel", endSplitterDrag);
+    window.addEventListener("dragend", endTabDrag);
+    window.addEventListener("drop", endTabDrag);
+    return () => {
+      window.removeEventListener("pointerup", endSplitterDrag);
+      window.removeEventListener("pointercancel", endSplitterDrag);
+      window.removeEventListener("dragend", endTabDrag);
+      window.removeEventListener("drop", endTabDrag);
+    };
+  }, [dragPlaceholders]);
+
+  // Captured, as FlexLayout's splitters stop the pointerdown from bubbling
+  const onPointerDown = (event: React.PointerEvent) => {
+    resizeBatcher.hold();
+    if (dragPlaceholders && (event.target as Element).closest?.(".flexlayout__splitter")) {
+      setSplitterDragging(true);
+    }
+  };
+
+  const onDragStart = () => {
+    if (dragPlaceholders) {
+      setTabDragging(true);
+    }
+  };
+
+  // Validate API key on component load or when key changes
+  useEffect(() => {
+    let isMounted = true;
+
+    const validateKey = async () => {
+      try {
+        if (apiKey) {
+          if (debugMode) {
+            console.log("DashDock: Validating API key...");
+          }
+
+          const result = await checkApiKeyValidity(apiKey, 'DashDock', sourceTabCount, apiUrl);
+
+          // Only update state if component is still mounted
+          if (isMounted) {
+            setValidation({
+              isValidated: true,
+              isValid: result.valid,
+              message: result.message
+            });
+
+            if (debugMode) {
+              console.log(`DashDock: API key validation result: ${result.valid ? "Valid" : "Invalid"} - ${result.message}`);
+            }
+          }
+        } else if (isMounted) {
+          setValidation({
+            isValidated: true,
+            isValid: false,
+            message: "No API key provided"
+          });
+
+          if (exceedsLimit && debugMode) {
+            console.log(
+              "DashDock: You are using the free version which is limited to 3 tabs. " +
+              "Get an API key for unlimited tabs at https://pip-install-python.com/pip/dash_dock"
+            );
+          }
+        }
+      } catch (error) {
+        console.error("API validation error:", error);
+        if (isMounted) {
+          setValidation({
+            isValidated: true,
+            isValid: false,
+            message: "Error validating API key"
+          });
+        }
+      }
+    };
+
+    validateKey();
+
+    // Cleanup function
+    return () => {
+      isMounted = false;
+    };
+  }, [apiKey, apiUrl, sourceTabCount, exceedsLimit, debugMode]);
+
+  /**
+   * If we are using dash to handle the layout, we should call setProps to
+   * persist the updated layout. Otherwise FlexLayout has already updated the
+   * live Model in place, and only a change in tab visibility is reported.
+   */
+  const reportModel = (updatedModel: Model) => {
+    if (!setProps) {
+      return;
+    }
+    const update = visibilityUpdate(updatedModel);
+    if (!useStateForModel) {
+      const json = updatedModel.toJson();
+      echoedModelsRef.current.add(json);
+      setProps({ model: json, ...update });
+    } else if (update.visibleTabIds) {
+      setProps(update);
+    }
+  };
+
+  // Idle callback that will report the model (see `deferModelUpdates`)
+  const pendingReportRef = useRef<number | null>(null);
+
+  const cancelModelReport = () => {
+    if (pendingReportRef.current !== null) {
+      cancelIdle(pendingReportRef.current);
+      pendingReportRef.current = null;
+    }
+  };
+
+  const reportModelRef = useRef(reportModel);
+  reportModelRef.current = reportModel;
+
+  // Actions are shared with the docks on the same `syncChannel` in other tabs
+  const layoutSyncRef = useRef<LayoutSync | null>(null);
+
+  useEffect(() => {
+    if (!syncChannel || !LayoutSync.isSupported()) {
+      return undefined;
+    }
+    const sync = new LayoutSync(
+      syncChannel,
+      // Straight onto the model: the action was already vetted where it started
+      action => liveModel.doAction(action),
+      (action, error) => {
+        if (debugMode) {
+          console.warn(`DashDock: could not replay synced action ${action.type}:`, error);
+        }
+      }
+    );
+    const restoreNodeIds = syncNodeIds(liveModel);
+    layoutSyncRef.current = sync;
+    return () => {
+      sync.close();
+      restoreNodeIds();
+      layoutSyncRef.current = null;
+    };
+  }, [syncChannel, liveModel]);
+
+  // A new model from the server supersedes unreported local changes. So does
+  // removing the dock: Dash has already replaced it, and reporting the old
+  // layout then would overwrite the new one
+  useEffect(() => cancelModelReport, [liveModel]);
+
+  // Listeners of the `Tab` components waiting for their tab to close
+  const closeListenersRef = useRef(new Map<string, Set<() => void>>());
+
+  const tabEvents = useMemo<TabEvents>(() => ({
+    onClose: (tabId, listener) => {
+      const listeners = closeListenersRef.current;
+      if (!listeners.has(tabId)) {
+        listeners.set(tabId, new Set());
+      }
+      listeners.get(tabId)!.add(listener);
+      return () => {
+        const forTab = listeners.get(tabId);
+        if (forTab) {
+          forTab.delete(listener);
+          if (!forTab.size) {
+            listeners.delete(tabId);
+          }
+        }
+      };
+    }
+  }), []);
+
+  // Runs as part of the action, before the closed tabs' content unmounts
+  const notifyClosedTabs = (updatedModel: Model) => {
+    closeListenersRef.current.forEach((listeners, tabId) => {
+      if (!updatedModel.getNodeById(tabId)) {
+        closeListenersRef.current.delete(tabId);
+        listeners.forEach(listener => listener());
+      }
+    });
+  };
+
+  /**
+   * Keep the quick switcher's index up to date, tell `Tab` components their
+   * tab closed, share the action with synced docks and report the changed
+   * layout, straight away or, with `deferModelUpdates`, once per idle period
+   */
+  // FlexLayout 0.8 subscribes the Layout to its model both on mount and on the
+  // first update, so the same action can be passed to onModelChange twice
+  const lastActionRef = useRef<CaplinFlexLayout.Action | null>(null);
+
+  const onModelChange = (updatedModel: Model, action: CaplinFlexLayout.Action) => {
+    if (action === lastActionRef.current) {
+      return;
+    }
+    lastActionRef.current = action;
+    const liveTabCount = countModelTabs(updatedModel);
+    if (liveTabCount !== tabCount || !currentLiveTabs) {
+      setLiveTabs({
+        source: sourceModel,
+        count: liveTabCount,
+        exceeded: exceedsLimit || liveTabCount > freeTabLimit
+      });
+    }
+    const tabIndex = tabIndexRef.current;
+    if (tabIndex && tabIndex.model === updatedModel && !updateTabIndex(tabIndex.index, action, updatedModel)) {
+      tabIndexRef.current = null;
+    }
+    if (closeListenersRef.current.size) {
+      notifyClosedTabs(updatedModel);
+    }
+    if (layoutSyncRef.current) {
+      layoutSyncRef.current.post(action);
+    }
+    if (!deferModelUpdates) {
+      reportModel(updatedModel);
+    } else if (pendingReportRef.current === null) {
+      pendingReportRef.current = requestIdle(() => {
+        pendingReportRef.current = null;
+        reportModelRef.current(updatedModel);
+      }, MODEL_REPORT_TIMEOUT);
+    }
+  };
+
+  // Hover intent: report a hidden tab once the pointer has rested on its button
+  const prefetchTimerRef = useRef<number | null>(null);
+  const prefetchedRef = useRef(prefetchTabId);
+
+  const cancelPrefetch = () => {
+    if (prefetchTimerRef.current !== null) {
+      window.clearTimeout(prefetchTimerRef.current);
+      prefetchTimerRef.current = null;
+    }
+  };
+
+  const schedulePrefetch = (node: TabNode) => {
+    cancelPrefetch();
+    prefetchTimerRef.current = window.setTimeout(() => {
+      prefetchTimerRef.current = null;
+      const tabId = node.getId();
+      if (!isTabVisible(node) && prefetchedRef.current !== tabId && setProps) {
+        prefetchedRef.current = tabId;
+        setProps({ prefetchTabId: tabId });
+      }
+    }, prefetchDelay);
+  };
+
+  useEffect(() => cancelPrefetch, []);
+
+  // Searchable menu of tabs (of a virtualized tab strip, or the quick
+  // switcher), while open
+  const [tabMenu, setTabMenu] = useState<{
+    className: string;
+    search: (query: string) => MenuTab[];
+    placeholder: string;
+    selectedId?: string;
+    style: React.CSSProperties;
+  } | null>(null);
+
+  useEffect(() => setTabMenu(null), [liveModel]);
+
+  const isVirtualStrip = (node: TabSetNode | BorderNode) =>
+    !!virtualTabStrip && virtualTabStrip > 0 && node.getChildren().length > virtualTabStrip;
+
+  // Tabs with a button in each virtualized tabset or border. Worked out in
+  // `onRenderTabSet`, which FlexLayout calls before rendering the tab buttons,
+  // so `onRenderTab` doesn't have to find the position of every tab
+  const stripWindowsRef = useRef(new WeakMap<TabSetNode | BorderNode, Set<CaplinFlexLayout.Node>>());
+
+  const updateStripWindow = (node: TabSetNode | BorderNode) => {
+    const children = node.getChildren();
+    const [start, end] = tabWindow(children.length, node.getSelected(), virtualTabStrip!);
+    const shown = new Set(children.slice(start, end));
+    stripWindowsRef.current.set(node, shown);
+    return shown;
+  };
+
+  const openStripMenu = (node: TabSetNode | BorderNode, anchor: Element) => {
+    const tabs = node.getChildren().map((child, index) => ({
+      id: child.getId(),
+      name: (child as TabNode).getName(),
+      index
+    }));
+    const tabSearch = new TabListSearch(tabs);
+    const selected = node.getSelectedNode();
+    const rect = anchor.getBoundingClientRect();
+    setTabMenu({
+      className: "dash-dock-strip-menu",
+      search: query => tabSearch.search(query),
+      placeholder: `Search ${tabs.length} tabs`,
+      selectedId: selected ? selected.getId() : undefined,
+      style: { top: rect.bottom, right: Math.max(0, window.innerWidth - rect.right) }
+    });
+  };
+
+  // Index of the tab names and ids for the quick switcher, built the first time
+  // it opens and then kept up to date from the actions in `onModelChange`
+  const tabIndexRef = useRef<{ model: Model; index: TabIndex } | null>(null);
+
+  const getTabIndex = () => {
+    if (!tabIndexRef.current || tabIndexRef.current.model !== liveModel) {
+      tabIndexRef.current = { model: liveModel, index: TabIndex.fromModel(liveModel) };
+    }
+    return tabIndexRef.current.index;
+  };
+
+  const containerRef = useRef<HTMLDivElement>(null);
+
+  const openQuickSwitcherRef = useRef<() => void>();
+  openQuickSwitcherRef.current = () => {
+    const index = getTabIndex();
+    const rect = containerRef.current
+      ? containerRef.current.getBoundingClientRect()
+      : { top: 0, left: 0, width: window.innerWidth };
+    const active = liveModel.getActiveTabset();
+    const selected = active ? active.getSelectedNode() : undefined;
+    setTabMenu({
+      className: "dash-dock-quick-switcher",
+      search: query => index.search(query),
+      placeholder: `Go to tab (${index.size} tabs)`,
+      selectedId: selected ? selected.getId() : undefined,
+      style: { top: rect.top + 40, left: rect.left + rect.width / 2 }
+    });
+  };
+
+  // Ctrl+K / Cmd+K opens the quick switcher of the dock holding the focus, or
+  // of the first dock with a quick switcher when the focus is outside every dock
+  useEffect(() => {
+    if (!quickSwitcher) {
+      return undefined;
+    }
+    const onKeyDown = (e: KeyboardEvent) => {
+      if (!(e.ctrlKey || e.metaKey) || e.shiftKey || e.altKey || e.key.toLowerCase() !== "k") {
+        return;
+      }
+      const target = e.target instanceof Element ? e.target : null;
+      const dock = (target && target.closest(".dash-dock-container")) ||
+        document.querySelector(".dash-dock-container[data-quick-switcher]");
+      if (dock && dock === containerRef.current && openQuickSwitcherRef.current) {
+        e.preventDefault();
+        openQuickSwitcherRef.current();
+      }
+    };
+    window.addEventListener("keydown", onKeyDown);
+    return () => window.removeEventListener("keydown", onKeyDown);
+  }, [quickSwitcher]);
+
+  const selectFromTabMenu = (tabId: string) => {
+    setTabMenu(null);
+    const node = liveModel.getNodeById(tabId) as TabNode | undefined;
+    // Selecting the selected tab of a border would collapse the border
+    if (!node || (isTabVisible(node) && node.getParent() instanceof BorderNode)) {
+      return;
+    }
+    dispatchAction(CaplinFlexLayout.Actions.selectTab(tabId));
+  };
+
+  /**
+   * With `virtualTabStrip`, tabsets and borders with many tabs get a button
+   * listing all their tabs, as the other tab buttons are not rendered.
+   */
+  const onRenderTabSet = (
+    node: TabSetNode | BorderNode,
+    renderValues: ITabSetRenderValues
+  ) => {
+    if (!isVirtualStrip(node)) {
+      return;
+    }
+    updateStripWindow(node);
+    renderValues.buttons.push(
+      <button
+        key="dash-dock-strip-menu"
+        className="dash-dock-strip-menu-button"
+        title="All tabs"
+        onPointerDown={e => e.stopPropagation()}
+        onClick={e => openStripMenu(node, e.currentTarget)}
+      >
+        {node.getChildren().length}
+      </button>
+    );
+  };
+
+  // FlexLayout's own overflow button opens the searchable menu too
+  const onShowOverflowMenu = (
+    node: TabSetNode | BorderNode,
+    mouseEvent: React.MouseEvent<HTMLElement, MouseEvent>
+  ) => openStripMenu(node, mouseEvent.target as Element);
+
+  /**
+   * Rendered headers by tab id. FlexLayout calls `onRenderTab` for every tab
+   * button on every layout render (including each frame of a drag), so a
+   * header is only rebuilt when its entry in `headers` or `headerSpecs` (or
+   * the tab name) changes; otherwise the same elements are handed back and
+   * React skips them.
+   */
+  const headerCacheRef = useRef(new Map<string, CachedHeader>());
+  const headerRendersRef = useRef(0);
+
+  /**
+   * Customise rendering of the tab to use the `headerSpecs` and `headers`
+   * maps if available.
+   */
+  const onRenderTab = (
+    node: TabNode,
+    renderValues: ITabRenderValues
+  ) => {
+    // Buttons outside the window of a virtualized strip are rendered as empty
+    // stubs and hidden, so neither their headers nor their layout cost anything
+    const parent = node.getParent() as TabSetNode | BorderNode | undefined;
+    if (parent && isVirtualStrip(parent)) {
+      const shown = stripWindowsRef.current.get(parent) || updateStripWindow(parent);
+      if (!shown.has(node)) {
+        renderValues.leading = null;
+        renderValues.content = <span className="dash-dock-tab-virtual" />;
+        renderValues.buttons.length = 0;
+        return;
+      }
+    }
+
+    const tabId = node.getId();
+    const header = headers ? headers[tabId] : undefined;
+    const spec = headerSpecs ? headerSpecs[tabId] : undefined;
+    if (!header && !spec) {
+      headerCacheRef.current.delete(tabId);
+    } else {
+      const key = headerKey(header);
+      const name = node.getName();
+      let cached = headerCacheRef.current.get(tabId);
+      if (!cached || cached.key !== key || cached.spec !== spec || cached.name !== name) {
+        headerRendersRef.current++;
+        cached = { key, spec, name, ...renderHeader(header, spec, name) };
+        headerCacheRef.current.set(tabId, cached);
+      }
+      if (cached.leading) {
+        renderValues.leading = cached.leading;
+      }
+      if (cached.content !== undefined) {
+        renderValues.content = cached.content;
+      }
+    }
+
+    if (prefetchDelay && setProps) {
+      renderValues.content = (
+        <span
+          className="dash-dock-tab-label"
+          onPointerEnter={() => schedulePrefetch(node)}
+          onPointerLeave={cancelPrefetch}
+        >
+          {renderValues.content}
+        </span>
+      );
+    }
+  };
+
+  /**
+   * Factory function to create the content for each tab
+   */
+  const factory = (node: CaplinFlexLayout.TabNode) => {
+    const matchedChildren = getMatchingChildren(children, node);
+    return (
+      <TabContent node={node} resizeBatcher={resizeBatcher}>
+        {matchedChildren}
+      </TabContent>
+    );
+  };
+
+  // Check if component is in loading state - this should be safe now with our defensive code
+  const isLoading = loading_state?.is_loading || false;
+
+  // Show a warning on the console if we're limiting tabs
+  useEffect(() => {
+    if (modelLimited && !isLoading && debugMode) {
+      console.warn(
+        "DashDock: Your layout has been limited to 3 tabs because you are using the free version. " +
+        "Get an API key for unlimited tabs at https://pip-install-python.com/pip/dash_dock"
+      );
+    }
+  }, [modelLimited, isLoading, debugMode]);
+
+  // Render the component
+  return (
+    <div
+      id={id}
+      ref={containerRef}
+      className={
+        `dash-dock-container dash-dock-${currentTheme}` +
+        (tabContainment ? " dash-dock-contained" : "")
+      }
+      style={style}
+      data-quick-switcher={quickSwitcher ? "" : undefined}
+      onPointerDownCapture={onPointerDown}
+      onDragStart={onDragStart}
+    >
+      {/* Show a premium indicator if using a valid API key */}
+      {validation.isValid && debugMode && (
+        <div className="dashdock-premium-indicator">
+          DashDock Premium
+        </div>
+      )}
+
+      <TabEventsContext.Provider value={tabEvents}>
+        <DraggingContext.Provider value={!!dragPlaceholders && (splitterDragging || tabDragging)}>
+          <Layout
+            model={liveModel}
+            factory={factory}
+            onModelChange={onModelChange}
+            onAction={syncChannel ? withSyncedIds : undefined}
+            onRenderTab={onRenderTab}
+            onRenderTabSet={virtualTabStrip ? onRenderTabSet : undefined}
+            onShowOverflowMenu={virtualTabStrip ? onShowOverflowMenu : undefined}
+            popoutURL={popoutURL || defaultPopoutURL()}
+            {...restProps}
+          />
+        </DraggingContext.Provider>
+      </TabEventsContext.Provider>
+
+      {tabMenu && (
+        <TabMenu
+          {...tabMenu}
+          onSelect={selectFromTabMenu}
+          onClose={() => setTabMenu(null)}
+        />
+      )}
+
+      {/* Show a free version indicator if not validated or invalid */}
+      {!validation.isValid && exceedsLimit && modelLimited && (
+        <div className="dashdock-free-indicator">
+          DashDock Free (Limited to {freeTabLimit} tabs)
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default DashDock;
\ No newline at end of file
@@ -0,0 +1,131 @@
+import React, { useState, useEffect, useMemo, useRef } from "react";
+
+export interface MenuTab {
+  id: string;
+  name: string;
+  /** Position of the tab in its tabset or border, shown when given */
+  index?: number;
+}
+
+export type TabMenuProps = {
+  /** Find the tabs matching a query, best first */
+  search: (query: string) => MenuTab[];
+  /** Placeholder of the search box */
+  placeholder: string;
+  /** Id of the selected tab */
+  selectedId?: string;
+  /** Class of the menu, e.g. for positioning */
+  className: string;
+  style?: React.CSSProperties;
+  /** Maximum number of matches to list */
+  maxItems?: number;
+  onSelect: (tabId: string) => void;
+  onClose: () => void;
+};
+
+/**
+ * Searchable list of tabs, used by the menu of virtualized tab strips and by
+ * the quick switcher. Typing narrows the list, the arrow keys move the
+ * highlight, Enter selects and Escape (or a click outside) closes the menu.
+ */
+const TabMenu = ({
+  search,
+  placeholder,
+  selectedId,
+  className,
+  style,
+  maxItems = 100,
+  onSelect,
+  onClose
+}: TabMenuProps) => {
+  const menuRef = useRef<HTMLDivElement>(null);
+  const listRef = useRef<HTMLUListElement>(null);
+
+  const [query, setQuery] = useState("");
+  const matches = useMemo(() => search(query), [search, query]);
+  const shown = matches.length > maxItems ? matches.slice(0, maxItems) : matches;
+
+  const [highlighted, setHighlighted] = useState(() =>
+    Math.max(0, shown.findIndex(tab => tab.id === selectedId))
+  );
+
+  useEffect(() => {
+    const onPointerDown = (e: PointerEvent) => {
+      if (menuRef.current && !menuRef.current.contains(e.target as Node)) {
+        onClose();
+      }
+    };
+    window.addEventListener("pointerdown", onPointerDown, true);
+    return () => window.removeEventListener("pointerdown", onPointerDown, true);
+  }, [onClose]);
+
+  useEffect(() => {
+    const item = listRef.current?.children[highlighted] as HTMLElement | undefined;
+    item?.scrollIntoView({ block: "nearest" });
+  }, [highlighted]);
+
+  const onKeyDown = (e: React.KeyboardEvent) => {
+    if (e.key === "ArrowDown") {
+      setHighlighted(i => Math.min(i + 1, shown.length - 1));
+    } else if (e.key === "ArrowUp") {
+      setHighlighted(i => Math.max(i - 1, 0));
+    } else if (e.key === "Enter") {
+      if (shown[highlighted]) {
+        onSelect(shown[highlighted].id);
+      }
+    } else if (e.key === "Escape") {
+      onClose();
+    } else {
+      return;
+    }
+    e.preventDefault();
+  };
+
+  return (
+    <div
+      ref={menuRef}
+      className={`dash-dock-tab-menu ${className}`}
+      style={style}
+      onKeyDown={onKeyDown}
+    >
+      <input
+        className="dash-dock-tab-menu-search"
+        autoFocus
+        placeholder={placeholder}
+        value={query}
+        onChange={e => {
+          setQuery(e.target.value);
+          setHighlighted(0);
+        }}
+      />
+      <ul ref={listRef} className="dash-dock-tab-menu-list" role="listbox">
+        {shown.map((tab, i) => (
+          <li
+            key={tab.id}
+            role="option"
+            aria-selected={tab.id === selectedId}
+            className={
+              "dash-dock-tab-menu-item" +
+              (i === highlighted ? " dash-dock-tab-menu-item--highlighted" : "") +
+              (tab.id === selectedId ? " dash-dock-tab-menu-item--selected" : "")
+            }
+            onPointerEnter={() => setHighlighted(i)}
+            onClick={() => onSelect(tab.id)}
+          >
+            {tab.index !== undefined && (
+              <span className="dash-dock-tab-menu-index">{tab.index + 1}</span>
+            )}
+            {tab.name}
+          </li>
+        ))}
+      </ul>
+      {matches.length > shown.length && (
+        <div className="dash-dock-tab-menu-more">
+          {matches.length - shown.length} more, refine the search
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default TabMenu;
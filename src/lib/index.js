@@ -1,7 +1,15 @@
+// FlexLayout styles and our custom theme styles are imported from the entry
+// so they are extracted into the stylesheet registered in `_css_dist`
+import 'flexlayout-react/style/light.css';
+import './styles/theme.css';
+
+import './clientside';
 import DashDock from './components/DashDock';
 import Tab from './components/Tab';
+import DockInterval from './components/DockInterval';
 
 export {
     DashDock,
-    Tab
+    Tab,
+    DockInterval
 };
\ No newline at end of file
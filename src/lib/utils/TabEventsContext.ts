@@ -0,0 +1,19 @@
+import React from "react";
+
+export interface TabEvents {
+  /**
+   * Call `listener` when the tab with this id is closed, i.e. removed from the
+   * layout by the user or a layout action
+   * @returns Function removing the listener
+   */
+  onClose: (tabId: string, listener: () => void) => () => void;
+}
+
+/**
+ * Lifecycle events of the tabs of a dock, for the `Tab` components rendered in
+ * it. Like `TabVisibilityContext`, it lives in the main bundle so `Tab` doesn't
+ * load FlexLayout. `null` outside a dock.
+ */
+const TabEventsContext = React.createContext<TabEvents | null>(null);
+
+export default TabEventsContext;
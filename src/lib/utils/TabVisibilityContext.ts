@@ -0,0 +1,12 @@
+import React from "react";
+
+/**
+ * Whether the tab a component is rendered in is currently visible.
+ *
+ * DashDock provides it for the content of each tab; it lives in the main bundle so
+ * components such as `DockInterval` can read it without loading FlexLayout.
+ * Components rendered outside a dock always see `true`.
+ */
+const TabVisibilityContext = React.createContext<boolean>(true);
+
+export default TabVisibilityContext;
@@ -27,6 +27,7 @@ declare global {
         useStore: () => any;
         useDispatch: () => any;
       };
+      stringifyId?: (id: any) => string;
     };
     dash_clientside?: {
       set_props: (componentPathOrId: string, props: Record<string, any>) => void;
@@ -88,6 +89,23 @@ export const getChildLayout = (child: any): { type: any; props: any } => {
   };
 };
 
+/**
+ * Stringify a component id the way Dash does for callbacks, so dict
+ * (pattern-matching) ids can be compared with string ids
+ */
+export const stringifyId = (id: any): string => {
+  if (typeof id !== 'object' || id === null) {
+    return id;
+  }
+  if (typeof window !== 'undefined' && window.dash_component_api?.stringifyId) {
+    return window.dash_component_api.stringifyId(id);
+  }
+  const parts = Object.keys(id).sort().map(
+    key => JSON.stringify(key) + ':' + JSON.stringify(id[key])
+  );
+  return '{' + parts.join(',') + '}';
+};
+
 /**
  * Get child props from layout
  */
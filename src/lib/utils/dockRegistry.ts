@@ -0,0 +1,56 @@
+/**
+ * Registry of the live FlexLayout models of mounted docks, keyed by dock id.
+ *
+ * The registry lives in the main bundle, while FlexLayout itself is in the async
+ * chunk, so each dock registers the FlexLayout helpers it was built with
+ * alongside its model. Code in the main bundle (e.g. the clientside namespace)
+ * can then dispatch actions without importing FlexLayout.
+ */
+
+export interface DockHandle {
+  /** The live FlexLayout Model of the dock */
+  model: any;
+  /** Dispatch a FlexLayout action through the dock's Layout */
+  doAction: (action: any) => any;
+  /** FlexLayout's `Actions` action creators */
+  actions: any;
+  /** FlexLayout's `DockLocation` */
+  DockLocation: any;
+  /** Rebuild the dock from the last model it received from the server */
+  reset: () => void;
+  /** Rendering counters, for diagnostics and benchmarks */
+  getStats: () => { headerRenders: number };
+  /** Open the dock's quick switcher */
+  openQuickSwitcher: () => void;
+}
+
+const docks = new Map<string, DockHandle>();
+
+/**
+ * Register a mounted dock
+ * @param id Dock id
+ * @param handle Handle for the dock's live model
+ */
+export function registerDock(id: string, handle: DockHandle): void {
+  docks.set(id, handle);
+}
+
+/**
+ * Unregister a dock, unless it has since been replaced by another instance
+ * @param id Dock id
+ * @param handle Handle that was registered
+ */
+export function unregisterDock(id: string, handle: DockHandle): void {
+  if (docks.get(id) === handle) {
+    docks.delete(id);
+  }
+}
+
+/**
+ * Look up a mounted dock
+ * @param id Dock id
+ * @returns The dock's handle, or undefined if no dock with this id is mounted
+ */
+export function getDock(id: string): DockHandle | undefined {
+  return docks.get(id);
+}
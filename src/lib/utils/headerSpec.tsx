@@ -0,0 +1,37 @@
+import React from "react";
+
+/**
+ * Plain-data description of a tab header, rendered by the component itself
+ * rather than sent as a Dash component tree
+ */
+export interface HeaderSpec {
+  /** CSS class(es) of an icon element shown before the text, e.g. "bi bi-graph-up" */
+  icon?: string;
+  /** Header text; defaults to the tab name */
+  text?: string;
+  /** Badge shown after the text, e.g. a count of unread items. Hidden when null or 0 */
+  badge?: number | string | null;
+  /** Extra CSS class(es) for the header */
+  className?: string;
+}
+
+/**
+ * Render the leading icon and content of a tab button from a header spec
+ * @param spec Header spec of the tab
+ * @param name Tab name, used when the spec has no text
+ */
+export function renderHeaderSpec(
+  spec: HeaderSpec,
+  name: string
+): { leading: React.ReactNode; content: React.ReactNode } {
+  const showBadge = spec.badge !== undefined && spec.badge !== null && spec.badge !== 0 && spec.badge !== "";
+  return {
+    leading: spec.icon ? <i className={`dash-dock-tab-icon ${spec.icon}`} /> : null,
+    content: (
+      <span className={spec.className ? `dash-dock-tab-header ${spec.className}` : "dash-dock-tab-header"}>
+        {spec.text !== undefined ? spec.text : name}
+        {showBadge && <span className="dash-dock-tab-badge">{spec.badge}</span>}
+      </span>
+    )
+  };
+}
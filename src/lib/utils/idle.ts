@@ -0,0 +1,31 @@
+/**
+ * `requestIdleCallback` with a fallback for browsers without it (Safari), where
+ * the callback runs on the next macrotask instead.
+ */
+
+const w = (typeof window !== "undefined" ? window : undefined) as any;
+
+/**
+ * Run a callback once the browser is idle
+ * @param callback Function to run
+ * @param timeout Maximum delay in milliseconds, even if the browser stays busy
+ * @returns Handle for `cancelIdle`
+ */
+export function requestIdle(callback: () => void, timeout: number): number {
+  if (w && w.requestIdleCallback) {
+    return w.requestIdleCallback(callback, { timeout });
+  }
+  return window.setTimeout(callback, 1);
+}
+
+/**
+ * Cancel a callback scheduled with `requestIdle`
+ * @param handle Handle returned by `requestIdle`
+ */
+export function cancelIdle(handle: number): void {
+  if (w && w.cancelIdleCallback) {
+    w.cancelIdleCallback(handle);
+  } else {
+    window.clearTimeout(handle);
+  }
+}
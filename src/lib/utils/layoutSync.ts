@@ -0,0 +1,130 @@
+/**
+ * Sync of layout actions between browser tabs (see the `syncChannel` prop).
+ *
+ * Every action applied to a dock's model is posted on a `BroadcastChannel`, and
+ * the docks with the same channel name in other same-origin tabs (or windows,
+ * or on the same page) replay it on their own model. Actions that open or close
+ * popout windows are specific to one browser tab and are not synced.
+ */
+import { Action, Actions, Model } from "flexlayout-react";
+
+const UNSYNCED_ACTIONS = new Set<string>([
+  Actions.POPOUT_TAB,
+  Actions.POPOUT_TABSET,
+  Actions.CLOSE_WINDOW,
+  Actions.CREATE_WINDOW
+]);
+
+const randomId = () =>
+  typeof crypto !== "undefined" && crypto.randomUUID
+    ? crypto.randomUUID()
+    : Math.random().toString(36).slice(2) + Date.now().toString(36);
+
+/**
+ * Tag an action with a random `syncId`, from which the ids of the nodes it
+ * creates are derived (see `syncNodeIds`)
+ */
+export function withSyncedIds(action: Action): Action {
+  if (action.data && !UNSYNCED_ACTIONS.has(action.type) && !action.data.syncId) {
+    action.data.syncId = randomId();
+  }
+  return action;
+}
+
+/**
+ * Make the ids FlexLayout generates for the nodes an action creates (a tab
+ * added without an id, or the tabset and row of a drag to the edge of a tabset)
+ * depend only on the action. While the model applies an action tagged by
+ * `withSyncedIds`, ids are numbered from its `syncId` in the order the nodes are
+ * created, so every browser tab replaying the action ends up with the same ids
+ * and later actions on those nodes replay too.
+ * @returns A function restoring the model's own id generation
+ */
+export function syncNodeIds(model: Model): () => void {
+  // FlexLayout assigns ids to new nodes through `nextUniqueId` while applying
+  // the action (at the latest when it rebuilds its id map at the end)
+  const patched = model as any;
+  const { doAction, nextUniqueId } = patched;
+  let syncId: string | undefined;
+  let count = 0;
+
+  patched.nextUniqueId = () =>
+    syncId ? `#${syncId}-${count++}` : nextUniqueId.call(model);
+  patched.doAction = (action: Action) => {
+    syncId = action.data && action.data.syncId;
+    count = 0;
+    try {
+      return doAction.call(model, action);
+    } finally {
+      syncId = undefined;
+    }
+  };
+
+  return () => {
+    delete patched.nextUniqueId;
+    delete patched.doAction;
+  };
+}
+
+export class LayoutSync {
+  private readonly channel: BroadcastChannel;
+  private readonly source = randomId();
+  private replaying = false;
+
+  /**
+   * @param name Channel name, shared by the docks to keep in sync
+   * @param replay Apply an action received from another dock
+   * @param onError Called when an action can't be replayed, e.g. because the
+   *   layouts have diverged and its node doesn't exist here
+   */
+  constructor(
+    name: string,
+    replay: (action: Action) => void,
+    onError?: (action: Action, error: unknown) => void
+  ) {
+    this.channel = new BroadcastChannel(`dash-dock:${name}`);
+    this.channel.onmessage = (e: MessageEvent) => {
+      const message = e.data || {};
+      if (message.source === this.source || !message.type || UNSYNCED_ACTIONS.has(message.type)) {
+        return;
+      }
+      const action = new Action(message.type, message.data);
+      this.replaying = true;
+      try {
+        replay(action);
+      } catch (error) {
+        if (onError) {
+          onError(action, error);
+        }
+      } finally {
+        this.replaying = false;
+      }
+    };
+  }
+
+  /**
+   * Whether BroadcastChannel is available in this browser
+   */
+  static isSupported(): boolean {
+    return typeof BroadcastChannel !== "undefined";
+  }
+
+  /**
+   * Post an action that was applied locally, unless it is being replayed
+   */
+  post(action: Action): void {
+    if (this.replaying || UNSYNCED_ACTIONS.has(action.type)) {
+      return;
+    }
+    try {
+      this.channel.postMessage({ source: this.source, type: action.type, data: action.data });
+    } catch (e) {
+      // Data that can't be cloned, e.g. from a custom drag source
+      console.warn(`DashDock: could not sync action ${action.type}:`, e);
+    }
+  }
+
+  close(): void {
+    this.channel.close();
+  }
+}
@@ -0,0 +1,30 @@
+/**
+ * The blank page popout windows are opened with, served by `dash_dock` (see
+ * `dash_dock/popout.py`). FlexLayout copies the stylesheets of the main page
+ * into the window and renders the popped out tabs into it through a portal, so
+ * the page loads no scripts and the tabs stay in the main page's Dash renderer.
+ */
+export const POPOUT_ROUTE = "_dash-dock/popout.html";
+
+let popoutURL: string | undefined;
+
+/**
+ * URL of the popout page of the running Dash app, under its
+ * `requests_pathname_prefix`. The config is only read on the first call, as it
+ * doesn't change for the life of the page.
+ */
+export function defaultPopoutURL(): string {
+  if (popoutURL === undefined) {
+    let prefix = "/";
+    try {
+      const config = document.getElementById("_dash-config");
+      if (config && config.textContent) {
+        prefix = JSON.parse(config.textContent).requests_pathname_prefix || prefix;
+      }
+    } catch (e) {
+      // Not rendered by Dash, or a malformed config; assume the root
+    }
+    popoutURL = `${prefix}${POPOUT_ROUTE}`;
+  }
+  return popoutURL;
+}
@@ -1,4 +1,4 @@
-import { IJsonModel } from "flexlayout-react";
+import { IJsonModel, Model } from "flexlayout-react";
 
 interface TabCount {
   total: number;
@@ -42,6 +42,22 @@ export function countTabs(model: IJsonModel): TabCount {
   return result;
 }
 
+/**
+ * Count the tabs of a live FlexLayout Model, including tabs added or closed in
+ * the browser since it was built
+ * @param model The FlexLayout Model
+ * @returns Number of tabs in the layout, its borders and popout windows
+ */
+export function countModelTabs(model: Model): number {
+  let total = 0;
+  model.visitNodes(node => {
+    if (node.getType() === 'tab') {
+      total++;
+    }
+  });
+  return total;
+}
+
 /**
  * Recursively count tabs in a layout node
  * @param node Layout node (row, tabset, or tab)
@@ -82,36 +98,39 @@ export function exceedsFreeTierLimit(model: IJsonModel, freeLimit: number = 3):
  * This will limit the number of tabs to the free tier limit
  * @param model The original model
  * @param freeLimit Maximum number of tabs allowed (default: 3)
- * @returns A new model with tabs limited to the free tier
+ * @returns A new model with tabs limited to the free tier. Only the nodes on the
+ * path to a change are copied; untouched subtrees are shared with the original.
  */
 export function limitModelToFreeTier(model: IJsonModel, freeLimit: number = 3): IJsonModel {
-  // Deep clone the model to avoid modifying the original
-  const limitedModel: IJsonModel = JSON.parse(JSON.stringify(model));
+  const limitedModel: IJsonModel = { ...model };
 
   let remainingTabs = freeLimit;
 
   // First handle borders, if present
-  if (limitedModel.borders && limitedModel.borders.length > 0) {
-    for (const border of limitedModel.borders) {
-      if (border.children && border.children.length > 0) {
-        // If we have no more tabs allowed, remove all tabs from this border
-        if (remainingTabs <= 0) {
-          border.children = [];
-          continue;
-        }
+  if (model.borders && model.borders.length > 0) {
+    limitedModel.borders = model.borders.map(border => {
+      if (!border.children || border.children.length === 0) {
+        return border;
+      }
 
-        // Otherwise, limit the number of tabs in this border
-        const tabsInBorder = border.children.filter(child => child.type === 'tab');
-        if (tabsInBorder.length > remainingTabs) {
-          // Keep only the allowed number of tabs
-          border.children = border.children.filter(child => child.type !== 'tab');
-          border.children.push(...tabsInBorder.slice(0, remainingTabs));
-          remainingTabs = 0;
-        } else {
-          remainingTabs -= tabsInBorder.length;
-        }
+      // If we have no more tabs allowed, remove all tabs from this border
+      if (remainingTabs <= 0) {
+        return { ...border, children: [] };
       }
-    }
+
+      // Otherwise, limit the number of tabs in this border
+      const tabsInBorder = border.children.filter(child => child.type === 'tab');
+      if (tabsInBorder.length > remainingTabs) {
+        // Keep only the allowed number of tabs
+        const children = border.children.filter(child => child.type !== 'tab');
+        children.push(...tabsInBorder.slice(0, remainingTabs));
+        remainingTabs = 0;
+        return { ...border, children };
+      }
+
+      remainingTabs -= tabsInBorder.length;
+      return border;
+    });
   }
 
   // If we have tabs remaining, apply limits to the main layout
@@ -169,7 +188,7 @@ function limitLayoutNode(node: any, maxTabs: number): any {
     for (const child of node.children) {
       if (remainingTabs <= 0) break;
 
-      const limitedChild = limitLayoutNode({ ...child }, remainingTabs);
+      const limitedChild = limitLayoutNode(child, remainingTabs);
       if (limitedChild) {
         // Calculate how many tabs were used in this child
         const childTabCount = countTabsInLayout(limitedChild);
@@ -0,0 +1,189 @@
+/**
+ * Search index over the names and ids of the tabs of a model, for the quick
+ * switcher. Queries of three or more characters are answered from a trigram
+ * index and shorter ones from an index of word prefixes, so a search only
+ * looks at tabs sharing those keys instead of walking the whole model. The
+ * index is kept up to date from the actions applied to the model.
+ */
+import { Actions, Action, Model, TabNode } from "flexlayout-react";
+
+export interface IndexedTab {
+  id: string;
+  name: string;
+}
+
+interface Entry extends IndexedTab {
+  text: string;
+  keys: string[];
+}
+
+const WORD_SEPARATOR = /[\s\-_.:/\\|()[\]]+/;
+
+const indexKeys = (text: string): string[] => {
+  const keys = new Set<string>();
+  for (const word of text.split(WORD_SEPARATOR)) {
+    if (word) {
+      keys.add(`p:${word.slice(0, 1)}`);
+      keys.add(`p:${word.slice(0, 2)}`);
+    }
+  }
+  for (let i = 0; i + 3 <= text.length; i++) {
+    keys.add(`t:${text.slice(i, i + 3)}`);
+  }
+  return Array.from(keys);
+};
+
+const queryKeys = (query: string): string[] => {
+  if (query.length < 3) {
+    return [`p:${query}`];
+  }
+  const keys = new Set<string>();
+  for (let i = 0; i + 3 <= query.length; i++) {
+    keys.add(`t:${query.slice(i, i + 3)}`);
+  }
+  return Array.from(keys);
+};
+
+// Lower is better: the name starts with the query, a word of it does, or it
+// only contains the query (or only the id matches)
+const rank = (entry: Entry, query: string) => {
+  const name = entry.name.toLowerCase();
+  if (name.startsWith(query)) {
+    return 0;
+  }
+  return name.split(WORD_SEPARATOR).some(word => word.startsWith(query)) ? 1 : 2;
+};
+
+export class TabIndex {
+  private readonly entries = new Map<string, Entry>();
+  private readonly postings = new Map<string, Set<string>>();
+
+  /**
+   * Build the index of every tab of a model, in the order of the model
+   */
+  static fromModel(model: Model): TabIndex {
+    const index = new TabIndex();
+    model.visitNodes(node => {
+      if (node.getType() === "tab") {
+        index.add(node.getId(), (node as TabNode).getName());
+      }
+    });
+    return index;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  has(id: string): boolean {
+    return this.entries.has(id);
+  }
+
+  /**
+   * Add a tab, or update its name
+   */
+  add(id: string, name: string): void {
+    this.remove(id);
+    const text = `${name}\n${id}`.toLowerCase();
+    const entry = { id, name, text, keys: indexKeys(text) };
+    this.entries.set(id, entry);
+    for (const key of entry.keys) {
+      let ids = this.postings.get(key);
+      if (!ids) {
+        ids = new Set();
+        this.postings.set(key, ids);
+      }
+      ids.add(id);
+    }
+  }
+
+  remove(id: string): void {
+    const entry = this.entries.get(id);
+    if (!entry) {
+      return;
+    }
+    this.entries.delete(id);
+    for (const key of entry.keys) {
+      const ids = this.postings.get(key)!;
+      ids.delete(id);
+      if (!ids.size) {
+        this.postings.delete(key);
+      }
+    }
+  }
+
+  /**
+   * Find the tabs whose name or id contains the query (or, for queries shorter
+   * than three characters, has a word starting with it)
+   * @param query Search text, case-insensitive
+   * @returns Matching tabs, best first. An empty query returns every tab.
+   */
+  search(query: string): IndexedTab[] {
+    const q = query.trim().toLowerCase();
+    if (!q) {
+      return Array.from(this.entries.values(), ({ id, name }) => ({ id, name }));
+    }
+
+    // Intersect the postings of the query's keys, smallest first
+    const sets = queryKeys(q).map(key => this.postings.get(key));
+    if (sets.some(ids => !ids)) {
+      return [];
+    }
+    sets.sort((a, b) => a!.size - b!.size);
+    let candidates = Array.from(sets[0]!);
+    for (const ids of sets.slice(1)) {
+      candidates = candidates.filter(id => ids!.has(id));
+    }
+
+    return candidates
+      .map(id => this.entries.get(id)!)
+      .filter(entry => q.length < 3 || entry.text.includes(q))
+      .map(entry => ({ entry, rank: rank(entry, q) }))
+      .sort((a, b) =>
+        a.rank - b.rank ||
+        a.entry.name.length - b.entry.name.length ||
+        a.entry.name.localeCompare(b.entry.name)
+      )
+      .map(({ entry: { id, name } }) => ({ id, name }));
+  }
+}
+
+/**
+ * Apply the effect of an action that was just applied to `model` to the index
+ * @returns false if the index can't follow the action and must be rebuilt
+ */
+export function updateTabIndex(index: TabIndex, action: Action, model: Model): boolean {
+  const data = action.data || {};
+  switch (action.type) {
+    case Actions.ADD_NODE: {
+      const json = data.json || {};
+      if ((json.type && json.type !== "tab") || !json.id) {
+        // A tabset or row of tabs, or a tab whose id FlexLayout generated
+        return false;
+      }
+      const node = model.getNodeById(json.id) as TabNode | undefined;
+      if (node) {
+        index.add(json.id, node.getName());
+      }
+      return true;
+    }
+    case Actions.DELETE_TAB:
+      index.remove(data.node);
+      return true;
+    case Actions.RENAME_TAB:
+      if (index.has(data.node)) {
+        index.add(data.node, data.text);
+      }
+      return true;
+    case Actions.UPDATE_NODE_ATTRIBUTES:
+      if (index.has(data.node) && data.json && data.json.name !== undefined) {
+        index.add(data.node, data.json.name);
+      }
+      return true;
+    case Actions.DELETE_TABSET:
+      return false;
+    default:
+      // Moves, selection, resizing etc. don't change names or the set of tabs
+      return true;
+  }
+}
@@ -0,0 +1,130 @@
+/**
+ * Coalesced resize notifications for tab content.
+ *
+ * FlexLayout fires a "resize" event on a TabNode for every change of its rect,
+ * which with `realtimeResize` means every frame of a splitter drag. The batcher
+ * collects these, waits until the pointer is released, and then on the next
+ * animation frame notifies each tab whose rect actually changed exactly once.
+ */
+
+/** Name of the DOM event dispatched on a tab's content element; it bubbles to window */
+export const TAB_RESIZE_EVENT = "dashdock:tabresize";
+
+export interface TabRect {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+export interface TabResize {
+  tabId: string;
+  rect: TabRect;
+}
+
+const sameRect = (a: TabRect, b: TabRect) =>
+  a.x === b.x && a.y === b.y && a.width === b.width && a.height === b.height;
+
+export class TabResizeBatcher {
+  private lastRects = new Map<string, TabRect>();
+  private pending = new Map<string, { rect: TabRect; element: HTMLElement | null }>();
+  private frame: number | null = null;
+  private held = false;
+
+  /**
+   * @param dockId Id of the dock, included in the event detail
+   * @param onFlush Called with the tabs notified in one batch
+   */
+  constructor(
+    private dockId: string | undefined,
+    private onFlush: (resized: TabResize[]) => void
+  ) {}
+
+  /**
+   * Record a new rect for a tab
+   * @param tabId Id of the tab
+   * @param rect The tab's new rect
+   * @param element The tab's content element, which the event is dispatched on
+   */
+  queue(tabId: string, rect: TabRect, element: HTMLElement | null): void {
+    const { x, y, width, height } = rect;
+    this.pending.set(tabId, { rect: { x, y, width, height }, element });
+    this.schedule();
+  }
+
+  /**
+   * Record the rect a tab is first rendered at, which FlexLayout may have
+   * reported before the tab's listener was added
+   * @param tabId Id of the tab
+   * @param rect The tab's current rect
+   */
+  track(tabId: string, rect: TabRect): void {
+    if (!this.lastRects.has(tabId) && rect.width > 0 && rect.height > 0) {
+      const { x, y, width, height } = rect;
+      this.lastRects.set(tabId, { x, y, width, height });
+    }
+  }
+
+  /** Hold notifications while a drag is in progress */
+  hold(): void {
+    this.held = true;
+  }
+
+  /** Release held notifications, e.g. when the pointer is released */
+  release(): void {
+    this.held = false;
+    this.schedule();
+  }
+
+  /** Forget a tab that is no longer rendered */
+  remove(tabId: string): void {
+    this.lastRects.delete(tabId);
+    this.pending.delete(tabId);
+  }
+
+  dispose(): void {
+    if (this.frame !== null) {
+      window.cancelAnimationFrame(this.frame);
+      this.frame = null;
+    }
+    this.pending.clear();
+  }
+
+  private schedule(): void {
+    if (this.held || this.frame !== null || this.pending.size === 0) {
+      return;
+    }
+    this.frame = window.requestAnimationFrame(() => {
+      this.frame = null;
+      this.flush();
+    });
+  }
+
+  private flush(): void {
+    if (this.held) {
+      return;
+    }
+    const resized: TabResize[] = [];
+    this.pending.forEach(({ rect, element }, tabId) => {
+      const last = this.lastRects.get(tabId);
+      this.lastRects.set(tabId, rect);
+      // The first rect of a tab is its initial size, not a resize
+      if (!last || sameRect(last, rect)) {
+        return;
+      }
+      resized.push({ tabId, rect });
+      if (element) {
+        element.dispatchEvent(
+          new CustomEvent(TAB_RESIZE_EVENT, {
+            bubbles: true,
+            detail: { dockId: this.dockId, tabId, ...rect }
+          })
+        );
+      }
+    });
+    this.pending.clear();
+    if (resized.length > 0) {
+      this.onFlush(resized);
+    }
+  }
+}
@@ -0,0 +1,54 @@
+/**
+ * Virtualized tab strips. With hundreds of tabs in a tabset, only a window of
+ * tab buttons around the selected tab is rendered, and every tab can be reached
+ * through a searchable menu listing the tabs by position.
+ */
+
+export interface StripTab {
+  id: string;
+  name: string;
+  /** Position of the tab in its tabset or border */
+  index: number;
+}
+
+/**
+ * Range of tab buttons to render
+ * @param count Number of tabs in the tabset or border
+ * @param selected Index of the selected tab, or -1
+ * @param size Maximum number of buttons to render
+ * @returns `[start, end)` tab indices, centred on the selected tab where possible
+ */
+export function tabWindow(count: number, selected: number, size: number): [number, number] {
+  if (count <= size) {
+    return [0, count];
+  }
+  const start = Math.min(Math.max(selected - Math.floor(size / 2), 0), count - size);
+  return [start, start + size];
+}
+
+/**
+ * Incremental case-insensitive search over the names and ids of a list of tabs.
+ * While the query is only extended (one keystroke at a time), each search only
+ * re-checks the matches of the previous one.
+ */
+export class TabListSearch {
+  private readonly keys: string[];
+  private lastQuery = "";
+  private lastMatches: number[];
+
+  constructor(private readonly tabs: StripTab[]) {
+    this.keys = tabs.map(tab => `${tab.name}\n${tab.id}`.toLowerCase());
+    this.lastMatches = tabs.map((_, i) => i);
+  }
+
+  search(query: string): StripTab[] {
+    const q = query.trim().toLowerCase();
+    const candidates = q.startsWith(this.lastQuery)
+      ? this.lastMatches
+      : this.tabs.map((_, i) => i);
+    const matches = q ? candidates.filter(i => this.keys[i].includes(q)) : candidates;
+    this.lastQuery = q;
+    this.lastMatches = matches;
+    return matches.map(i => this.tabs[i]);
+  }
+}
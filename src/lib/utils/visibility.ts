@@ -0,0 +1,84 @@
+import type { Model, Node, TabNode, TabSetNode, BorderNode } from "flexlayout-react";
+
+/**
+ * Which tabs of a dock are currently on screen, as published through the
+ * `visibleTabIds` / `activeTabId` props
+ */
+export interface TabVisibility {
+  visibleTabIds: string[];
+  activeTabId: string | null;
+}
+
+const selectedTabId = (node: TabSetNode | BorderNode): string | undefined => {
+  const selected = node.getSelectedNode() as TabNode | undefined;
+  return selected ? selected.getId() : undefined;
+};
+
+/**
+ * Work out the visible tabs of a model: the selected tab of every tabset (only
+ * the maximized tabset, when one is maximized) and of every open border.
+ * Ids are returned in document order, borders first.
+ * @param model Live FlexLayout model
+ */
+export function getTabVisibility(model: Model): TabVisibility {
+  const visibleTabIds: string[] = [];
+
+  model.getBorderSet().getBorders().forEach((border: BorderNode) => {
+    const tabId = selectedTabId(border);
+    if (tabId !== undefined) {
+      visibleTabIds.push(tabId);
+    }
+  });
+
+  const maximized = model.getMaximizedTabset();
+  if (maximized) {
+    const tabId = selectedTabId(maximized);
+    if (tabId !== undefined) {
+      visibleTabIds.push(tabId);
+    }
+  } else {
+    model.visitNodes((node: Node) => {
+      if (node.getType() === "tabset") {
+        const tabId = selectedTabId(node as TabSetNode);
+        if (tabId !== undefined) {
+          visibleTabIds.push(tabId);
+        }
+      }
+    });
+  }
+
+  const active = model.getActiveTabset();
+  const activeTabId = (active && selectedTabId(active)) || null;
+
+  return { visibleTabIds, activeTabId };
+}
+
+/**
+ * Whether a tab is on screen: selected in an open border, or selected in a
+ * tabset while no other tabset of its window is maximized. Follow changes
+ * through the tab's `"visibility"` event.
+ */
+export function isTabVisible(node: TabNode): boolean {
+  const parent = node.getParent();
+  if (!parent || !node.isSelected()) {
+    return false;
+  }
+  if (parent.getType() === "border") {
+    // A collapsed border has no selected tab
+    return true;
+  }
+  const maximized = node.getModel().getMaximizedTabset(node.getWindowId());
+  return !maximized || maximized === parent;
+}
+
+/**
+ * Compare two visibility states
+ */
+export function sameVisibility(a: TabVisibility | undefined, b: TabVisibility): boolean {
+  return (
+    !!a &&
+    a.activeTabId === b.activeTabId &&
+    a.visibleTabIds.length === b.visibleTabIds.length &&
+    a.visibleTabIds.every((tabId, i) => tabId === b.visibleTabIds[i])
+  );
+}
@@ -0,0 +1,99 @@
+import importlib
+import json
+import os
+import sys
+
+import dash
+import pytest
+from dash import html
+
+import dash_dock
+from dash_dock._assets import load_asset_manifest, register_immutable_cache
+
+
+def _client(**kwargs):
+    app = dash.Dash(__name__, **kwargs)
+    app.layout = html.Div([dash_dock.DashDock([], id="dock", model={"layout": {}})])
+    return app.server.test_client()
+
+
+def test_async_resources_are_built():
+    for resource in dash_dock.async_resources:
+        path = os.path.join(
+            os.path.dirname(dash_dock.__file__), dash_dock._asset("async-{}.js".format(resource))
+        )
+        assert os.path.exists(path)
+
+
+def test_eager_loading_serves_every_registered_script():
+    client = _client(eager_loading=True)
+    page = client.get("/")
+    assert page.status_code == 200
+    for resource in dash_dock.DashDock._js_dist:
+        if resource.get("dynamic"):
+            continue
+        url = "/_dash-component-suites/dash_dock/" + resource["relative_package_path"]
+        assert client.get(url).status_code == 200, url
+
+
+def test_load_asset_manifest(tmp_path):
+    (tmp_path / "dash_dock-manifest.json").write_text(
+        json.dumps({"dash_dock.min.js": "dash_dock.1a2b3c4d.min.js"})
+    )
+    assert load_asset_manifest(str(tmp_path), "dash_dock") == {
+        "dash_dock.min.js": "dash_dock.1a2b3c4d.min.js"
+    }
+
+
+def test_load_asset_manifest_missing(tmp_path):
+    assert load_asset_manifest(str(tmp_path), "dash_dock") == {}
+
+
+def test_asset_falls_back_to_unhashed_name(monkeypatch):
+    monkeypatch.setattr(dash_dock, "_asset_manifest", {"dash_dock.min.js": "dash_dock.1a2b3c4d.min.js"})
+    assert dash_dock._asset("dash_dock.min.js") == "dash_dock.1a2b3c4d.min.js"
+    assert dash_dock._asset("async-dashdock.js") == "async-dashdock.js"
+
+
+HASHED = "immutable_pkg.1a2b3c4d.min.js"
+UNHASHED = "immutable_pkg.min.js"
+
+register_immutable_cache("immutable_pkg", [HASHED])
+
+
+@pytest.fixture
+def suite_client(tmp_path, monkeypatch):
+    package = tmp_path / "immutable_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("__version__ = '1.0.0'\n")
+    for name in (HASHED, UNHASHED):
+        (package / name).write_text("// bundle\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(sys.modules, "immutable_pkg", importlib.import_module("immutable_pkg"))
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    app.registered_paths["immutable_pkg"].update([HASHED, UNHASHED])
+    return app.server.test_client()
+
+
+def _cache_control(client, filename):
+    response = client.get("/_dash-component-suites/immutable_pkg/" + filename)
+    assert response.status_code == 200
+    return response.headers.get("Cache-Control", "")
+
+
+def test_hashed_bundle_is_immutable(suite_client):
+    # Dash's fingerprint goes after the first dot, before the content hash
+    assert "immutable" in _cache_control(suite_client, "immutable_pkg.v1_0_0m123.1a2b3c4d.min.js")
+
+
+def test_unhashed_bundle_is_not_immutable(suite_client):
+    cache_control = _cache_control(suite_client, "immutable_pkg.v1_0_0m123.min.js")
+    assert "max-age" in cache_control
+    assert "immutable" not in cache_control
+
+
+def test_hashed_bundle_without_dash_fingerprint_is_not_immutable(suite_client):
+    # Served with an etag for revalidation, so it must not be marked immutable
+    assert "immutable" not in _cache_control(suite_client, HASHED)
@@ -0,0 +1,91 @@
+import pytest
+from dash import ALL, MATCH, Input, Output, dcc, html
+
+import dash_dock
+
+
+def _dock():
+    return dash_dock.DashDock(
+        id="dock",
+        model={"global": {}, "layout": {"type": "row", "children": []}},
+        children=[
+            dash_dock.Tab(id="report", children=html.Div([dcc.Graph(id="report-graph")])),
+            dash_dock.Tab(id="logs", children=html.Pre(id="log-text")),
+            dash_dock.Tab(
+                id={"type": "panel", "index": 1},
+                children=html.Div(id={"type": "panel-body", "index": 1}),
+            ),
+            dash_dock.Tab(
+                id={"type": "panel", "index": 2},
+                children=html.Div(id={"type": "panel-body", "index": 2}),
+            ),
+        ],
+    )
+
+
+def _ids(inputs):
+    return [(dep.component_id, dep.component_property) for dep in inputs]
+
+
+def test_tab_cancel_inputs():
+    dock = _dock()
+    assert _ids(dash_dock.tab_cancel_inputs(dock, Output("report-graph", "figure"))) == [
+        ("report", "hiddenAt"),
+    ]
+    assert _ids(dash_dock.tab_cancel_inputs(
+        dock, [Output("log-text", "children"), Output("report-graph", "figure")], on="closedAt"
+    )) == [("report", "closedAt"), ("logs", "closedAt")]
+    # A callback updating the tab itself
+    assert _ids(dash_dock.tab_cancel_inputs(dock, Output("logs", "children"))) == [
+        ("logs", "hiddenAt"),
+    ]
+    assert dash_dock.tab_cancel_inputs(dock, Output("elsewhere", "children")) == []
+
+
+def test_tab_cancel_inputs_pattern_matching():
+    dock = _dock()
+    # One job updates every panel, so hiding any of them cancels it
+    assert _ids(dash_dock.tab_cancel_inputs(
+        dock, Output({"type": "panel-body", "index": ALL}, "children")
+    )) == [({"type": "panel", "index": 1}, "hiddenAt"), ({"type": "panel", "index": 2}, "hiddenAt")]
+    assert _ids(dash_dock.tab_cancel_inputs(
+        dock, Output({"type": "panel-body", "index": 2}, "children")
+    )) == [({"type": "panel", "index": 2}, "hiddenAt")]
+    assert dash_dock.tab_cancel_inputs(
+        dock, Output({"type": "other", "index": ALL}, "children")
+    ) == []
+
+
+def test_tab_cancel_inputs_rejects_match_outputs():
+    # Every panel runs its own job, which hiding another panel must not cancel
+    with pytest.raises(ValueError):
+        dash_dock.tab_cancel_inputs(_dock(), Output({"type": "panel-body", "index": MATCH}, "children"))
+
+
+def test_tab_cancel_inputs_rejects_unknown_event():
+    with pytest.raises(ValueError):
+        dash_dock.tab_cancel_inputs(_dock(), Output("report-graph", "figure"), on="removed")
+
+
+class _App:
+    def __init__(self):
+        self.registered = None
+
+    def callback(self, *args, **kwargs):
+        self.registered = args, kwargs
+        return lambda func: func
+
+
+def test_background_tab_callback_adds_cancel_inputs():
+    app = _App()
+    dash_dock.background_tab_callback(
+        _dock(),
+        Output("report-graph", "figure"),
+        Input("run", "n_clicks"),
+        app=app,
+        cancel=Input("stop", "n_clicks"),
+    )
+    args, kwargs = app.registered
+    assert kwargs["background"] is True
+    assert _ids(kwargs["cancel"]) == [("stop", "n_clicks"), ("report", "hiddenAt")]
+    assert len(args) == 2
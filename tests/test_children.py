@@ -0,0 +1,95 @@
+from dash import html
+
+import dash_dock
+
+MODEL = {
+    "global": {},
+    "borders": [
+        {"type": "border", "location": "left", "children": [
+            {"type": "tab", "id": "explorer", "name": "Explorer"},
+        ]},
+    ],
+    "layout": {
+        "type": "row",
+        "children": [
+            {"type": "tabset", "id": "main", "children": [
+                {"type": "tab", "id": "a", "name": "A"},
+                {"type": "tab", "id": '{"index":1,"type":"panel"}', "name": "Panel 1"},
+            ]},
+        ],
+    },
+}
+
+
+def _as_state(component):
+    return {"type": component._type, "namespace": component._namespace, "props": {
+        prop: getattr(component, prop) for prop in component._prop_names if hasattr(component, prop)
+    }}
+
+
+def test_child_tab_id():
+    assert dash_dock.child_tab_id(dash_dock.Tab(id="a")) == "a"
+    assert dash_dock.child_tab_id(dash_dock.Tab(id={"type": "panel", "index": 1})) == '{"index":1,"type":"panel"}'
+    assert dash_dock.child_tab_id(html.Div()) is None
+
+
+def test_child_tab_id_of_state_children():
+    # Children passed in as a State are plain dicts
+    assert dash_dock.child_tab_id(_as_state(dash_dock.Tab(id="a"))) == "a"
+    assert dash_dock.child_tab_id(
+        _as_state(dash_dock.Tab(id={"type": "panel", "index": 1}))
+    ) == '{"index":1,"type":"panel"}'
+    assert dash_dock.child_tab_id(_as_state(html.Div())) is None
+
+
+def test_prune_orphan_children():
+    children = [
+        dash_dock.Tab(id="explorer"),
+        dash_dock.Tab(id="closed-earlier"),
+        dash_dock.Tab(id="a"),
+        dash_dock.Tab(id={"type": "panel", "index": 1}),
+        dash_dock.Tab(id={"type": "panel", "index": 2}),
+        html.Div("no id"),
+    ]
+    kept, dropped = dash_dock.prune_orphan_children(MODEL, children)
+    assert [dash_dock.child_tab_id(child) for child in kept] == [
+        "explorer", "a", '{"index":1,"type":"panel"}',
+    ]
+    assert dropped == ["closed-earlier", '{"index":2,"type":"panel"}', None]
+
+
+def test_prune_orphan_children_of_state_children():
+    children = [
+        _as_state(dash_dock.Tab(id="a")),
+        _as_state(dash_dock.Tab(id="closed-earlier")),
+        _as_state(dash_dock.Tab(id={"type": "panel", "index": 1})),
+    ]
+    kept, dropped = dash_dock.prune_orphan_children(MODEL, children)
+    assert kept == [children[0], children[2]]
+    assert dropped == ["closed-earlier"]
+
+
+def test_prune_orphan_children_single_child():
+    kept, dropped = dash_dock.prune_orphan_children(MODEL, dash_dock.Tab(id="a"))
+    assert len(kept) == 1 and dropped == []
+
+
+def test_pattern_matching_tabs():
+    tabs, children = dash_dock.pattern_matching_tabs(
+        "panel", [1, 2], name="Panel {}", content=lambda index: html.Div(index), enableClose=False,
+    )
+    assert tabs == [
+        {"type": "tab", "id": '{"index":1,"type":"panel"}', "name": "Panel 1", "enableClose": False},
+        {"type": "tab", "id": '{"index":2,"type":"panel"}', "name": "Panel 2", "enableClose": False},
+    ]
+    assert [child.id for child in children] == [{"type": "panel", "index": 1}, {"type": "panel", "index": 2}]
+    assert children[1].children.children == 2
+
+    model = {"layout": {"type": "row", "children": [{"type": "tabset", "children": tabs}]}}
+    kept, dropped = dash_dock.prune_orphan_children(model, children)
+    assert len(kept) == 2 and dropped == []
+
+
+def test_stringify_tab_id():
+    assert dash_dock.stringify_tab_id("a") == "a"
+    assert dash_dock.stringify_tab_id({"type": "ticker", "index": "É"}) == '{"index":"É","type":"ticker"}'
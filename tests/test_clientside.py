@@ -0,0 +1,141 @@
+import dash
+from dash import Input, Output, html
+
+import dash_dock
+
+MODEL = {
+    "global": {},
+    "layout": {
+        "type": "row",
+        "children": [
+            {"type": "tabset", "id": "left", "children": [
+                {"type": "tab", "id": "tab-1", "name": "Tab 1"},
+                {"type": "tab", "id": "tab-2", "name": "Tab 2"},
+            ]},
+            {"type": "tabset", "id": "right", "children": [
+                {"type": "tab", "id": "tab-3", "name": "Tab 3"},
+            ]},
+        ],
+    },
+}
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model=MODEL,
+            children=[
+                dash_dock.Tab(id="tab-{}".format(i), children=html.Div("Content {}".format(i)))
+                for i in range(1, 4)
+            ],
+            # Room for the tabs the tests add
+            freeTabLimit=10,
+            style={"height": "400px", "position": "relative"},
+        ),
+        html.Div(id="reported"),
+    ])
+
+    # Layout changes made in the browser still reach the server
+    @app.callback(Output("reported", "children"), Input("dock", "model"), prevent_initial_call=True)
+    def report(model):
+        return ",".join(
+            tab["id"] for tabset in model["layout"]["children"] for tab in tabset["children"]
+        )
+
+    return app
+
+
+def _call(dash_duo, call):
+    return dash_duo.driver.execute_script("return window.dash_clientside.dash_dock." + call + ";")
+
+
+def _tabsets(dash_duo):
+    return {
+        tabset["id"]: tabset
+        for tabset in _call(dash_duo, "getModel('dock')")["layout"]["children"]
+    }
+
+
+def _start(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Content 1")
+
+
+def test_select_tab(dash_duo):
+    _start(dash_duo)
+    assert _call(dash_duo, "selectTab('dock', 'tab-2')") is True
+    dash_duo.wait_for_contains_text("#dock", "Content 2")
+    assert _tabsets(dash_duo)["left"].get("selected") == 1
+
+
+def test_focus_tab(dash_duo):
+    _start(dash_duo)
+    assert _call(dash_duo, "focusTab('dock', 'tab-3')") is True
+    assert _tabsets(dash_duo)["right"].get("active") is True
+
+
+def test_add_and_delete_tab(dash_duo):
+    _start(dash_duo)
+    assert _call(dash_duo, "addTab('dock', {id: 'tab-4', name: 'Added'}, 'right')") is True
+    dash_duo.wait_for_text_to_equal("#reported", "tab-1,tab-2,tab-3,tab-4")
+    assert _call(dash_duo, "deleteTab('dock', 'tab-1')") is True
+    dash_duo.wait_for_text_to_equal("#reported", "tab-2,tab-3,tab-4")
+
+
+def test_open_tab(dash_duo):
+    _start(dash_duo)
+    # An open tab is selected rather than added again
+    assert _call(dash_duo, "openTab('dock', {id: 'tab-2', name: 'Tab 2'})") is True
+    assert _call(dash_duo, "openTab('dock', {id: 'tab-4', name: 'Opened'}, 'right')") is True
+    tabsets = _tabsets(dash_duo)
+    assert tabsets["left"].get("selected") == 1
+    assert [tab["id"] for tab in tabsets["right"]["children"]] == ["tab-3", "tab-4"]
+
+
+def test_rename_and_update_attributes(dash_duo):
+    _start(dash_duo)
+    assert _call(dash_duo, "renameTab('dock', 'tab-1', 'Renamed')") is True
+    assert _call(dash_duo, "updateNodeAttributes('dock', 'tab-2', {enableClose: false})") is True
+    tabs = _tabsets(dash_duo)["left"]["children"]
+    assert tabs[0]["name"] == "Renamed"
+    assert tabs[1]["enableClose"] is False
+
+
+def test_maximize_toggle(dash_duo):
+    _start(dash_duo)
+    assert _call(dash_duo, "maximizeToggle('dock', 'right')") is True
+    assert _tabsets(dash_duo)["right"].get("maximized") is True
+    assert _call(dash_duo, "maximizeToggle('dock', 'right')") is True
+    assert not _tabsets(dash_duo)["right"].get("maximized")
+
+
+def test_reset_layout(dash_duo):
+    _start(dash_duo)
+    _call(dash_duo, "deleteTab('dock', 'tab-1')")
+    dash_duo.wait_for_text_to_equal("#reported", "tab-2,tab-3")
+    assert _call(dash_duo, "resetLayout('dock')") is True
+    dash_duo.wait_for_text_to_equal("#reported", "tab-1,tab-2,tab-3")
+    assert [tab["id"] for tab in _tabsets(dash_duo)["left"]["children"]] == ["tab-1", "tab-2"]
+
+
+def test_unknown_dock(dash_duo):
+    _start(dash_duo)
+    for call in [
+        "selectTab('missing', 'tab-1')",
+        "focusTab('missing', 'tab-1')",
+        "addTab('missing', {id: 'tab-4', name: 'Added'})",
+        "openTab('missing', {id: 'tab-4', name: 'Added'})",
+        "deleteTab('missing', 'tab-1')",
+        "renameTab('missing', 'tab-1', 'Renamed')",
+        "maximizeToggle('missing', 'left')",
+        "updateNodeAttributes('missing', 'tab-1', {enableClose: false})",
+        "resetLayout('missing')",
+        "openQuickSwitcher('missing')",
+    ]:
+        assert _call(dash_duo, call) is False, call
+    assert _call(dash_duo, "getModel('missing')") is None
+    assert _call(dash_duo, "getStats('missing')") is None
+    # Nothing was applied to the mounted dock
+    assert [tab["id"] for tab in _tabsets(dash_duo)["left"]["children"]] == ["tab-1", "tab-2"]
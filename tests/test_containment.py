@@ -0,0 +1,70 @@
+import dash
+from dash import Input, Output, html
+
+import dash_dock
+
+N_TABS = 50
+TABS_PER_TABSET = 10
+ROWS_PER_TAB = 200
+
+CONTENT_VISIBILITY = """
+return Array.from(document.querySelectorAll('#dock .dash-dock-tab-content'))
+    .map(el => getComputedStyle(el).contentVisibility);
+"""
+
+
+def _app():
+    tabsets = [
+        {
+            "type": "tabset",
+            "children": [
+                {"type": "tab", "id": "tab-{}".format(i), "name": "Tab {}".format(i)}
+                for i in range(start, start + TABS_PER_TABSET)
+            ],
+        }
+        for start in range(0, N_TABS, TABS_PER_TABSET)
+    ]
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button("Toggle containment", id="toggle"),
+        dash_dock.DashDock(
+            id="dock",
+            model={"global": {}, "layout": {"type": "row", "children": tabsets}},
+            children=[
+                dash_dock.Tab(
+                    id="tab-{}".format(i),
+                    children=[html.Div("Row {}".format(j))
+                              for j in range(ROWS_PER_TAB)],
+                )
+                for i in range(N_TABS)
+            ],
+            freeTabLimit=N_TABS,
+            style={"height": "600px", "position": "relative"},
+        ),
+    ])
+
+    @app.callback(Output("dock", "tabContainment"), Input("toggle", "n_clicks"), prevent_initial_call=True)
+    def toggle(n_clicks):
+        return n_clicks % 2 == 1
+
+    return app
+
+
+def _content_visibility(dash_duo):
+    return dash_duo.driver.execute_script(CONTENT_VISIBILITY)
+
+
+def test_containment_is_toggled(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock .dash-dock-tab-content", "Row 0")
+    # Containment is off by default
+    assert set(_content_visibility(dash_duo)) == {"visible"}
+
+    dash_duo.find_element("#toggle").click()
+    dash_duo.wait_for_element("#dock.dash-dock-contained")
+    # Every rendered tab is visible: one per tabset
+    assert _content_visibility(dash_duo) == ["auto"] * (N_TABS // TABS_PER_TABSET)
+
+    dash_duo.find_element("#toggle").click()
+    dash_duo.wait_for_no_elements("#dock.dash-dock-contained")
+    assert set(_content_visibility(dash_duo)) == {"visible"}
@@ -0,0 +1,82 @@
+import time
+
+import dash
+from dash import Input, Output, html
+
+import dash_dock
+
+RENAMES = 20
+
+
+# Idle callbacks that never run, so deferred reports stay pending
+NEVER_IDLE = "window.requestIdleCallback = () => 1; window.cancelIdleCallback = () => {};"
+
+
+def _dock(content):
+    return dash_dock.DashDock(
+        id="dock",
+        model={
+            "global": {},
+            "layout": {
+                "type": "row",
+                "children": [{
+                    "type": "tabset",
+                    "children": [{"type": "tab", "id": "tab-1", "name": "Tab 1"}],
+                }],
+            },
+        },
+        children=[dash_dock.Tab(id="tab-1", children=html.Div(content))],
+        deferModelUpdates=True,
+        style={"height": "400px", "position": "relative"},
+    )
+
+
+def _app(reports):
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button("Replace", id="replace"),
+        html.Div(_dock("Content"), id="container"),
+        html.Div(id="reported"),
+    ])
+
+    @app.callback(Output("container", "children"), Input("replace", "n_clicks"), prevent_initial_call=True)
+    def replace(n_clicks):
+        return _dock("Replaced")
+
+    @app.callback(Output("reported", "children"), Input("dock", "model"), prevent_initial_call=True)
+    def report(model):
+        reports.append(model)
+        return model["layout"]["children"][0]["children"][0]["name"]
+
+    return app
+
+
+def test_burst_of_actions_is_reported_once(dash_duo):
+    reports = []
+    dash_duo.start_server(_app(reports))
+    dash_duo.wait_for_contains_text("#dock", "Content")
+
+    dash_duo.driver.execute_script(
+        "for (let i = 0; i < {}; i++) {{"
+        "window.dash_clientside.dash_dock.renameTab('dock', 'tab-1', 'Name ' + i);"
+        "}}".format(RENAMES)
+    )
+    dash_duo.wait_for_text_to_equal("#reported", "Name {}".format(RENAMES - 1))
+    assert len(reports) == 1
+
+
+def test_pending_report_is_dropped_when_the_dock_is_replaced(dash_duo):
+    reports = []
+    dash_duo.start_server(_app(reports))
+    dash_duo.wait_for_contains_text("#dock", "Content")
+
+    dash_duo.driver.execute_script(
+        NEVER_IDLE + "window.dash_clientside.dash_dock.renameTab('dock', 'tab-1', 'Stale');"
+    )
+    dash_duo.find_element("#replace").click()
+    dash_duo.wait_for_contains_text("#dock", "Replaced")
+    # Dash fires the callback for the model of the new dock; give a late report
+    # of the old one the time to reach the server too
+    time.sleep(1)
+    assert [report["layout"]["children"][0]["children"][0]["name"] for report in reports] == ["Tab 1"]
+    assert dash_duo.find_element("#reported").text == "Tab 1"
@@ -0,0 +1,51 @@
+import dash
+from dash import html
+from selenium.webdriver.common.action_chains import ActionChains
+
+import dash_dock
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {"type": "row", "children": [
+                    {"type": "tabset", "children": [
+                        {"type": "tab", "id": "chart", "name": "Chart", "config": {"heavy": True}},
+                    ]},
+                    {"type": "tabset", "children": [
+                        {"type": "tab", "id": "notes", "name": "Notes"},
+                    ]},
+                ]},
+            },
+            children=[
+                dash_dock.Tab(id="chart", children=html.Div("Chart content")),
+                dash_dock.Tab(id="notes", children=html.Div("Notes content")),
+            ],
+            dragPlaceholders=True,
+            realtimeResize=True,
+            style={"height": "400px", "position": "relative"},
+        ),
+    ])
+    return app
+
+
+def test_heavy_tab_shows_placeholder_while_dragging(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Notes content")
+    dash_duo.wait_for_no_elements("#dock .dash-dock-tab-placeholder")
+
+    splitter = dash_duo.find_element("#dock .flexlayout__splitter")
+    ActionChains(dash_duo.driver).click_and_hold(splitter).move_by_offset(20, 0).perform()
+    # Only the heavy tab is replaced
+    dash_duo.wait_for_text_to_equal("#dock .dash-dock-tab-placeholder", "Chart")
+    assert len(dash_duo.find_elements("#dock .dash-dock-tab-placeholder")) == 1
+    assert len(dash_duo.find_elements("#dock .dash-dock-tab-content--frozen")) == 1
+
+    ActionChains(dash_duo.driver).move_by_offset(20, 0).release().perform()
+    dash_duo.wait_for_no_elements("#dock .dash-dock-tab-placeholder")
+    assert dash_duo.find_elements("#dock .dash-dock-tab-content--frozen") == []
+    dash_duo.wait_for_contains_text("#dock", "Chart content")
@@ -0,0 +1,89 @@
+import dash
+from dash import Input, Output, Patch, html
+
+import dash_dock
+
+N_TABS = 200
+TABS_PER_TABSET = 20
+
+GET_STATS = "return window.dash_clientside.dash_dock.getStats('dock');"
+
+
+def _app():
+    tabsets = [
+        {
+            "type": "tabset",
+            "children": [
+                {"type": "tab", "id": "tab-{}".format(i), "name": "Tab {}".format(i)}
+                for i in range(start, start + TABS_PER_TABSET)
+            ],
+        }
+        for start in range(0, N_TABS, TABS_PER_TABSET)
+    ]
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button("Restyle", id="restyle"),
+        html.Button("Rename header", id="rename"),
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                # Stacked, so the first tab buttons of every tabset fit the window
+                "layout": {"type": "row", "children": [{"type": "row", "children": tabsets}]},
+            },
+            children=[
+                dash_dock.Tab(id="tab-{}".format(i), children=html.Div("Content {}".format(i)))
+                for i in range(N_TABS)
+            ],
+            headers={
+                "tab-{}".format(i): html.Span("Header {}".format(i), className="bench-header")
+                for i in range(N_TABS)
+            },
+            freeTabLimit=N_TABS,
+            style={"height": "600px", "position": "relative"},
+        ),
+    ])
+
+    @app.callback(Output("dock", "style"), Input("restyle", "n_clicks"), prevent_initial_call=True)
+    def restyle(n_clicks):
+        # Re-renders the dock with the same headers
+        return {"height": "{}px".format(600 + n_clicks), "position": "relative"}
+
+    @app.callback(Output("dock", "headers"), Input("rename", "n_clicks"), prevent_initial_call=True)
+    def rename(n_clicks):
+        headers = Patch()
+        headers["tab-0"] = html.Span("Renamed", className="bench-header")
+        return headers
+
+    return app
+
+
+def _header_renders(dash_duo):
+    return dash_duo.driver.execute_script(GET_STATS)["headerRenders"]
+
+
+def test_headers_are_not_rerendered(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Header 0")
+    initial = _header_renders(dash_duo)
+    assert 0 < initial <= N_TABS
+
+    # Selecting tabs re-renders the layout, and with it every tab button
+    for start in range(0, N_TABS, TABS_PER_TABSET):
+        dash_duo.driver.execute_script(
+            "Array.from(document.querySelectorAll('#dock .flexlayout__tab_button'))"
+            ".find(b => b.textContent === 'Header {}').click();".format(start + 1)
+        )
+        dash_duo.wait_for_contains_text("#dock", "Content {}".format(start + 1))
+    assert _header_renders(dash_duo) == initial
+
+    # Re-rendering the dock from Dash hands over new header elements
+    for _ in range(3):
+        dash_duo.find_element("#restyle").click()
+    dash_duo.wait_for_style_to_equal("#dock", "height", "603px")
+    assert _header_renders(dash_duo) == initial
+
+    # Only the changed header is rebuilt
+    dash_duo.find_element("#rename").click()
+    dash_duo.wait_for_contains_text("#dock", "Renamed")
+    assert _header_renders(dash_duo) == initial + 1
@@ -0,0 +1,79 @@
+import dash
+from dash import Input, Output, Patch, html
+
+import dash_dock
+
+TABS = ["a", "b", "c", "d"]
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button("Notify", id="notify"),
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {"type": "row", "children": [{
+                    "type": "tabset",
+                    "children": [
+                        {"type": "tab", "id": tab_id, "name": "Tab {}".format(tab_id.upper())}
+                        for tab_id in TABS
+                    ],
+                }]},
+            },
+            children=[dash_dock.Tab(id=tab_id, children=html.Div("Content {}".format(tab_id))) for tab_id in TABS],
+            headerSpecs={
+                "a": {"badge": 0},
+                "b": {"badge": None},
+                "c": {"icon": "bi bi-graph-up", "text": "Custom C", "badge": 3},
+                "d": {"icon": "bi bi-table", "text": "Spec D"},
+            },
+            headers={"d": html.Span("Header D")},
+            freeTabLimit=len(TABS),
+            style={"height": "400px", "position": "relative"},
+        ),
+    ])
+
+    @app.callback(Output("dock", "headerSpecs"), Input("notify", "n_clicks"), prevent_initial_call=True)
+    def notify(n_clicks):
+        specs = Patch()
+        specs["a"]["badge"] = n_clicks % 2
+        return specs
+
+    return app
+
+
+def _buttons(dash_duo):
+    return dict(zip(TABS, dash_duo.find_elements("#dock .flexlayout__tab_button")))
+
+
+def _badges(button):
+    return [badge.text for badge in button.find_elements("css selector", ".dash-dock-tab-badge")]
+
+
+def test_header_specs(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_text_to_equal("#dock .dash-dock-tab-badge", "3")
+    buttons = _buttons(dash_duo)
+
+    # Badges of 0 and null are hidden, and the text defaults to the tab name
+    assert buttons["a"].text == "Tab A"
+    assert _badges(buttons["a"]) == []
+    assert buttons["b"].text == "Tab B"
+    assert _badges(buttons["b"]) == []
+
+    assert buttons["c"].text == "Custom C\n3"
+    assert _badges(buttons["c"]) == ["3"]
+    assert buttons["c"].find_elements("css selector", "i.dash-dock-tab-icon.bi-graph-up")
+
+    # headers takes precedence over the spec's text, but keeps its icon
+    assert buttons["d"].text == "Header D"
+    assert buttons["d"].find_elements("css selector", "i.dash-dock-tab-icon.bi-table")
+
+    # A badge patched in shows up, and is hidden again when back to 0
+    dash_duo.find_element("#notify").click()
+    dash_duo.wait_for_text_to_equal("#dock .flexlayout__tab_button .dash-dock-tab-badge", "1")
+    dash_duo.find_element("#notify").click()
+    dash_duo.wait_for_text_to_equal("#dock .flexlayout__tab_button .dash-dock-tab-badge", "3")
+    assert _badges(_buttons(dash_duo)["a"]) == []
@@ -0,0 +1,61 @@
+import time
+
+import dash
+from dash import Input, Output, html
+from dash.testing.wait import until
+
+import dash_dock
+
+
+def _app():
+    tabs = [
+        {"type": "tab", "id": "shown", "name": "Shown"},
+        {"type": "tab", "id": "hidden", "name": "Hidden"},
+    ]
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {
+                    "type": "row",
+                    "children": [{"type": "tabset", "id": "tabset", "selected": 0, "children": tabs}],
+                },
+            },
+            children=[
+                dash_dock.Tab(id="shown", children=dash_dock.DockInterval(id="shown-interval", interval=100)),
+                dash_dock.Tab(id="hidden", children=dash_dock.DockInterval(id="hidden-interval", interval=100)),
+            ],
+            style={"height": "300px", "position": "relative"},
+        ),
+        html.Div(id="shown-count"),
+        html.Div(id="hidden-count"),
+    ])
+
+    for name in ["shown", "hidden"]:
+        app.callback(
+            Output("{}-count".format(name), "children"),
+            Input("{}-interval".format(name), "n_intervals"),
+        )(lambda n_intervals: str(n_intervals or 0))
+
+    return app
+
+
+def _count(dash_duo, name):
+    return int(dash_duo.find_element("#{}-count".format(name)).text or 0)
+
+
+def test_interval_paused_in_hidden_tab(dash_duo):
+    dash_duo.start_server(_app())
+    # The intervals tick every 100ms, faster than exact counts can be observed
+    until(lambda: _count(dash_duo, "shown") >= 5, timeout=10)
+    assert _count(dash_duo, "hidden") == 0
+
+    # Revealing the tab resumes its interval, while the interval in the tab that
+    # is now hidden stops
+    dash_duo.find_elements("#dock .flexlayout__tab_button")[1].click()
+    until(lambda: _count(dash_duo, "hidden") >= 5, timeout=10)
+    shown = _count(dash_duo, "shown")
+    time.sleep(0.5)
+    assert _count(dash_duo, "shown") == shown
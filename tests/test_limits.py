@@ -0,0 +1,74 @@
+from dash import html
+
+import dash_dock
+
+MODEL = {
+    "global": {},
+    "borders": [
+        {"type": "border", "location": "left", "children": [
+            {"type": "tab", "id": "explorer", "name": "Explorer"},
+        ]},
+        {"type": "border", "location": "bottom", "children": [
+            {"type": "tab", "id": "logs", "name": "Logs"},
+        ]},
+    ],
+    "layout": {
+        "type": "row",
+        "children": [
+            {"type": "tabset", "id": "left", "children": [
+                {"type": "tab", "id": "a", "name": "A"},
+                {"type": "tab", "id": "b", "name": "B"},
+            ]},
+            {"type": "tabset", "id": "right", "children": [
+                {"type": "tab", "id": "c", "name": "C"},
+            ]},
+        ],
+    },
+}
+
+
+def test_count_tabs():
+    assert dash_dock.count_tabs(MODEL) == 5
+
+
+def test_limit_model_within_limit():
+    assert dash_dock.limit_model(MODEL, 5) is MODEL
+
+
+def test_limit_model_keeps_first_tabs():
+    limited = dash_dock.limit_model(MODEL, 3)
+    assert dash_dock.ModelIndex(limited).tab_ids == ["explorer", "logs", "a"]
+    assert [tabset["id"] for tabset in limited["layout"]["children"]] == ["left"]
+    # Untouched nodes are shared, and the original is unchanged
+    assert limited["borders"][0] is MODEL["borders"][0]
+    assert dash_dock.count_tabs(MODEL) == 5
+
+
+def test_limit_model_borders_only():
+    limited = dash_dock.limit_model(MODEL, 1)
+    assert dash_dock.ModelIndex(limited).tab_ids == ["explorer"]
+    assert limited["borders"][1]["children"] == []
+    assert limited["layout"] == {
+        "type": "row",
+        "weight": 100,
+        "children": [{"type": "tabset", "weight": 100, "children": []}],
+    }
+
+
+def test_enforce_tab_limit_drops_children():
+    children = [dash_dock.Tab(id=tab_id, children=tab_id) for tab_id in ["explorer", "logs", "a", "b", "c"]]
+    children.append(html.Div(id="not-a-tab"))
+    model, kept = dash_dock.enforce_tab_limit(MODEL, children, limit=3)
+    assert dash_dock.count_tabs(model) == 3
+    assert [child.id for child in kept] == ["explorer", "logs", "a", "not-a-tab"]
+
+
+def test_enforce_tab_limit_keeps_state_children():
+    # Children passed in as a State are plain dicts
+    children = [
+        {"type": "Tab", "namespace": "dash_dock", "props": {"id": tab_id, "children": tab_id}}
+        for tab_id in ["explorer", "logs", "a", "b", "c"]
+    ]
+    model, kept = dash_dock.enforce_tab_limit(MODEL, children, limit=3)
+    assert dash_dock.count_tabs(model) == 3
+    assert [child["props"]["id"] for child in kept] == ["explorer", "logs", "a"]
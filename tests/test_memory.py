@@ -0,0 +1,106 @@
+import dash
+from dash import Input, Output, html
+
+import dash_dock
+
+TABS_PER_DOCK = 200
+
+# Generous upper bound on the heap retained by one dock of TABS_PER_DOCK tabs.
+# A single FlexLayout Model plus its rendered tab strip fits well inside this;
+# keeping three or four copies of the tree per dock does not.
+RETAINED_BYTES_PER_DOCK = 4 * 1024 * 1024
+
+# Find the Model passed to a dock's FlexLayout <Layout> through the React fiber
+# tree, and return its prototype so its live instances can be queried
+FIND_MODEL_PROTOTYPE = """
+(() => {
+    const el = document.querySelector('#dock-0 .flexlayout__layout');
+    const key = Object.keys(el).find(k => k.startsWith('__reactFiber$'));
+    let fiber = el[key];
+    while (fiber && !(fiber.memoizedProps && fiber.memoizedProps.model && fiber.memoizedProps.factory)) {
+        fiber = fiber.return;
+    }
+    return Object.getPrototypeOf(fiber.memoizedProps.model);
+})()
+"""
+
+
+def _dock(index):
+    tabs = [
+        {"type": "tab", "id": "dock-{}-tab-{}".format(index, i), "name": "Tab {}".format(i)}
+        for i in range(TABS_PER_DOCK)
+    ]
+    return dash_dock.DashDock(
+        id="dock-{}".format(index),
+        model={
+            "global": {},
+            "layout": {
+                "type": "row",
+                "children": [{"type": "tabset", "id": "dock-{}-tabset".format(index), "children": tabs}],
+            },
+        },
+        children=[dash_dock.Tab(id=tab["id"], children=tab["name"]) for tab in tabs],
+        freeTabLimit=TABS_PER_DOCK,
+        style={"height": "300px", "position": "relative"},
+    )
+
+
+def _app(n_docks):
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button("Toggle", id="toggle"),
+        html.Div([_dock(i) for i in range(n_docks)], id="docks"),
+    ])
+
+    @app.callback(Output("docks", "children"), Input("toggle", "n_clicks"), prevent_initial_call=True)
+    def toggle(n_clicks):
+        return [_dock(i) for i in range(n_docks)] if n_clicks % 2 == 0 else []
+
+    return app
+
+
+def _used_heap(driver):
+    driver.execute_cdp_cmd("HeapProfiler.enable", {})
+    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    return driver.execute_cdp_cmd("Runtime.getHeapUsage", {})["usedSize"]
+
+
+def _count_models(driver):
+    prototype = driver.execute_cdp_cmd(
+        "Runtime.evaluate", {"expression": FIND_MODEL_PROTOTYPE}
+    )["result"]["objectId"]
+    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    instances = driver.execute_cdp_cmd(
+        "Runtime.queryObjects", {"prototypeObjectId": prototype}
+    )["objects"]["objectId"]
+    return driver.execute_cdp_cmd(
+        "Runtime.callFunctionOn",
+        {
+            "functionDeclaration": "function() { return this.length; }",
+            "objectId": instances,
+            "returnByValue": True,
+        },
+    )["result"]["value"]
+
+
+def test_one_model_per_dock(dash_duo):
+    dash_duo.start_server(_app(2))
+    dash_duo.wait_for_element("#dock-1 .flexlayout__tab_button")
+
+    # Selecting a tab round-trips the model through setProps
+    dash_duo.find_elements("#dock-0 .flexlayout__tab_button")[1].click()
+    dash_duo.wait_for_element("#dock-0 .flexlayout__tab_button--selected")
+
+    assert _count_models(dash_duo.driver) == 2
+
+
+def test_retained_size_per_dock(dash_duo):
+    dash_duo.start_server(_app(2))
+    dash_duo.wait_for_element("#dock-1 .flexlayout__tab_button")
+    mounted = _used_heap(dash_duo.driver)
+
+    dash_duo.find_element("#toggle").click()
+    dash_duo.wait_for_no_elements("#dock-0")
+    unmounted = _used_heap(dash_duo.driver)
+
+    assert mounted - unmounted < 2 * RETAINED_BYTES_PER_DOCK
@@ -0,0 +1,108 @@
+import dash
+from dash import Input, Output, html
+
+import dash_dock
+
+# Find the Model class through the React fiber tree of the dock's FlexLayout
+# <Layout> (see test_memory.py) and count the calls of Model.fromJson
+COUNT_FROM_JSON = """
+const el = document.querySelector('#dock .flexlayout__layout');
+const key = Object.keys(el).find(k => k.startsWith('__reactFiber$'));
+let fiber = el[key];
+while (fiber && !(fiber.memoizedProps && fiber.memoizedProps.model && fiber.memoizedProps.factory)) {
+    fiber = fiber.return;
+}
+const Model = fiber.memoizedProps.model.constructor;
+const fromJson = Model.fromJson;
+window.fromJsonCalls = 0;
+Model.fromJson = function () {
+    window.fromJsonCalls++;
+    return fromJson.apply(this, arguments);
+};
+"""
+
+
+def _model(names):
+    return {
+        "global": {},
+        "layout": {
+            "type": "row",
+            "children": [{
+                "type": "tabset",
+                "children": [
+                    {"type": "tab", "id": "tab-{}".format(i), "name": name}
+                    for i, name in enumerate(names, 1)
+                ],
+            }],
+        },
+    }
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        html.Button("Rename", id="rename"),
+        dash_dock.DashDock(
+            id="dock",
+            model=_model(["Tab 1", "Tab 2"]),
+            children=[
+                dash_dock.Tab(id="tab-1", children=html.Div("Content 1")),
+                dash_dock.Tab(id="tab-2", children=html.Div("Content 2")),
+            ],
+            style={"height": "400px", "position": "relative"},
+        ),
+        html.Div(id="selected"),
+    ])
+
+    @app.callback(Output("selected", "children"), Input("dock", "model"), prevent_initial_call=True)
+    def selected(model):
+        return str(model["layout"]["children"][0].get("selected", 0))
+
+    @app.callback(Output("dock", "model"), Input("rename", "n_clicks"), prevent_initial_call=True)
+    def rename(n_clicks):
+        return _model(["Server 1", "Server 2"])
+
+    return app
+
+
+def _from_json_calls(dash_duo):
+    return dash_duo.driver.execute_script("return window.fromJsonCalls;")
+
+
+def test_echoed_model_is_not_rebuilt(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Content 1")
+    dash_duo.driver.execute_script(COUNT_FROM_JSON)
+
+    # Selecting a tab reports the model, which Dash feeds back as the prop
+    dash_duo.find_elements("#dock .flexlayout__tab_button")[1].click()
+    dash_duo.wait_for_text_to_equal("#selected", "1")
+    dash_duo.wait_for_contains_text("#dock", "Content 2")
+    assert _from_json_calls(dash_duo) == 0
+
+
+def test_server_model_is_rebuilt(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Content 1")
+    dash_duo.driver.execute_script(COUNT_FROM_JSON)
+
+    dash_duo.find_element("#rename").click()
+    dash_duo.wait_for_contains_text("#dock", "Server 1")
+    assert _from_json_calls(dash_duo) == 1
+
+
+def test_tabs_added_in_the_browser_are_limited(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Content 1")
+
+    # Without an API key the dock is limited to 3 tabs, also when they are
+    # added in the browser rather than by the server
+    for i in [3, 4]:
+        dash_duo.driver.execute_script(
+            "window.dash_clientside.dash_dock.addTab('dock', {{id: 'tab-{0}', name: 'Added {0}'}});".format(i)
+        )
+    dash_duo.wait_for_element("#dock .dashdock-free-indicator")
+    # Limiting starts from the live layout, which keeps the tab added first
+    assert [button.text for button in dash_duo.find_elements("#dock .flexlayout__tab_button")] == [
+        "Tab 1", "Tab 2", "Added 3"
+    ]
@@ -0,0 +1,94 @@
+from dash import Patch
+
+import dash_dock
+
+MODEL = {
+    "borders": [
+        {"type": "border", "location": "left", "children": [
+            {"type": "tab", "id": "explorer", "name": "Explorer"},
+        ]},
+    ],
+    "layout": {
+        "type": "row",
+        "id": "root",
+        "children": [
+            {"type": "tabset", "id": "left", "weight": 50, "selected": 1, "children": [
+                {"type": "tab", "id": "a", "name": "A"},
+                {"type": "tab", "id": "b", "name": "B"},
+                {"type": "tab", "id": "c", "name": "C"},
+            ]},
+            {"type": "tabset", "id": "right", "weight": 50, "children": [
+                {"type": "tab", "id": "d", "name": "D"},
+            ]},
+        ],
+    },
+}
+
+
+def _operations(patch):
+    return [
+        (op["operation"], op["location"], op["params"].get("value"))
+        for op in patch.to_plotly_json()["operations"]
+    ]
+
+
+def test_model_index_paths():
+    index = dash_dock.ModelIndex(MODEL)
+    assert index.path("c") == ("layout", "children", 0, "children", 2)
+    assert index.path("border_left") == ("borders", 0)
+    assert index.parent_path("explorer") == ("borders", 0)
+    assert index.tab_ids == ["explorer", "a", "b", "c", "d"]
+    assert index.node("d")["name"] == "D"
+
+
+def test_add_tab_appends_and_selects():
+    patch = dash_dock.add_tab(Patch(), MODEL, "right", {"id": "e", "name": "E"})
+    assert _operations(patch) == [
+        ("Append", ["layout", "children", 1, "children"], {"id": "e", "name": "E", "type": "tab"}),
+        ("Assign", ["layout", "children", 1, "selected"], 1),
+    ]
+
+
+def test_add_tab_without_select_keeps_selection():
+    patch = dash_dock.add_tab(Patch(), MODEL, "left", {"id": "e"}, position=0, select=False)
+    assert _operations(patch)[-1] == ("Assign", ["layout", "children", 0, "selected"], 2)
+
+
+def test_add_tab_to_closed_border_keeps_it_closed():
+    patch = dash_dock.add_tab(Patch(), MODEL, "border_left", {"id": "e"}, position=0, select=False)
+    assert _operations(patch) == [
+        ("Insert", ["borders", 0, "children"], {"id": "e", "type": "tab"}),
+    ]
+
+
+def test_remove_tab_shifts_selection():
+    patch = dash_dock.remove_tab(Patch(), MODEL, "a")
+    assert _operations(patch) == [
+        ("Delete", ["layout", "children", 0, "children", 0], None),
+        ("Assign", ["layout", "children", 0, "selected"], 0),
+    ]
+    # Removing a tab after the selected one leaves the selection alone
+    assert len(_operations(dash_dock.remove_tab(Patch(), MODEL, "c"))) == 1
+
+
+def test_select_tab_and_set_weights():
+    patch = dash_dock.select_tab(Patch(), MODEL, "c")
+    dash_dock.set_weights(patch, MODEL, {"left": 30, "right": 70})
+    assert _operations(patch) == [
+        ("Assign", ["layout", "children", 0, "selected"], 2),
+        ("Assign", ["layout", "children", 0, "weight"], 30),
+        ("Assign", ["layout", "children", 1, "weight"], 70),
+    ]
+
+
+def test_tab_content_helpers():
+    patch = dash_dock.add_tab_content(Patch(), "e", "content")
+    (operation, location, value), = _operations(patch)
+    assert operation == "Append" and value.id == "e"
+
+    children = [
+        {"type": "Tab", "namespace": "dash_dock", "props": {"id": "a"}},
+        {"type": "Tab", "namespace": "dash_dock", "props": {"id": "b"}},
+    ]
+    patch = dash_dock.remove_tab_content(Patch(), children, "b")
+    assert _operations(patch) == [("Delete", [1], None)]
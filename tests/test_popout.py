@@ -0,0 +1,24 @@
+import dash
+from dash import html
+
+import dash_dock
+
+
+def _client(**kwargs):
+    app = dash.Dash(__name__, **kwargs)
+    app.layout = html.Div()
+    return app.server.test_client()
+
+
+def test_popout_page_is_served():
+    response = _client().get("/" + dash_dock.POPOUT_ROUTE)
+    assert response.status_code == 200
+    assert response.mimetype == "text/html"
+    page = response.get_data(as_text=True)
+    assert "<body>" in page
+    assert "<script" not in page
+
+
+def test_popout_page_follows_pathname_prefix():
+    client = _client(routes_pathname_prefix="/workspace/", requests_pathname_prefix="/workspace/")
+    assert client.get("/workspace/" + dash_dock.POPOUT_ROUTE).status_code == 200
@@ -0,0 +1,111 @@
+import dash
+from dash import html
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+
+import dash_dock
+
+N_TABS = 500
+TABS_PER_TABSET = 100
+SYMBOLS = ["alpha", "bravo", "charlie", "delta", "echo"]
+
+
+def _name(i):
+    return "{} {}".format(SYMBOLS[i % len(SYMBOLS)], i)
+
+
+def _dock():
+    tabsets = [
+        {
+            "type": "tabset",
+            "children": [
+                {"type": "tab", "id": "tab-{}".format(i), "name": _name(i)}
+                for i in range(start, start + TABS_PER_TABSET)
+            ],
+        }
+        for start in range(0, N_TABS, TABS_PER_TABSET)
+    ]
+    return dash_dock.DashDock(
+        id="dock",
+        model={"global": {}, "layout": {"type": "row", "children": tabsets}},
+        children=[
+            dash_dock.Tab(id="tab-{}".format(i), children=html.Div("Panel {}".format(i)))
+            for i in range(N_TABS)
+        ],
+        freeTabLimit=N_TABS + 1,
+        quickSwitcher=True,
+        style={"height": "600px", "position": "relative"},
+    )
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([_dock()])
+    return app
+
+
+def _switch_to(dash_duo, query):
+    ActionChains(dash_duo.driver).key_down(Keys.CONTROL).send_keys("k").key_up(Keys.CONTROL).perform()
+    search = dash_duo.find_element("#dock .dash-dock-quick-switcher .dash-dock-tab-menu-search")
+    search.send_keys(query)
+    return search
+
+
+def test_quick_switcher_selects_tab(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Panel 0")
+
+    search = _switch_to(dash_duo, "delta 38")
+    # The shortest of the names starting with "delta 38" comes first
+    dash_duo.wait_for_text_to_equal(
+        "#dock .dash-dock-tab-menu-item--highlighted", "delta 38"
+    )
+    search.send_keys(Keys.ENTER)
+    dash_duo.wait_for_contains_text("#dock", "Panel 38")
+    assert not dash_duo.find_elements("#dock .dash-dock-quick-switcher")
+
+
+def test_quick_switcher_follows_actions(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Panel 0")
+
+    # Build the index, then change the model
+    search = _switch_to(dash_duo, "x")
+    search.send_keys(Keys.ESCAPE)
+    dash_duo.driver.execute_script(
+        "const dd = window.dash_clientside.dash_dock;"
+        "dd.addTab('dock', {id: 'tab-new', name: 'foxtrot'}, null, 'center', -1, false);"
+        "dd.renameTab('dock', 'tab-1', 'golf');"
+        "dd.deleteTab('dock', 'tab-2');"
+    )
+
+    search = _switch_to(dash_duo, "foxtrot")
+    dash_duo.wait_for_text_to_equal("#dock .dash-dock-tab-menu-item--highlighted", "foxtrot")
+    search.send_keys(Keys.CONTROL, "a")
+    search.send_keys("golf")
+    dash_duo.wait_for_text_to_equal("#dock .dash-dock-tab-menu-item--highlighted", "golf")
+    search.send_keys(Keys.CONTROL, "a")
+    search.send_keys("charlie 2")
+    dash_duo.wait_for_text_to_equal("#dock .dash-dock-tab-menu-item--highlighted", "charlie 22")
+
+
+def test_quick_switcher_skips_docks_without_it(dash_duo):
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="plain",
+            model={"global": {}, "layout": {"type": "row", "children": [{
+                "type": "tabset", "children": [{"type": "tab", "id": "notes", "name": "Notes"}],
+            }]}},
+            children=[dash_dock.Tab(id="notes", children=html.Div("Notes"))],
+            style={"height": "200px", "position": "relative"},
+        ),
+        _dock(),
+    ])
+    dash_duo.start_server(app)
+    dash_duo.wait_for_contains_text("#dock", "Panel 0")
+
+    # With the focus outside both docks, the first dock with a switcher opens it
+    _switch_to(dash_duo, "echo 4")
+    dash_duo.wait_for_text_to_equal("#dock .dash-dock-tab-menu-item--highlighted", "echo 4")
+    assert not dash_duo.find_elements("#plain .dash-dock-quick-switcher")
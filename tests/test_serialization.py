@@ -0,0 +1,57 @@
+import json
+
+import dash_dock
+from dash_dock import serialization
+
+MODEL = {
+    "global": {"tabEnableClose": True},
+    "layout": {
+        "type": "row",
+        "children": [
+            {
+                "type": "tabset",
+                "weight": 50,
+                "children": [{"type": "tab", "name": "One", "id": "tab-1"}],
+            }
+        ],
+    },
+}
+
+
+def _reordered(model):
+    # Round-trip through a reversed key order to get an equal but differently ordered dict
+    if isinstance(model, dict):
+        return {k: _reordered(model[k]) for k in reversed(list(model))}
+    if isinstance(model, list):
+        return [_reordered(v) for v in model]
+    return model
+
+
+def test_canonical_json_is_sorted_and_compact():
+    text = dash_dock.to_canonical_json(MODEL)
+    assert " " not in text.replace('"One"', "")
+    assert text == json.dumps(MODEL, sort_keys=True, separators=(",", ":"))
+
+
+def test_hash_ignores_key_order():
+    assert dash_dock.model_hash(MODEL) == dash_dock.model_hash(_reordered(MODEL))
+    assert dash_dock.models_equal(MODEL, _reordered(MODEL))
+
+
+def test_hash_changes_with_structure():
+    changed = _reordered(MODEL)
+    changed["layout"]["children"][0]["weight"] = 60
+    assert dash_dock.model_hash(MODEL) != dash_dock.model_hash(changed)
+    assert not dash_dock.models_equal(MODEL, changed)
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    expected = dash_dock.to_canonical_json(MODEL)
+    monkeypatch.setattr(serialization, "_orjson", None)
+    assert dash_dock.to_canonical_json(MODEL) == expected
+
+
+def test_serializes_dash_components():
+    component = dash_dock.Tab(id="tab-1", children="content")
+    text = dash_dock.to_canonical_json({"child": component})
+    assert json.loads(text)["child"]["props"]["id"] == "tab-1"
@@ -0,0 +1,106 @@
+import dash
+from dash import html
+from dash.testing.wait import until
+
+import dash_dock
+
+TAB_IDS = (
+    "return window.dash_clientside.dash_dock.getModel('dock')"
+    ".layout.children[0].children.map(t => t.id);"
+)
+
+
+# Each page generates its own id for the root row, so compare below it
+LAYOUT = "return JSON.stringify(window.dash_clientside.dash_dock.getModel('dock').layout.children);"
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {
+                    "type": "row",
+                    "children": [{
+                        "type": "tabset",
+                        "id": "main",
+                        "children": [
+                            {"type": "tab", "id": "tab-1", "name": "Tab 1"},
+                            {"type": "tab", "id": "tab-2", "name": "Tab 2"},
+                        ],
+                    }],
+                },
+            },
+            children=[
+                dash_dock.Tab(id="tab-1", children=html.Div("Content 1")),
+                dash_dock.Tab(id="tab-2", children=html.Div("Content 2")),
+            ],
+            syncChannel="workspace",
+            # Room for the tabs the tests add
+            freeTabLimit=10,
+            style={"height": "400px", "position": "relative"},
+        ),
+    ])
+    return app
+
+
+def _open_twice(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Content 1")
+    first = dash_duo.driver.current_window_handle
+
+    dash_duo.driver.switch_to.new_window("tab")
+    dash_duo.driver.get(dash_duo.server_url)
+    dash_duo.wait_for_contains_text("#dock", "Content 1")
+    second = dash_duo.driver.current_window_handle
+    return first, second
+
+
+def test_actions_are_replayed_in_other_tabs(dash_duo):
+    first, second = _open_twice(dash_duo)
+
+    dash_duo.driver.switch_to.window(first)
+    dash_duo.driver.execute_script(
+        "const dd = window.dash_clientside.dash_dock;"
+        "dd.renameTab('dock', 'tab-1', 'Renamed');"
+        "dd.selectTab('dock', 'tab-2');"
+        "dd.addTab('dock', {name: 'Added'}, 'main');"
+    )
+
+    dash_duo.driver.switch_to.window(second)
+    dash_duo.wait_for_contains_text("#dock", "Renamed")
+    dash_duo.wait_for_contains_text("#dock", "Added")
+    # The added tab got the same id in both tabs
+    second_ids = dash_duo.driver.execute_script(TAB_IDS)
+    dash_duo.driver.switch_to.window(first)
+    assert dash_duo.driver.execute_script(TAB_IDS) == second_ids
+    assert len(second_ids) == 3
+
+
+def test_actions_on_split_tabsets_are_replayed(dash_duo):
+    first, second = _open_twice(dash_duo)
+
+    # Docking a tab to the right of the tabset creates a tabset (and row)
+    # without an explicit id
+    dash_duo.driver.switch_to.window(first)
+    dash_duo.driver.execute_script(
+        "window.dash_clientside.dash_dock.addTab('dock', {id: 'tab-3', name: 'Split'}, 'main', 'right');"
+    )
+    split_id = dash_duo.driver.execute_script(
+        "return window.dash_clientside.dash_dock.getModel('dock').layout.children"
+        ".find(tabset => tabset.children.some(tab => tab.id === 'tab-3')).id;"
+    )
+    assert split_id != "main"
+
+    # Act on the new tabset, by its generated id
+    dash_duo.driver.execute_script(
+        "const dd = window.dash_clientside.dash_dock;"
+        "dd.addTab('dock', {id: 'tab-4', name: 'Into split'}, '" + split_id + "');"
+        "dd.maximizeToggle('dock', '" + split_id + "');"
+    )
+    first_layout = dash_duo.driver.execute_script(LAYOUT)
+
+    dash_duo.driver.switch_to.window(second)
+    until(lambda: dash_duo.driver.execute_script(LAYOUT) == first_layout, timeout=10)
@@ -0,0 +1,55 @@
+import dash
+from dash import Input, Output, html
+
+import dash_dock
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {
+                    "type": "row",
+                    "children": [{
+                        "type": "tabset",
+                        "children": [
+                            {"type": "tab", "id": "report", "name": "Report"},
+                            {"type": "tab", "id": "logs", "name": "Logs"},
+                        ],
+                    }],
+                },
+            },
+            children=[
+                dash_dock.Tab(id="report", children=html.Div("Report content")),
+                dash_dock.Tab(id="logs", children=html.Div("Logs content")),
+            ],
+            style={"height": "400px", "position": "relative"},
+        ),
+        html.Div(id="hidden"),
+        html.Div(id="closed"),
+    ])
+
+    @app.callback(Output("hidden", "children"), Input("report", "hiddenAt"), prevent_initial_call=True)
+    def hidden(hidden_at):
+        return "hidden" if hidden_at else ""
+
+    @app.callback(Output("closed", "children"), Input("report", "closedAt"), prevent_initial_call=True)
+    def closed(closed_at):
+        return "closed" if closed_at else ""
+
+    return app
+
+
+def test_tab_reports_hide_and_close(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Report content")
+
+    dash_duo.driver.execute_script("window.dash_clientside.dash_dock.selectTab('dock', 'logs');")
+    dash_duo.wait_for_text_to_equal("#hidden", "hidden")
+    assert dash_duo.find_element("#closed").text == ""
+
+    dash_duo.driver.execute_script("window.dash_clientside.dash_dock.deleteTab('dock', 'report');")
+    dash_duo.wait_for_text_to_equal("#closed", "closed")
@@ -0,0 +1,83 @@
+import json
+import time
+
+import dash
+from dash import Input, Output, State, html
+from dash.testing.wait import until
+from selenium.webdriver.common.action_chains import ActionChains
+
+import dash_dock
+
+TAB_WIDTH = """
+return Array.from(document.querySelectorAll('#dock .dash-dock-tab-content'))
+    .find(el => el.textContent === 'Content ' + arguments[0])
+    .getBoundingClientRect().width;
+"""
+
+
+def _tabset(tab_id):
+    return {"type": "tabset", "children": [{"type": "tab", "id": tab_id, "name": tab_id.title()}]}
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {"type": "row", "children": [_tabset("left"), _tabset("middle"), _tabset("right")]},
+            },
+            children=[
+                dash_dock.Tab(id=tab_id, children=html.Div("Content {}".format(tab_id)))
+                for tab_id in ["left", "middle", "right"]
+            ],
+            realtimeResize=True,
+            reportTabResize=True,
+            style={"height": "400px", "width": "600px", "position": "relative"},
+        ),
+        html.Div(id="updates"),
+        html.Div(id="resized"),
+    ])
+
+    @app.callback(
+        Output("updates", "children"),
+        Output("resized", "children"),
+        Input("dock", "resizedTabs"),
+        State("updates", "children"),
+        prevent_initial_call=True,
+    )
+    def report(resized_tabs, updates):
+        return str(int(updates or 0) + 1), json.dumps(resized_tabs, sort_keys=True)
+
+    return app
+
+
+def _updates(dash_duo):
+    return int(dash_duo.find_element("#updates").text or 0)
+
+
+def test_splitter_drag_reports_resized_tabs_once(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Content right")
+    # Let the sizes of the first render settle
+    time.sleep(0.5)
+    before = _updates(dash_duo)
+    widths = {tab_id: dash_duo.driver.execute_script(TAB_WIDTH, tab_id) for tab_id in ["left", "middle"]}
+
+    # Drag the splitter between the left and middle tabsets over several frames
+    splitter = dash_duo.find_elements("#dock .flexlayout__splitter")[0]
+    actions = ActionChains(dash_duo.driver).click_and_hold(splitter)
+    for _ in range(5):
+        actions.move_by_offset(10, 0).pause(0.05)
+    actions.release().perform()
+
+    until(lambda: _updates(dash_duo) > before, timeout=4)
+    # Nothing else is reported for the same drag
+    time.sleep(0.5)
+    assert _updates(dash_duo) == before + 1
+
+    resized = json.loads(dash_duo.find_element("#resized").text)
+    assert sorted(resized) == ["left", "middle"]
+    assert resized["left"]["width"] > widths["left"]
+    assert resized["middle"]["width"] < widths["middle"]
@@ -0,0 +1,63 @@
+import dash
+from dash import html
+from selenium.webdriver.common.keys import Keys
+
+import dash_dock
+
+N_TABS = 300
+WINDOW = 20
+
+RENDERED_BUTTONS = (
+    "return Array.from(document.querySelectorAll('#dock .flexlayout__tab_button'))"
+    ".filter(b => b.offsetParent !== null).length;"
+)
+
+
+def _app():
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dash_dock.DashDock(
+            id="dock",
+            model={
+                "global": {},
+                "layout": {
+                    "type": "row",
+                    "children": [{
+                        "type": "tabset",
+                        "children": [
+                            {"type": "tab", "id": "tab-{}".format(i), "name": "Instrument {}".format(i)}
+                            for i in range(N_TABS)
+                        ],
+                    }],
+                },
+            },
+            children=[
+                dash_dock.Tab(id="tab-{}".format(i), children=html.Div("Quote {}".format(i)))
+                for i in range(N_TABS)
+            ],
+            freeTabLimit=N_TABS,
+            virtualTabStrip=WINDOW,
+            style={"height": "600px", "position": "relative"},
+        ),
+    ])
+    return app
+
+
+def test_virtual_tab_strip(dash_duo):
+    dash_duo.start_server(_app())
+    dash_duo.wait_for_contains_text("#dock", "Quote 0")
+    assert dash_duo.driver.execute_script(RENDERED_BUTTONS) <= WINDOW
+
+    dash_duo.find_element("#dock .dash-dock-strip-menu-button").click()
+    search = dash_duo.find_element("#dock .dash-dock-tab-menu-search")
+    search.send_keys("instrument 25")
+    # Instrument 25 and 250-259
+    dash_duo.wait_for_text_to_equal(
+        "#dock .dash-dock-tab-menu-item--highlighted", "26\nInstrument 25"
+    )
+    assert len(dash_duo.find_elements("#dock .dash-dock-tab-menu-item")) == 11
+
+    search.send_keys("7", Keys.ENTER)
+    dash_duo.wait_for_contains_text("#dock", "Quote 257")
+    assert not dash_duo.find_elements("#dock .dash-dock-strip-menu")
+    assert dash_duo.driver.execute_script(RENDERED_BUTTONS) <= WINDOW
@@ -0,0 +1,124 @@
+import pytest
+from dash import no_update
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+from dash.exceptions import PreventUpdate
+
+import dash_dock
+
+MODEL = {
+    "borders": [
+        {"type": "border", "location": "left", "children": [
+            {"type": "tab", "id": "explorer", "name": "Explorer"},
+        ]},
+        {"type": "border", "location": "bottom", "selected": 0, "children": [
+            {"type": "tab", "id": "logs", "name": "Logs"},
+        ]},
+    ],
+    "layout": {
+        "type": "row",
+        "children": [
+            {"type": "tabset", "id": "left", "selected": 1, "active": True, "children": [
+                {"type": "tab", "id": "a", "name": "A"},
+                {"type": "tab", "id": "b", "name": "B"},
+            ]},
+            {"type": "tabset", "id": "right", "children": [
+                {"type": "tab", "id": "c", "name": "C"},
+                {"type": "tab", "id": "d", "name": "D"},
+            ]},
+        ],
+    },
+}
+
+
+def test_visible_tab_ids():
+    assert dash_dock.visible_tab_ids(MODEL) == ["logs", "b", "c"]
+    assert dash_dock.active_tab_id(MODEL) == "b"
+
+
+def test_visible_tab_ids_maximized():
+    model = dict(MODEL, layout=dict(MODEL["layout"]))
+    model["layout"]["children"] = [
+        MODEL["layout"]["children"][0],
+        dict(MODEL["layout"]["children"][1], maximized=True),
+    ]
+    assert dash_dock.visible_tab_ids(model) == ["logs", "c"]
+
+
+def _call(func, visible, dirty, triggered):
+    context_value.set(AttributeDict(
+        input_values={"dock.visibleTabIds": visible},
+        state_values={"dock.dirtyOutputs": dirty},
+        triggered_inputs=[{"prop_id": prop_id, "value": None} for prop_id in triggered],
+        outputs_list={"id": "graph", "property": "figure"},
+        updated_props={},
+    ))
+    try:
+        return func(), context_value.get().updated_props
+    except PreventUpdate:
+        return PreventUpdate, context_value.get().updated_props
+
+
+@dash_dock.only_if_visible("dock", "c")
+def _update():
+    return "figure"
+
+
+def _operations(updated):
+    return updated["dock"]["dirtyOutputs"].to_plotly_json()["operations"]
+
+
+def test_hidden_tab_is_marked_dirty():
+    result, updated = _call(_update, ["a"], None, ["range.value"])
+    assert result is no_update
+    assert _operations(updated) == [
+        {"operation": "Assign", "location": ["graph.figure"], "params": {"value": "c"}}
+    ]
+
+
+def test_marks_of_other_outputs_are_kept():
+    # Only this output's mark is patched, whatever the state of the others
+    _, updated = _call(_update, ["a"], {"table.data": "b"}, ["range.value"])
+    assert _operations(updated) == [
+        {"operation": "Assign", "location": ["graph.figure"], "params": {"value": "c"}}
+    ]
+
+
+def test_reveal_recomputes_dirty_output():
+    result, updated = _call(_update, ["c"], {"graph.figure": "c"}, ["dock.visibleTabIds"])
+    assert result == "figure"
+    assert _operations(updated) == [{"operation": "Delete", "location": ["graph.figure"], "params": {}}]
+
+
+def test_reveal_skips_clean_output():
+    result, updated = _call(_update, ["c"], {}, ["dock.visibleTabIds"])
+    assert result is PreventUpdate
+    assert updated == {}
+
+
+def test_visible_tab_runs():
+    assert _call(_update, ["c"], {}, ["range.value"]) == ("figure", {})
+    # Visibility not reported yet
+    assert _call(_update, None, None, []) == ("figure", {})
+
+
+def test_dict_tab_id():
+    # Matched against visibleTabIds the way the component stringifies it
+    @dash_dock.only_if_visible("dock", {"type": "panel", "index": 1})
+    def update():
+        return "figure"
+
+    assert _call(update, ['{"index":1,"type":"panel"}'], {}, ["range.value"]) == ("figure", {})
+    result, updated = _call(update, ["a"], None, ["range.value"])
+    assert result is no_update
+    assert _operations(updated) == [
+        {"operation": "Assign", "location": ["graph.figure"], "params": {"value": '{"index":1,"type":"panel"}'}}
+    ]
+
+
+def test_requires_visible_tab_ids_input():
+    context_value.set(AttributeDict(
+        input_values={}, state_values={}, triggered_inputs=[], outputs_list=[], updated_props={},
+    ))
+    with pytest.raises(ValueError):
+        _update()
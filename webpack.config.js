@@ -1,10 +1,48 @@
 const path = require('path');
 const webpack = require('webpack');
 const WebpackDashDynamicImport = require('@plotly/webpack-dash-dynamic-import');
+const MiniCssExtractPlugin = require('mini-css-extract-plugin');
 const packagejson = require('./package.json');
 
 const dashLibraryName = packagejson.name.replace(/-/g, '_');
 
+/**
+ * Writes `<library>-manifest.json`, mapping each emitted asset's un-hashed
+ * name to its content-hashed filename, so `__init__.py` can register the
+ * fingerprinted files without knowing the hashes in advance.
+ *
+ * Entry bundles are also copied to their un-hashed name, for the R and
+ * Julia wrappers and unpkg links, which reference fixed filenames.
+ */
+class DashAssetManifestPlugin {
+    apply(compiler) {
+        compiler.hooks.thisCompilation.tap('DashAssetManifestPlugin', compilation => {
+            compilation.hooks.processAssets.tap(
+                {
+                    name: 'DashAssetManifestPlugin',
+                    stage: webpack.Compilation.PROCESS_ASSETS_STAGE_REPORT
+                },
+                () => {
+                    const manifest = {};
+                    for (const chunk of compilation.chunks) {
+                        for (const file of chunk.files) {
+                            const name = file.replace(/\.[0-9a-f]{8}(?=\.)/, '');
+                            manifest[name] = file;
+                            if (name !== file && chunk.canBeInitial() && name.endsWith('.js')) {
+                                compilation.emitAsset(name, compilation.getAsset(file).source);
+                            }
+                        }
+                    }
+                    compilation.emitAsset(
+                        `${dashLibraryName}-manifest.json`,
+                        new webpack.sources.RawSource(JSON.stringify(manifest, null, 2))
+                    );
+                }
+            );
+        });
+    }
+}
+
 module.exports = (env, argv) => {
     let mode;
 
@@ -23,16 +61,24 @@ module.exports = (env, argv) => {
         mode = 'production';
     }
 
+    // Production bundles get a content hash in their name so they can be
+    // cached forever; `__init__.py` looks the names up in the manifest
+    const contentHash = mode === 'development' ? '' : '.[contenthash:8]';
+
     let filename = (overrides.output || {}).filename;
     if(!filename) {
         const modeSuffix = mode === 'development' ? 'dev' : 'min';
-        filename = `${dashLibraryName}.${modeSuffix}.js`;
+        filename = `${dashLibraryName}${contentHash}.${modeSuffix}.js`;
     }
 
     const entry = overrides.entry || {main: './src/lib/index.js'};
 
     const devtool = overrides.devtool || 'source-map';
 
+    // Styles are extracted to a content-hashed stylesheet registered in
+    // `_css_dist`; the dev server keeps injecting them for live reload
+    const extractCss = mode !== 'development';
+
     // Use a different external React depending on mode
     const reactExternals = mode === 'development'
         ? {
@@ -58,7 +104,7 @@ module.exports = (env, argv) => {
         entry,
         output: {
             path: path.resolve(__dirname, dashLibraryName),
-            chunkFilename: '[name].js',
+            chunkFilename: `[name]${contentHash}.js`,
             filename,
             library: dashLibraryName,
             libraryTarget: 'window',
@@ -102,7 +148,7 @@ module.exports = (env, argv) => {
                 {
                     test: /\.css$/,
                     use: [
-                        'style-loader',
+                        extractCss ? MiniCssExtractPlugin.loader : 'style-loader',
                         'css-loader'
                     ],
                 },
@@ -139,6 +185,17 @@ module.exports = (env, argv) => {
         },
         plugins: [
             new WebpackDashDynamicImport(),
+            ...(extractCss
+                ? [
+                    new MiniCssExtractPlugin({
+                        filename: `${dashLibraryName}${contentHash}.css`,
+                        // All styles are imported from the entry, so no
+                        // runtime is needed to load per-chunk stylesheets
+                        runtime: false
+                    })
+                ]
+                : []),
+            ...(mode === 'development' ? [] : [new DashAssetManifestPlugin()]),
             new webpack.SourceMapDevToolPlugin({
                 filename: '[file].map',
                 exclude: ['async-plotlyjs']